@@ -0,0 +1,41 @@
+"""Benchmark an AlphaSquared replay on synthetic data.
+
+Usage:
+    python benchmarks/bench_alphasquared_replay.py --years 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+from bench_backtest import _synthetic
+
+from coinbase_advanced_trader.backtesting import AlphaSquaredReplay
+
+
+def _strategy(risk):
+    if risk < 40:
+        return 'buy', 10 * (40 - risk) / 10
+    if risk > 70:
+        return 'sell', (risk - 70) / 3
+    return 'none', 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=int, default=5)
+    args = parser.parse_args()
+
+    candles, fgi = _synthetic(args.years * 365)
+    risk = np.clip(fgi, 0, 100)
+
+    start = time.perf_counter()
+    result = AlphaSquaredReplay(candles, risk, _strategy, order_ttl=7).run()
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(candles)} daily candles, {result.trade_count} fills: {elapsed * 1000:.1f}ms")
+    print(result.summary())
+
+
+if __name__ == '__main__':
+    main()
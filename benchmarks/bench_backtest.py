@@ -0,0 +1,61 @@
+"""Benchmark the vectorized Fear and Greed backtester on synthetic data.
+
+Generates a random-walk price series with a matching FGI series and times
+a full backtest run.
+
+Usage:
+    python benchmarks/bench_backtest.py --years 10 --runs 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from coinbase_advanced_trader.backtesting import Candles, FearAndGreedBacktester
+from coinbase_advanced_trader.trading_config import FearAndGreedConfig
+
+
+def _synthetic(days: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.03, days)))
+    spread = np.abs(rng.normal(0, 0.02, days))
+    candles = Candles(
+        timestamp=1388534400 + 86400 * np.arange(days, dtype=np.int64),
+        open=close,
+        high=close * (1 + spread),
+        low=close * (1 - spread),
+        close=close,
+        volume=np.zeros(days)
+    )
+    fgi = np.clip(50 + np.cumsum(rng.normal(0, 5, days)) % 100 - 50, 0, 100).round()
+    return candles, fgi
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    candles, fgi = _synthetic(args.years * 365)
+    backtester = FearAndGreedBacktester(
+        FearAndGreedConfig().get_compiled_schedule(), fiat_amount=10,
+        buy_price_multiplier='0.995', sell_price_multiplier='1.005'
+    )
+    backtester.run(candles, fgi)
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        result = backtester.run(candles, fgi)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    print(f"{len(candles)} daily candles, {len(result.trades)} trades")
+    print(f"  median={timings[len(timings) // 2] * 1000:.2f}ms "
+          f"min={timings[0] * 1000:.2f}ms max={timings[-1] * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
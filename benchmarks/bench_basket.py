@@ -0,0 +1,85 @@
+"""Compare scalar Decimal sizing with NumPy basket sizing.
+
+Sizes a rebalance of many orders across products three ways: one
+`SizingKernel.limit_order` per order with its residual cash and minimum
+size check (the scalar Decimal path), `size_basket` up to the accepted
+mask and residual cash, and `size_basket` including the Decimal prices and
+sizes of the accepted orders. Orders on a product share its reference
+price, as they do when a basket is sized from one price snapshot.
+
+Usage:
+    python benchmarks/bench_basket.py --products 50 --orders-per-product 200
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import OrderSide
+from coinbase_advanced_trader.sizing import SizingKernel, size_basket
+
+INCREMENTS = [('0.00000001', '0.01'), ('0.0001', '0.01'), ('0.01', '0.0001'), ('1', '0.000001')]
+
+
+def scalar(kernels, fiat_amounts, prices):
+    orders, residual = [], Decimal(0)
+    for kernel, amount, price in zip(kernels, fiat_amounts, prices):
+        limit_price, size = kernel.limit_order(amount, price, OrderSide.BUY)
+        if kernel.meets_min_size(size):
+            orders.append((kernel.product_id, OrderSide.BUY, limit_price, size))
+            residual += amount - limit_price * size
+        else:
+            residual += amount
+    return orders, residual
+
+
+def best_time(call, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=50)
+    parser.add_argument('--orders-per-product', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    kernels, fiat_amounts, prices = [], [], []
+    for index in range(args.products):
+        base_increment, quote_increment = INCREMENTS[index % len(INCREMENTS)]
+        kernel = SizingKernel(f'P{index}-USD', base_increment, quote_increment,
+                              base_min_size=base_increment)
+        price = Decimal(rng.randint(10**4, 10**9)) / 10**4 * Decimal('0.9995')
+        for _ in range(args.orders_per_product):
+            kernels.append(kernel)
+            fiat_amounts.append(Decimal(rng.randint(100, 10**6)) / 100)
+            prices.append(price)
+    orders = len(kernels)
+
+    (expected, residual), scalar_time = best_time(
+        lambda: scalar(kernels, fiat_amounts, prices), args.repeat)
+    basket, basket_time = best_time(
+        lambda: size_basket(kernels, fiat_amounts, prices, OrderSide.BUY), args.repeat)
+    _, cash_time = best_time(lambda: basket.residual_cash, args.repeat)
+    _, orders_time = best_time(lambda: basket.orders(), args.repeat)
+    assert basket.orders() == expected and basket.residual_cash == residual
+
+    print(f"{orders} orders on {args.products} products, "
+          f"{orders - len(expected)} below the minimum size")
+    for label, elapsed in (('scalar Decimal', scalar_time),
+                           ('basket + residual cash', basket_time + cash_time),
+                           ('basket + orders', basket_time + cash_time + orders_time)):
+        print(f"{label:>22}: {elapsed * 1e3:8.2f}ms  {elapsed / orders * 1e6:6.2f}us/order  "
+              f"({scalar_time / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Measure market data traffic of a DCA order placed on many accounts.
+
+Places one limit buy per account through independent PaperTradingClients
+and through a ClientPool, and prints the market data and order requests
+sent for growing account counts.
+
+Usage:
+    python benchmarks/bench_client_pool.py --accounts 1 10 50
+"""
+
+import argparse
+import logging
+import time
+
+from coinbase_advanced_trader import ClientPool
+from coinbase_advanced_trader.paper_trading import LatencyModel, PaperTradingClient, SimulatedExchange
+
+PRODUCT_ID = 'BTC-USDC'
+
+
+def _exchange() -> SimulatedExchange:
+    exchange = SimulatedExchange(balances={'USDC': '1000000'})
+    exchange.add_product(PRODUCT_ID, '60000')
+    return exchange
+
+
+def _paper_client(api_key, api_secret, **kwargs):
+    return PaperTradingClient(_exchange(), latency=LatencyModel(read=0.02, write=0.04, seed=1),
+                              **kwargs)
+
+
+def _market_data_requests(clients) -> int:
+    return sum(count for client in clients for endpoint, count in client.session.calls.items()
+               if endpoint.startswith('GET products'))
+
+
+def _independent(accounts: int):
+    clients = [_paper_client('key', 'secret') for _ in range(accounts)]
+    start = time.perf_counter()
+    for client in clients:
+        client.fiat_limit_buy(PRODUCT_ID, '10')
+    return _market_data_requests(clients), time.perf_counter() - start
+
+
+def _pooled(accounts: int):
+    credentials = {f'account-{index}': (f'key-{index}', 'secret') for index in range(accounts)}
+    with ClientPool(credentials, client_factory=_paper_client, max_workers=16) as pool:
+        start = time.perf_counter()
+        pool.fan_out('fiat_limit_buy', PRODUCT_ID, '10', prefetch=[PRODUCT_ID])
+        elapsed = time.perf_counter() - start
+        return _market_data_requests(pool[name] for name in pool), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--accounts', type=int, nargs='+', default=[1, 10, 50])
+    args = parser.parse_args()
+    logging.getLogger('coinbase_advanced_trader').setLevel(logging.ERROR)
+
+    print(f"{'accounts':>8}{'separate reads':>16}{'separate s':>12}{'pool reads':>12}{'pool s':>9}")
+    for accounts in args.accounts:
+        separate_reads, separate_time = _independent(accounts)
+        pool_reads, pool_time = _pooled(accounts)
+        print(f"{accounts:>8}{separate_reads:>16}{separate_time:>12.2f}"
+              f"{pool_reads:>12}{pool_time:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Measure how much read coalescing cuts the requests of concurrent orders.
+
+Several threads place limit buys on the same product at once through a
+PaperTradingClient with simulated latency, with and without coalescing, and
+the requests sent per burst are compared.
+
+Usage:
+    python benchmarks/bench_coalescing.py --threads 16 --bursts 5
+"""
+
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from coinbase_advanced_trader.paper_trading import LatencyModel, PaperTradingClient, SimulatedExchange
+
+
+def _run_bursts(coalesce: bool, threads: int, bursts: int):
+    exchange = SimulatedExchange(balances={'USDC': '1000000000'})
+    exchange.add_product('BTC-USDC', '60000')
+    client = PaperTradingClient(exchange, latency=LatencyModel(read=0.05, write=0.1, seed=1),
+                                coalesce_reads=coalesce)
+    client.fiat_limit_buy('BTC-USDC', '10')
+    client.session.reset_counts()
+    barrier = threading.Barrier(threads)
+
+    def order():
+        barrier.wait()
+        client.fiat_limit_buy('BTC-USDC', '10')
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in range(bursts):
+            for future in [executor.submit(order) for _ in range(threads)]:
+                future.result()
+    elapsed = time.perf_counter() - start
+    return client.session.calls, elapsed / bursts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--bursts', type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger('coinbase_advanced_trader').setLevel(logging.WARNING)
+
+    for label, coalesce in (('separate', False), ('coalesced', True)):
+        calls, per_burst = _run_bursts(coalesce, args.threads, args.bursts)
+        reads = sum(count for endpoint, count in calls.items() if endpoint.startswith('GET'))
+        print(f"{label:>10}: {sum(calls.values()) / args.bursts:6.1f} requests per burst "
+              f"({reads / args.bursts:.1f} reads), {per_burst * 1e3:7.1f}ms per burst")
+
+
+if __name__ == '__main__':
+    main()
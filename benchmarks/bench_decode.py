@@ -0,0 +1,97 @@
+"""Compare SDK response objects with fast decoding on large payloads.
+
+Builds `list_orders` and `get_fills` responses with many entries on the
+simulated exchange, then times the SDK path and `fast_decode=True` with a
+session that replays the recorded bodies, so only decoding is measured.
+
+Usage:
+    python benchmarks/bench_decode.py --orders 1000 --repeat 20
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Dict
+
+import requests
+
+from coinbase_advanced_trader.fast_decode import JSON_BACKEND
+from coinbase_advanced_trader.instrumentation import endpoint_name
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+
+
+class ReplaySession:
+    """Answers each endpoint with a recorded response body."""
+
+    def __init__(self, bodies: Dict[str, bytes]) -> None:
+        self.bodies = bodies
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.bodies[endpoint_name(method, url)]
+        response.encoding = 'utf-8'
+        return response
+
+
+def record_bodies(orders: int) -> Dict[str, bytes]:
+    exchange = SimulatedExchange(balances={'USDC': str(orders * 20)})
+    exchange.add_product('BTC-USDC', '60000')
+    client = PaperTradingClient(exchange)
+    for index in range(orders):
+        if index % 2:
+            client.fiat_market_buy('BTC-USDC', '10')
+        else:
+            client.fiat_limit_buy('BTC-USDC', '10', '0.9')
+    session = client.session
+    bodies = {}
+    for endpoint, call in (('GET orders/historical/batch', lambda: client.list_orders(limit=orders)),
+                           ('GET orders/historical/fills', lambda: client.get_fills(limit=orders))):
+        original = session.request
+
+        def recording(method, url, **kwargs):
+            response = original(method, url, **kwargs)
+            bodies[endpoint] = response.content
+            return response
+        session.request = recording
+        call()
+        session.request = original
+    return bodies
+
+
+def time_call(call, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    logging.getLogger('coinbase_advanced_trader').setLevel(logging.WARNING)
+
+    bodies = record_bodies(args.orders)
+    sdk = PaperTradingClient()
+    fast = PaperTradingClient(fast_decode=True)
+    sdk.session = fast.session = ReplaySession(bodies)
+    print(f"JSON backend: {JSON_BACKEND}")
+    for label, endpoint, call in (
+        ('list_orders', 'GET orders/historical/batch',
+         lambda client: client.list_orders(limit=args.orders)),
+        ('get_fills', 'GET orders/historical/fills',
+         lambda client: client.get_fills(limit=args.orders)),
+    ):
+        size = len(bodies[endpoint])
+        sdk_time = time_call(lambda: call(sdk), args.repeat)
+        fast_time = time_call(lambda: call(fast), args.repeat)
+        print(f"{label:>12} ({size / 1024:.0f} KiB): sdk {sdk_time * 1e3:7.2f}ms  "
+              f"fast {fast_time * 1e3:7.2f}ms  ({sdk_time / fast_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Report `python -X importtime` costs for the package entry points.
+
+Each module is imported in a fresh interpreter several times and the best
+cumulative time is reported together with the slowest dependencies of that
+run. `profile_import` is shared with the import time budget tests.
+
+Usage:
+    python benchmarks/bench_import_time.py --runs 5 --top 10
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULES = [
+    'coinbase_advanced_trader',
+    'coinbase_advanced_trader.enhanced_rest_client',
+    'coinbase_advanced_trader.alphasquared_trader',
+]
+
+
+def profile_import(module: str) -> Tuple[Dict[str, int], List[Tuple[int, str]]]:
+    """
+    Import a module in a fresh interpreter and parse its `-X importtime` report.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        Tuple[Dict[str, int], List[Tuple[int, str]]]: Cumulative microseconds
+        by module name, and (cumulative_us, name) for every module imported
+        by `module` itself.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True
+    )
+    timings = {}
+    dependencies = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+        if name.strip() == module:
+            continue
+        if not name.startswith('  '):
+            # A top-level import made by the interpreter before our module.
+            dependencies = []
+            continue
+        dependencies.append((int(cumulative), name.strip()))
+    return timings, dependencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        timings, dependencies = min((profile_import(module) for _ in range(args.runs)),
+                                    key=lambda profile: profile[0][module])
+        print(f"{module}: {timings[module] / 1000:.1f} ms")
+        slowest = sorted(dependencies, reverse=True)[:args.top]
+        for cumulative, name in slowest:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Measure the per-order overhead of request instrumentation.
+
+Places the same limit buys through PaperTradingClient without
+instrumentation, with the no-op `Instrumentation` base class and with
+`InMemoryInstrumentation`, then prints the best of several interleaved
+runs and the in-memory summary.
+
+Usage:
+    python benchmarks/bench_instrumentation.py --orders 5000
+"""
+
+import argparse
+import logging
+import time
+
+from coinbase_advanced_trader.instrumentation import InMemoryInstrumentation, Instrumentation
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+
+
+def _time_orders(instrumentation, orders: int) -> float:
+    exchange = SimulatedExchange(balances={'USDC': '1000000000'})
+    exchange.add_product('BTC-USDC', '60000')
+    client = PaperTradingClient(exchange, instrumentation=instrumentation)
+    client.fiat_limit_buy('BTC-USDC', '10')
+    start = time.perf_counter()
+    for _ in range(orders):
+        client.fiat_limit_buy('BTC-USDC', '10')
+    return (time.perf_counter() - start) / orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per variant; the best counts')
+    args = parser.parse_args()
+    logging.getLogger('coinbase_advanced_trader').setLevel(logging.WARNING)
+
+    in_memory = InMemoryInstrumentation()
+    variants = (('none', None), ('no-op', Instrumentation()), ('in-memory', in_memory))
+    best = {label: float('inf') for label, _ in variants}
+    for _ in range(args.repeat):
+        for label, instrumentation in variants:
+            best[label] = min(best[label], _time_orders(instrumentation, args.orders))
+    for label, per_order in best.items():
+        print(f"{label:>10}: {per_order * 1e6:8.1f}us per order "
+              f"({(per_order / best['none'] - 1) * 100:+.1f}%)")
+    print()
+    print(in_memory.format_table())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Compare answering open-order queries from the API and from an OpenOrderBook.
+
+Rests limit orders on a paper trading exchange, then asks "which orders
+are more than 2% from mid?" three ways: a paginated `list_orders` call
+filtered client-side (what every query cost before), a linear scan of a
+local list, and `OpenOrderBook.away_from`.
+
+Usage:
+    python benchmarks/bench_open_orders.py --orders 5000 --queries 200
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import Order, OrderSide, OrderType
+from coinbase_advanced_trader.open_orders import OpenOrderBook
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.user_stream import list_open_orders, order_from_api
+
+PRODUCT = 'ETH-USDC'
+
+
+def far_from_mid_linear(orders, mid: Decimal, fraction: Decimal):
+    low, high = mid * (1 - fraction), mid * (1 + fraction)
+    return [order for order in orders if order.product_id == PRODUCT and (
+        (order.side == OrderSide.BUY and order.price < low)
+        or (order.side == OrderSide.SELL and order.price > high))]
+
+
+def best_time(call, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=5000, help='resting orders')
+    parser.add_argument('--queries', type=int, default=200, help='queries per measurement')
+    parser.add_argument('--api-queries', type=int, default=5, help='queries sent to the API')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mid = Decimal('3000')
+    exchange = SimulatedExchange(balances={'USDC': '1000000000', 'ETH': '1000000000'})
+    exchange.add_product(PRODUCT, mid, base_increment='0.0001')
+    client = PaperTradingClient(exchange)
+    orders = []
+    for index in range(args.orders):
+        side = OrderSide.BUY if index % 2 else OrderSide.SELL
+        offset = Decimal(rng.randint(10, 1000)) / 10000
+        price = (mid * (1 - offset) if side == OrderSide.BUY else mid * (1 + offset))
+        orders.append(Order(id=str(index), product_id=PRODUCT, side=side, type=OrderType.LIMIT,
+                            size=Decimal('0.01'), price=price.quantize(Decimal('0.01'))))
+    book = OpenOrderBook()
+    for order in orders:
+        book.update(order)
+    # Rest the same orders on the exchange for the API queries.
+    for order in orders:
+        place = (client.limit_order_gtc_buy if order.side == OrderSide.BUY
+                 else client.limit_order_gtc_sell)
+        place(order.id, PRODUCT, str(order.size), str(order.price))
+
+    fraction = Decimal('0.02')
+    mids = [mid * (1 + Decimal(rng.randint(-50, 50)) / 10000) for _ in range(args.queries)]
+
+    api, api_time = best_time(lambda: [far_from_mid_linear(
+        [order_from_api(order) for order in list_open_orders(client, [PRODUCT])], m, fraction)
+        for m in mids[:args.api_queries]], 1)
+    linear, linear_time = best_time(
+        lambda: [far_from_mid_linear(orders, m, fraction) for m in mids], args.repeat)
+    indexed, indexed_time = best_time(
+        lambda: [book.away_from(PRODUCT, m, fraction) for m in mids], args.repeat)
+    assert [sorted(o.id for o in r) for r in linear] == [sorted(o.id for o in r) for r in indexed]
+    assert [len(r) for r in api] == [len(r) for r in linear[:args.api_queries]]
+
+    print(f"{args.orders} resting orders, queries for orders more than {fraction:%} from mid")
+    for label, elapsed, queries in (('list_orders', api_time, args.api_queries),
+                                    ('linear scan', linear_time, args.queries),
+                                    ('order book', indexed_time, args.queries)):
+        print(f"{label:>12}: {elapsed / queries * 1e3:9.3f}ms/query")
+
+
+if __name__ == '__main__':
+    main()
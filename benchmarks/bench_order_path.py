@@ -0,0 +1,264 @@
+"""Benchmark the order placement hot path against a local mock transport.
+
+Runs every order entry point through a PaperTradingClient and records, per
+order, the wall time, CPU time and REST calls by endpoint. It also times
+Decimal sizing and order log formatting in isolation and measures the hit
+rates of the product, account and Fear and Greed caches over a mixed
+workload.
+
+Results are compared with a JSON baseline. Any increase in calls per order
+or drop in cache hit rate is a regression, as is any timing more than
+`--tolerance` above the baseline.
+
+Usage:
+    python benchmarks/bench_order_path.py                  # compare with the baseline
+    python benchmarks/bench_order_path.py --update         # write a new baseline
+    python benchmarks/bench_order_path.py --output run.json
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+from coinbase_advanced_trader.models import OrderSide
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.services.fear_and_greed_provider import FearAndGreedProvider
+from coinbase_advanced_trader.sizing import SizingKernel
+
+BASELINE_PATH = Path(__file__).parent / 'baselines' / 'order_path.json'
+PRODUCT_ID = 'BTC-USDC'
+# Workload rounds for the hit rates; fixed so the one cold miss weighs the same every run.
+CACHE_ROUNDS = 50
+
+OPERATIONS: Dict[str, Callable[[PaperTradingClient], Any]] = {
+    'fiat_market_buy': lambda client: client.fiat_market_buy(PRODUCT_ID, '10'),
+    'fiat_limit_buy': lambda client: client.fiat_limit_buy(PRODUCT_ID, '10'),
+    'fiat_market_sell': lambda client: client.fiat_market_sell(PRODUCT_ID, '10'),
+    'trade_based_on_fgi': lambda client: client.trade_based_on_fgi(PRODUCT_ID, '10'),
+}
+
+
+class StaticFearAndGreedIndex:
+    """Fear and Greed client returning a fixed reading and counting fetches."""
+
+    def __init__(self, value: int = 25) -> None:
+        self.value = value
+        self.fetches = 0
+
+    def get_current_data(self) -> Dict[str, Any]:
+        self.fetches += 1
+        return {'value': self.value, 'value_classification': 'Fear',
+                'timestamp': int(time.time()), 'time_until_update': 3600}
+
+
+@contextlib.contextmanager
+def formatted_logging() -> Iterator[None]:
+    """Format package log records as usual but write them to the null device."""
+    package_logger = logging.getLogger('coinbase_advanced_trader')
+    handlers = package_logger.handlers[:]
+    with open(os.devnull, 'w') as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        package_logger.handlers = [handler]
+        try:
+            yield
+        finally:
+            package_logger.handlers = handlers
+
+
+def make_client() -> PaperTradingClient:
+    """Create a client on a fresh exchange with ample balances."""
+    exchange = SimulatedExchange(balances={'USDC': '1000000000', 'BTC': '100000'})
+    exchange.add_product(PRODUCT_ID, '61536.12')
+    return PaperTradingClient(
+        exchange, fgi_provider=FearAndGreedProvider(client=StaticFearAndGreedIndex())
+    )
+
+
+def measure_operation(operation: Callable[[PaperTradingClient], Any],
+                      iterations: int) -> Dict[str, Any]:
+    """Measure steady-state wall time, CPU time and REST calls per order."""
+    client = make_client()
+    operation(client)
+    client.session.reset_counts()
+
+    wall = []
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation(client)
+        wall.append(time.perf_counter() - start)
+    cpu = time.process_time() - cpu_start
+
+    return {
+        'requests_per_order': client.session.request_count / iterations,
+        'endpoints': {endpoint: count / iterations
+                      for endpoint, count in sorted(client.session.calls.items())},
+        'wall_us': statistics.median(wall) * 1e6,
+        'cpu_us': cpu / iterations * 1e6,
+    }
+
+
+def measure_cpu(iterations: int) -> Dict[str, float]:
+    """Time limit order sizing and order log formatting in isolation."""
+    fiat_amount = Decimal('10')
+    spot_price = Decimal('61536.12')
+    multiplier = Decimal('0.9995')
+    kernel = SizingKernel(PRODUCT_ID, '0.00000001', '0.01')
+
+    start = time.process_time()
+    for _ in range(iterations):
+        kernel.limit_order(fiat_amount, spot_price * multiplier, OrderSide.BUY)
+    sizing = time.process_time() - start
+
+    client = make_client()
+    order_service = client._order_service
+    response = {'success': True, 'success_response': {'order_id': 'benchmark'}}
+    order_service.price_service.get_product_details(PRODUCT_ID)
+    start = time.process_time()
+    for _ in range(iterations):
+        order_service._log_order_result(response, PRODUCT_ID, '10', '61505.35', OrderSide.BUY)
+    formatting = time.process_time() - start
+
+    return {
+        'decimal_sizing_us': sizing / iterations * 1e6,
+        'log_formatting_us': formatting / iterations * 1e6,
+    }
+
+
+def measure_cache_hit_rates(rounds: int = CACHE_ROUNDS) -> Dict[str, float]:
+    """Run a mixed workload from a cold client and report cache hit rates."""
+    client = make_client()
+    price_service = client._price_service
+    account_service = client._account_service
+    provider = client._fear_and_greed_strategy.fgi_provider
+    lookups = {'product_details': 0, 'accounts': 0, 'fear_and_greed': 0}
+    misses = {'product_details': 0}
+
+    # Increments are cached as sizing kernels, so kernel lookups count here.
+    get_sizing_kernel = price_service.get_sizing_kernel
+    get_accounts = account_service._get_accounts
+    get_reading = provider.get_reading
+
+    def counted_sizing_kernel(product_id):
+        lookups['product_details'] += 1
+        if product_id not in price_service._kernels:
+            misses['product_details'] += 1
+        return get_sizing_kernel(product_id)
+
+    def counted_accounts(*args, **kwargs):
+        lookups['accounts'] += 1
+        return get_accounts(*args, **kwargs)
+
+    def counted_reading():
+        lookups['fear_and_greed'] += 1
+        return get_reading()
+
+    price_service.get_sizing_kernel = counted_sizing_kernel
+    account_service._get_accounts = counted_accounts
+    provider.get_reading = counted_reading
+
+    for _ in range(rounds):
+        for operation in OPERATIONS.values():
+            operation(client)
+        client.get_crypto_balance('BTC')
+
+    misses['accounts'] = client.session.calls['GET accounts']
+    misses['fear_and_greed'] = provider._client.fetches
+    return {name: 1 - misses[name] / lookups[name] if lookups[name] else 0.0
+            for name in lookups}
+
+
+def run(iterations: int) -> Dict[str, Any]:
+    """Run the whole suite."""
+    with formatted_logging():
+        return {
+            'environment': {
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+            },
+            'iterations': iterations,
+            'operations': {name: measure_operation(operation, iterations)
+                           for name, operation in OPERATIONS.items()},
+            'cpu': measure_cpu(iterations * 10),
+            'cache_hit_rate': measure_cache_hit_rates(),
+        }
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float) -> list:
+    """Return a list of human-readable regressions against the baseline."""
+    regressions = []
+    for name, expected in baseline['operations'].items():
+        actual = result['operations'].get(name)
+        if actual is None:
+            regressions.append(f"{name}: missing from results")
+            continue
+        if actual['requests_per_order'] > expected['requests_per_order']:
+            regressions.append(
+                f"{name}: {actual['requests_per_order']:g} requests per order "
+                f"(baseline {expected['requests_per_order']:g}; {actual['endpoints']})")
+        for metric in ('wall_us', 'cpu_us'):
+            if actual[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {actual[metric]:.1f} "
+                                   f"(baseline {expected[metric]:.1f})")
+    for metric, expected in baseline['cpu'].items():
+        if result['cpu'][metric] > expected * (1 + tolerance):
+            regressions.append(f"{metric} {result['cpu'][metric]:.2f} (baseline {expected:.2f})")
+    for cache, expected in baseline['cache_hit_rate'].items():
+        if result['cache_hit_rate'][cache] < expected - 0.01:
+            regressions.append(f"{cache} cache hit rate {result['cache_hit_rate'][cache]:.2%} "
+                               f"(baseline {expected:.2%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown before a timing counts as a regression')
+    parser.add_argument('--update', action='store_true', help='overwrite the baseline')
+    parser.add_argument('--output', type=Path, help='also write the results here')
+    args = parser.parse_args()
+
+    result = run(args.iterations)
+    for name, stats in result['operations'].items():
+        print(f"{name:>20}: {stats['requests_per_order']:g} requests/order, "
+              f"{stats['wall_us']:.1f}us wall, {stats['cpu_us']:.1f}us cpu")
+    for metric, value in result['cpu'].items():
+        print(f"{metric:>20}: {value:.2f}us")
+    for cache, rate in result['cache_hit_rate'].items():
+        print(f"{cache + ' cache':>20}: {rate:.1%} hits")
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + '\n')
+    if args.update:
+        args.baseline.write_text(json.dumps(result, indent=2) + '\n')
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update to create one")
+        return
+
+    regressions = compare(result, json.loads(args.baseline.read_text()), args.tolerance)
+    if regressions:
+        print("Regressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("No regressions against the baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Load-test order placement against the local simulated exchange.
+
+Several threads place limit and market orders through PaperTradingClient
+while the reference price moves, optionally with injected latency.
+
+Usage:
+    python benchmarks/bench_paper_trading.py --threads 8 --orders 2000 --latency 0.05
+"""
+
+import argparse
+import logging
+import random
+import threading
+import time
+
+from coinbase_advanced_trader.paper_trading import (
+    LatencyModel,
+    PaperTradingClient,
+    SimulatedExchange
+)
+
+
+def _worker(client: PaperTradingClient, orders: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(orders):
+        if rng.random() < 0.8:
+            client.fiat_limit_buy('BTC-USDC', '10', price_multiplier=str(rng.uniform(0.98, 1.0)))
+        else:
+            client.fiat_market_buy('BTC-USDC', '10')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--orders', type=int, default=2000, help='orders per thread')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='median write latency in seconds')
+    args = parser.parse_args()
+    logging.getLogger('coinbase_advanced_trader').setLevel(logging.WARNING)
+
+    exchange = SimulatedExchange(balances={'USDC': '1000000000'})
+    exchange.add_product('BTC-USDC', '60000')
+    latency = LatencyModel(read=args.latency / 2, write=args.latency) if args.latency else None
+    clients = [PaperTradingClient(exchange, latency=latency) for _ in range(args.threads)]
+
+    stop = threading.Event()
+
+    def move_price():
+        rng = random.Random(0)
+        price = 60000.0
+        while not stop.wait(0.01):
+            price *= 1 + rng.gauss(0, 0.001)
+            exchange.set_price('BTC-USDC', f"{price:.2f}")
+
+    mover = threading.Thread(target=move_price)
+    workers = [threading.Thread(target=_worker, args=(client, args.orders, i))
+               for i, client in enumerate(clients)]
+    start = time.perf_counter()
+    mover.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    mover.join()
+
+    total = args.threads * args.orders
+    requests = sum(client.session.request_count for client in clients)
+    print(f"{total} orders ({requests} requests) on {args.threads} threads in {elapsed:.2f}s: "
+          f"{total / elapsed:.0f} orders/s")
+
+
+if __name__ == '__main__':
+    main()
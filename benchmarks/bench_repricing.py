@@ -0,0 +1,120 @@
+"""Compare resting, naively requoted and repriced limit buys in a rising market.
+
+Places limit buys at BUY_PRICE_MULTIPLIER-style discounts on a paper
+trading exchange, then moves the price along a drifting random walk. Each
+strategy sees the same walk:
+
+* static: the orders never move (today's behaviour);
+* cancel/replace: every step cancels every open order and places it again
+  at the best bid;
+* repricer: `Repricer` edits orders behind the best bid, with a minimum
+  move and a requote budget.
+
+Reports how many orders filled, after how many steps, at what premium over
+their original price, and how many order requests each strategy sent.
+
+Usage:
+    python benchmarks/bench_repricing.py --orders 20 --steps 300
+"""
+
+import argparse
+import logging
+import random
+from decimal import Decimal
+from statistics import mean
+
+from coinbase_advanced_trader.instrumentation import InMemoryInstrumentation
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.repricing import RepricingPolicy
+from coinbase_advanced_trader.resilience import RateLimiter
+
+PRODUCT = 'BTC-USDC'
+
+
+def walk(steps: int, seed: int, drift: float, volatility: float):
+    rng = random.Random(seed)
+    price = 60000.0
+    prices = []
+    for _ in range(steps):
+        price *= 1 + drift + rng.gauss(0, volatility)
+        prices.append(f"{price:.2f}")
+    return prices
+
+
+def run(strategy: str, args, prices):
+    exchange = SimulatedExchange(balances={'USDC': '1000000'})
+    exchange.add_product(PRODUCT, '60000', spread='0.0004')
+    instrumentation = InMemoryInstrumentation()
+    client = PaperTradingClient(exchange, instrumentation=instrumentation)
+    rng = random.Random(args.seed)
+    orders = [client.fiat_limit_buy(PRODUCT, '100', price_multiplier=str(rng.uniform(0.995, 0.9995)))
+              for _ in range(args.orders)]
+    original = {order.id: order.price for order in orders}
+    instrumentation.reset()
+
+    repricer = None
+    if strategy == 'repricer':
+        clock = [0.0]
+        repricer = client.repricer(RepricingPolicy(max_chase=Decimal('0.02')))
+        repricer.rate_limiter = RateLimiter(args.budget, args.budget * 2, clock=lambda: clock[0])
+        for order in orders:
+            repricer.chase(order)
+    filled_at = {}
+    for step, price in enumerate(prices):
+        exchange.set_price(PRODUCT, price)
+        for order in client.list_orders(order_ids=[o.id for o in orders])['orders']:
+            if order['status'] == 'FILLED' and order['order_id'] not in filled_at:
+                filled_at[order['order_id']] = (step, Decimal(order['average_filled_price']))
+        open_orders = [order for order in orders if order.id not in filled_at]
+        if not open_orders:
+            break
+        if strategy == 'cancel/replace':
+            bid = Decimal(client.get_best_bid_ask(product_ids=[PRODUCT])
+                          ['pricebooks'][0]['bids'][0]['price'])
+            replacements = []
+            for order in open_orders:
+                if order.price >= bid:
+                    continue
+                replacement = client._order_service.replace_limit_order(order, bid)
+                if replacement is not None:
+                    original[replacement.id] = original[order.id]
+                    replacements.append((order, replacement))
+            for order, replacement in replacements:
+                orders[orders.index(order)] = replacement
+        elif strategy == 'repricer':
+            clock[0] += 1
+            for requote in repricer.reprice():
+                if requote.replaced is not None:
+                    original[requote.order.id] = original[requote.replaced.id]
+
+    writes = sum(entry['count'] for entry in instrumentation.snapshot()['requests']
+                 if entry['endpoint'].startswith('POST'))
+    steps = [step for step, _ in filled_at.values()]
+    premium = [(price / original[order_id] - 1) * 100
+               for order_id, (_, price) in filled_at.items()]
+    return len(filled_at), steps, premium, writes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=20)
+    parser.add_argument('--steps', type=int, default=300)
+    parser.add_argument('--drift', type=float, default=0.0002, help='mean move per step')
+    parser.add_argument('--volatility', type=float, default=0.0005)
+    parser.add_argument('--budget', type=float, default=5, help='repricer requotes per step')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    logging.getLogger('coinbase_advanced_trader').setLevel(logging.WARNING)
+
+    prices = walk(args.steps, args.seed, args.drift, args.volatility)
+    print(f"{args.orders} limit buys, {args.steps} steps, drift {args.drift:+.2%}/step")
+    for strategy in ('static', 'cancel/replace', 'repricer'):
+        filled, steps, premium, writes = run(strategy, args, prices)
+        print(f"{strategy:>15}: {filled:3d} filled"
+              f"  mean steps {mean(steps) if steps else float('nan'):6.1f}"
+              f"  mean premium {mean(premium) if premium else float('nan'):6.3f}%"
+              f"  order requests {writes:5d}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark shared market data cache read latency under contention.
+
+One feeder process republishes a set of products as fast as it can while
+several reader processes read random products from the same cache. Each
+reader reports its read latency percentiles.
+
+Usage:
+    python benchmarks/bench_shared_cache.py --readers 8 --reads 200000
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from decimal import Decimal
+
+from coinbase_advanced_trader.shared_cache import SharedMarketDataCache
+
+PRODUCTS = [f"P{i}-USDC" for i in range(64)]
+
+
+def _feeder(name: str, stop) -> None:
+    cache = SharedMarketDataCache(name)
+    price = 0
+    while not stop.is_set():
+        price += 1
+        for product_id in PRODUCTS:
+            cache.publish(product_id, Decimal(price), Decimal('0.00000001'), Decimal('0.01'))
+    cache.close()
+
+
+def _reader(name: str, reads: int, results) -> None:
+    cache = SharedMarketDataCache(name)
+    rng = random.Random(os.getpid())
+    latencies = []
+    for _ in range(reads):
+        product_id = rng.choice(PRODUCTS)
+        start = time.perf_counter_ns()
+        cache.get(product_id)
+        latencies.append(time.perf_counter_ns() - start)
+    cache.close()
+    latencies.sort()
+    results.put((
+        latencies[len(latencies) // 2],
+        latencies[int(len(latencies) * 0.99)],
+        latencies[-1]
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--reads', type=int, default=100000)
+    args = parser.parse_args()
+
+    name = f"cbat_bench_{os.getpid()}"
+    with SharedMarketDataCache(name, slots=len(PRODUCTS) * 2, create=True) as cache:
+        for product_id in PRODUCTS:
+            cache.publish(product_id, Decimal('1'), Decimal('0.00000001'), Decimal('0.01'))
+
+        stop = multiprocessing.Event()
+        results = multiprocessing.Queue()
+        feeder = multiprocessing.Process(target=_feeder, args=(name, stop))
+        readers = [multiprocessing.Process(target=_reader, args=(name, args.reads, results))
+                   for _ in range(args.readers)]
+        feeder.start()
+        for reader in readers:
+            reader.start()
+        stats = [results.get() for _ in readers]
+        for reader in readers:
+            reader.join()
+        stop.set()
+        feeder.join()
+
+    print(f"{args.readers} readers x {args.reads} reads, 1 concurrent feeder")
+    for i, (p50, p99, worst) in enumerate(stats):
+        print(f"  reader {i}: p50={p50 / 1000:.2f}us p99={p99 / 1000:.2f}us max={worst / 1000:.2f}us")
+
+
+if __name__ == '__main__':
+    main()
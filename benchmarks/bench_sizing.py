@@ -0,0 +1,83 @@
+"""Compare per-order Decimal sizing with sizing kernels.
+
+Sizes a fan-out of limit buys (each amount bought on several accounts, at
+a few reference prices) three ways: the previous per-order code (increments
+parsed from product details on every order, size rounded half up),
+`SizingKernel.limit_order` one order at a time, and the batched
+`SizingKernel.limit_orders`. Also counts orders whose size * price
+exceeded the fiat amount under half-up rounding.
+
+Usage:
+    python benchmarks/bench_sizing.py --prices 4 --amounts 50 --accounts 50
+"""
+
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+from coinbase_advanced_trader.models import OrderSide
+from coinbase_advanced_trader.sizing import SizingKernel
+
+DETAILS = {'base_increment': '0.00000001', 'quote_increment': '0.01'}
+
+
+def half_up_sizing(fiat_amount: Decimal, price: Decimal):
+    base_increment = Decimal(DETAILS['base_increment'])
+    quote_increment = Decimal(DETAILS['quote_increment'])
+    price = price.quantize(quote_increment)
+    return price, (fiat_amount / price).quantize(base_increment, rounding=ROUND_HALF_UP)
+
+
+def best_time(call, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--prices', type=int, default=4, help='distinct reference prices')
+    parser.add_argument('--amounts', type=int, default=50, help='distinct fiat amounts per price')
+    parser.add_argument('--accounts', type=int, default=50, help='orders per amount and price')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    spot = Decimal('61536.12')
+    fiat_amounts, prices = [], []
+    for _ in range(args.prices):
+        price = spot * (1 - Decimal(rng.randint(0, 40)) / 10000)
+        for _ in range(args.amounts):
+            amount = Decimal(rng.randint(500, 50000)) / 100
+            fiat_amounts += [amount] * args.accounts
+            prices += [price] * args.accounts
+    orders = len(fiat_amounts)
+    kernel = SizingKernel.from_details('BTC-USDC', DETAILS)
+
+    old, old_time = best_time(lambda: [half_up_sizing(amount, price)
+                                       for amount, price in zip(fiat_amounts, prices)],
+                              args.repeat)
+    single, single_time = best_time(lambda: [kernel.limit_order(amount, price, OrderSide.BUY)
+                                             for amount, price in zip(fiat_amounts, prices)],
+                                    args.repeat)
+    batch, batch_time = best_time(
+        lambda: kernel.limit_orders(fiat_amounts, prices, OrderSide.BUY), args.repeat
+    )
+    assert single == batch
+
+    over_budget = sum(price * size > amount for (price, size), amount in zip(old, fiat_amounts))
+    print(f"{orders} orders ({args.prices} prices x {args.amounts} amounts x "
+          f"{args.accounts} accounts)")
+    for label, elapsed in (('half-up per order', old_time), ('kernel per order', single_time),
+                           ('kernel batch', batch_time)):
+        print(f"{label:>18}: {elapsed * 1e3:8.2f}ms  {elapsed / orders * 1e6:6.2f}us/order")
+    print(f"half-up sizes over the fiat amount: {over_budget} of {orders}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark a parallel FGI schedule sweep on synthetic data.
+
+Usage:
+    python benchmarks/bench_sweep.py --years 8 --workers 16
+"""
+
+import argparse
+import os
+import time
+
+from bench_backtest import _synthetic
+
+from coinbase_advanced_trader.backtesting import ScheduleSweep, format_results, schedule_grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    candles, fgi = _synthetic(args.years * 365)
+    schedules = list(schedule_grid(
+        buy_thresholds=range(5, 50, 5), buy_factors=[0.5, 1.0, 1.5, 2.0],
+        sell_thresholds=range(55, 100, 5), sell_factors=[0.5, 1.0, 2.0],
+        max_buy_rules=2, max_sell_rules=1
+    ))
+    sweep = ScheduleSweep(candles, fgi, max_workers=args.workers, fiat_amount=10,
+                          buy_price_multiplier='0.995', sell_price_multiplier='1.005')
+
+    start = time.perf_counter()
+    results = sweep.run(schedules)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(results)} schedules x {len(candles)} candles on {args.workers} workers: "
+          f"{elapsed:.2f}s ({len(results) / elapsed:.0f} schedules/s)")
+    print(format_results(results, limit=10))
+
+
+if __name__ == '__main__':
+    main()
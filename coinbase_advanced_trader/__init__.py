@@ -1,4 +1,28 @@
-from .enhanced_rest_client import EnhancedRESTClient
-from .alphasquared_trader import AlphaSquaredTrader
+"""Coinbase Advanced Trader.
 
-__all__ = ['EnhancedRESTClient', 'AlphaSquaredTrader']
\ No newline at end of file
+The public classes are imported lazily on first attribute access so that
+``import coinbase_advanced_trader`` does not pull in the Coinbase SDK or
+third-party strategy clients until they are actually used.
+"""
+
+from importlib import import_module
+
+_LAZY_ATTRIBUTES = {
+    'EnhancedRESTClient': '.enhanced_rest_client',
+    'AlphaSquaredTrader': '.alphasquared_trader',
+    'ClientPool': '.client_pool',
+}
+
+__all__ = ['EnhancedRESTClient', 'AlphaSquaredTrader', 'ClientPool']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
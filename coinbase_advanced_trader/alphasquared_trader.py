@@ -1,22 +1,32 @@
 from decimal import Decimal, ROUND_DOWN
 import logging
-from .enhanced_rest_client import EnhancedRESTClient
-from alphasquared import AlphaSquared
+from typing import TYPE_CHECKING
+from coinbase_advanced_trader.instrumentation.hooks import instrumentation_of
+from coinbase_advanced_trader.instrumentation.tracing import traced
 from coinbase_advanced_trader.models import Order
+from coinbase_advanced_trader.utils import generate_client_order_id
+
+if TYPE_CHECKING:
+    from alphasquared import AlphaSquared
+    from .enhanced_rest_client import EnhancedRESTClient
 
 logger = logging.getLogger(__name__)
 
 class AlphaSquaredTrader:
-    def __init__(self, coinbase_client: EnhancedRESTClient, alphasquared_client: AlphaSquared):
+    def __init__(self, coinbase_client: 'EnhancedRESTClient', alphasquared_client: 'AlphaSquared'):
         self.coinbase_client = coinbase_client
         self.alphasquared_client = alphasquared_client
 
+    @traced('product_id', 'strategy_name', client=lambda self: self.coinbase_client)
     def execute_strategy(self, product_id: str, strategy_name: str):
         try:
             asset, base_currency = product_id.split('-')
             
             current_risk = self.alphasquared_client.get_current_risk(asset)
             logger.info(f"Current {asset} Risk: {current_risk}")
+            instrumentation = instrumentation_of(self.coinbase_client)
+            if instrumentation is not None:
+                instrumentation.on_signal('alphasquared_risk', current_risk, asset)
             
             action, value = self.alphasquared_client.get_strategy_value_for_risk(strategy_name, current_risk)
             logger.info(f"Strategy suggests: Action = {action.upper()}, Value = {value}")
@@ -64,7 +74,7 @@ class AlphaSquaredTrader:
             limit_price = (current_price * Decimal('1.005')).quantize(quote_increment, rounding=ROUND_DOWN)
             
             order = self.coinbase_client.limit_order_gtc_sell(
-                client_order_id=self.coinbase_client._order_service._generate_client_order_id(),
+                client_order_id=generate_client_order_id(),
                 product_id=product_id,
                 base_size=str(sell_amount),
                 limit_price=str(limit_price)
@@ -0,0 +1,36 @@
+"""Offline backtesting tools for Coinbase Advanced Trader strategies.
+
+Requires NumPy (`pip install coinbase-advancedtrade-python[backtest]`).
+"""
+
+from .alphasquared_replay import (
+    AlphaSquaredReplay,
+    ReplayAlphaSquaredClient,
+    SimulatedCoinbaseClient
+)
+from .data import (
+    Candles,
+    DailySeries,
+    FearAndGreedHistory,
+    align_fear_and_greed,
+    align_series,
+    load_candles,
+    load_fear_and_greed,
+    load_series
+)
+from .fgi_backtest import (
+    BacktestResult,
+    FearAndGreedBacktester,
+    SimulatedTrade,
+    evaluate_schedule
+)
+from .sweep import ScheduleSweep, SweepResult, SweepResults, format_results, schedule_grid
+
+__all__ = [
+    'AlphaSquaredReplay', 'ReplayAlphaSquaredClient', 'SimulatedCoinbaseClient',
+    'Candles', 'DailySeries', 'FearAndGreedHistory', 'align_fear_and_greed',
+    'align_series', 'load_candles', 'load_fear_and_greed', 'load_series',
+    'BacktestResult', 'FearAndGreedBacktester', 'SimulatedTrade',
+    'evaluate_schedule', 'ScheduleSweep', 'SweepResult', 'SweepResults', 'format_results',
+    'schedule_grid'
+]
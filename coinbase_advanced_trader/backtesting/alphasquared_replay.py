@@ -0,0 +1,296 @@
+"""Offline replay of `AlphaSquaredTrader` over historical data.
+
+The unmodified trader is driven one candle at a time. A replay AlphaSquared
+client serves the historical risk value for the current day, and a simulated
+Coinbase client stands in for `EnhancedRESTClient`: limit buys go through the
+real `OrderService` sizing and pricing code, sells go through the trader's
+own percentage-of-balance logic, and resting orders fill against the
+following candles' ranges.
+"""
+
+import logging
+from contextlib import contextmanager, nullcontext
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from coinbase_advanced_trader.alphasquared_trader import AlphaSquaredTrader
+from coinbase_advanced_trader.models import Order, OrderSide
+from coinbase_advanced_trader.services.fee_service import DEFAULT_FEE_TIER, FeeService
+from coinbase_advanced_trader.services.order_service import OrderService
+from coinbase_advanced_trader.services.price_service import PriceService
+from .data import Candles
+from .fgi_backtest import BacktestResult, SimulatedTrade
+
+Number = Union[float, Decimal, str]
+Strategy = Callable[[float], Tuple[str, float]]
+
+
+class ReplayAlphaSquaredClient:
+    """Serves a historical risk series in place of the AlphaSquared API."""
+
+    def __init__(self, risk: np.ndarray, strategy: Strategy) -> None:
+        """
+        Initialize the replay client.
+
+        Args:
+            risk: One risk value per candle (see `align_series`).
+            strategy: Maps a risk value to an (action, value) pair, as
+                `AlphaSquared.get_strategy_value_for_risk` does for a named
+                strategy.
+        """
+        self.risk = risk
+        self.strategy = strategy
+        self.day = 0
+
+    def get_current_risk(self, asset: str) -> float:
+        """Return the risk value of the current replay day."""
+        return float(self.risk[self.day])
+
+    def get_strategy_value_for_risk(self, strategy_name: str,
+                                    risk: float) -> Tuple[str, float]:
+        """Return the strategy's action and value for the risk."""
+        if np.isnan(risk):
+            return 'none', 0
+        return self.strategy(risk)
+
+
+class SimulatedCoinbaseClient:
+    """
+    Paper account exposing the `EnhancedRESTClient` methods used by
+    `AlphaSquaredTrader`.
+
+    Orders placed on a day rest until a later candle's range reaches their
+    limit price and then fill at that price, paying `fee_rate`. The quote
+    balance may go negative; the deficit is the fiat contributed.
+    """
+
+    def __init__(self, candles: Candles, product_id: str,
+                 base_increment: Number = '0.00000001',
+                 quote_increment: Number = '0.01',
+                 fee_rate: Optional[Number] = None,
+                 initial_quote_balance: Number = 0,
+                 initial_base_balance: Number = 0,
+                 order_ttl: Optional[int] = None,
+                 fee_rates: Optional[Callable[[str], Tuple[Decimal, Decimal]]] = None) -> None:
+        """
+        Initialize the simulated client.
+
+        Args:
+            candles: Daily candles to trade against.
+            product_id: The product being replayed, e.g. 'BTC-USDC'.
+            base_increment: Base size increment of the product.
+            quote_increment: Price increment of the product.
+            fee_rate: Fee charged on every fill. Defaults to the maker rate
+                from `fee_rates`, or to the lowest tier's maker rate without it.
+            initial_quote_balance: Starting quote balance.
+            initial_base_balance: Starting base balance.
+            order_ttl: Days an order rests before it is cancelled; None
+                keeps orders open until filled, like GTC orders.
+            fee_rates: Returns the (maker, taker) fee rates of a product,
+                e.g. `client.fee_service.get_fee_rates`, so the replay pays
+                the same rates live orders are sized with.
+        """
+        self.candles = candles
+        self.product_id = product_id
+        self.base_currency, self.quote_currency = product_id.split('-')
+        self.base_increment = Decimal(str(base_increment))
+        self.quote_increment = Decimal(str(quote_increment))
+        if fee_rate is None:
+            fee_rate = (fee_rates(product_id)[0] if fee_rates is not None
+                        else DEFAULT_FEE_TIER.maker_fee_rate)
+        self.fee_rate = Decimal(str(fee_rate))
+        self.balances = {
+            self.quote_currency: Decimal(str(initial_quote_balance)),
+            self.base_currency: Decimal(str(initial_base_balance)),
+        }
+        self.order_ttl = order_ttl
+        self.day = 0
+        self.open_orders: List[Dict[str, Any]] = []
+        self.fills: List[SimulatedTrade] = []
+        self._order_count = 0
+        self._order_service = OrderService(self, PriceService(self, max_price_age=0),
+                                           FeeService(self))
+
+    # EnhancedRESTClient interface used by AlphaSquaredTrader
+
+    def fiat_limit_buy(self, product_id: str, fiat_amount: str,
+                       limit_price: Optional[str] = None,
+                       price_multiplier: Optional[float] = None) -> Order:
+        """Place a limit buy through the real OrderService sizing code."""
+        return self._order_service.fiat_limit_buy(product_id, fiat_amount,
+                                                  limit_price, price_multiplier)
+
+    def get_crypto_balance(self, currency: str) -> Decimal:
+        """Return the balance not held by open sell orders."""
+        balance = self.balances.get(currency, Decimal('0'))
+        if currency == self.base_currency:
+            balance -= sum((order['size'] for order in self.open_orders
+                            if order['side'] == OrderSide.SELL), Decimal('0'))
+        return balance
+
+    def get_product(self, product_id: str) -> Dict[str, str]:
+        """Return the product with the current day's close as its price."""
+        return {
+            'product_id': product_id,
+            'price': str(self.candles.close[self.day]),
+            'base_increment': str(self.base_increment),
+            'quote_increment': str(self.quote_increment),
+        }
+
+    def limit_order_gtc_buy(self, client_order_id: str, product_id: str,
+                            base_size: str, limit_price: str) -> Dict[str, Any]:
+        """Rest a limit buy order."""
+        return self._rest_order(client_order_id, OrderSide.BUY, base_size, limit_price)
+
+    def limit_order_gtc_sell(self, client_order_id: str, product_id: str,
+                             base_size: str, limit_price: str) -> Dict[str, Any]:
+        """Rest a limit sell order."""
+        return self._rest_order(client_order_id, OrderSide.SELL, base_size, limit_price)
+
+    def get_transaction_summary(self) -> Dict[str, Any]:
+        """Return `fee_rate` as both the maker and taker rate."""
+        return {'fee_tier': {'pricing_tier': 'Replay',
+                             'maker_fee_rate': str(self.fee_rate),
+                             'taker_fee_rate': str(self.fee_rate)}}
+
+    # Simulation
+
+    def _rest_order(self, client_order_id: str, side: OrderSide, base_size: str,
+                    limit_price: str) -> Dict[str, Any]:
+        self._order_count += 1
+        order_id = f"replay-{self._order_count}"
+        self.open_orders.append({
+            'order_id': order_id,
+            'client_order_id': client_order_id,
+            'side': side,
+            'size': Decimal(base_size),
+            'price': Decimal(limit_price),
+            'placed': self.day,
+        })
+        return {'success': True, 'success_response': {'order_id': order_id}}
+
+    def advance(self, day: int) -> None:
+        """
+        Move to a new day, filling or expiring the orders resting from earlier days.
+
+        Args:
+            day: Index of the candle to move to.
+        """
+        self.day = day
+        low = self.candles.low[day]
+        high = self.candles.high[day]
+        still_open = []
+        for order in self.open_orders:
+            price = float(order['price'])
+            if order['side'] == OrderSide.BUY:
+                filled = low <= price
+            else:
+                filled = high >= price
+            if filled:
+                self._fill(order)
+            elif self.order_ttl is None or day - order['placed'] < self.order_ttl:
+                still_open.append(order)
+        self.open_orders = still_open
+
+    def _fill(self, order: Dict[str, Any]) -> None:
+        size, price = order['size'], order['price']
+        notional = size * price
+        fee = notional * self.fee_rate
+        if order['side'] == OrderSide.BUY:
+            self.balances[self.base_currency] += size
+            self.balances[self.quote_currency] -= notional + fee
+        else:
+            self.balances[self.base_currency] -= size
+            self.balances[self.quote_currency] += notional - fee
+        self.fills.append(SimulatedTrade(
+            int(self.candles.timestamp[self.day]), order['side'],
+            float(price), float(size), float(fee)
+        ))
+
+
+@contextmanager
+def _quiet_logging(level: int = logging.WARNING) -> Iterator[None]:
+    """Silence the package's per-order info logging for the duration of a replay."""
+    package_logger = logging.getLogger('coinbase_advanced_trader')
+    previous = package_logger.level
+    package_logger.setLevel(level)
+    try:
+        yield
+    finally:
+        package_logger.setLevel(previous)
+
+
+class AlphaSquaredReplay:
+    """Replays `AlphaSquaredTrader.execute_strategy` once per historical candle."""
+
+    def __init__(self, candles: Candles, risk: np.ndarray, strategy: Strategy,
+                 product_id: str = 'BTC-USDC', quiet: bool = True,
+                 **client_settings) -> None:
+        """
+        Initialize the replay.
+
+        Args:
+            candles: Daily candles.
+            risk: One AlphaSquared risk value per candle.
+            strategy: Maps a risk value to an (action, value) pair.
+            product_id: The product to trade.
+            quiet: Suppress info-level logging while replaying.
+            **client_settings: Keyword arguments for `SimulatedCoinbaseClient`
+                (increments, fee_rate or fee_rates, starting balances,
+                order_ttl).
+
+        Raises:
+            ValueError: If `risk` and `candles` differ in length.
+        """
+        if len(risk) != len(candles):
+            raise ValueError("risk must contain one value per candle")
+        self.candles = candles
+        self.risk = np.asarray(risk, dtype=np.float64)
+        self.strategy = strategy
+        self.product_id = product_id
+        self.quiet = quiet
+        self.client_settings = client_settings
+
+    def run(self, strategy_name: str = 'replay') -> BacktestResult:
+        """
+        Run the replay.
+
+        Args:
+            strategy_name: Strategy name passed to the trader.
+
+        Returns:
+            BacktestResult: Balance path, equity, drawdown and fills.
+        """
+        coinbase_client = SimulatedCoinbaseClient(self.candles, self.product_id,
+                                                  **self.client_settings)
+        alphasquared_client = ReplayAlphaSquaredClient(self.risk, self.strategy)
+        trader = AlphaSquaredTrader(coinbase_client, alphasquared_client)
+        base, quote = coinbase_client.base_currency, coinbase_client.quote_currency
+        initial_cash = float(coinbase_client.balances[quote])
+
+        n = len(self.candles)
+        cash = np.empty(n)
+        holdings = np.empty(n)
+        with _quiet_logging() if self.quiet else nullcontext():
+            for day in range(n):
+                coinbase_client.advance(day)
+                alphasquared_client.day = day
+                trader.execute_strategy(self.product_id, strategy_name)
+                cash[day] = coinbase_client.balances[quote]
+                holdings[day] = coinbase_client.balances[base]
+
+        equity = cash + holdings * self.candles.close
+        fills = coinbase_client.fills
+        return BacktestResult(
+            timestamp=self.candles.timestamp,
+            equity=equity,
+            cash=cash,
+            holdings=holdings,
+            drawdown=equity - np.maximum.accumulate(equity),
+            trades=fills,
+            initial_cash=initial_cash,
+            trade_count=len(fills),
+            total_fees=float(sum(fill.fee for fill in fills))
+        )
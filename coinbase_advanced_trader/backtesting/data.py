@@ -0,0 +1,211 @@
+"""Offline market data loading for backtests.
+
+Candles and daily indicators such as the Fear and Greed Index or
+AlphaSquared risk are read from local CSV or Parquet files into NumPy
+arrays. Parquet support requires pandas with a Parquet engine installed.
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+_TIMESTAMP_COLUMNS = ('timestamp', 'start', 'time', 'date')
+
+
+@dataclass(frozen=True)
+class Candles:
+    """
+    Daily OHLCV candles as parallel arrays, sorted by timestamp.
+
+    Attributes:
+        timestamp (np.ndarray): Unix timestamps (int64) of each candle start.
+        open (np.ndarray): Open prices.
+        high (np.ndarray): High prices.
+        low (np.ndarray): Low prices.
+        close (np.ndarray): Close prices.
+        volume (np.ndarray): Traded volume.
+    """
+
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+@dataclass(frozen=True)
+class DailySeries:
+    """
+    A daily indicator such as the Fear and Greed Index or AlphaSquared risk,
+    sorted by timestamp.
+
+    Attributes:
+        timestamp (np.ndarray): Unix timestamps (int64) of each publication.
+        value (np.ndarray): Indicator values.
+    """
+
+    timestamp: np.ndarray
+    value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+FearAndGreedHistory = DailySeries
+
+
+def _parse_timestamp(value: str) -> int:
+    """Parse a unix timestamp or an ISO date/datetime into unix seconds."""
+    try:
+        return int(float(value))
+    except ValueError:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+
+def _read_columns(path: Union[str, Path]) -> Dict[str, List[str]]:
+    """Read a CSV or Parquet file into a dict of lower-cased column lists."""
+    path = Path(path)
+    if path.suffix.lower() in ('.parquet', '.pq'):
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("Reading Parquet files requires pandas and pyarrow") from e
+        frame = pd.read_parquet(path)
+        return {str(name).lower(): [str(value) for value in frame[name]]
+                for name in frame.columns}
+
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        raise ValueError(f"No rows found in {path}")
+    return {name.lower(): [row[name] for row in rows] for name in rows[0]}
+
+
+def _timestamps(columns: Dict[str, List[str]], path) -> np.ndarray:
+    for name in _TIMESTAMP_COLUMNS:
+        if name in columns:
+            return np.array([_parse_timestamp(value) for value in columns[name]],
+                            dtype=np.int64)
+    raise ValueError(f"{path} has no timestamp column (expected one of "
+                     f"{', '.join(_TIMESTAMP_COLUMNS)})")
+
+
+def load_candles(path: Union[str, Path]) -> Candles:
+    """
+    Load daily candles from a CSV or Parquet file.
+
+    The file needs a timestamp column (`timestamp`, `start`, `time` or
+    `date`) and `open`, `high`, `low`, `close` columns; `volume` is optional.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Candles: The candles sorted by timestamp.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    columns = _read_columns(path)
+    timestamp = _timestamps(columns, path)
+    order = np.argsort(timestamp, kind='stable')
+    fields = {}
+    for name in ('open', 'high', 'low', 'close', 'volume'):
+        if name not in columns:
+            if name == 'volume':
+                fields[name] = np.zeros(len(timestamp))
+                continue
+            raise ValueError(f"{path} has no {name} column")
+        fields[name] = np.array(columns[name], dtype=np.float64)[order]
+    return Candles(timestamp=timestamp[order], **fields)
+
+
+def load_series(path: Union[str, Path], column: str = 'value') -> DailySeries:
+    """
+    Load a daily indicator from a CSV or Parquet file.
+
+    Args:
+        path: Path to the file.
+        column: Name of the value column.
+
+    Returns:
+        DailySeries: The values sorted by timestamp.
+
+    Raises:
+        ValueError: If the timestamp or value column is missing.
+    """
+    columns = _read_columns(path)
+    timestamp = _timestamps(columns, path)
+    if column not in columns:
+        raise ValueError(f"{path} has no {column} column")
+    order = np.argsort(timestamp, kind='stable')
+    return DailySeries(
+        timestamp=timestamp[order],
+        value=np.array(columns[column], dtype=np.float64)[order]
+    )
+
+
+def load_fear_and_greed(path: Union[str, Path]) -> FearAndGreedHistory:
+    """
+    Load Fear and Greed Index history from a CSV or Parquet file.
+
+    The file needs a timestamp column and a `value` column, matching the
+    fields returned by the alternative.me API.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        FearAndGreedHistory: The history sorted by timestamp.
+
+    Raises:
+        ValueError: If the value column is missing.
+    """
+    return load_series(path)
+
+
+def align_series(candles: Candles, series: DailySeries) -> np.ndarray:
+    """
+    Map each candle to the latest value published on or before its day.
+
+    Args:
+        candles: The candles to align to.
+        series: The indicator history.
+
+    Returns:
+        np.ndarray: One value per candle, NaN before the first publication.
+    """
+    candle_days = candles.timestamp // SECONDS_PER_DAY
+    series_days = series.timestamp // SECONDS_PER_DAY
+    index = np.searchsorted(series_days, candle_days, side='right') - 1
+    aligned = np.full(len(candles), np.nan)
+    known = index >= 0
+    aligned[known] = series.value[index[known]]
+    return aligned
+
+
+def align_fear_and_greed(candles: Candles, history: FearAndGreedHistory) -> np.ndarray:
+    """
+    Map each candle to the latest FGI value published on or before its day.
+
+    Args:
+        candles: The candles to align to.
+        history: The Fear and Greed Index history.
+
+    Returns:
+        np.ndarray: One FGI value per candle, NaN before the first publication.
+    """
+    return align_series(candles, history)
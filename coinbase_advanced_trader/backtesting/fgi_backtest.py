@@ -0,0 +1,305 @@
+"""Vectorized backtest of the Fear and Greed Index strategy.
+
+Every candle the schedule is evaluated against that day's FGI value. A
+matching rule places a limit order at the close, priced with the same
+buy/sell multipliers as `OrderService.fiat_limit_buy`/`fiat_limit_sell`,
+and sized so it costs the scheduled fiat amount, fees included. The order
+fills on the first of the following `order_ttl` days whose range reaches
+the limit price and is cancelled otherwise. Sells are clipped to the
+holdings available when they fill, and every fill pays the maker fee.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from coinbase_advanced_trader import trading_config
+from coinbase_advanced_trader.models import OrderSide
+from coinbase_advanced_trader.services.fee_service import DEFAULT_FEE_TIER
+from coinbase_advanced_trader.trading_config import CompiledFGISchedule
+from .data import Candles
+
+Number = Union[float, Decimal, str]
+
+# Guards floor/ceil against values a hair off an exact tick.
+_TICK_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class SimulatedTrade:
+    """
+    A simulated fill.
+
+    Attributes:
+        timestamp (int): Unix timestamp of the candle the order filled in.
+        side (OrderSide): Buy or sell.
+        price (float): The limit price.
+        size (float): The filled base size.
+        fee (float): The fee paid in quote currency.
+    """
+
+    timestamp: int
+    side: OrderSide
+    price: float
+    size: float
+    fee: float
+
+
+@dataclass
+class BacktestResult:
+    """
+    Outcome of a backtest, with one entry per candle in the curves.
+
+    Attributes:
+        timestamp (np.ndarray): Candle timestamps.
+        equity (np.ndarray): Cash plus holdings valued at the close.
+        cash (np.ndarray): Quote currency balance; negative values are
+            fiat contributed beyond `initial_cash`.
+        holdings (np.ndarray): Base currency balance.
+        drawdown (np.ndarray): Equity minus its running peak (<= 0).
+        trades (List[SimulatedTrade]): Every fill in chronological order,
+            empty when the run did not record trades.
+        initial_cash (float): The starting quote balance.
+        trade_count (int): Number of fills.
+        total_fees (float): Sum of the fees paid on every fill.
+    """
+
+    timestamp: np.ndarray
+    equity: np.ndarray
+    cash: np.ndarray
+    holdings: np.ndarray
+    drawdown: np.ndarray
+    trades: List[SimulatedTrade] = field(default_factory=list)
+    initial_cash: float = 0.0
+    trade_count: int = 0
+    total_fees: float = 0.0
+
+    @property
+    def net_profit(self) -> float:
+        """Final equity minus the starting cash."""
+        return float(self.equity[-1] - self.initial_cash) if len(self.equity) else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        """Largest peak-to-trough equity decline in quote currency (<= 0)."""
+        return float(self.drawdown.min()) if len(self.drawdown) else 0.0
+
+    @property
+    def invested(self) -> float:
+        """Largest amount of fiat contributed beyond the starting cash."""
+        return float(max(0.0, -self.cash.min())) if len(self.cash) else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the headline statistics as a dict."""
+        return {
+            'final_equity': float(self.equity[-1]) if len(self.equity) else self.initial_cash,
+            'net_profit': self.net_profit,
+            'max_drawdown': self.max_drawdown,
+            'invested': self.invested,
+            'total_fees': self.total_fees,
+            'trades': self.trade_count,
+        }
+
+
+def evaluate_schedule(schedule: CompiledFGISchedule,
+                      fgi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate a compiled schedule for an array of FGI values.
+
+    Uses the same rule selection as `CompiledFGISchedule.evaluate`.
+
+    Args:
+        schedule: The compiled schedule.
+        fgi: FGI values; NaN never matches.
+
+    Returns:
+        Tuple of a side array (1 buy, -1 sell, 0 none) and a factor array.
+    """
+    fgi = np.asarray(fgi, dtype=np.float64)
+    side = np.zeros(len(fgi), dtype=np.int8)
+    factor = np.zeros(len(fgi))
+    known = ~np.isnan(fgi)
+
+    buy_rules = schedule.buy_rules
+    if buy_rules:
+        thresholds = np.array([rule.threshold for rule in buy_rules], dtype=np.float64)
+        factors = np.array([float(rule.factor) for rule in buy_rules])
+        index = np.searchsorted(thresholds, fgi, side='left')
+        is_buy = known & (index < len(buy_rules))
+        side[is_buy] = 1
+        factor[is_buy] = factors[index[is_buy]]
+
+    sell_rules = schedule.sell_rules
+    if sell_rules:
+        thresholds = np.array([rule.threshold for rule in sell_rules], dtype=np.float64)
+        factors = np.array([float(rule.factor) for rule in sell_rules])
+        index = np.searchsorted(thresholds, fgi, side='right') - 1
+        is_sell = known & (side == 0) & (index >= 0)
+        side[is_sell] = -1
+        factor[is_sell] = factors[index[is_sell]]
+
+    return side, factor
+
+
+class FearAndGreedBacktester:
+    """Simulates `FearAndGreedStrategy` over historical candles and FGI values."""
+
+    def __init__(
+        self,
+        schedule: Union[CompiledFGISchedule, List[Dict[str, Any]]],
+        fiat_amount: Number,
+        base_increment: Number = '0.00000001',
+        quote_increment: Number = '0.01',
+        fee_rate: Optional[Number] = None,
+        buy_price_multiplier: Optional[Number] = None,
+        sell_price_multiplier: Optional[Number] = None,
+        order_ttl: int = 1,
+        initial_cash: Number = 0,
+        fee_rates: Optional[Callable[[Optional[str]], Tuple[Decimal, Decimal]]] = None,
+        product_id: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the backtester.
+
+        Args:
+            schedule: The FGI schedule, compiled or as a list of rules.
+            fiat_amount: Fiat amount traded per signal before the factor.
+            base_increment: Base size increment of the product.
+            quote_increment: Price increment of the product.
+            fee_rate: Fee charged on every fill; buys are sized so it fits
+                in their fiat amount, like live limit buys. Defaults to the
+                maker rate from `fee_rates`, or to the lowest tier's maker
+                rate without it.
+            buy_price_multiplier: Limit price multiplier for buys. Defaults
+                to the configured BUY_PRICE_MULTIPLIER.
+            sell_price_multiplier: Limit price multiplier for sells. Defaults
+                to the configured SELL_PRICE_MULTIPLIER.
+            order_ttl: Number of days a limit order rests before it is cancelled.
+            initial_cash: Starting quote balance.
+            fee_rates: Returns the (maker, taker) fee rates of a product,
+                e.g. `client.fee_service.get_fee_rates`, so the backtest
+                pays the same rates live orders are sized with.
+            product_id: The product being backtested, passed to `fee_rates`.
+
+        Raises:
+            ValueError: If the schedule is invalid or order_ttl < 1.
+        """
+        if not isinstance(schedule, CompiledFGISchedule):
+            schedule = CompiledFGISchedule(schedule)
+        if order_ttl < 1:
+            raise ValueError("order_ttl must be at least one day")
+        self.schedule = schedule
+        self.fiat_amount = float(fiat_amount)
+        self.base_increment = float(base_increment)
+        self.quote_increment = float(quote_increment)
+        if fee_rate is None:
+            fee_rate = (fee_rates(product_id)[0] if fee_rates is not None
+                        else DEFAULT_FEE_TIER.maker_fee_rate)
+        self.fee_rate = float(fee_rate)
+        self.buy_price_multiplier = float(
+            trading_config.BUY_PRICE_MULTIPLIER if buy_price_multiplier is None
+            else buy_price_multiplier
+        )
+        self.sell_price_multiplier = float(
+            trading_config.SELL_PRICE_MULTIPLIER if sell_price_multiplier is None
+            else sell_price_multiplier
+        )
+        self.order_ttl = order_ttl
+        self.initial_cash = float(initial_cash)
+
+    def run(self, candles: Candles, fgi: np.ndarray,
+            record_trades: bool = True) -> BacktestResult:
+        """
+        Run the backtest.
+
+        Args:
+            candles: Daily candles.
+            fgi: One FGI value per candle (see `align_fear_and_greed`).
+            record_trades: Build the trade list. Disable when only the
+                curves and statistics are needed.
+
+        Returns:
+            BacktestResult: Curves, drawdown and trade list.
+
+        Raises:
+            ValueError: If `fgi` and `candles` differ in length.
+        """
+        n = len(candles)
+        if len(fgi) != n:
+            raise ValueError("fgi must contain one value per candle")
+
+        side, factor = evaluate_schedule(self.schedule, fgi)
+        # An order placed on the last candle has no future candle to fill in.
+        side[n - 1:] = 0
+        placed = np.nonzero(side)[0]
+        side = side[placed]
+        is_buy = side == 1
+
+        # Limit prices rounded toward the passive side, sizes rounded down.
+        multiplier = np.where(is_buy, self.buy_price_multiplier, self.sell_price_multiplier)
+        raw_price = candles.close[placed] * multiplier / self.quote_increment
+        price_ticks = np.where(is_buy, np.floor(raw_price + _TICK_EPSILON),
+                               np.ceil(raw_price - _TICK_EPSILON))
+        price = price_ticks * self.quote_increment
+        budget = self.fiat_amount * factor[placed] / np.where(is_buy, 1 + self.fee_rate, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            size_ticks = np.floor(budget / price / self.base_increment + _TICK_EPSILON)
+        size_ticks = np.where(price > 0, size_ticks, 0).astype(np.int64)
+
+        # Fill on the first of the next order_ttl candles reaching the limit.
+        ttl = self.order_ttl
+        future_low = np.lib.stride_tricks.sliding_window_view(
+            np.concatenate([candles.low[1:], np.full(ttl, np.inf)]), ttl)[placed]
+        future_high = np.lib.stride_tricks.sliding_window_view(
+            np.concatenate([candles.high[1:], np.full(ttl, -np.inf)]), ttl)[placed]
+        hit = np.where(is_buy[:, None], future_low <= price[:, None],
+                       future_high >= price[:, None])
+        filled = hit.any(axis=1) & (size_ticks > 0)
+        fill_day = placed + 1 + hit.argmax(axis=1)
+
+        fill_day, side, price = fill_day[filled], side[filled], price[filled]
+        requested = np.where(side == 1, size_ticks[filled], -size_ticks[filled])
+        order = np.argsort(fill_day, kind='stable')
+        fill_day, side, price, requested = (fill_day[order], side[order],
+                                            price[order], requested[order])
+
+        # Holdings can't go negative: H_k = max(0, H_{k-1} + d_k), computed in
+        # closed form as the cumulative sum minus its running minimum.
+        cumulative = np.cumsum(requested)
+        holdings_after = cumulative - np.minimum(0, np.minimum.accumulate(cumulative))
+        executed = np.diff(holdings_after, prepend=0)
+        executed_mask = executed != 0
+        fill_day, side, price, executed = (fill_day[executed_mask], side[executed_mask],
+                                           price[executed_mask], executed[executed_mask])
+
+        size = np.abs(executed) * self.base_increment
+        notional = size * price
+        fee = notional * self.fee_rate
+        cash_flow = np.where(side == 1, -notional, notional) - fee
+
+        cash = self.initial_cash + np.cumsum(np.bincount(fill_day, weights=cash_flow, minlength=n))
+        holdings = np.cumsum(np.bincount(fill_day, weights=executed, minlength=n)) * self.base_increment
+        equity = cash + holdings * candles.close
+        drawdown = equity - np.maximum.accumulate(equity)
+
+        trades = []
+        if record_trades:
+            trades = [
+                SimulatedTrade(int(ts), OrderSide.BUY if s == 1 else OrderSide.SELL,
+                               float(p), float(q), float(f))
+                for ts, s, p, q, f in zip(candles.timestamp[fill_day], side,
+                                          price, size, fee)
+            ]
+        return BacktestResult(
+            timestamp=candles.timestamp,
+            equity=equity,
+            cash=cash,
+            holdings=holdings,
+            drawdown=drawdown,
+            trades=trades,
+            initial_cash=self.initial_cash,
+            trade_count=len(fill_day),
+            total_fees=float(fee.sum())
+        )
@@ -0,0 +1,275 @@
+"""Parallel parameter sweeps over Fear and Greed schedules.
+
+Candidate schedules are compiled with `CompiledFGISchedule`, invalid ones
+are counted and dropped, and the rest are backtested across a process
+pool. The candle and FGI arrays are copied once into a shared memory block
+that every worker maps read-only, so only the schedules themselves and the
+summary statistics cross process boundaries.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import combinations, product
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.shared_cache import attach_shared_memory
+from coinbase_advanced_trader.trading_config import CompiledFGISchedule
+from .data import Candles
+from .fgi_backtest import FearAndGreedBacktester
+
+Schedule = List[Dict[str, Any]]
+
+# Rows of the shared market data matrix.
+_FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume', 'fgi')
+
+# Per-worker state set up by _init_worker.
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_candles: Optional[Candles] = None
+_worker_fgi: Optional[np.ndarray] = None
+_worker_settings: Dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Backtest statistics for one candidate schedule.
+
+    Attributes:
+        rank (int): Position in the ranking, starting at 1.
+        schedule (Schedule): The candidate schedule.
+        stats (Dict[str, Any]): The `BacktestResult.summary()` of its run.
+    """
+
+    rank: int
+    schedule: Schedule
+    stats: Dict[str, Any]
+
+
+class SweepResults(list):
+    """
+    Ranked sweep results, best first.
+
+    Attributes:
+        rejected (int): Number of candidate schedules that failed
+            validation and were not backtested.
+    """
+
+    def __init__(self, results: Iterable[SweepResult] = (), rejected: int = 0) -> None:
+        super().__init__(results)
+        self.rejected = rejected
+
+
+def schedule_grid(
+    buy_thresholds: Sequence[int],
+    buy_factors: Sequence[float],
+    sell_thresholds: Sequence[int],
+    sell_factors: Sequence[float],
+    max_buy_rules: int = 2,
+    max_sell_rules: int = 2
+) -> Iterator[Schedule]:
+    """
+    Generate candidate schedules from threshold and factor grids.
+
+    Every schedule has between one and `max_buy_rules` buy rules and between
+    one and `max_sell_rules` sell rules, each on a distinct threshold with
+    any of the given factors.
+
+    Args:
+        buy_thresholds: Thresholds to choose buy rules from.
+        buy_factors: Factors to choose for each buy rule.
+        sell_thresholds: Thresholds to choose sell rules from.
+        sell_factors: Factors to choose for each sell rule.
+        max_buy_rules: Maximum number of buy rules per schedule.
+        max_sell_rules: Maximum number of sell rules per schedule.
+
+    Yields:
+        Schedule: Candidate schedules; not all of them are necessarily valid.
+    """
+    def rules(thresholds, factors, max_rules, action):
+        for count in range(1, max_rules + 1):
+            for chosen in combinations(sorted(thresholds), count):
+                for chosen_factors in product(factors, repeat=count):
+                    yield [{'threshold': threshold, 'factor': factor, 'action': action}
+                           for threshold, factor in zip(chosen, chosen_factors)]
+
+    sell_sides = list(rules(sell_thresholds, sell_factors, max_sell_rules, 'sell'))
+    for buy_side in rules(buy_thresholds, buy_factors, max_buy_rules, 'buy'):
+        for sell_side in sell_sides:
+            yield buy_side + sell_side
+
+
+def _init_worker(shm_name: str, length: int, settings: Dict[str, Any]) -> None:
+    """Map the shared market data into this worker process."""
+    global _worker_shm, _worker_candles, _worker_fgi, _worker_settings
+    _worker_shm = attach_shared_memory(shm_name)
+    matrix = np.ndarray((len(_FIELDS), length), dtype=np.float64, buffer=_worker_shm.buf)
+    matrix.flags.writeable = False
+    _worker_candles = Candles(
+        timestamp=matrix[0].astype(np.int64),
+        open=matrix[1],
+        high=matrix[2],
+        low=matrix[3],
+        close=matrix[4],
+        volume=matrix[5]
+    )
+    _worker_fgi = matrix[6]
+    _worker_settings = settings
+
+
+def _release_worker() -> None:
+    """Drop the in-process worker state and detach from the shared block."""
+    global _worker_shm, _worker_candles, _worker_fgi
+    _worker_candles = _worker_fgi = None
+    if _worker_shm is not None:
+        _worker_shm.close()
+        _worker_shm = None
+
+
+def _run_batch(batch: List[Tuple[int, Schedule]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """Backtest a batch of schedules against the worker's market data."""
+    results = []
+    for index, schedule in batch:
+        backtester = FearAndGreedBacktester(schedule, **_worker_settings)
+        result = backtester.run(_worker_candles, _worker_fgi, record_trades=False)
+        results.append((index, result.summary()))
+    return results
+
+
+class ScheduleSweep:
+    """Backtests many candidate FGI schedules in parallel and ranks them."""
+
+    def __init__(self, candles: Candles, fgi: np.ndarray,
+                 max_workers: Optional[int] = None, **backtest_settings) -> None:
+        """
+        Initialize the sweep.
+
+        Args:
+            candles: Daily candles shared by every run.
+            fgi: One FGI value per candle.
+            max_workers: Number of worker processes. Defaults to the CPU
+                count; 1 runs everything in the current process.
+            **backtest_settings: Keyword arguments passed to every
+                `FearAndGreedBacktester` (fiat_amount, fee_rate, ...).
+                `fee_rates` is called once here and its maker rate passed
+                on as `fee_rate`, since workers cannot receive it.
+
+        Raises:
+            ValueError: If `fgi` and `candles` differ in length.
+        """
+        if len(fgi) != len(candles):
+            raise ValueError("fgi must contain one value per candle")
+        self.candles = candles
+        self.fgi = np.asarray(fgi, dtype=np.float64)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        fee_rates = backtest_settings.pop('fee_rates', None)
+        if fee_rates is not None and backtest_settings.get('fee_rate') is None:
+            backtest_settings['fee_rate'] = fee_rates(backtest_settings.get('product_id'))[0]
+        self.backtest_settings = backtest_settings
+
+    def run(self, schedules: Iterable[Schedule], rank_by: str = 'net_profit',
+            batch_size: Optional[int] = None) -> SweepResults:
+        """
+        Validate and backtest the candidate schedules.
+
+        Args:
+            schedules: Candidate schedules, e.g. from `schedule_grid`.
+            rank_by: Summary statistic to rank by, highest first.
+            batch_size: Schedules sent to a worker at a time. Defaults to
+                spreading the candidates over four batches per worker.
+
+        Returns:
+            SweepResults: Valid schedules ranked by `rank_by`, with the
+            number of invalid candidates skipped.
+        """
+        # Compiled without FearAndGreedConfig.validate_schedule, which logs
+        # a warning per invalid schedule and would flood large sweeps.
+        candidates = []
+        rejected = 0
+        for schedule in schedules:
+            try:
+                CompiledFGISchedule(schedule)
+            except ValueError:
+                rejected += 1
+            else:
+                candidates.append(schedule)
+        if rejected:
+            logger.info(f"Skipped {rejected} invalid FGI schedules")
+        if not candidates:
+            return SweepResults(rejected=rejected)
+        logger.info(f"Backtesting {len(candidates)} FGI schedules "
+                    f"on {self.max_workers} worker(s)")
+
+        indexed = list(enumerate(candidates))
+        if batch_size is None:
+            batch_size = max(1, -(-len(indexed) // (self.max_workers * 4)))
+        batches = [indexed[i:i + batch_size] for i in range(0, len(indexed), batch_size)]
+
+        shm = shared_memory.SharedMemory(
+            create=True, size=len(_FIELDS) * max(1, len(self.candles)) * 8
+        )
+        try:
+            matrix = np.ndarray((len(_FIELDS), len(self.candles)), dtype=np.float64,
+                                buffer=shm.buf)
+            for row, name in enumerate(_FIELDS[:-1]):
+                matrix[row] = getattr(self.candles, name)
+            matrix[-1] = self.fgi
+            del matrix
+
+            init_args = (shm.name, len(self.candles), self.backtest_settings)
+            if self.max_workers == 1:
+                _init_worker(*init_args)
+                try:
+                    stats = [item for batch in batches for item in _run_batch(batch)]
+                finally:
+                    _release_worker()
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers,
+                                         initializer=_init_worker,
+                                         initargs=init_args) as executor:
+                    stats = [item for batch_stats in executor.map(_run_batch, batches)
+                             for item in batch_stats]
+        finally:
+            shm.close()
+            shm.unlink()
+
+        stats.sort(key=lambda item: (-item[1][rank_by], item[0]))
+        return SweepResults((SweepResult(rank, candidates[index], summary)
+                             for rank, (index, summary) in enumerate(stats, start=1)),
+                            rejected=rejected)
+
+
+def _format_schedule(schedule: Schedule) -> str:
+    return ' '.join(f"{rule['action'][0].upper()}{rule['threshold']}x{rule['factor']}"
+                    for rule in sorted(schedule, key=lambda rule: rule['threshold']))
+
+
+def format_results(results: List[SweepResult], limit: int = 20) -> str:
+    """
+    Render ranked sweep results as a plain-text table.
+
+    Schedules are abbreviated as B<threshold>x<factor> for buy rules and
+    S<threshold>x<factor> for sell rules.
+
+    Args:
+        results: Ranked results from `ScheduleSweep.run`.
+        limit: Maximum number of rows.
+
+    Returns:
+        str: The table.
+    """
+    header = (f"{'rank':>4}  {'net_profit':>12}  {'invested':>10}  "
+              f"{'max_drawdown':>12}  {'fees':>8}  {'trades':>6}  schedule")
+    lines = [header, '-' * len(header)]
+    for result in results[:limit]:
+        stats = result.stats
+        lines.append(
+            f"{result.rank:>4}  {stats['net_profit']:>12.2f}  {stats['invested']:>10.2f}  "
+            f"{stats['max_drawdown']:>12.2f}  {stats['total_fees']:>8.2f}  "
+            f"{stats['trades']:>6}  {_format_schedule(result.schedule)}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,199 @@
+"""Many authenticated clients sharing one market data layer.
+
+`ClientPool` holds one `EnhancedRESTClient` per API key. Products, prices
+and increments are the same for every account, so all clients share the
+first client's `PriceService` (and one Fear and Greed Index provider), while
+balances, accounts caches and rate limiters stay per key. Fan-out
+operations run a call on every account concurrently.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
+)
+
+from coinbase_advanced_trader.constants import PRIVATE_REQUESTS_PER_SECOND
+from coinbase_advanced_trader.enhanced_rest_client import EnhancedRESTClient
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.resilience import RateLimiter
+from coinbase_advanced_trader.services.fear_and_greed_provider import FearAndGreedProvider
+from coinbase_advanced_trader.services.price_service import PriceService
+
+T = TypeVar('T')
+
+
+@dataclass
+class FanOutResult:
+    """
+    The outcome of a fan-out call on one account.
+
+    Attributes:
+        name (str): The account's name in the pool.
+        value (Any): What the call returned, None if it raised.
+        error (Optional[BaseException]): What the call raised, if anything.
+    """
+
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call returned without raising."""
+        return self.error is None
+
+
+class ClientPool:
+    """
+    One client per API key, sharing market data.
+
+    The first client in `credentials` fetches market data for the whole
+    pool, so product and price requests do not grow with the number of
+    accounts. Every client gets its own `RateLimiter`, named after its
+    account, its own accounts cache, and its own resilience and coalescing
+    state.
+    """
+
+    def __init__(self, credentials: Mapping[str, Tuple[str, str]],
+                 client_factory: Callable[..., EnhancedRESTClient] = EnhancedRESTClient,
+                 requests_per_second: float = PRIVATE_REQUESTS_PER_SECOND,
+                 max_workers: int = 16,
+                 fgi_provider: Optional[FearAndGreedProvider] = None,
+                 **client_kwargs: Any) -> None:
+        """
+        Create the clients.
+
+        Args:
+            credentials: (api_key, api_secret) per account name.
+            client_factory: Builds each client from api_key, api_secret and
+                keyword arguments, e.g. a `PaperTradingClient` factory.
+            requests_per_second: Request rate allowed per API key.
+            max_workers: Threads used by fan-out operations.
+            fgi_provider: Fear and Greed Index provider shared by every
+                client; a new one is created if omitted.
+            **client_kwargs: Further keyword arguments for every client,
+                e.g. `instrumentation` or `shared_cache`. `resilience` and
+                `coalesce_reads` may only be True or False, so that every
+                client gets its own breakers, throttles and coalescing.
+
+        Raises:
+            ValueError: If `credentials` is empty, or if `client_kwargs`
+                holds a `Resilience` or `SingleFlight` instance.
+        """
+        if not credentials:
+            raise ValueError("ClientPool needs at least one account")
+        for name in ('resilience', 'coalesce_reads'):
+            if not isinstance(client_kwargs.get(name, True), bool):
+                raise ValueError(f"ClientPool creates one {name} object per client; "
+                                 f"pass {name}=True or False instead of an instance")
+        self.max_workers = max_workers
+        self.fgi_provider = fgi_provider or FearAndGreedProvider()
+        self._clients: Dict[str, EnhancedRESTClient] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        market_data: Optional[PriceService] = None
+        for name, (api_key, api_secret) in credentials.items():
+            client = client_factory(
+                api_key=api_key, api_secret=api_secret,
+                rate_limiter=RateLimiter(requests_per_second, name=name),
+                price_service=market_data, fgi_provider=self.fgi_provider,
+                **client_kwargs
+            )
+            market_data = market_data or client.price_service
+            self._clients[name] = client
+        self.market_data: PriceService = market_data
+
+    def __getitem__(self, name: str) -> EnhancedRESTClient:
+        return self._clients[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @property
+    def names(self) -> List[str]:
+        """The account names, in the order they were given."""
+        return list(self._clients)
+
+    def prefetch(self, product_ids: Sequence[str]) -> None:
+        """Load prices and increments of products for every client in one request."""
+        self.market_data.prefetch_products(list(product_ids))
+
+    def map(self, fn: Callable[[str, EnhancedRESTClient], T],
+            names: Optional[Iterable[str]] = None) -> Dict[str, FanOutResult]:
+        """
+        Call `fn(name, client)` for several accounts concurrently.
+
+        Args:
+            fn: The call to make per account.
+            names: Accounts to include; defaults to all of them.
+
+        Returns:
+            Dict[str, FanOutResult]: The outcome per account, in pool order.
+            Exceptions are captured rather than raised.
+        """
+        names = list(self._clients) if names is None else list(names)
+        executor = self._get_executor()
+
+        def call(name: str) -> FanOutResult:
+            try:
+                return FanOutResult(name, fn(name, self._clients[name]))
+            except Exception as e:
+                return FanOutResult(name, error=e)
+
+        futures = [executor.submit(copy_context().run, call, name) for name in names]
+        return {result.name: result for result in (future.result() for future in futures)}
+
+    def fan_out(self, method: str, *args: Any, prefetch: Sequence[str] = (),
+                names: Optional[Iterable[str]] = None, **kwargs: Any) -> Dict[str, FanOutResult]:
+        """
+        Call a client method on several accounts concurrently.
+
+        Example:
+            pool.fan_out('fiat_limit_buy', 'BTC-USDC', '10', prefetch=['BTC-USDC'])
+
+        Args:
+            method: Name of the `EnhancedRESTClient` method, e.g. 'fiat_market_buy'.
+            *args: Positional arguments for the method.
+            prefetch: Products whose prices are fetched once up front, so
+                the per-account calls need no market data requests.
+            names: Accounts to include; defaults to all of them.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Dict[str, FanOutResult]: The outcome per account, in pool order.
+        """
+        if prefetch:
+            self.prefetch(prefetch)
+        results = self.map(lambda _, client: getattr(client, method)(*args, **kwargs), names)
+        failed = [name for name, result in results.items() if not result.ok]
+        if failed:
+            logger.warning(f"{method} failed for {len(failed)} of {len(results)} accounts: "
+                           f"{', '.join(failed)}")
+        return results
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='client-pool')
+            return self._executor
+
+    def close(self) -> None:
+        """Stop the fan-out worker threads."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ClientPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
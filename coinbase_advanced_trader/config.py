@@ -1,35 +1,59 @@
 """Configuration management for Coinbase Advanced Trader."""
 
 import logging
+import threading
 from pathlib import Path
 
-import yaml
-
 from coinbase_advanced_trader.constants import DEFAULT_CONFIG
 
 
 class ConfigManager:
-    """Singleton class for managing application configuration."""
+    """
+    Singleton class for managing application configuration.
+
+    The user configuration file is read on first access rather than at
+    import time. Creating the instance and loading the file are guarded by a
+    lock, so concurrent first uses share one instance and one load.
+    """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         """Create a new instance if one doesn't exist, otherwise return the existing instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.initialize()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.initialize()
+                    cls._instance = instance
+                instance = cls._instance
+        return instance
 
     def initialize(self):
         """Initialize the ConfigManager with default configuration and user overrides."""
         self.config_path = Path('config.yaml')
-        self.config = self._load_config()
+        self._config = None
+
+    @property
+    def config(self):
+        """The merged configuration, loaded on first access."""
+        config = self._config
+        if config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = self._load_config()
+                config = self._config
+        return config
 
     def _load_config(self):
         """Load configuration from file, falling back to defaults if necessary."""
         config = DEFAULT_CONFIG.copy()
         if self.config_path.exists():
             try:
+                import yaml
+
                 with open(self.config_path, 'r') as f:
                     user_config = yaml.safe_load(f)
                 if user_config:
@@ -45,7 +69,8 @@ class ConfigManager:
     @classmethod
     def reset(cls):
         """Reset the singleton instance."""
-        cls._instance = None
+        with cls._lock:
+            cls._instance = None
 
 
 config_manager = ConfigManager()
\ No newline at end of file
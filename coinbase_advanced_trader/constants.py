@@ -5,4 +5,8 @@ DEFAULT_CONFIG = {
     'SELL_PRICE_MULTIPLIER': 1.005,
     'LOG_FILE_PATH': 'coinbase_advanced_trader.log',
     'LOG_LEVEL': 'DEBUG'
-}
\ No newline at end of file
+}
+# Path prefix of the Advanced Trade brokerage endpoints.
+API_PREFIX = '/api/v3/brokerage'
+# Coinbase's per-key request limit for private Advanced Trade endpoints.
+PRIVATE_REQUESTS_PER_SECOND = 30
@@ -6,47 +6,219 @@ here and used by various service methods.
 """
 
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Union
 
+from coinbase.constants import RATE_LIMIT_HEADERS
 from coinbase.rest import RESTClient
+from coinbase.rest.rest_base import handle_exception
 
+from .services.fee_service import FeeService
 from .services.order_service import OrderService
+from .services.fear_and_greed_provider import FearAndGreedProvider
 from .services.fear_and_greed_strategy import FearAndGreedStrategy
 from .services.price_service import PriceService
 from .trading_config import FearAndGreedConfig
 from coinbase_advanced_trader.constants import DEFAULT_CONFIG
+from coinbase_advanced_trader.fast_decode import dict_read, loads
+from coinbase_advanced_trader.instrumentation.hooks import (
+    Instrumentation,
+    InstrumentedSession,
+    endpoint_name,
+    instrumented_operation
+)
 from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.models import Order, OrderSide
+from coinbase_advanced_trader.open_orders import OpenOrderBook
+from coinbase_advanced_trader.repricing import Repricer, RepricingPolicy
+from coinbase_advanced_trader.resilience import RateLimiter, Resilience
+from coinbase_advanced_trader.routing import DEFAULT_QUOTE_CURRENCIES, QuoteRouter
+from coinbase_advanced_trader.single_flight import SingleFlight
 from coinbase_advanced_trader.services.account_service import AccountService, Account
 from coinbase_advanced_trader.services.funds_service import FundsService
+from coinbase_advanced_trader.user_stream import UserChannelTransport, UserStream
+
+if TYPE_CHECKING:
+    from coinbase_advanced_trader.shared_cache import SharedMarketDataCache
+
+# Reads whose concurrent identical requests share one response. Orders and
+# fills are left out: a read started after placing an order must see it.
+COALESCED_ENDPOINTS = frozenset({
+    'GET products', 'GET products/{id}', 'GET best_bid_ask', 'GET product_book',
+    'GET accounts', 'GET accounts/{id}'
+})
 
 
 class EnhancedRESTClient(RESTClient):
     """Enhanced REST client with additional trading functionalities."""
 
-    def __init__(self, api_key: str, api_secret: str, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        shared_cache: Optional['SharedMarketDataCache'] = None,
+        fgi_provider: Optional[FearAndGreedProvider] = None,
+        transport: Optional[Any] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        resilience: Union[Resilience, bool] = True,
+        coalesce_reads: Union[SingleFlight, bool] = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        price_service: Optional[PriceService] = None,
+        fast_decode: bool = False,
+        **kwargs: Any
+    ) -> None:
         """
         Initialize the EnhancedRESTClient with trading service dependencies.
 
         Args:
             api_key: The API key for authentication.
             api_secret: The API secret for authentication.
+            shared_cache: Optional cross-process market data cache read by
+                the price service before calling the API.
+            fgi_provider: Optional Fear and Greed Index provider, e.g. one
+                configured with a fallback file or shared between clients.
+            transport: Optional `requests.Session`-compatible object used
+                for HTTP calls instead of a real session, e.g. a
+                `SimulatedSession` for paper trading.
+            instrumentation: Optional receiver of per-request and
+                per-operation events, e.g. an `InMemoryInstrumentation`.
+                Without it requests are not observed at all.
+            resilience: Retry, throttling and circuit breaker settings for
+                every request. True uses the defaults, False sends each
+                request exactly once.
+            coalesce_reads: Whether concurrent identical product, price and
+                account reads share one request, or the `SingleFlight`
+                that coalesces them.
+            rate_limiter: Optional limiter pacing this client's requests,
+                retries included.
+            price_service: Optional price service to use instead of a new
+                one, e.g. the market data layer shared by a `ClientPool`.
+                `shared_cache` is ignored when it is given.
+            fast_decode: Parse each response once, with orjson if it is
+                installed, and return plain dicts from the product, best
+                bid/ask, account, order and fill reads instead of SDK
+                response objects.
             **kwargs: Additional keyword arguments for RESTClient.
         """
         super().__init__(api_key=api_key, api_secret=api_secret, **kwargs)
+        if transport is not None:
+            self.session = transport
+        self._instrumentation = None
+        self.instrumentation = instrumentation
+        if resilience is True:
+            resilience = Resilience()
+        self.resilience: Optional[Resilience] = resilience or None
+        if coalesce_reads is True:
+            coalesce_reads = SingleFlight()
+        self.single_flight: Optional[SingleFlight] = coalesce_reads or None
+        self.rate_limiter = rate_limiter
+        self.fast_decode = fast_decode
 
         # Initialize service dependencies
         self._account_service = AccountService(self)
         self._funds_service = FundsService(self)
-        self._price_service = PriceService(self)
-        self._order_service = OrderService(self, self._price_service)
+        self._price_service = price_service or PriceService(self, shared_cache=shared_cache)
+        self._fee_service = FeeService(self)
+        self._order_service = OrderService(self, self._price_service, self._fee_service)
         self._config = FearAndGreedConfig()
         self._fear_and_greed_strategy = FearAndGreedStrategy(
-            self._order_service, self._price_service, self._config
+            self._order_service, self._price_service, self._config,
+            fgi_provider=fgi_provider
+        )
+
+    @property
+    def price_service(self) -> PriceService:
+        """The service answering product and price lookups for this client."""
+        return self._price_service
+
+    @property
+    def fee_service(self) -> FeeService:
+        """The service caching this account's maker and taker fee rates."""
+        return self._fee_service
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """The receiver of request and operation events, if any."""
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        if isinstance(self.session, InstrumentedSession):
+            self.session = self.session.session
+        if instrumentation is not None:
+            self.session = InstrumentedSession(self.session, instrumentation)
+        self._instrumentation = instrumentation
+
+    def prepare_and_send_request(self, http_method: str, url_path: str,
+                                 params: Optional[Dict[str, Any]] = None,
+                                 data: Optional[Dict[str, Any]] = None,
+                                 public: bool = False) -> Dict[str, Any]:
+        """
+        Send a request through the coalescing, resilience and rate
+        limiting layers.
+
+        Identical reads of `COALESCED_ENDPOINTS` already in flight are
+        joined rather than sent again. Authenticated reads are only joined
+        with this client's own, so a `SingleFlight` shared between clients
+        never hands one account's balances to another. Headers, including the JWT, are
+        rebuilt for every attempt so that retries are never sent with an
+        expired token.
+        """
+        send = partial(super().prepare_and_send_request, http_method, url_path,
+                       params, data, public)
+        if self.rate_limiter is not None:
+            send = partial(self._send_rate_limited, send)
+        if self.resilience is not None:
+            send = partial(self.resilience.call, http_method, url_path, send,
+                           self._instrumentation)
+        if self.single_flight is None or http_method != 'GET':
+            return send()
+        endpoint = endpoint_name(http_method, url_path)
+        if endpoint not in COALESCED_ENDPOINTS:
+            return send()
+
+        account = None if public else id(self)
+        key = (account, url_path, public, repr(sorted((params or {}).items())))
+        response, joined = self.single_flight.do(key, send, endpoint)
+        if joined and self._instrumentation is not None:
+            self._instrumentation.on_request_coalesced(endpoint)
+        return response
+
+    def send_request(self, http_method: str, url_path: str, params: Optional[Dict[str, Any]],
+                     headers: Dict[str, str], data: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one request; in fast mode, decode the response body only once."""
+        if not self.fast_decode:
+            return super().send_request(http_method, url_path, params, headers, data=data)
+        response = self.session.request(
+            http_method, f"https://{self.base_url}{url_path}", params=params,
+            json={} if data is None else data, headers=headers, timeout=self.timeout
         )
+        handle_exception(response)
+        response_data = loads(response.content)
+        if self.rate_limit_headers:
+            response_data.update({key: response.headers.get(key) for key in RATE_LIMIT_HEADERS})
+        return response_data
+
+    # Reads returning plain dicts in fast mode.
+    get_product = dict_read(RESTClient.get_product, 'products/{product_id}')
+    get_products = dict_read(RESTClient.get_products, 'products')
+    get_best_bid_ask = dict_read(RESTClient.get_best_bid_ask, 'best_bid_ask')
+    get_accounts = dict_read(RESTClient.get_accounts, 'accounts')
+    get_account = dict_read(RESTClient.get_account, 'accounts/{account_uuid}')
+    list_orders = dict_read(RESTClient.list_orders, 'orders/historical/batch')
+    get_order = dict_read(RESTClient.get_order, 'orders/historical/{order_id}')
+    get_fills = dict_read(RESTClient.get_fills, 'orders/historical/fills')
+
+    def _send_rate_limited(self, send: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        waited = self.rate_limiter.acquire()
+        if waited > 0 and self._instrumentation is not None:
+            self._instrumentation.on_rate_limit_wait(self.rate_limiter.name, waited)
+        return send()
 
     # -------------------------------------------------------------------------
     # Account Services
     # -------------------------------------------------------------------------
+    @instrumented_operation
     def get_crypto_balance(self, currency: str) -> Decimal:
         """
         Get the available balance of a specific cryptocurrency.
@@ -59,6 +231,17 @@ class EnhancedRESTClient(RESTClient):
         """
         return self._account_service.get_crypto_balance(currency)
 
+    @instrumented_operation
+    def get_available_balances(self) -> Dict[str, Decimal]:
+        """
+        Get the available balance of every account, from the accounts cache.
+
+        Returns:
+            A dict mapping currency codes to their available balances.
+        """
+        return self._account_service.get_available_balances()
+
+    @instrumented_operation
     def list_held_crypto_balances(self) -> Dict[str, Decimal]:
         """
         Get a dictionary of held cryptocurrencies and their respective balances.
@@ -68,6 +251,10 @@ class EnhancedRESTClient(RESTClient):
         """
         return self._account_service.list_held_crypto_balances()
 
+    def invalidate_balances(self) -> None:
+        """Drop the cached accounts, e.g. after a fill, so the next balance read fetches them."""
+        self._account_service.invalidate()
+
     # -------------------------------------------------------------------------
     # Fear and Greed Index Trading Configuration
     # -------------------------------------------------------------------------
@@ -120,6 +307,7 @@ class EnhancedRESTClient(RESTClient):
     # -------------------------------------------------------------------------
     # Fiat Trading (Market and Limit Orders)
     # -------------------------------------------------------------------------
+    @instrumented_operation
     def fiat_market_buy(self, product_id: str, fiat_amount: str) -> Dict[str, Any]:
         """
         Execute a fiat market buy order.
@@ -133,6 +321,7 @@ class EnhancedRESTClient(RESTClient):
         """
         return self._order_service.fiat_market_buy(product_id, fiat_amount)
 
+    @instrumented_operation
     def fiat_market_sell(self, product_id: str, fiat_amount: str) -> Dict[str, Any]:
         """
         Execute a fiat market sell order.
@@ -146,6 +335,7 @@ class EnhancedRESTClient(RESTClient):
         """
         return self._order_service.fiat_market_sell(product_id, fiat_amount)
 
+    @instrumented_operation
     def fiat_limit_buy(
         self,
         product_id: str,
@@ -169,6 +359,7 @@ class EnhancedRESTClient(RESTClient):
             product_id, fiat_amount, limit_price, price_multiplier
         )
 
+    @instrumented_operation
     def fiat_limit_sell(
         self,
         product_id: str,
@@ -192,9 +383,189 @@ class EnhancedRESTClient(RESTClient):
             product_id, fiat_amount, limit_price, price_multiplier
         )
 
+    @instrumented_operation
+    def fiat_limit_buy_many(
+        self,
+        fiat_amounts: Dict[str, str],
+        price_multiplier: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute fiat limit buy orders for a basket of products.
+
+        Prices for all products are fetched in a single request, the orders
+        are sized together, and orders below the minimum size are skipped.
+
+        Args:
+            fiat_amounts: Mapping of product identifier to fiat amount.
+            price_multiplier: Multiplier for the current prices; defaults
+                to the configured BUY_PRICE_MULTIPLIER.
+
+        Returns:
+            A dict mapping each product to its Order, None if the order was
+            below the minimum size, or the exception raised while placing it.
+        """
+        return self._order_service.place_limit_orders(
+            fiat_amounts, OrderSide.BUY, price_multiplier
+        )
+
+    @instrumented_operation
+    def fiat_limit_sell_many(
+        self,
+        fiat_amounts: Dict[str, str],
+        price_multiplier: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute fiat limit sell orders for a basket of products.
+
+        Args:
+            fiat_amounts: Mapping of product identifier to fiat amount to receive.
+            price_multiplier: Multiplier for the current prices; defaults
+                to the configured SELL_PRICE_MULTIPLIER.
+
+        Returns:
+            A dict mapping each product to its Order, None if the order was
+            below the minimum size, or the exception raised while placing it.
+        """
+        return self._order_service.place_limit_orders(
+            fiat_amounts, OrderSide.SELL, price_multiplier
+        )
+
+    @instrumented_operation
+    def cancel_open_orders(self, order_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel orders by ID, removing them from any attached OpenOrderBook.
+
+        Args:
+            order_ids: The IDs of the orders to cancel.
+
+        Returns:
+            A dict mapping each order ID to whether it was cancelled.
+        """
+        return self._order_service.cancel_orders(order_ids)
+
+    def add_order_listener(self, listener: Callable[[Order], Any]) -> None:
+        """
+        Call `listener` with every order this client places or reprices.
+
+        Args:
+            listener: The callable to add, e.g. a `UserStream.track`.
+        """
+        self._order_service.order_listeners.append(listener)
+
+    def remove_order_listener(self, listener: Callable[[Order], Any]) -> None:
+        """
+        Stop calling a listener added with `add_order_listener`.
+
+        Args:
+            listener: The callable to remove; ignored if it was not added.
+        """
+        if listener in self._order_service.order_listeners:
+            self._order_service.order_listeners.remove(listener)
+
+    def add_cancel_listener(self, listener: Callable[[str], Any]) -> None:
+        """
+        Call `listener` with the ID of every order this client cancels.
+
+        Args:
+            listener: The callable to add, e.g. an `OpenOrderBook.discard`.
+        """
+        self._order_service.cancel_listeners.append(listener)
+
+    def remove_cancel_listener(self, listener: Callable[[str], Any]) -> None:
+        """
+        Stop calling a listener added with `add_cancel_listener`.
+
+        Args:
+            listener: The callable to remove; ignored if it was not added.
+        """
+        if listener in self._order_service.cancel_listeners:
+            self._order_service.cancel_listeners.remove(listener)
+
+    def open_order_book(
+        self,
+        product_ids: Optional[List[str]] = None,
+        stream: Optional[UserStream] = None
+    ) -> OpenOrderBook:
+        """
+        Load this account's open limit orders into a local index kept
+        current from the orders this client places and cancels. Call
+        `close()` on the book, or use it as a context manager, to stop
+        updating it once it is no longer needed.
+
+        Args:
+            product_ids: Products to index; all products if omitted.
+            stream: Optional user stream whose status updates (fills,
+                expiries, cancels made elsewhere) also update the index.
+
+        Returns:
+            The loaded OpenOrderBook.
+        """
+        return OpenOrderBook(product_ids or ()).attach(self, stream).load(self)
+
+    def repricer(self, policy: Optional[RepricingPolicy] = None) -> Repricer:
+        """
+        Create a repricer that keeps chased limit orders near the best bid
+        or ask, editing them (or cancelling and replacing them) as the
+        market moves.
+
+        Args:
+            policy: Tick offset, maximum chase distance and requote budget;
+                the defaults if omitted.
+
+        Returns:
+            A Repricer; pass orders to its `chase` method.
+        """
+        return Repricer(self._order_service, policy, fee_rates=self._fee_service.get_fee_rates)
+
+    def quote_router(
+        self,
+        quote_currencies: Sequence[str] = DEFAULT_QUOTE_CURRENCIES,
+        fee_rates: Optional[Callable[[str], Any]] = None
+    ) -> QuoteRouter:
+        """
+        Create a router placing orders on whichever equivalent quote
+        currency (e.g. BTC-USD or BTC-USDC) is cheapest after fees.
+
+        Args:
+            quote_currencies: Quote currencies to choose from.
+            fee_rates: Optional function returning the (maker, taker) fee
+                rates of a product; the account's rates from `fee_service`
+                if omitted.
+
+        Returns:
+            A QuoteRouter; its `buy` and `sell` methods return the order
+            together with the routing decision.
+        """
+        return QuoteRouter(self, quote_currencies, fee_rates)
+
+    def user_stream(
+        self,
+        product_ids: Optional[List[str]] = None,
+        on_order: Optional[Callable[[Any], Any]] = None,
+        on_fill: Optional[Callable[[Any], Any]] = None,
+        transport: Optional[UserChannelTransport] = None
+    ) -> UserStream:
+        """
+        Create a stream of this account's order updates from the WebSocket
+        user channel. Call `start()` on it, or use it as a context manager.
+
+        Args:
+            product_ids: Products to follow; all products if omitted.
+            on_order: Called with every Order whose status or fills changed.
+            on_fill: Called with an OrderFill for every new fill.
+            transport: Optional connection to use instead of the SDK's
+                WebSocket client, e.g. a stub replaying recorded messages.
+
+        Returns:
+            A UserStream keeping this client's orders up to date.
+        """
+        return UserStream(self, product_ids or (), transport=transport,
+                          on_order=on_order, on_fill=on_fill)
+
     # -------------------------------------------------------------------------
     # Fear and Greed-Based Trade Execution
     # -------------------------------------------------------------------------
+    @instrumented_operation
     def trade_based_on_fgi(
         self,
         product_id: str,
@@ -211,14 +582,47 @@ class EnhancedRESTClient(RESTClient):
 
         Returns:
             The API response as a dict.
+
+        Raises:
+            ValueError: If the provided schedule is invalid.
+        """
+        return self._fear_and_greed_strategy.execute_trade(
+            product_id, fiat_amount, schedule=schedule
+        )
+
+    @instrumented_operation
+    def trade_based_on_fgi_many(
+        self,
+        fiat_amounts: Dict[str, str],
+        schedule: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute Fear and Greed Index trades for a basket of products.
+
+        The index is fetched once, prices for all products are fetched in a
+        single request, and the resulting orders are placed concurrently.
+
+        Args:
+            fiat_amounts: Mapping of product identifier to fiat amount.
+            schedule: Optional trading schedule to override defaults.
+
+        Returns:
+            A dict mapping each product to its Order, None if no condition
+            was met, or the exception raised while placing its order.
+
+        Raises:
+            ValueError: If the provided schedule is invalid.
         """
-        return self._fear_and_greed_strategy.execute_trade(product_id, fiat_amount)
+        return self._fear_and_greed_strategy.execute_trades(
+            fiat_amounts, schedule=schedule
+        )
 
     # -------------------------------------------------------------------------
     # Funds Operations (Delegated to FundsService)
     # Note: The actual funds_service methods (deposit/withdraw)
     # are implemented in the FundsService module.
     # -------------------------------------------------------------------------
+    @instrumented_operation
     def deposit_fiat(
         self,
         account_id: str,
@@ -244,10 +648,12 @@ class EnhancedRESTClient(RESTClient):
             account_id, payment_method_id, amount, currency, commit
         )
 
+    @instrumented_operation
     def show_deposit_methods(self) -> None:
         """Show all payment methods that allow deposits."""
         return self._account_service.show_deposit_methods()
 
+    @instrumented_operation
     def get_account_by_currency(self, currency: str) -> Optional[Account]:
         """Show account details for a specific currency."""
         return self._account_service.get_account_by_currency(currency)
\ No newline at end of file
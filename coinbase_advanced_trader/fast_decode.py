@@ -0,0 +1,67 @@
+"""Fast response decoding for `EnhancedRESTClient(fast_decode=True)`.
+
+The SDK parses every response body twice (once for a debug log line) and
+then builds response objects field by field. In fast mode the body is
+parsed once, with orjson when it is installed (the `fast` extra), and the
+hot read endpoints return the decoded dicts directly.
+"""
+
+import inspect
+import json
+from functools import wraps
+from string import Formatter
+from typing import Any, Callable, Dict
+
+from coinbase_advanced_trader.constants import API_PREFIX
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#: Name of the JSON library used to decode responses in fast mode.
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dict_read(sdk_method: Callable[..., Any], path: str) -> Callable[..., Any]:
+    """
+    Make a version of an SDK read method that returns plain dicts in fast mode.
+
+    The method takes the same arguments as the SDK's. Arguments named in
+    `path` fill in the endpoint; all others are sent as query parameters,
+    exactly as the SDK sends them.
+
+    Args:
+        sdk_method: The SDK method, e.g. `RESTClient.get_product`.
+        path: Endpoint after the API prefix, e.g. 'products/{product_id}'.
+
+    Returns:
+        Callable[..., Any]: The method, for use in the client class body.
+    """
+    signature = inspect.signature(sdk_method)
+    path_arguments = [field for _, field, _, _ in Formatter().parse(path) if field]
+
+    @wraps(sdk_method)
+    def method(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.fast_decode:
+            return sdk_method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments: Dict[str, Any] = dict(bound.arguments)
+        del arguments['self']
+        extra = arguments.pop('kwargs', {})
+        endpoint = f"{API_PREFIX}/" + path.format(
+            **{name: arguments.pop(name) for name in path_arguments}
+        )
+        return self.get(endpoint, params=arguments or None, **extra)
+
+    method.__doc__ = (f"{sdk_method.__name__} from the SDK; returns the decoded JSON dict "
+                      f"instead of a response object when the client uses fast_decode.")
+    return method
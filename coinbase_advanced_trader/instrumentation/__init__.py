@@ -0,0 +1,52 @@
+"""Request, operation and trading instrumentation and tracing for EnhancedRESTClient.
+
+The Prometheus and tracing exporters are imported lazily on first attribute
+access, so modules that only need the hooks (every client and trader) do
+not load `http.server` for a metrics server nobody started.
+"""
+
+from importlib import import_module
+
+from .hooks import (
+    DEFAULT_LATENCY_BUCKETS,
+    CompositeInstrumentation,
+    InMemoryInstrumentation,
+    InstrumentedSession,
+    Instrumentation,
+    LatencyHistogram,
+    OperationEvent,
+    OrderEvent,
+    RequestEvent,
+    current_operation,
+    endpoint_name,
+    instrumentation_of,
+    track_operation
+)
+
+_LAZY_ATTRIBUTES = {
+    'MetricsServer': '.prometheus',
+    'PrometheusInstrumentation': '.prometheus',
+    'OpenTelemetryInstrumentation': '.tracing',
+    'Span': '.tracing',
+    'SpanCollector': '.tracing',
+}
+
+__all__ = [
+    'DEFAULT_LATENCY_BUCKETS', 'CompositeInstrumentation', 'InMemoryInstrumentation',
+    'InstrumentedSession', 'Instrumentation', 'LatencyHistogram', 'MetricsServer',
+    'OpenTelemetryInstrumentation', 'OperationEvent', 'OrderEvent',
+    'PrometheusInstrumentation', 'RequestEvent', 'Span', 'SpanCollector',
+    'current_operation', 'endpoint_name', 'instrumentation_of', 'track_operation'
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,578 @@
+"""Hooks observing every REST request made by `EnhancedRESTClient`.
+
+A client given an `Instrumentation` wraps its HTTP session in an
+`InstrumentedSession`, which reports one `RequestEvent` per request: the
+endpoint, status, latency, payload sizes and retry attempt. Public client
+methods such as `fiat_limit_buy` run inside an operation scope, so each
+request is attributed to the high-level call that triggered it and an
+`OperationEvent` reports how many requests that call made. Clients without
+instrumentation skip all of this.
+
+Services report order results, cache lookups, trading signals, rate
+limiter waits and coalesced reads through the same object, found with `instrumentation_of`,
+and open timing spans around their work with `Instrumentation.span`.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import (
+    Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+)
+from urllib.parse import urlsplit
+
+from coinbase_advanced_trader.constants import API_PREFIX
+
+# Upper bounds in seconds of the request latency histogram buckets.
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                           1.0, 2.5, 5.0, 10.0)
+
+# Path segments followed by an identifier, and the literal endpoints that
+# can appear in the same position.
+_ID_PARENTS = frozenset({'products', 'accounts', 'portfolios', 'historical', 'payment_methods'})
+_LITERAL_SEGMENTS = frozenset({'batch', 'fills', 'batch_cancel'})
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    One HTTP request, as seen by the transport.
+
+    Attributes:
+        method (str): HTTP method.
+        endpoint (str): Endpoint with identifiers replaced by {id}, e.g.
+            'GET products/{id}'.
+        status (Optional[int]): HTTP status, or None if no response arrived.
+        latency (float): Seconds from sending the request to receiving the
+            response.
+        request_bytes (int): Size of the request body.
+        response_bytes (int): Size of the response body.
+        operation (Optional[str]): The client operation that made the
+            request, or None for direct SDK calls.
+        attempt (int): 0 for the first try, 1 and up for retries.
+        error (Optional[str]): Exception type name if the request failed
+            without a response.
+    """
+
+    method: str
+    endpoint: str
+    status: Optional[int]
+    latency: float
+    request_bytes: int
+    response_bytes: int
+    operation: Optional[str] = None
+    attempt: int = 0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request got no response or an error status."""
+        return self.status is None or self.status >= 400
+
+
+@dataclass(frozen=True)
+class OperationEvent:
+    """
+    One call to an instrumented client operation.
+
+    Attributes:
+        name (str): Operation name, e.g. 'fiat_limit_buy'.
+        latency (float): Wall time of the call in seconds.
+        requests (int): HTTP requests made during the call, retries included.
+        error (Optional[str]): Exception type name if the call raised.
+    """
+
+    name: str
+    latency: float
+    requests: int
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class OrderEvent:
+    """
+    One order submission.
+
+    Attributes:
+        product_id (str): The product ordered, e.g. 'BTC-USDC'.
+        side (str): 'buy' or 'sell'.
+        order_type (str): 'market' or 'limit'.
+        outcome (str): 'success', 'failure' if Coinbase rejected the order,
+            or 'error' if the request raised.
+        latency (float): Seconds spent submitting the order.
+    """
+
+    product_id: str
+    side: str
+    order_type: str
+    outcome: str
+    latency: float
+
+
+class Instrumentation:
+    """
+    Receiver of request, operation, order, cache, signal, rate limiter and
+    request coalescing events.
+
+    The base class ignores every event; subclass it and override the hooks
+    to export them. Hooks run on the thread making the request and must not
+    raise.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called after every HTTP request, including failed ones."""
+
+    def on_operation(self, event: OperationEvent) -> None:
+        """Called when an instrumented client operation returns or raises."""
+
+    def on_order(self, event: OrderEvent) -> None:
+        """Called after every order submission."""
+
+    def on_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Called on every lookup in a client-side cache, e.g. 'accounts'."""
+
+    def on_signal(self, name: str, value: float, asset: str = '') -> None:
+        """Called with each trading signal read, e.g. the Fear and Greed Index."""
+
+    def on_rate_limit_wait(self, limiter: str, seconds: float) -> None:
+        """Called after a request waited for a rate limiter."""
+
+    def on_request_coalesced(self, endpoint: str) -> None:
+        """Called when a read joined an identical request already in flight."""
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        """Return a context manager timing a unit of work, e.g. 'OrderService.fiat_market_buy'."""
+        return nullcontext()
+
+
+class CompositeInstrumentation(Instrumentation):
+    """Forwards every event to several instrumentations, e.g. metrics and tracing."""
+
+    def __init__(self, *instrumentations: Instrumentation) -> None:
+        self.instrumentations = instrumentations
+
+    def on_request(self, event: RequestEvent) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_request(event)
+
+    def on_operation(self, event: OperationEvent) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_operation(event)
+
+    def on_order(self, event: OrderEvent) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_order(event)
+
+    def on_cache_lookup(self, cache: str, hit: bool) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_cache_lookup(cache, hit)
+
+    def on_signal(self, name: str, value: float, asset: str = '') -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_signal(name, value, asset)
+
+    def on_rate_limit_wait(self, limiter: str, seconds: float) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_rate_limit_wait(limiter, seconds)
+
+    def on_request_coalesced(self, endpoint: str) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_request_coalesced(endpoint)
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        with ExitStack() as stack:
+            for instrumentation in self.instrumentations:
+                stack.enter_context(instrumentation.span(name, attributes))
+            yield
+
+
+def instrumentation_of(client: Any) -> Optional[Instrumentation]:
+    """Return the instrumentation attached to a client, if any."""
+    instrumentation = getattr(client, 'instrumentation', None)
+    return instrumentation if isinstance(instrumentation, Instrumentation) else None
+
+
+class _OperationScope:
+    """The operation a request belongs to and the requests it has made."""
+
+    __slots__ = ('name', 'requests', '_lock')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+
+_current_operation: ContextVar[Optional[_OperationScope]] = ContextVar(
+    'coinbase_advanced_trader_operation', default=None
+)
+
+
+_current_attempt: ContextVar[int] = ContextVar('coinbase_advanced_trader_attempt', default=0)
+
+
+@contextmanager
+def request_attempt(attempt: int) -> Iterator[None]:
+    """Mark the requests sent inside the block as the given retry attempt."""
+    token = _current_attempt.set(attempt)
+    try:
+        yield
+    finally:
+        _current_attempt.reset(token)
+
+
+def current_operation() -> Optional[str]:
+    """Return the name of the operation running in this context, if any."""
+    scope = _current_operation.get()
+    return scope.name if scope else None
+
+
+@contextmanager
+def track_operation(instrumentation: Optional[Instrumentation], name: str) -> Iterator[None]:
+    """
+    Attribute the requests made inside the block to an operation.
+
+    Scopes do not nest: inside an existing operation the outer one keeps the
+    attribution, so a bot can group several client calls under its own name.
+    The block also runs inside an `Instrumentation.span` of the same name.
+    Worker threads see the scope only if started with a copy of the current
+    context (`contextvars.copy_context().run`).
+
+    Args:
+        instrumentation: Receiver of the `OperationEvent`; None disables
+            tracking.
+        name: Operation name.
+    """
+    if instrumentation is None or _current_operation.get() is not None:
+        yield
+        return
+    scope = _OperationScope(name)
+    token = _current_operation.set(scope)
+    error = None
+    start = time.perf_counter()
+    try:
+        with instrumentation.span(name, {}):
+            yield
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        latency = time.perf_counter() - start
+        _current_operation.reset(token)
+        instrumentation.on_operation(OperationEvent(name, latency, scope.requests, error))
+
+
+def instrumented_operation(method: F) -> F:
+    """Run a client method inside an operation scope named after it."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return method(self, *args, **kwargs)
+        with track_operation(instrumentation, name):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+@lru_cache(maxsize=1024)
+def endpoint_name(method: str, url: str) -> str:
+    """
+    Name a request by its endpoint.
+
+    The brokerage prefix is dropped and identifiers are replaced by {id}, so
+    'GET /api/v3/brokerage/products/BTC-USDC' becomes 'GET products/{id}'.
+
+    Args:
+        method: HTTP method.
+        url: Full URL or path of the request.
+
+    Returns:
+        str: The endpoint name.
+    """
+    path = urlsplit(url).path
+    if path.startswith(API_PREFIX):
+        path = path[len(API_PREFIX):]
+    parts = path.strip('/').split('/')
+    for i in range(1, len(parts)):
+        if parts[i - 1] in _ID_PARENTS and parts[i] not in _LITERAL_SEGMENTS:
+            parts[i] = '{id}'
+    return f"{method} {'/'.join(parts)}"
+
+
+class InstrumentedSession:
+    """
+    Wraps a `requests.Session`-compatible object and reports each request.
+
+    Attributes other than `request` are forwarded to the wrapped session.
+    """
+
+    def __init__(self, session: Any, instrumentation: Instrumentation) -> None:
+        """
+        Initialize the session wrapper.
+
+        Args:
+            session: The session actually sending requests.
+            instrumentation: Receiver of the request events.
+        """
+        self.session = session
+        self.instrumentation = instrumentation
+        self._reports = type(instrumentation).on_request is not Instrumentation.on_request
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request through the wrapped session and report it."""
+        scope = _current_operation.get()
+        if scope is not None:
+            scope.count_request()
+        if not self._reports:
+            return self.session.request(method, url, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception as e:
+            self._report(method, url, kwargs, None, time.perf_counter() - start,
+                         scope, type(e).__name__)
+            raise
+        self._report(method, url, kwargs, response, time.perf_counter() - start, scope)
+        return response
+
+    def _report(self, method: str, url: str, kwargs: Dict[str, Any], response: Any,
+                latency: float, scope: Optional[_OperationScope],
+                error: Optional[str] = None) -> None:
+        self.instrumentation.on_request(RequestEvent(
+            method=method,
+            endpoint=endpoint_name(method, url),
+            status=response.status_code if response is not None else None,
+            latency=latency,
+            request_bytes=_request_size(response, kwargs.get('json')),
+            response_bytes=len(response.content) if response is not None else 0,
+            operation=scope.name if scope else None,
+            attempt=_current_attempt.get(),
+            error=error
+        ))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+
+def _request_size(response: Any, body: Optional[Dict[str, Any]]) -> int:
+    """Size of the body that was sent, or of the JSON body if unknown."""
+    prepared = getattr(response, 'request', None)
+    if prepared is not None and prepared.body is not None:
+        return len(prepared.body)
+    return len(json.dumps(body)) if body else 0
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, observations at or below it) pairs, ending at +Inf."""
+        pairs, total = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': [[bound if bound != float('inf') else '+Inf', count]
+                        for bound, count in self.cumulative()],
+        }
+
+
+class _RequestStats:
+    __slots__ = ('count', 'errors', 'retries', 'statuses', 'request_bytes',
+                 'response_bytes', 'latency')
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.statuses: Counter = Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency = LatencyHistogram(buckets)
+
+
+class _OperationStats:
+    __slots__ = ('count', 'errors', 'requests', 'latency')
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.count = 0
+        self.errors = 0
+        self.requests = 0
+        self.latency = LatencyHistogram(buckets)
+
+
+class InMemoryInstrumentation(Instrumentation):
+    """
+    Aggregates events in memory, per operation and endpoint.
+
+    Use `snapshot()` for the numbers, `dump()` for JSON and `format_table()`
+    for a readable summary.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Initialize the aggregator.
+
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+        """
+        self.buckets = tuple(buckets)
+        self._requests: Dict[Tuple[Optional[str], str], _RequestStats] = {}
+        self._operations: Dict[str, _OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def on_request(self, event: RequestEvent) -> None:
+        key = (event.operation, event.endpoint)
+        with self._lock:
+            stats = self._requests.get(key)
+            if stats is None:
+                stats = self._requests[key] = _RequestStats(self.buckets)
+            stats.count += 1
+            stats.errors += event.failed
+            stats.retries += event.attempt > 0
+            stats.statuses[event.status if event.status is not None else event.error] += 1
+            stats.request_bytes += event.request_bytes
+            stats.response_bytes += event.response_bytes
+            stats.latency.observe(event.latency)
+
+    def on_operation(self, event: OperationEvent) -> None:
+        with self._lock:
+            stats = self._operations.get(event.name)
+            if stats is None:
+                stats = self._operations[event.name] = _OperationStats(self.buckets)
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.requests += event.requests
+            stats.latency.observe(event.latency)
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._requests.clear()
+            self._operations.clear()
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return the aggregated statistics.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 'requests' holds one entry per
+            (operation, endpoint) pair and 'operations' one per operation,
+            each with counts, bytes and a latency summary in seconds.
+        """
+        with self._lock:
+            requests = [{
+                'operation': operation,
+                'endpoint': endpoint,
+                'count': stats.count,
+                'errors': stats.errors,
+                'retries': stats.retries,
+                'statuses': {str(status): count for status, count in stats.statuses.items()},
+                'request_bytes': stats.request_bytes,
+                'response_bytes': stats.response_bytes,
+                'latency': stats.latency.to_dict(),
+            } for (operation, endpoint), stats in self._requests.items()]
+            operations = [{
+                'name': name,
+                'count': stats.count,
+                'errors': stats.errors,
+                'requests': stats.requests,
+                'requests_per_call': stats.requests / stats.count,
+                'latency': stats.latency.to_dict(),
+            } for name, stats in self._operations.items()]
+        requests.sort(key=lambda entry: (entry['operation'] or '', entry['endpoint']))
+        operations.sort(key=lambda entry: entry['name'])
+        return {'requests': requests, 'operations': operations}
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """
+        Serialize the snapshot as JSON.
+
+        Args:
+            path: Optional file to write the JSON to.
+
+        Returns:
+            str: The JSON document.
+        """
+        document = json.dumps(self.snapshot(), indent=2)
+        if path is not None:
+            with open(path, 'w') as file:
+                file.write(document + '\n')
+        return document
+
+    def format_table(self) -> str:
+        """Render the snapshot as a plain-text table, latencies in milliseconds."""
+        snapshot = self.snapshot()
+        lines = [f"{'operation':<26}{'calls':>7}{'errors':>8}{'req/call':>10}"
+                 f"{'p50 ms':>9}{'p95 ms':>9}"]
+        for entry in snapshot['operations']:
+            latency = entry['latency']
+            lines.append(f"{entry['name']:<26}{entry['count']:>7}{entry['errors']:>8}"
+                         f"{entry['requests_per_call']:>10.2f}"
+                         f"{latency['p50'] * 1e3:>9.1f}{latency['p95'] * 1e3:>9.1f}")
+        lines.append('')
+        lines.append(f"{'operation':<26}{'endpoint':<32}{'count':>7}{'errors':>8}"
+                     f"{'retries':>8}{'p50 ms':>9}{'p95 ms':>9}{'bytes in':>10}")
+        for entry in snapshot['requests']:
+            latency = entry['latency']
+            lines.append(f"{entry['operation'] or '-':<26}{entry['endpoint']:<32}"
+                         f"{entry['count']:>7}{entry['errors']:>8}{entry['retries']:>8}"
+                         f"{latency['p50'] * 1e3:>9.1f}{latency['p95'] * 1e3:>9.1f}"
+                         f"{entry['response_bytes']:>10}")
+        return '\n'.join(lines)
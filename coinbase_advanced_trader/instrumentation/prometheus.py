@@ -0,0 +1,258 @@
+"""Prometheus metrics for long-running bots.
+
+`PrometheusInstrumentation` turns instrumentation events into counters,
+gauges and histograms, and `MetricsServer` serves them in the Prometheus
+text format at `/metrics` from a background thread. Only the standard
+library is used, so neither `prometheus_client` nor a Prometheus server is
+needed to run or test it.
+"""
+
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from coinbase_advanced_trader.logger import logger
+from .hooks import (
+    DEFAULT_LATENCY_BUCKETS,
+    Instrumentation,
+    LatencyHistogram,
+    OperationEvent,
+    OrderEvent,
+    RequestEvent
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class _Family:
+    """A metric and its samples, one per label combination."""
+
+    def __init__(self, name: str, kind: str, help_text: str, label_names: Sequence[str],
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.samples: Dict[Labels, Union[float, LatencyHistogram]] = {}
+
+    def inc(self, labels: Labels, amount: float = 1) -> None:
+        self.samples[labels] = self.samples.get(labels, 0) + amount
+
+    def set(self, labels: Labels, value: float) -> None:
+        self.samples[labels] = value
+
+    def observe(self, labels: Labels, value: float) -> None:
+        histogram = self.samples.get(labels)
+        if histogram is None:
+            histogram = self.samples[labels] = LatencyHistogram(self.buckets)
+        histogram.observe(value)
+
+    def _labels(self, values: Labels, extra: str = '') -> str:
+        pairs = [f'{name}="{_escape(str(value))}"'
+                 for name, value in zip(self.label_names, values)]
+        if extra:
+            pairs.append(extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for labels, sample in sorted(self.samples.items()):
+            if isinstance(sample, LatencyHistogram):
+                for bound, count in sample.cumulative():
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{self.name}_bucket{self._labels(labels, le)} {count}")
+                lines.append(f"{self.name}_sum{self._labels(labels)} {_format_value(sample.sum)}")
+                lines.append(f"{self.name}_count{self._labels(labels)} {sample.count}")
+            else:
+                lines.append(f"{self.name}{self._labels(labels)} {_format_value(sample)}")
+        return lines
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Instrumentation keeping Prometheus metrics of orders, requests, caches,
+    rate limiter waits and trading signals.
+
+    Pass it to the client and serve it with `MetricsServer`, or call
+    `render()` to get the exposition text directly.
+    """
+
+    def __init__(self, namespace: str = 'coinbase_advanced_trader',
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Initialize the metrics.
+
+        Args:
+            namespace: Prefix of every metric name.
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+        """
+        def family(name, kind, help_text, *label_names):
+            return _Family(f"{namespace}_{name}", kind, help_text, label_names, buckets)
+
+        self._orders = family('orders_total', 'counter',
+                              'Orders submitted.', 'product_id', 'side', 'type', 'outcome')
+        self._order_latency = family('order_latency_seconds', 'histogram',
+                                     'Order submission latency.', 'side', 'type')
+        self._requests = family('rest_requests_total', 'counter',
+                                'REST requests by endpoint and status.', 'endpoint', 'status')
+        self._request_latency = family('rest_request_duration_seconds', 'histogram',
+                                       'REST request latency by endpoint.', 'endpoint')
+        self._response_bytes = family('rest_response_bytes_total', 'counter',
+                                      'REST response body bytes by endpoint.', 'endpoint')
+        self._retries = family('rest_retries_total', 'counter',
+                               'REST requests that were retries.', 'endpoint')
+        self._coalesced = family('rest_requests_coalesced_total', 'counter',
+                                 'Reads that joined an identical request in flight.',
+                                 'endpoint')
+        self._operation_latency = family('operation_duration_seconds', 'histogram',
+                                         'Client operation latency.', 'operation')
+        self._operation_requests = family('operation_requests_total', 'counter',
+                                          'REST requests made by client operations.',
+                                          'operation')
+        self._rate_limit_wait = family('rate_limiter_wait_seconds', 'histogram',
+                                       'Time spent waiting for rate limiters.', 'limiter')
+        self._cache_lookups = family('cache_lookups_total', 'counter',
+                                     'Client-side cache lookups.', 'cache', 'result')
+        self._cache_hit_ratio = family('cache_hit_ratio', 'gauge',
+                                       'Share of cache lookups that were hits.', 'cache')
+        self._signals = family('signal', 'gauge',
+                               'Latest trading signal values.', 'name', 'asset')
+        self._families = [
+            self._orders, self._order_latency, self._requests, self._request_latency,
+            self._response_bytes, self._retries, self._coalesced, self._operation_latency,
+            self._operation_requests, self._rate_limit_wait, self._cache_lookups,
+            self._cache_hit_ratio, self._signals
+        ]
+        self._lock = threading.Lock()
+
+    def on_request(self, event: RequestEvent) -> None:
+        status = str(event.status) if event.status is not None else (event.error or 'error')
+        with self._lock:
+            self._requests.inc((event.endpoint, status))
+            self._request_latency.observe((event.endpoint,), event.latency)
+            self._response_bytes.inc((event.endpoint,), event.response_bytes)
+            if event.attempt:
+                self._retries.inc((event.endpoint,))
+
+    def on_operation(self, event: OperationEvent) -> None:
+        with self._lock:
+            self._operation_latency.observe((event.name,), event.latency)
+            self._operation_requests.inc((event.name,), event.requests)
+
+    def on_order(self, event: OrderEvent) -> None:
+        with self._lock:
+            self._orders.inc((event.product_id, event.side, event.order_type, event.outcome))
+            self._order_latency.observe((event.side, event.order_type), event.latency)
+
+    def on_cache_lookup(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            self._cache_lookups.inc((cache, 'hit' if hit else 'miss'))
+            hits = self._cache_lookups.samples.get((cache, 'hit'), 0)
+            misses = self._cache_lookups.samples.get((cache, 'miss'), 0)
+            self._cache_hit_ratio.set((cache,), hits / (hits + misses))
+
+    def on_signal(self, name: str, value: float, asset: str = '') -> None:
+        with self._lock:
+            self._signals.set((name, asset), float(value))
+
+    def on_rate_limit_wait(self, limiter: str, seconds: float) -> None:
+        with self._lock:
+            self._rate_limit_wait.observe((limiter,), seconds)
+
+    def on_request_coalesced(self, endpoint: str) -> None:
+        with self._lock:
+            self._coalesced.inc((endpoint,))
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [line for family in self._families if family.samples
+                     for line in family.render()]
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Serves `PrometheusInstrumentation.render()` at /metrics over HTTP."""
+
+    def __init__(self, metrics: PrometheusInstrumentation, host: str = '127.0.0.1',
+                 port: int = 9464) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            metrics: The metrics to serve.
+            host: Interface to listen on; the default only accepts local
+                connections.
+            port: Port to listen on; 0 picks a free one (see `port`).
+        """
+        self.metrics = metrics
+        self.host = host
+        self._requested_port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """The port the server listens on."""
+        return self._server.server_port if self._server else self._requested_port
+
+    @property
+    def url(self) -> str:
+        """The URL of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> 'MetricsServer':
+        """Start serving in a daemon thread."""
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics server: {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self._requested_port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='metrics-server', daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to exit."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def __enter__(self) -> 'MetricsServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
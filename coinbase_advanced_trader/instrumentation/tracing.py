@@ -0,0 +1,320 @@
+"""Timing spans across strategy, order, cache and HTTP layers.
+
+Strategy runs, `OrderService`, `PriceService` and `AccountService` methods
+open spans through the client's instrumentation, and each HTTP request
+becomes a child span of the work that made it. `SpanCollector` keeps
+finished spans in memory and breaks latency down by span name;
+`OpenTelemetryInstrumentation` forwards the same spans to OpenTelemetry.
+"""
+
+import inspect
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from .hooks import Instrumentation, RequestEvent, instrumentation_of
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_NO_SPAN = Instrumentation().span('', {})
+
+
+@dataclass
+class Span:
+    """
+    A timed unit of work.
+
+    Attributes:
+        name (str): What was timed, e.g. 'OrderService.fiat_market_buy' or
+            'HTTP POST orders'.
+        trace_id (int): ID shared by a root span and all its descendants.
+        span_id (int): ID of this span.
+        parent_id (Optional[int]): ID of the enclosing span, None for roots.
+        start (float): Start time on the `time.perf_counter` clock.
+        end (float): End time on the same clock; 0 while running.
+        attributes (Dict[str, Any]): Details such as the product ID.
+        error (Optional[str]): Exception type name if the work raised.
+    """
+
+    name: str
+    trace_id: int
+    span_id: int
+    parent_id: Optional[int]
+    start: float
+    end: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return self.end - self.start
+
+
+def span(client: Any, name: str, **attributes: Any) -> ContextManager[Any]:
+    """
+    Time a block of work through a client's instrumentation.
+
+    Args:
+        client: The REST client whose instrumentation receives the span.
+        name: Span name.
+        **attributes: Span attributes.
+
+    Returns:
+        ContextManager[Any]: The span context, a no-op without instrumentation.
+    """
+    instrumentation = instrumentation_of(client)
+    if instrumentation is None:
+        return _NO_SPAN
+    return instrumentation.span(name, attributes)
+
+
+def traced(*attribute_names: str,
+           client: Callable[[Any], Any] = lambda self: getattr(self, 'rest_client', None)
+           ) -> Callable[[F], F]:
+    """
+    Run a method inside a span named after its class and method.
+
+    Args:
+        *attribute_names: Parameters recorded as span attributes.
+        client: Returns the REST client of the instance, whose
+            instrumentation receives the span.
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+    def decorator(method: F) -> F:
+        name = method.__qualname__
+        positions = {parameter: index - 1 for index, parameter in
+                     enumerate(inspect.signature(method).parameters)
+                     if parameter in attribute_names}
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            instrumentation = instrumentation_of(client(self))
+            if instrumentation is None:
+                return method(self, *args, **kwargs)
+            attributes = {}
+            for parameter, position in positions.items():
+                if parameter in kwargs:
+                    attributes[parameter] = kwargs[parameter]
+                elif position < len(args):
+                    attributes[parameter] = args[position]
+            with instrumentation.span(name, attributes):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class SpanCollector(Instrumentation):
+    """
+    Keeps finished spans in memory.
+
+    Use `traces()` to inspect individual runs, `format_trace()` to print one
+    as a tree and `breakdown()` for total and self time per span name.
+    """
+
+    def __init__(self, max_spans: int = 10000) -> None:
+        """
+        Initialize the collector.
+
+        Args:
+            max_spans: Number of most recent spans kept.
+        """
+        self._spans: deque = deque(maxlen=max_spans)
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            'coinbase_advanced_trader_span', default=None
+        )
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _new_span(self, name: str, attributes: Dict[str, Any], start: float) -> Span:
+        parent = self._current.get()
+        span_id = next(self._ids)
+        return Span(name, parent.trace_id if parent else span_id, span_id,
+                    parent.span_id if parent else None, start, attributes=dict(attributes))
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+        span = self._new_span(name, attributes, time.perf_counter())
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self._current.reset(token)
+            self._finish(span)
+
+    def on_request(self, event: RequestEvent) -> None:
+        end = time.perf_counter()
+        span = self._new_span(f"HTTP {event.endpoint}", {
+            'status': event.status,
+            'request_bytes': event.request_bytes,
+            'response_bytes': event.response_bytes,
+            'attempt': event.attempt,
+        }, end - event.latency)
+        span.end = end
+        span.error = event.error or (f"HTTP {event.status}" if event.failed else None)
+        self._finish(span)
+
+    def spans(self) -> List[Span]:
+        """Return the finished spans, oldest first."""
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.start)
+
+    def reset(self) -> None:
+        """Discard every collected span."""
+        with self._lock:
+            self._spans.clear()
+
+    def traces(self) -> Dict[int, List[Span]]:
+        """Return the finished spans grouped by trace, each ordered by start time."""
+        traces: Dict[int, List[Span]] = {}
+        for span in self.spans():
+            traces.setdefault(span.trace_id, []).append(span)
+        return traces
+
+    def breakdown(self, spans: Optional[Sequence[Span]] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize where time went, per span name.
+
+        Self time is a span's duration minus that of its direct children,
+        i.e. the time spent in the span's own code.
+
+        Args:
+            spans: Spans to summarize; defaults to every collected span.
+
+        Returns:
+            List[Dict[str, Any]]: Entries with name, count, total, self and
+            mean in seconds, sorted by self time, largest first.
+        """
+        spans = self.spans() if spans is None else list(spans)
+        child_time: Dict[int, float] = {}
+        for span in spans:
+            if span.parent_id is not None:
+                child_time[span.parent_id] = child_time.get(span.parent_id, 0.0) + span.duration
+        summary: Dict[str, Dict[str, Any]] = {}
+        for span in spans:
+            entry = summary.setdefault(span.name, {'name': span.name, 'count': 0,
+                                                   'total': 0.0, 'self': 0.0})
+            entry['count'] += 1
+            entry['total'] += span.duration
+            entry['self'] += max(0.0, span.duration - child_time.get(span.span_id, 0.0))
+        for entry in summary.values():
+            entry['mean'] = entry['total'] / entry['count']
+        return sorted(summary.values(), key=lambda entry: -entry['self'])
+
+    def format_trace(self, trace_id: Optional[int] = None) -> str:
+        """
+        Render a trace as an indented tree with durations in milliseconds.
+
+        Args:
+            trace_id: The trace to render; defaults to the most recent one.
+
+        Returns:
+            str: The tree, or an empty string if nothing was collected.
+        """
+        traces = self.traces()
+        if not traces:
+            return ''
+        if trace_id is None:
+            trace_id = max(traces, key=lambda key: traces[key][0].start)
+        spans = traces[trace_id]
+        children: Dict[Optional[int], List[Span]] = {}
+        for span in spans:
+            children.setdefault(span.parent_id, []).append(span)
+
+        lines = []
+
+        def render(span: Span, depth: int) -> None:
+            attributes = ' '.join(f"{key}={value}" for key, value in span.attributes.items())
+            error = f" [{span.error}]" if span.error else ''
+            lines.append(f"{'  ' * depth}{span.name} {span.duration * 1e3:.2f}ms"
+                         f"{' ' + attributes if attributes else ''}{error}")
+            for child in children.get(span.span_id, []):
+                render(child, depth + 1)
+
+        ids = {span.span_id for span in spans}
+        for root in (span for span in spans if span.parent_id not in ids):
+            render(root, 0)
+        return '\n'.join(lines)
+
+    def format_breakdown(self) -> str:
+        """Render `breakdown()` as a plain-text table in milliseconds."""
+        lines = [f"{'span':<48}{'count':>7}{'total ms':>11}{'self ms':>10}{'mean ms':>10}"]
+        for entry in self.breakdown():
+            lines.append(f"{entry['name']:<48}{entry['count']:>7}{entry['total'] * 1e3:>11.2f}"
+                         f"{entry['self'] * 1e3:>10.2f}{entry['mean'] * 1e3:>10.2f}")
+        return '\n'.join(lines)
+
+
+def _otel_value(value: Any) -> Any:
+    """Convert an attribute to a type OpenTelemetry accepts."""
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Forwards spans to OpenTelemetry.
+
+    Requires the `opentelemetry-api` package (the `tracing` extra); exporters
+    and sampling are configured through the OpenTelemetry SDK as usual.
+    """
+
+    def __init__(self, tracer: Any = None, tracer_name: str = 'coinbase_advanced_trader') -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            tracer: An OpenTelemetry tracer; defaults to the global tracer
+                provider's tracer named `tracer_name`.
+            tracer_name: Name of the default tracer.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api; install it with "
+                "pip install coinbase-advancedtrade-python[tracing]"
+            ) from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer(tracer_name)
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        return self.tracer.start_as_current_span(
+            name, attributes={key: _otel_value(value) for key, value in attributes.items()}
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        end = time.time_ns()
+        attributes = {
+            'http.request.method': event.method,
+            'coinbase.endpoint': event.endpoint,
+            'coinbase.attempt': event.attempt,
+            'http.request.body.size': event.request_bytes,
+            'http.response.body.size': event.response_bytes,
+        }
+        if event.status is not None:
+            attributes['http.response.status_code'] = event.status
+        span = self.tracer.start_span(f"HTTP {event.endpoint}", attributes=attributes,
+                                      start_time=end - int(event.latency * 1e9))
+        if event.failed:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR,
+                                               event.error or f"HTTP {event.status}"))
+        span.end(end_time=end)
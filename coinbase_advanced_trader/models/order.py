@@ -30,6 +30,9 @@ class Order:
         price (Optional[Decimal]): The price for limit orders (None for market orders).
         client_order_id (Optional[str]): Client-specified order ID.
         status (str): Current status of the order.
+        filled_size (Decimal): Base size filled so far.
+        average_filled_price (Optional[Decimal]): Average price of the fills, if any.
+        total_fees (Decimal): Fees paid on the fills so far.
     """
 
     id: str
@@ -40,6 +43,9 @@ class Order:
     price: Optional[Decimal] = None
     client_order_id: Optional[str] = None
     status: str = "pending"
+    filled_size: Decimal = Decimal('0')
+    average_filled_price: Optional[Decimal] = None
+    total_fees: Decimal = Decimal('0')
 
     def __post_init__(self):
         """Validates that limit orders have a price."""
@@ -0,0 +1,274 @@
+"""A local index of this account's resting limit orders.
+
+`OpenOrderBook` is seeded from one paginated `list_orders` call and then
+kept current without further requests: from orders placed and cancelled
+through the `OrderService`, and from status changes reported by a
+`UserStream`. Orders are indexed by product, side and price level, so
+queries such as "orders more than 2% from mid" bisect the sorted levels
+instead of scanning every order.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.models import Order, OrderSide
+from coinbase_advanced_trader.user_stream import (
+    TERMINAL_STATUSES,
+    list_open_orders,
+    order_from_api
+)
+
+
+class _BookSide:
+    """The resting orders of one product and side, by price level."""
+
+    __slots__ = ('prices', 'levels')
+
+    def __init__(self) -> None:
+        # Sorted distinct prices; each level maps order ID to order.
+        self.prices: List[Decimal] = []
+        self.levels: Dict[Decimal, Dict[str, Order]] = {}
+
+    def add(self, order: Order) -> None:
+        level = self.levels.get(order.price)
+        if level is None:
+            level = self.levels[order.price] = {}
+            insort(self.prices, order.price)
+        level[order.id] = order
+
+    def remove(self, order_id: str, price: Decimal) -> None:
+        level = self.levels[price]
+        del level[order_id]
+        if not level:
+            del self.levels[price]
+            del self.prices[bisect_left(self.prices, price)]
+
+    def between(self, low: int, high: int) -> List[Order]:
+        """Orders at the price levels with indexes in [low, high), lowest price first."""
+        return [order for price in self.prices[low:high]
+                for order in self.levels[price].values()]
+
+
+class OpenOrderBook:
+    """
+    This account's open limit orders, indexed by product, side and price.
+
+    Safe to share between threads: updates come from the threads placing
+    orders and from the user stream's thread. Lookups by price take
+    O(log n) plus the size of the answer; adding a new price level moves
+    the levels above it.
+    """
+
+    def __init__(self, product_ids: Iterable[str] = ()) -> None:
+        """
+        Args:
+            product_ids (Iterable[str]): Products to index, all if empty.
+        """
+        self.product_ids = frozenset(product_ids)
+        self._sides: Dict[Tuple[str, OrderSide], _BookSide] = {}
+        # Where each order is indexed: (product_id, side, price).
+        self._locations: Dict[str, Tuple[str, OrderSide, Decimal]] = {}
+        self._lock = threading.Lock()
+        # The client and stream this book follows, until it is closed.
+        self._attached: Optional[Tuple[Any, Any]] = None
+
+    def attach(self, rest_client: Any, stream: Any = None) -> 'OpenOrderBook':
+        """
+        Follow the orders placed and cancelled through a client, and the
+        status updates of a user stream, until `close()` is called.
+
+        Args:
+            rest_client (Any): An `EnhancedRESTClient`.
+            stream (Any): Optional `UserStream` of the same account.
+
+        Returns:
+            OpenOrderBook: This book.
+        """
+        self.close()
+        rest_client.add_order_listener(self.update)
+        rest_client.add_cancel_listener(self.discard)
+        if stream is not None:
+            stream.order_listeners.append(self.update)
+        self._attached = (rest_client, stream)
+        return self
+
+    def close(self) -> None:
+        """Stop following the client and stream the book was attached to."""
+        attached, self._attached = self._attached, None
+        if attached is None:
+            return
+        rest_client, stream = attached
+        rest_client.remove_order_listener(self.update)
+        rest_client.remove_cancel_listener(self.discard)
+        if stream is not None and self.update in stream.order_listeners:
+            stream.order_listeners.remove(self.update)
+
+    def __enter__(self) -> 'OpenOrderBook':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def load(self, rest_client: Any) -> 'OpenOrderBook':
+        """
+        Replace the index with the open orders read from the REST API.
+
+        Args:
+            rest_client (Any): The client to read the orders with.
+
+        Returns:
+            OpenOrderBook: This book.
+        """
+        orders = [order_from_api(order)
+                  for order in list_open_orders(rest_client, sorted(self.product_ids))]
+        with self._lock:
+            self._sides.clear()
+            self._locations.clear()
+            for order in orders:
+                self._update(order)
+        logger.info(f"Loaded {len(self._locations)} open orders")
+        return self
+
+    def update(self, order: Order) -> None:
+        """
+        Index a placed or changed order, moving it if its price changed and
+        removing it once it is finished. Market orders are ignored.
+
+        Args:
+            order (Order): The order's current state.
+        """
+        with self._lock:
+            self._update(order)
+
+    def discard(self, order_id: str) -> None:
+        """
+        Remove an order, e.g. after cancelling it. Unknown IDs are ignored.
+
+        Args:
+            order_id (str): The ID of the order.
+        """
+        with self._lock:
+            self._remove(order_id)
+
+    def _update(self, order: Order) -> None:
+        self._remove(order.id)
+        if (order.price is None or order.status in TERMINAL_STATUSES
+                or (self.product_ids and order.product_id not in self.product_ids)):
+            return
+        key = (order.product_id, order.side)
+        book_side = self._sides.get(key)
+        if book_side is None:
+            book_side = self._sides[key] = _BookSide()
+        book_side.add(order)
+        self._locations[order.id] = (order.product_id, order.side, order.price)
+
+    def _remove(self, order_id: str) -> None:
+        location = self._locations.pop(order_id, None)
+        if location is not None:
+            product_id, side, price = location
+            self._sides[(product_id, side)].remove(order_id, price)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._locations
+
+    def __iter__(self) -> Iterator[Order]:
+        with self._lock:
+            return iter([order for book_side in self._sides.values()
+                         for order in book_side.between(0, len(book_side.prices))])
+
+    def get(self, order_id: str) -> Optional[Order]:
+        """Return an open order by ID, or None."""
+        with self._lock:
+            location = self._locations.get(order_id)
+            if location is None:
+                return None
+            product_id, side, price = location
+            return self._sides[(product_id, side)].levels[price][order_id]
+
+    def orders(self, product_id: str, side: Optional[OrderSide] = None) -> List[Order]:
+        """
+        Return the open orders of a product, lowest price first.
+
+        Args:
+            product_id (str): The product.
+            side (Optional[OrderSide]): Only orders on this side; both if None.
+
+        Returns:
+            List[Order]: The orders; buys before sells when both sides are asked for.
+        """
+        sides = [side] if side is not None else [OrderSide.BUY, OrderSide.SELL]
+        return [order for book_side in sides
+                for order in self.between(product_id, book_side)]
+
+    def between(self, product_id: str, side: OrderSide, low: Optional[Decimal] = None,
+                high: Optional[Decimal] = None) -> List[Order]:
+        """
+        Return the orders of a product and side priced from `low` to `high`.
+
+        Args:
+            product_id (str): The product.
+            side (OrderSide): The side of the orders.
+            low (Optional[Decimal]): Lowest price included; unbounded if None.
+            high (Optional[Decimal]): Highest price included; unbounded if None.
+
+        Returns:
+            List[Order]: The orders, lowest price first.
+        """
+        with self._lock:
+            book_side = self._sides.get((product_id, side))
+            if book_side is None:
+                return []
+            prices = book_side.prices
+            start = 0 if low is None else bisect_left(prices, low)
+            end = len(prices) if high is None else bisect_right(prices, high)
+            return book_side.between(start, end)
+
+    def best(self, product_id: str, side: OrderSide) -> Optional[Decimal]:
+        """Return the highest open buy or lowest open sell price, or None."""
+        with self._lock:
+            book_side = self._sides.get((product_id, side))
+            if book_side is None or not book_side.prices:
+                return None
+            return book_side.prices[-1 if side == OrderSide.BUY else 0]
+
+    def away_from(self, product_id: str, mid: Decimal, fraction: Decimal,
+                  side: Optional[OrderSide] = None) -> List[Order]:
+        """
+        Return the orders more than `fraction` of `mid` away from it: buys
+        below `mid * (1 - fraction)` and sells above `mid * (1 + fraction)`.
+
+        Args:
+            product_id (str): The product.
+            mid (Decimal): The reference price, e.g. the mid of the best bid and ask.
+            fraction (Decimal): The distance, e.g. Decimal('0.02') for 2%.
+            side (Optional[OrderSide]): Only orders on this side; both if None.
+
+        Returns:
+            List[Order]: The buys furthest from mid first, then the sells
+            nearest to mid first.
+        """
+        mid, fraction = Decimal(mid), Decimal(fraction)
+        result: List[Order] = []
+        with self._lock:
+            if side in (None, OrderSide.BUY):
+                book_side = self._sides.get((product_id, OrderSide.BUY))
+                if book_side is not None:
+                    end = bisect_left(book_side.prices, mid * (1 - fraction))
+                    result.extend(book_side.between(0, end))
+            if side in (None, OrderSide.SELL):
+                book_side = self._sides.get((product_id, OrderSide.SELL))
+                if book_side is not None:
+                    start = bisect_right(book_side.prices, mid * (1 + fraction))
+                    result.extend(book_side.between(start, len(book_side.prices)))
+        return result
+
+    def resting_size(self, product_id: str, side: OrderSide) -> Decimal:
+        """Return the unfilled base size of a product's open orders on one side."""
+        return sum((order.size - order.filled_size for order in self.between(product_id, side)),
+                   Decimal('0'))
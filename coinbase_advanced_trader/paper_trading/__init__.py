@@ -0,0 +1,10 @@
+"""Paper trading against a local simulated Coinbase exchange."""
+
+from .client import PaperTradingClient
+from .exchange import SimulatedExchange, SimulatedProduct
+from .transport import LatencyModel, SimulatedSession
+
+__all__ = [
+    'PaperTradingClient', 'SimulatedExchange', 'SimulatedProduct',
+    'LatencyModel', 'SimulatedSession'
+]
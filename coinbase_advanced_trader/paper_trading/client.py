@@ -0,0 +1,39 @@
+"""EnhancedRESTClient wired to a local simulated exchange."""
+
+from typing import Any, Dict, Optional, Union
+
+from coinbase.constants import USER_AGENT
+
+from coinbase_advanced_trader.enhanced_rest_client import EnhancedRESTClient
+from .exchange import SimulatedExchange
+from .transport import LatencyModel, SimulatedSession
+
+
+class PaperTradingClient(EnhancedRESTClient):
+    """
+    An EnhancedRESTClient whose requests never leave the process.
+
+    Every service and strategy runs unchanged; only the HTTP layer is
+    replaced by a `SimulatedSession`, and requests are not signed.
+    """
+
+    def __init__(self, exchange: Optional[SimulatedExchange] = None,
+                 latency: Union[LatencyModel, float, None] = None,
+                 **kwargs: Any) -> None:
+        """
+        Initialize the paper trading client.
+
+        Args:
+            exchange: The exchange to trade on. A new, empty one is created
+                if omitted.
+            latency: Latency injected into every request (see
+                `SimulatedSession`).
+            **kwargs: Additional keyword arguments for EnhancedRESTClient.
+        """
+        self.exchange = exchange or SimulatedExchange()
+        super().__init__(api_key='paper-trading', api_secret='paper-trading',
+                         transport=SimulatedSession(self.exchange, latency), **kwargs)
+
+    def set_headers(self, method: str, path: str) -> Dict[str, str]:
+        """Return request headers without a JWT; the simulator needs none."""
+        return {'User-Agent': USER_AGENT, 'Content-Type': 'application/json'}
@@ -0,0 +1,798 @@
+"""In-process simulation of the Coinbase Advanced Trade brokerage API.
+
+`SimulatedExchange` keeps balances, order books and orders in memory and
+answers the REST endpoints used by this package with payloads shaped like
+Coinbase's. Each product has a book that is either synthetic (generated
+around a reference price) or replayed (installed level by level). Market
+orders and marketable limit orders walk the book as takers; the book itself
+is not depleted, so every order sees the same liquidity. Resting limit
+orders sit in per-side heaps and fill at their limit price as makers when
+the book or a replayed candle crosses them.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from coinbase_advanced_trader.constants import API_PREFIX
+from coinbase_advanced_trader.services.order_service import OrderService
+
+DEFAULT_TAKER_FEE_RATE = Decimal('0.012')
+
+Number = Union[Decimal, float, int, str]
+Level = Tuple[Decimal, Decimal]
+Response = Tuple[int, Dict[str, Any]]
+
+
+def _decimal(value: Number) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _str(value: Decimal) -> str:
+    """Format without exponent notation, as the Coinbase API does."""
+    return format(value, 'f')
+
+
+@dataclass
+class SimulatedProduct:
+    """
+    A tradable product and its current book.
+
+    Attributes:
+        product_id (str): The product identifier, e.g. 'BTC-USDC'.
+        base_increment (Decimal): Minimum base size increment.
+        quote_increment (Decimal): Minimum price increment.
+        price (Decimal): Reference (last) price.
+        spread (Decimal): Synthetic bid/ask spread as a fraction of price.
+        depth_levels (int): Number of synthetic levels per side.
+        level_size (Decimal): Base size available at each synthetic level.
+        bids (List[Level]): Bid levels, best first.
+        asks (List[Level]): Ask levels, best first.
+    """
+
+    product_id: str
+    base_increment: Decimal
+    quote_increment: Decimal
+    price: Decimal
+    spread: Decimal
+    depth_levels: int
+    level_size: Decimal
+    bids: List[Level] = field(default_factory=list)
+    asks: List[Level] = field(default_factory=list)
+
+    @property
+    def base_currency(self) -> str:
+        return self.product_id.split('-')[0]
+
+    @property
+    def quote_currency(self) -> str:
+        return self.product_id.split('-')[1]
+
+    def rebuild_synthetic_book(self) -> None:
+        """Regenerate evenly spaced levels around the reference price."""
+        step = max(self.quote_increment, self.price * self.spread)
+        half_spread = self.price * self.spread / 2
+        best_bid = (self.price - half_spread).quantize(self.quote_increment, rounding=ROUND_FLOOR)
+        best_ask = (self.price + half_spread).quantize(self.quote_increment, rounding=ROUND_CEILING)
+        if best_ask <= best_bid:
+            best_ask = best_bid + self.quote_increment
+        self.bids = [((best_bid - step * i).quantize(self.quote_increment, rounding=ROUND_FLOOR),
+                      self.level_size) for i in range(self.depth_levels)]
+        self.asks = [((best_ask + step * i).quantize(self.quote_increment, rounding=ROUND_CEILING),
+                      self.level_size) for i in range(self.depth_levels)]
+
+
+class _SimulatedOrder:
+    """Mutable exchange-side order state."""
+
+    __slots__ = ('order_id', 'client_order_id', 'product_id', 'side', 'order_type',
+                 'configuration', 'size', 'price', 'filled_size', 'filled_value',
+                 'fees', 'status', 'created_time', 'hold', 'sequence')
+
+    def __init__(self, order_id: str, client_order_id: str, product_id: str, side: str,
+                 order_type: str, configuration: Dict[str, Any], size: Decimal,
+                 price: Optional[Decimal], created_time: str, sequence: int) -> None:
+        self.order_id = order_id
+        self.client_order_id = client_order_id
+        self.product_id = product_id
+        self.side = side
+        self.order_type = order_type
+        self.configuration = configuration
+        self.size = size
+        self.price = price
+        self.filled_size = Decimal('0')
+        self.filled_value = Decimal('0')
+        self.fees = Decimal('0')
+        self.status = 'PENDING'
+        self.created_time = created_time
+        self.hold = Decimal('0')
+        self.sequence = sequence
+
+    @property
+    def remaining(self) -> Decimal:
+        return self.size - self.filled_size
+
+    def to_json(self) -> Dict[str, Any]:
+        average = (self.filled_value / self.filled_size) if self.filled_size else Decimal('0')
+        completion = (self.filled_size / self.size * 100) if self.size else Decimal('0')
+        return {
+            'order_id': self.order_id,
+            'client_order_id': self.client_order_id,
+            'product_id': self.product_id,
+            'side': self.side,
+            'order_type': self.order_type,
+            'order_configuration': self.configuration,
+            'status': self.status,
+            'time_in_force': 'GOOD_UNTIL_CANCELLED' if self.order_type == 'LIMIT'
+                             else 'IMMEDIATE_OR_CANCEL',
+            'created_time': self.created_time,
+            'filled_size': _str(self.filled_size),
+            'filled_value': _str(self.filled_value),
+            'average_filled_price': _str(average),
+            'total_fees': _str(self.fees),
+            'completion_percentage': _str(completion.quantize(Decimal('0.01'))),
+            'product_type': 'SPOT',
+        }
+
+
+def _order_error(error: str, message: str, preview_reason: str) -> Response:
+    return 200, {
+        'success': False,
+        'failure_reason': 'UNKNOWN_FAILURE_REASON',
+        'order_id': '',
+        'error_response': {
+            'error': error,
+            'message': message,
+            'error_details': message,
+            'preview_failure_reason': preview_reason,
+        },
+    }
+
+
+class SimulatedExchange:
+    """
+    Thread-safe in-memory exchange answering Coinbase brokerage REST calls.
+
+    Supported endpoints: products (single, list, book, best bid/ask),
+    accounts (list, single), order creation (market IOC and limit GTC),
+    order lookup, listing, fills, batch cancel, edit and the transaction
+    summary.
+    """
+
+    def __init__(self, balances: Optional[Dict[str, Number]] = None,
+                 maker_fee_rate: Optional[Number] = None,
+                 taker_fee_rate: Number = DEFAULT_TAKER_FEE_RATE,
+                 clock: Callable[[], float] = time.time) -> None:
+        """
+        Initialize the exchange.
+
+        Args:
+            balances: Starting available balance per currency.
+            maker_fee_rate: Fee rate for resting fills. Defaults to
+                `OrderService.MAKER_FEE_RATE`.
+            taker_fee_rate: Fee rate for fills that take liquidity.
+            clock: Source of the timestamps stamped on orders and fills.
+        """
+        self.maker_fee_rate = _decimal(OrderService.MAKER_FEE_RATE if maker_fee_rate is None
+                                       else maker_fee_rate)
+        self.taker_fee_rate = _decimal(taker_fee_rate)
+        self.clock = clock
+        self.products: Dict[str, SimulatedProduct] = {}
+        self._available: Dict[str, Decimal] = {}
+        self._holds: Dict[str, Decimal] = {}
+        self._orders: Dict[str, _SimulatedOrder] = {}
+        self._orders_by_client_id: Dict[str, str] = {}
+        self._order_log: List[_SimulatedOrder] = []
+        self._fills: List[Dict[str, Any]] = []
+        self._bids: Dict[str, List[Tuple[Decimal, int, str]]] = {}
+        self._asks: Dict[str, List[Tuple[Decimal, int, str]]] = {}
+        self._sequence = itertools.count(1)
+        self._lock = threading.RLock()
+        for currency, amount in (balances or {}).items():
+            self.deposit(currency, amount)
+
+    # -------------------------------------------------------------------------
+    # Market and account setup
+    # -------------------------------------------------------------------------
+    def add_product(self, product_id: str, price: Number,
+                    base_increment: Number = '0.00000001',
+                    quote_increment: Number = '0.01',
+                    spread: Number = '0.0005', depth_levels: int = 10,
+                    level_size: Number = '1') -> SimulatedProduct:
+        """
+        List a product with a synthetic book around `price`.
+
+        Args:
+            product_id: The product identifier, e.g. 'BTC-USDC'.
+            price: Reference price.
+            base_increment: Minimum base size increment.
+            quote_increment: Minimum price increment.
+            spread: Bid/ask spread as a fraction of price; also the spacing
+                between synthetic levels.
+            depth_levels: Number of synthetic levels per side.
+            level_size: Base size available at each level.
+
+        Returns:
+            SimulatedProduct: The listed product.
+        """
+        product = SimulatedProduct(
+            product_id=product_id,
+            base_increment=_decimal(base_increment),
+            quote_increment=_decimal(quote_increment),
+            price=_decimal(price),
+            spread=_decimal(spread),
+            depth_levels=depth_levels,
+            level_size=_decimal(level_size)
+        )
+        product.rebuild_synthetic_book()
+        with self._lock:
+            self.products[product_id] = product
+            self._bids.setdefault(product_id, [])
+            self._asks.setdefault(product_id, [])
+            for currency in (product.base_currency, product.quote_currency):
+                self._available.setdefault(currency, Decimal('0'))
+                self._holds.setdefault(currency, Decimal('0'))
+        return product
+
+    def set_price(self, product_id: str, price: Number) -> None:
+        """Move a product's synthetic book to a new reference price."""
+        with self._lock:
+            product = self.products[product_id]
+            product.price = _decimal(price)
+            product.rebuild_synthetic_book()
+            self._match_resting(product, product.asks[0][0], product.bids[0][0])
+
+    def set_book(self, product_id: str, bids: List[Tuple[Number, Number]],
+                 asks: List[Tuple[Number, Number]]) -> None:
+        """
+        Install a replayed book snapshot.
+
+        Args:
+            product_id: The product identifier.
+            bids: (price, size) levels, best first.
+            asks: (price, size) levels, best first.
+        """
+        with self._lock:
+            product = self.products[product_id]
+            product.bids = [(_decimal(price), _decimal(size)) for price, size in bids]
+            product.asks = [(_decimal(price), _decimal(size)) for price, size in asks]
+            if product.bids and product.asks:
+                product.price = ((product.bids[0][0] + product.asks[0][0]) / 2).quantize(
+                    product.quote_increment)
+            self._match_resting(
+                product,
+                product.asks[0][0] if product.asks else None,
+                product.bids[0][0] if product.bids else None
+            )
+
+    def apply_candle(self, product_id: str, low: Number, high: Number, close: Number) -> None:
+        """
+        Replay a candle: fill resting orders inside its range, then move to its close.
+
+        Args:
+            product_id: The product identifier.
+            low: The candle low.
+            high: The candle high.
+            close: The candle close.
+        """
+        with self._lock:
+            product = self.products[product_id]
+            self._match_resting(product, _decimal(low), _decimal(high))
+            self.set_price(product_id, close)
+
+    def deposit(self, currency: str, amount: Number) -> None:
+        """Credit an available balance."""
+        with self._lock:
+            self._available[currency] = self._available.get(currency, Decimal('0')) + _decimal(amount)
+            self._holds.setdefault(currency, Decimal('0'))
+
+    def balance(self, currency: str) -> Tuple[Decimal, Decimal]:
+        """Return the (available, hold) balances of a currency."""
+        with self._lock:
+            return (self._available.get(currency, Decimal('0')),
+                    self._holds.get(currency, Decimal('0')))
+
+    # -------------------------------------------------------------------------
+    # Request dispatch
+    # -------------------------------------------------------------------------
+    def handle(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+               body: Optional[Dict[str, Any]] = None) -> Response:
+        """
+        Answer a brokerage REST request.
+
+        Args:
+            method: HTTP method.
+            path: URL path, e.g. '/api/v3/brokerage/products/BTC-USDC'.
+            params: Query parameters.
+            body: JSON body.
+
+        Returns:
+            Tuple of HTTP status code and JSON payload.
+        """
+        params = params or {}
+        body = body or {}
+        if not path.startswith(API_PREFIX):
+            return 404, {'error': 'NOT_FOUND', 'message': f"Unknown path {path}"}
+        parts = path[len(API_PREFIX):].strip('/').split('/')
+        with self._lock:
+            if method == 'GET':
+                return self._handle_get(parts, params)
+            if method == 'POST':
+                return self._handle_post(parts, body)
+        return 405, {'error': 'METHOD_NOT_ALLOWED', 'message': f"{method} {path}"}
+
+    def _handle_get(self, parts: List[str], params: Dict[str, Any]) -> Response:
+        head = parts[0]
+        if head == 'products' and len(parts) == 2:
+            product = self.products.get(parts[1])
+            if product is None:
+                return 404, {'error': 'NOT_FOUND', 'message': 'ProductID is invalid'}
+            return 200, self._product_json(product)
+        if head == 'products' and len(parts) == 1:
+            product_ids = _as_list(params.get('product_ids')) or list(self.products)
+            products = [self._product_json(self.products[product_id])
+                        for product_id in product_ids if product_id in self.products]
+            return 200, {'products': products, 'num_products': len(products)}
+        if head == 'best_bid_ask':
+            product_ids = _as_list(params.get('product_ids')) or list(self.products)
+            return 200, {'pricebooks': [self._pricebook_json(self.products[product_id], 1)
+                                        for product_id in product_ids
+                                        if product_id in self.products]}
+        if head == 'product_book':
+            product = self.products.get(params.get('product_id'))
+            if product is None:
+                return 404, {'error': 'NOT_FOUND', 'message': 'ProductID is invalid'}
+            limit = int(params.get('limit') or product.depth_levels)
+            return 200, {'pricebook': self._pricebook_json(product, limit)}
+        if head == 'accounts':
+            if len(parts) == 2:
+                for currency in self._available:
+                    if self._account_uuid(currency) == parts[1]:
+                        return 200, {'account': self._account_json(currency)}
+                return 404, {'error': 'NOT_FOUND', 'message': 'account not found'}
+            return 200, self._paginate([self._account_json(currency)
+                                        for currency in sorted(self._available)],
+                                       'accounts', params)
+        if head == 'orders' and len(parts) == 3 and parts[1] == 'historical':
+            if parts[2] == 'batch':
+                return 200, self._list_orders(params)
+            if parts[2] == 'fills':
+                return 200, self._list_fills(params)
+            order = self._orders.get(parts[2])
+            if order is None:
+                return 404, {'error': 'NOT_FOUND', 'message': 'order not found'}
+            return 200, {'order': order.to_json()}
+        if head == 'transaction_summary':
+            return 200, self._transaction_summary()
+        return 404, {'error': 'NOT_FOUND', 'message': f"Unknown endpoint {'/'.join(parts)}"}
+
+    def _handle_post(self, parts: List[str], body: Dict[str, Any]) -> Response:
+        if parts == ['orders']:
+            return self._create_order(body)
+        if parts == ['orders', 'batch_cancel']:
+            return 200, {'results': [self._cancel(order_id)
+                                     for order_id in body.get('order_ids', [])]}
+        if parts == ['orders', 'edit']:
+            return self._edit_order(body)
+        return 404, {'error': 'NOT_FOUND', 'message': f"Unknown endpoint {'/'.join(parts)}"}
+
+    # -------------------------------------------------------------------------
+    # Orders
+    # -------------------------------------------------------------------------
+    def _create_order(self, body: Dict[str, Any]) -> Response:
+        client_order_id = body.get('client_order_id') or str(uuid.uuid4())
+        existing = self._orders_by_client_id.get(client_order_id)
+        if existing is not None:
+            # Coinbase treats a repeated client_order_id as the same order.
+            return 200, self._order_success(self._orders[existing])
+
+        product = self.products.get(body.get('product_id'))
+        if product is None:
+            return _order_error('INVALID_PRODUCT_ID', 'Invalid product_id',
+                                'PREVIEW_INVALID_PRODUCT_ID')
+        side = body.get('side')
+        if side not in ('BUY', 'SELL'):
+            return _order_error('INVALID_SIDE', 'Invalid side', 'PREVIEW_INVALID_SIDE')
+        configuration = body.get('order_configuration') or {}
+
+        if 'market_market_ioc' in configuration:
+            return self._create_market_order(product, side, client_order_id, configuration)
+        if 'limit_limit_gtc' in configuration:
+            return self._create_limit_order(product, side, client_order_id, configuration)
+        return _order_error('UNSUPPORTED_ORDER_CONFIGURATION',
+                            'Unsupported order configuration',
+                            'PREVIEW_INVALID_ORDER_CONFIG')
+
+    def _new_order(self, product: SimulatedProduct, side: str, client_order_id: str,
+                   order_type: str, configuration: Dict[str, Any], size: Decimal,
+                   price: Optional[Decimal]) -> _SimulatedOrder:
+        order = _SimulatedOrder(str(uuid.uuid4()), client_order_id, product.product_id,
+                                side, order_type, configuration, size, price,
+                                self._now(), next(self._sequence))
+        self._orders[order.order_id] = order
+        self._orders_by_client_id[client_order_id] = order.order_id
+        self._order_log.append(order)
+        return order
+
+    def _create_market_order(self, product: SimulatedProduct, side: str,
+                             client_order_id: str, configuration: Dict[str, Any]) -> Response:
+        settings = configuration['market_market_ioc']
+        base, quote = product.base_currency, product.quote_currency
+        if side == 'BUY':
+            if 'quote_size' not in settings:
+                return _order_error('INVALID_ORDER_CONFIG', 'Market buys need quote_size',
+                                    'PREVIEW_INVALID_QUOTE_SIZE')
+            quote_size = _decimal(settings['quote_size'])
+            if quote_size > self._available.get(quote, Decimal('0')):
+                return _order_error('INSUFFICIENT_FUND', 'Insufficient balance in source account',
+                                    'PREVIEW_INSUFFICIENT_FUND')
+            # The quote size includes the fee.
+            size, value = self._walk(product.asks, True,
+                                     quote_budget=quote_size / (1 + self.taker_fee_rate),
+                                     base_increment=product.base_increment)
+        else:
+            if 'base_size' not in settings:
+                return _order_error('INVALID_ORDER_CONFIG', 'Market sells need base_size',
+                                    'PREVIEW_INVALID_BASE_SIZE')
+            base_size = _decimal(settings['base_size'])
+            if base_size > self._available.get(base, Decimal('0')):
+                return _order_error('INSUFFICIENT_FUND', 'Insufficient balance in source account',
+                                    'PREVIEW_INSUFFICIENT_FUND')
+            size, value = self._walk(product.bids, False, base_size=base_size)
+
+        if size <= 0:
+            return _order_error('INSUFFICIENT_LIQUIDITY', 'No liquidity available',
+                                'PREVIEW_INSUFFICIENT_LIQUIDITY')
+        order = self._new_order(product, side, client_order_id, 'MARKET', configuration,
+                                size, None)
+        self._execute(order, product, size, value, self.taker_fee_rate, 'TAKER')
+        order.status = 'FILLED'
+        return 200, self._order_success(order)
+
+    def _create_limit_order(self, product: SimulatedProduct, side: str,
+                            client_order_id: str, configuration: Dict[str, Any]) -> Response:
+        settings = configuration['limit_limit_gtc']
+        try:
+            size = _decimal(settings['base_size'])
+            price = _decimal(settings['limit_price'])
+        except (KeyError, ArithmeticError):
+            return _order_error('INVALID_ORDER_CONFIG', 'Limit orders need base_size and limit_price',
+                                'PREVIEW_INVALID_ORDER_CONFIG')
+        if size <= 0 or size % product.base_increment:
+            return _order_error('INVALID_SIZE_PRECISION', 'Invalid base size',
+                                'PREVIEW_INVALID_SIZE_PRECISION')
+        if price <= 0 or price % product.quote_increment:
+            return _order_error('INVALID_PRICE_PRECISION', 'Invalid limit price',
+                                'PREVIEW_INVALID_PRICE_PRECISION')
+
+        crosses = (side == 'BUY' and product.asks and price >= product.asks[0][0]) or \
+                  (side == 'SELL' and product.bids and price <= product.bids[0][0])
+        if crosses and settings.get('post_only'):
+            return _order_error('INVALID_LIMIT_PRICE_POST_ONLY',
+                                'Post-only order would cross the book',
+                                'PREVIEW_INVALID_LIMIT_PRICE_POST_ONLY')
+
+        if side == 'BUY':
+            currency = product.quote_currency
+            hold = size * price * (1 + max(self.maker_fee_rate, self.taker_fee_rate))
+        else:
+            currency = product.base_currency
+            hold = size
+        if hold > self._available.get(currency, Decimal('0')):
+            return _order_error('INSUFFICIENT_FUND', 'Insufficient balance in source account',
+                                'PREVIEW_INSUFFICIENT_FUND')
+
+        order = self._new_order(product, side, client_order_id, 'LIMIT', configuration,
+                                size, price)
+        self._available[currency] -= hold
+        self._holds[currency] += hold
+        order.hold = hold
+        order.status = 'OPEN'
+
+        if crosses:
+            levels = product.asks if side == 'BUY' else product.bids
+            taken, value = self._walk(levels, side == 'BUY', base_size=size, limit=price)
+            if taken > 0:
+                self._execute(order, product, taken, value, self.taker_fee_rate, 'TAKER')
+        if order.remaining > 0:
+            heap = self._bids if side == 'BUY' else self._asks
+            key = -price if side == 'BUY' else price
+            heapq.heappush(heap[product.product_id], (key, order.sequence, order.order_id))
+        else:
+            self._close(order, 'FILLED')
+        return 200, self._order_success(order)
+
+    @staticmethod
+    def _walk(levels: List[Level], buying: bool, base_size: Optional[Decimal] = None,
+              quote_budget: Optional[Decimal] = None, limit: Optional[Decimal] = None,
+              base_increment: Optional[Decimal] = None) -> Tuple[Decimal, Decimal]:
+        """
+        Walk book levels best first, returning the base size and quote value taken.
+
+        `buying` is True when `levels` are asks and False when they are
+        bids; it decides which side of the limit stops the walk. Exactly
+        one of `base_size` and `quote_budget` is given; the budget form
+        rounds each level's size down to `base_increment`. A limit stops
+        the walk at the first level beyond it.
+        """
+        taken = Decimal('0')
+        value = Decimal('0')
+        for price, available in levels:
+            if limit is not None and (price > limit if buying else price < limit):
+                break
+            if base_size is not None:
+                take = min(available, base_size - taken)
+            else:
+                take = min(available, ((quote_budget - value) / price).quantize(
+                    base_increment, rounding=ROUND_FLOOR))
+            if take <= 0:
+                break
+            taken += take
+            value += take * price
+        return taken, value
+
+    def _execute(self, order: _SimulatedOrder, product: SimulatedProduct, size: Decimal,
+                 value: Decimal, fee_rate: Decimal, liquidity: str) -> None:
+        """Settle a fill of `size` base for `value` quote against the account."""
+        base, quote = product.base_currency, product.quote_currency
+        fee = value * fee_rate
+        if order.side == 'BUY':
+            cost = value + fee
+            from_hold = min(order.hold, cost)
+            order.hold -= from_hold
+            self._holds[quote] -= from_hold
+            self._available[quote] -= cost - from_hold
+            self._available[base] += size
+        else:
+            from_hold = min(order.hold, size)
+            order.hold -= from_hold
+            self._holds[base] -= from_hold
+            self._available[base] -= size - from_hold
+            self._available[quote] += value - fee
+        order.filled_size += size
+        order.filled_value += value
+        order.fees += fee
+        self._fills.append({
+            'entry_id': str(uuid.uuid4()),
+            'trade_id': str(uuid.uuid4()),
+            'order_id': order.order_id,
+            'trade_time': self._now(),
+            'trade_type': 'FILL',
+            'price': _str((value / size).quantize(product.quote_increment)),
+            'size': _str(size),
+            'commission': _str(fee),
+            'product_id': order.product_id,
+            'liquidity_indicator': liquidity,
+            'size_in_quote': False,
+            'side': order.side,
+        })
+
+    def _close(self, order: _SimulatedOrder, status: str) -> None:
+        """Finish an order and release whatever it still holds."""
+        if order.hold:
+            product = self.products[order.product_id]
+            currency = product.quote_currency if order.side == 'BUY' else product.base_currency
+            self._holds[currency] -= order.hold
+            self._available[currency] += order.hold
+            order.hold = Decimal('0')
+        order.status = status
+
+    def _match_resting(self, product: SimulatedProduct, lowest_offer: Optional[Decimal],
+                       highest_bid: Optional[Decimal]) -> None:
+        """
+        Fill resting orders the market has traded through, at their limit price.
+
+        Buys priced at or above `lowest_offer` and sells priced at or below
+        `highest_bid` fill; None leaves that side untouched.
+        """
+        bids = self._bids[product.product_id]
+        while bids and lowest_offer is not None:
+            neg_price, sequence, order_id = bids[0]
+            order = self._orders[order_id]
+            if order.status != 'OPEN' or order.sequence != sequence:
+                heapq.heappop(bids)
+                continue
+            if -neg_price < lowest_offer:
+                break
+            heapq.heappop(bids)
+            self._execute(order, product, order.remaining, order.remaining * order.price,
+                          self.maker_fee_rate, 'MAKER')
+            self._close(order, 'FILLED')
+
+        asks = self._asks[product.product_id]
+        while asks and highest_bid is not None:
+            price, sequence, order_id = asks[0]
+            order = self._orders[order_id]
+            if order.status != 'OPEN' or order.sequence != sequence:
+                heapq.heappop(asks)
+                continue
+            if price > highest_bid:
+                break
+            heapq.heappop(asks)
+            self._execute(order, product, order.remaining, order.remaining * order.price,
+                          self.maker_fee_rate, 'MAKER')
+            self._close(order, 'FILLED')
+
+    def _cancel(self, order_id: str) -> Dict[str, Any]:
+        order = self._orders.get(order_id)
+        if order is None:
+            return {'success': False, 'failure_reason': 'UNKNOWN_CANCEL_ORDER',
+                    'order_id': order_id}
+        if order.status != 'OPEN':
+            return {'success': False, 'failure_reason': 'COMMANDER_REJECTED_CANCEL_ORDER',
+                    'order_id': order_id}
+        self._close(order, 'CANCELLED')
+        return {'success': True, 'failure_reason': 'UNKNOWN_CANCEL_FAILURE_REASON',
+                'order_id': order_id}
+
+    def _edit_order(self, body: Dict[str, Any]) -> Response:
+        order = self._orders.get(body.get('order_id'))
+        if order is None or order.status != 'OPEN' or order.order_type != 'LIMIT':
+            return 200, {'success': False, 'errors': [
+                {'edit_failure_reason': 'ORDER_NOT_FOUND' if order is None
+                 else 'CANNOT_EDIT_TO_BELOW_FILLED_SIZE' if order.status != 'OPEN'
+                 else 'UNKNOWN_EDIT_ORDER_FAILURE_REASON'}
+            ]}
+        product = self.products[order.product_id]
+        price = _decimal(body['price']) if body.get('price') else order.price
+        size = _decimal(body['size']) if body.get('size') else order.size
+        if size <= order.filled_size or size % product.base_increment \
+                or price % product.quote_increment:
+            return 200, {'success': False, 'errors': [
+                {'edit_failure_reason': 'CANNOT_EDIT_TO_BELOW_FILLED_SIZE'
+                 if size <= order.filled_size else 'UNKNOWN_EDIT_ORDER_FAILURE_REASON'}
+            ]}
+
+        if order.side == 'BUY':
+            currency = product.quote_currency
+            hold = (size - order.filled_size) * price * (
+                1 + max(self.maker_fee_rate, self.taker_fee_rate))
+        else:
+            currency = product.base_currency
+            hold = size - order.filled_size
+        if hold - order.hold > self._available[currency]:
+            return 200, {'success': False, 'errors': [
+                {'edit_failure_reason': 'UNKNOWN_EDIT_ORDER_FAILURE_REASON',
+                 'preview_failure_reason': 'PREVIEW_INSUFFICIENT_FUND'}
+            ]}
+        self._available[currency] -= hold - order.hold
+        self._holds[currency] += hold - order.hold
+        order.hold = hold
+        order.size = size
+        order.price = price
+        order.configuration = {'limit_limit_gtc': {
+            **order.configuration['limit_limit_gtc'],
+            'base_size': _str(size), 'limit_price': _str(price)
+        }}
+        # An edit loses queue priority, as on Coinbase; the entry under the
+        # old sequence is skipped when it reaches the top of the heap.
+        order.sequence = next(self._sequence)
+        heap = self._bids if order.side == 'BUY' else self._asks
+        heapq.heappush(heap[order.product_id],
+                       (-price if order.side == 'BUY' else price, order.sequence, order.order_id))
+        self._match_resting(product, product.asks[0][0] if product.asks else None,
+                            product.bids[0][0] if product.bids else None)
+        return 200, {'success': True, 'errors': []}
+
+    # -------------------------------------------------------------------------
+    # Payloads
+    # -------------------------------------------------------------------------
+    def _now(self) -> str:
+        return datetime.fromtimestamp(self.clock(), timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+    def _order_success(self, order: _SimulatedOrder) -> Dict[str, Any]:
+        return {
+            'success': True,
+            'failure_reason': 'UNKNOWN_FAILURE_REASON',
+            'order_id': order.order_id,
+            'success_response': {
+                'order_id': order.order_id,
+                'product_id': order.product_id,
+                'side': order.side,
+                'client_order_id': order.client_order_id,
+            },
+            'order_configuration': order.configuration,
+        }
+
+    def _product_json(self, product: SimulatedProduct) -> Dict[str, Any]:
+        return {
+            'product_id': product.product_id,
+            'price': _str(product.price.quantize(product.quote_increment)),
+            'base_increment': _str(product.base_increment),
+            'quote_increment': _str(product.quote_increment),
+            'base_min_size': _str(product.base_increment),
+            'quote_min_size': _str(product.quote_increment),
+            'base_currency_id': product.base_currency,
+            'quote_currency_id': product.quote_currency,
+            'status': 'online',
+            'trading_disabled': False,
+            'product_type': 'SPOT',
+        }
+
+    def _pricebook_json(self, product: SimulatedProduct, limit: int) -> Dict[str, Any]:
+        return {
+            'product_id': product.product_id,
+            'bids': [{'price': _str(price), 'size': _str(size)} for price, size in product.bids[:limit]],
+            'asks': [{'price': _str(price), 'size': _str(size)} for price, size in product.asks[:limit]],
+            'time': self._now(),
+        }
+
+    @staticmethod
+    def _account_uuid(currency: str) -> str:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"simulated-exchange/{currency}"))
+
+    def _account_json(self, currency: str) -> Dict[str, Any]:
+        return {
+            'uuid': self._account_uuid(currency),
+            'name': f"{currency} Wallet",
+            'currency': currency,
+            'available_balance': {'value': _str(self._available[currency]), 'currency': currency},
+            'hold': {'value': _str(self._holds.get(currency, Decimal('0'))), 'currency': currency},
+            'default': True,
+            'active': True,
+            'created_at': '2024-01-01T00:00:00.000Z',
+            'type': 'ACCOUNT_TYPE_CRYPTO',
+            'ready': True,
+        }
+
+    @staticmethod
+    def _paginate(items: List[Dict[str, Any]], key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        start = int(params.get('cursor') or 0)
+        limit = int(params.get('limit') or 250)
+        page = items[start:start + limit]
+        has_next = start + limit < len(items)
+        return {key: page, 'has_next': has_next,
+                'cursor': str(start + limit) if has_next else '', 'size': len(page)}
+
+    def _list_orders(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        order_ids = set(_as_list(params.get('order_ids')))
+        product_ids = set(_as_list(params.get('product_ids')))
+        statuses = set(_as_list(params.get('order_status')))
+        side = params.get('order_side')
+        orders = [
+            order.to_json() for order in reversed(self._order_log)
+            if (not order_ids or order.order_id in order_ids)
+            and (not product_ids or order.product_id in product_ids)
+            and (not statuses or order.status in statuses)
+            and (not side or order.side == side)
+        ]
+        result = self._paginate(orders, 'orders', params)
+        result['sequence'] = '0'
+        return result
+
+    def _list_fills(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        order_ids = set(_as_list(params.get('order_ids')))
+        product_ids = set(_as_list(params.get('product_ids')))
+        fills = [fill for fill in reversed(self._fills)
+                 if (not order_ids or fill['order_id'] in order_ids)
+                 and (not product_ids or fill['product_id'] in product_ids)]
+        return self._paginate(fills, 'fills', params)
+
+    def _transaction_summary(self) -> Dict[str, Any]:
+        volume = sum(Decimal(fill['price']) * Decimal(fill['size']) for fill in self._fills)
+        fees = sum((Decimal(fill['commission']) for fill in self._fills), Decimal('0'))
+        return {
+            'total_volume': float(volume),
+            'total_fees': float(fees),
+            'fee_tier': {
+                'pricing_tier': 'Simulated',
+                'usd_from': '0',
+                'usd_to': '',
+                'taker_fee_rate': _str(self.taker_fee_rate),
+                'maker_fee_rate': _str(self.maker_fee_rate),
+            },
+        }
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
@@ -0,0 +1,180 @@
+"""HTTP transport that routes REST calls to an in-process exchange.
+
+`SimulatedSession` stands in for the `requests.Session` used by the
+Coinbase SDK. It answers every request from a `SimulatedExchange` and wraps
+the payload in a real `requests.Response`, so the SDK's status handling and
+response parsing run unchanged.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from coinbase_advanced_trader.instrumentation.hooks import endpoint_name
+from .exchange import SimulatedExchange
+
+
+class LatencyModel:
+    """
+    Random request latency with a heavy right tail.
+
+    Each delay is the median for the request kind scaled by a log-normal
+    factor, so most requests land near the median and a few take several
+    times longer, as on a real network.
+    """
+
+    def __init__(self, read: float = 0.05, write: float = 0.1, jitter: float = 0.3,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize the latency model.
+
+        Args:
+            read: Median latency of GET requests in seconds.
+            write: Median latency of other requests in seconds.
+            jitter: Standard deviation of the log-normal factor.
+            seed: Seed for reproducible delays.
+        """
+        self.read = read
+        self.write = write
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, method: str) -> float:
+        """Return the delay in seconds for a request."""
+        median = self.read if method == 'GET' else self.write
+        with self._lock:
+            return median * self._random.lognormvariate(0, self.jitter)
+
+
+class SimulatedSession:
+    """
+    `requests.Session` replacement answering from a `SimulatedExchange`.
+
+    Requests are counted in total and per endpoint (e.g. 'GET products/{id}')
+    in `request_count` and `calls`. `inject_failure` makes upcoming requests
+    fail before they reach the exchange, to exercise retries.
+    """
+
+    def __init__(self, exchange: SimulatedExchange,
+                 latency: Union[LatencyModel, float, None] = None) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            exchange: The exchange answering requests.
+            latency: A LatencyModel, a fixed delay in seconds, or None for
+                no delay.
+        """
+        self.exchange = exchange
+        self.latency = latency
+        self.request_count = 0
+        self.calls: Counter = Counter()
+        self._failures: List[_InjectedFailure] = []
+        self._count_lock = threading.Lock()
+
+    def inject_failure(self, status: Optional[int] = 503, times: int = 1,
+                       endpoint: Optional[str] = None,
+                       retry_after: Optional[float] = None) -> None:
+        """
+        Fail the next matching requests without passing them to the exchange.
+
+        Args:
+            status: HTTP status to answer with, or None to raise
+                `requests.ConnectionError` instead.
+            times: Number of requests to fail.
+            endpoint: Endpoint to fail, e.g. 'POST orders'; None fails any.
+            retry_after: Value of the Retry-After header, in seconds.
+        """
+        with self._count_lock:
+            self._failures.append(_InjectedFailure(status, times, endpoint, retry_after))
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                json: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        """
+        Answer a request the way `requests.Session.request` would.
+
+        Args:
+            method: HTTP method.
+            url: Full request URL.
+            params: Query parameters.
+            json: JSON body.
+            headers: Request headers (ignored).
+            timeout: Request timeout (ignored).
+
+        Returns:
+            requests.Response: The exchange's answer.
+        """
+        path = urlsplit(url).path
+        endpoint = endpoint_name(method, path)
+        with self._count_lock:
+            self.request_count += 1
+            self.calls[endpoint] += 1
+            failure = self._take_failure(endpoint)
+        delay = self._delay(method)
+        if delay > 0:
+            time.sleep(delay)
+
+        if failure is not None:
+            if failure.status is None:
+                raise requests.ConnectionError(f"Injected connection error for {endpoint}")
+            response = _build_response(url, failure.status,
+                                       {'error': HTTPStatus(failure.status).phrase})
+            if failure.retry_after is not None:
+                response.headers['Retry-After'] = str(failure.retry_after)
+            return response
+        status, payload = self.exchange.handle(method, path, params, json)
+        return _build_response(url, status, payload)
+
+    def reset_counts(self) -> None:
+        """Zero the request counters."""
+        with self._count_lock:
+            self.request_count = 0
+            self.calls.clear()
+
+    def _take_failure(self, endpoint: str) -> Optional['_InjectedFailure']:
+        for failure in self._failures:
+            if failure.endpoint in (None, endpoint):
+                failure.times -= 1
+                if failure.times <= 0:
+                    self._failures.remove(failure)
+                return failure
+        return None
+
+    def _delay(self, method: str) -> float:
+        if self.latency is None:
+            return 0.0
+        if isinstance(self.latency, LatencyModel):
+            return self.latency.sample(method)
+        return float(self.latency)
+
+    def close(self) -> None:
+        """Provided for `requests.Session` compatibility."""
+
+
+@dataclass
+class _InjectedFailure:
+    status: Optional[int]
+    times: int
+    endpoint: Optional[str]
+    retry_after: Optional[float]
+
+
+def _build_response(url: str, status: int, payload: Dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase
+    response.url = url
+    response.encoding = 'utf-8'
+    response.headers['Content-Type'] = 'application/json'
+    response._content = json.dumps(payload).encode('utf-8')
+    return response
@@ -0,0 +1,289 @@
+"""Chasing resting limit orders toward the market.
+
+A limit buy placed `BUY_PRICE_MULTIPLIER` below spot rests until the market
+comes back to it, which it often never does. `Repricer` compares each
+chased order with the best bid and ask and moves it up to a set number of
+ticks behind the best price on its side, so it keeps resting as a maker
+order near the front of the book:
+
+* orders are amended in place with `edit_order`; an order that cannot be
+  edited is cancelled and its unfilled size placed again;
+* orders only move toward the market, and never further than
+  `max_chase` from the price they were first chased at; with
+  `fee_capped_chase`, not past the point where resting at the maker fee
+  costs more than taking at that first price would have at the taker fee;
+* every request is paid for from a token bucket, so a fast market defers
+  requotes instead of flooding the API with them.
+"""
+
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.models import Order
+from coinbase_advanced_trader.resilience import RateLimiter
+from coinbase_advanced_trader.services.fee_service import DEFAULT_FEE_TIER
+from coinbase_advanced_trader.services.order_service import OrderService
+from coinbase_advanced_trader.user_stream import TERMINAL_STATUSES
+
+
+@dataclass(frozen=True)
+class RepricingPolicy:
+    """
+    How far and how often orders are chased.
+
+    Attributes:
+        tick_offset (int): Ticks behind the best price on the order's side
+            to rest at: 0 joins the best bid (buys) or ask (sells). Orders
+            never cross the spread, whatever the offset.
+        max_chase (Decimal): Furthest an order moves from the price it was
+            first chased at, as a fraction of that price.
+        min_move_ticks (int): Smallest move worth a requote, in ticks.
+        requotes_per_second (float): Sustained rate of edit, cancel and
+            order requests.
+        requote_burst (float): Requests allowed at once.
+        fee_capped_chase (bool): Also stop a buy where its price plus the
+            maker fee exceeds the price it was first chased at plus the
+            taker fee (and a sell where its proceeds fall below that
+            price's taker proceeds), since crossing then would have cost less.
+    """
+
+    tick_offset: int = 0
+    max_chase: Decimal = Decimal('0.01')
+    min_move_ticks: int = 1
+    requotes_per_second: float = 2.0
+    requote_burst: float = 10.0
+    fee_capped_chase: bool = False
+
+
+@dataclass
+class Requote:
+    """
+    One repriced order.
+
+    Attributes:
+        order (Order): The order resting at the new price.
+        old_price (Decimal): Its price before the requote.
+        new_price (Decimal): Its price now.
+        replaced (Optional[Order]): The cancelled order, if the order could
+            not be edited and `order` replaces it.
+    """
+
+    order: Order
+    old_price: Decimal
+    new_price: Decimal
+    replaced: Optional[Order] = None
+
+
+class Repricer:
+    """
+    Keeps chased limit orders near the best bid or ask.
+
+    Call `reprice()` whenever prices may have moved, or `start()` to do so
+    on a background thread. Orders leave the chase when they finish (as
+    reported by a user stream) or can no longer be cancelled.
+    """
+
+    def __init__(self, order_service: OrderService, policy: Optional[RepricingPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 fee_rates: Optional[Callable[[str], Tuple[Decimal, Decimal]]] = None) -> None:
+        """
+        Args:
+            order_service (OrderService): The service editing and placing orders.
+            policy (Optional[RepricingPolicy]): Offsets, chase limit and
+                request budget; the defaults if omitted.
+            rate_limiter (Optional[RateLimiter]): The requote budget, by
+                default a bucket sized from the policy.
+            fee_rates (Optional[Callable[[str], Tuple[Decimal, Decimal]]]):
+                Returns the (maker, taker) fee rates of a product, for
+                `fee_capped_chase`; the order service's fee service if omitted.
+        """
+        self.order_service = order_service
+        self.policy = policy or RepricingPolicy()
+        fee_service = order_service.fee_service
+        self.fee_rates = fee_rates or (fee_service.get_fee_rates if fee_service is not None
+                                       else lambda product_id: (DEFAULT_FEE_TIER.maker_fee_rate,
+                                                                DEFAULT_FEE_TIER.taker_fee_rate))
+        self.rate_limiter = rate_limiter or RateLimiter(
+            self.policy.requotes_per_second, self.policy.requote_burst, name='requotes'
+        )
+        self.edits = 0
+        self.replacements = 0
+        self.deferred = 0
+        # Order ID -> (order, price it was first chased at).
+        self._chased: Dict[str, Tuple[Order, Decimal]] = {}
+        # Orders Coinbase refused to edit; they are cancelled and replaced.
+        self._not_editable: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def orders(self) -> List[Order]:
+        """The orders being chased."""
+        return [order for order, _ in list(self._chased.values())]
+
+    def chase(self, order: Order) -> Order:
+        """
+        Start chasing a resting limit order.
+
+        Args:
+            order (Order): The order; its current price anchors `max_chase`.
+
+        Returns:
+            Order: The same order.
+        """
+        if not order.is_limit:
+            raise ValueError(f"Only limit orders can be repriced, {order.id} is a market order")
+        self._chased[order.id] = (order, order.price)
+        return order
+
+    def release(self, order_id: str) -> None:
+        """Stop chasing an order. Unknown IDs are ignored."""
+        self._chased.pop(order_id, None)
+        self._not_editable.discard(order_id)
+
+    def target_price(self, order: Order, anchor: Decimal, bid: Decimal,
+                     ask: Decimal) -> Optional[Decimal]:
+        """
+        Return where an order should rest, or None if it should stay.
+
+        Args:
+            order (Order): The chased order.
+            anchor (Decimal): The price it was first chased at.
+            bid (Decimal): The best bid.
+            ask (Decimal): The best ask.
+
+        Returns:
+            Optional[Decimal]: The new limit price, on the quote increment.
+        """
+        kernel = self.order_service.price_service.get_sizing_kernel(order.product_id)
+        if kernel is None:
+            return None
+        tick = kernel.quote_increment
+        offset = self.policy.tick_offset * tick
+        if self.policy.fee_capped_chase:
+            maker, taker = self.fee_rates(order.product_id)
+        if order.is_buy:
+            limit = anchor * (1 + self.policy.max_chase)
+            if self.policy.fee_capped_chase:
+                limit = min(limit, anchor * (1 + taker) / (1 + maker))
+            limit = kernel.quantize_price(limit, order.side)
+            target = kernel.quantize_price(min(bid - offset, ask - tick, limit), order.side)
+            move = target - order.price
+        else:
+            limit = anchor * (1 - self.policy.max_chase)
+            if self.policy.fee_capped_chase:
+                limit = max(limit, anchor * (1 - taker) / (1 - maker))
+            limit = kernel.quantize_price(limit, order.side)
+            target = kernel.quantize_price(max(ask + offset, bid + tick, limit), order.side)
+            move = order.price - target
+        if move < self.policy.min_move_ticks * tick:
+            return None
+        return target
+
+    def reprice(self, quotes: Optional[Dict[str, Tuple[Decimal, Decimal]]] = None
+                ) -> List[Requote]:
+        """
+        Move every chased order that has fallen behind the market.
+
+        Args:
+            quotes (Optional[Dict[str, Tuple[Decimal, Decimal]]]): Best bid
+                and ask by product, e.g. from a ticker; fetched in one
+                `get_best_bid_ask` request if omitted.
+
+        Returns:
+            List[Requote]: The orders moved in this pass.
+        """
+        with self._lock:
+            for order_id, (order, _) in list(self._chased.items()):
+                if order.status in TERMINAL_STATUSES:
+                    del self._chased[order_id]
+            if not self._chased:
+                return []
+            if quotes is None:
+                quotes = self._best_bid_ask(sorted({order.product_id
+                                                    for order, _ in self._chased.values()}))
+            requotes = []
+            for order, anchor in list(self._chased.values()):
+                quote = quotes.get(order.product_id)
+                if quote is None:
+                    continue
+                target = self.target_price(order, anchor, *quote)
+                if target is None:
+                    continue
+                try:
+                    requote = self._requote(order, anchor, target)
+                except Exception as e:
+                    logger.error(f"Could not reprice order {order.id}: {str(e)}")
+                    continue
+                if requote is not None:
+                    requotes.append(requote)
+            return requotes
+
+    def _requote(self, order: Order, anchor: Decimal, target: Decimal) -> Optional[Requote]:
+        """Edit an order to `target`, falling back to cancel and replace."""
+        old_price = order.price
+        if order.id not in self._not_editable:
+            if not self.rate_limiter.try_acquire():
+                self.deferred += 1
+                return None
+            if self.order_service.edit_limit_price(order, target):
+                self.edits += 1
+                logger.info(f"Repriced order {order.id} from {old_price} to {target}")
+                return Requote(order, old_price, target)
+            self._not_editable.add(order.id)
+        # The cancel and the new order need a token each: take both or neither.
+        if not self.rate_limiter.try_acquire(2):
+            self.deferred += 1
+            return None
+        replacement = self.order_service.replace_limit_order(order, target)
+        del self._chased[order.id]
+        self._not_editable.discard(order.id)
+        if replacement is None:
+            return None
+        self._chased[replacement.id] = (replacement, anchor)
+        self.replacements += 1
+        logger.info(f"Replaced order {order.id} at {old_price} with {replacement.id} at {target}")
+        return Requote(replacement, old_price, target, replaced=order)
+
+    def _best_bid_ask(self, product_ids: List[str]) -> Dict[str, Tuple[Decimal, Decimal]]:
+        response = self.order_service.rest_client.get_best_bid_ask(product_ids=product_ids)
+        quotes = {}
+        for pricebook in response['pricebooks']:
+            if pricebook['bids'] and pricebook['asks']:
+                quotes[pricebook['product_id']] = (Decimal(pricebook['bids'][0]['price']),
+                                                   Decimal(pricebook['asks'][0]['price']))
+        return quotes
+
+    def start(self, interval: float = 1.0) -> 'Repricer':
+        """
+        Reprice every `interval` seconds on a background thread.
+
+        Args:
+            interval (float): Seconds between passes.
+
+        Returns:
+            Repricer: This repricer.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,),
+                                        name='repricer', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background thread after its current pass."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.reprice()
+            except Exception as e:
+                logger.error(f"Repricing pass failed: {str(e)}")
@@ -0,0 +1,463 @@
+"""Retries, throttling and circuit breaking for REST requests.
+
+`Resilience` wraps every request sent by `EnhancedRESTClient`. Failed
+requests are retried according to a `RetryPolicy` chosen by request kind:
+
+* reads (GET) fail fast, with one short retry;
+* order writes (order placement, edits and cancels) retry longer, which is
+  safe because Coinbase deduplicates orders by client_order_id;
+* other writes, such as deposits, are retried only after a 429, when
+  Coinbase has rejected the request without processing it.
+
+Requests are grouped by the first segment of their endpoint ('products',
+'orders', ...). A 429 pauses the whole group for the Retry-After time, or an
+adaptive backoff if none is given, so concurrent callers do not stampede
+the API. Repeated 5xx responses or connection errors open the group's
+`CircuitBreaker`, which fails requests immediately until a half-open probe
+succeeds.
+
+`RateLimiter` paces the requests of one API key so that bursts stay under
+Coinbase's per-key limit instead of provoking 429s.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, TypeVar
+
+import requests
+
+from coinbase_advanced_trader.constants import API_PREFIX, PRIVATE_REQUESTS_PER_SECOND
+from coinbase_advanced_trader.instrumentation.hooks import Instrumentation, request_attempt
+from coinbase_advanced_trader.logger import logger
+
+T = TypeVar('T')
+
+READ = 'read'
+ORDER_WRITE = 'order_write'
+WRITE = 'write'
+
+# Non-GET endpoints that are idempotent: orders carry a client_order_id,
+# and cancelling or editing twice leaves the order in the same state.
+_ORDER_WRITE_PATHS = ('orders', 'orders/batch_cancel', 'orders/edit')
+
+
+class ResilienceError(Exception):
+    """
+    A request refused locally without being sent.
+
+    Attributes:
+        group (str): The endpoint group, e.g. 'orders'.
+        retry_in (float): Seconds until requests to the group are allowed again.
+    """
+
+    def __init__(self, message: str, group: str, retry_in: float) -> None:
+        super().__init__(message)
+        self.group = group
+        self.retry_in = retry_in
+
+
+class CircuitOpenError(ResilienceError):
+    """Raised while an endpoint group's circuit breaker is open."""
+
+
+class ThrottledError(ResilienceError):
+    """Raised when an endpoint group is throttled for longer than the policy waits."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How one kind of request is retried.
+
+    Attributes:
+        max_attempts (int): Total tries, the first one included.
+        base_delay (float): Backoff before the first retry, in seconds;
+            doubled for every further retry.
+        max_delay (float): Longest wait before a retry or for a throttled
+            group. A longer Retry-After makes the request fail at once.
+        retry_statuses (FrozenSet[int]): HTTP statuses that are retried.
+        retry_connection_errors (bool): Whether connection errors and
+            timeouts are retried. Only safe if the request is idempotent.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_connection_errors: bool = True
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Return the jittered delay before retry number `attempt + 1`."""
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * rng.uniform(0.5, 1.0)
+
+
+DEFAULT_POLICIES: Dict[str, RetryPolicy] = {
+    READ: RetryPolicy(max_attempts=2, base_delay=0.1, max_delay=1.0),
+    ORDER_WRITE: RetryPolicy(max_attempts=5, base_delay=0.25, max_delay=10.0),
+    WRITE: RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=10.0,
+                       retry_statuses=frozenset({429}), retry_connection_errors=False),
+}
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with half-open probing.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    refuses requests. Once `recovery_time` has passed it lets up to
+    `half_open_probes` requests through; a successful probe closes it and a
+    failed one opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0,
+                 half_open_probes: int = 1,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            recovery_time: Seconds the breaker stays open before probing.
+            half_open_probes: Requests allowed through at once while probing.
+            clock: Monotonic time source.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_time:
+                return self.HALF_OPEN
+            return self._state
+
+    def acquire(self) -> Optional[float]:
+        """
+        Ask to send a request.
+
+        Returns:
+            Optional[float]: None if the request may be sent, otherwise the
+            seconds until the breaker will probe again.
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                remaining = self.recovery_time - (self._clock() - self._opened_at)
+                if remaining > 0:
+                    return remaining
+                self._state = self.HALF_OPEN
+                self._probes = 0
+            if self._state == self.HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    return self.recovery_time
+                self._probes += 1
+            return None
+
+    def record_success(self) -> None:
+        """Record a request the server handled; closes a half-open breaker."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                logger.info("Circuit breaker closed after a successful probe")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def release(self) -> None:
+        """
+        Give back a probe slot without judging the server, e.g. after a
+        request failed on the client side.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_failure(self) -> None:
+        """Record a server error or connection failure."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probes = 0
+
+
+class RateLimiter:
+    """
+    Token bucket pacing the requests of one API key.
+
+    Up to `burst` requests go out at once; after that requests are spaced
+    to `rate` per second. Safe to share between threads.
+    """
+
+    def __init__(self, rate: float = PRIVATE_REQUESTS_PER_SECOND,
+                 burst: Optional[float] = None, name: str = 'rest',
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second.
+            burst: Requests allowed at once; defaults to `rate`.
+            name: Label of the limiter in instrumentation events.
+            clock: Monotonic time source.
+            sleep: Function used to wait.
+        """
+        self.rate = rate
+        self.burst = rate if burst is None else burst
+        self.name = name
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting for one if the bucket is empty.
+
+        Returns:
+            float: Seconds waited.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now, so that concurrent callers queue up
+            # behind each other instead of all waking at once.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take `tokens` tokens if the bucket holds them, without waiting.
+
+        Returns:
+            bool: Whether the tokens were taken.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+
+@dataclass
+class _GroupState:
+    breaker: CircuitBreaker
+    throttled_until: float = 0.0
+    throttle_streak: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def endpoint_group(url_path: str) -> str:
+    """Return the group of a request path: its first segment after the API prefix."""
+    path = url_path[len(API_PREFIX):] if url_path.startswith(API_PREFIX) else url_path
+    return path.strip('/').split('/', 1)[0]
+
+
+def request_kind(method: str, url_path: str) -> str:
+    """Classify a request as READ, ORDER_WRITE or WRITE."""
+    if method == 'GET':
+        return READ
+    path = url_path[len(API_PREFIX):] if url_path.startswith(API_PREFIX) else url_path
+    return ORDER_WRITE if path.strip('/') in _ORDER_WRITE_PATHS else WRITE
+
+
+def _retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Resilience:
+    """Applies retry policies, group throttling and circuit breakers to requests."""
+
+    def __init__(self, policies: Optional[Dict[str, RetryPolicy]] = None,
+                 failure_threshold: int = 5, recovery_time: float = 30.0,
+                 half_open_probes: int = 1, throttle_base_delay: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize the resilience layer.
+
+        Args:
+            policies: Retry policies by request kind (READ, ORDER_WRITE,
+                WRITE), merged over `DEFAULT_POLICIES`.
+            failure_threshold: Consecutive failures that open a group's breaker.
+            recovery_time: Seconds an open breaker waits before probing.
+            half_open_probes: Concurrent probes allowed while half-open.
+            throttle_base_delay: Pause after a 429 without Retry-After,
+                doubled for each consecutive 429 in the group.
+            clock: Monotonic time source.
+            sleep: Function used to wait.
+            seed: Seed for reproducible backoff jitter.
+        """
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_probes = half_open_probes
+        self.throttle_base_delay = throttle_base_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._groups: Dict[str, _GroupState] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, group: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint group."""
+        return self._group(group).breaker
+
+    def _group(self, group: str) -> _GroupState:
+        state = self._groups.get(group)
+        if state is None:
+            with self._lock:
+                state = self._groups.get(group)
+                if state is None:
+                    state = self._groups[group] = _GroupState(CircuitBreaker(
+                        self.failure_threshold, self.recovery_time,
+                        self.half_open_probes, self._clock
+                    ))
+        return state
+
+    def call(self, method: str, url_path: str, send: Callable[[], T],
+             instrumentation: Optional[Instrumentation] = None) -> T:
+        """
+        Send a request, retrying and throttling according to its policy.
+
+        Args:
+            method: HTTP method.
+            url_path: Request path.
+            send: Sends the request once and returns the parsed response,
+                raising `requests.HTTPError` for error statuses.
+            instrumentation: Receives rate limiter waits.
+
+        Returns:
+            T: The result of the first successful `send`.
+
+        Raises:
+            CircuitOpenError: If the group's breaker is open.
+            ThrottledError: If the group is throttled for longer than the
+                policy's `max_delay`.
+            requests.HTTPError: If the request fails and is not retried.
+        """
+        kind = request_kind(method, url_path)
+        policy = self.policies[kind]
+        group = endpoint_group(url_path)
+        state = self._group(group)
+        attempt = 0
+        while True:
+            self._wait_for_throttle(state, group, policy, instrumentation)
+            retry_in = state.breaker.acquire()
+            if retry_in is not None:
+                raise CircuitOpenError(
+                    f"Circuit open for '{group}' requests; retry in {retry_in:.1f}s",
+                    group, retry_in
+                )
+
+            retry_after = None
+            try:
+                with request_attempt(attempt):
+                    result = send()
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status == 429:
+                    retry_after = self._throttle(state, _retry_after(e.response))
+                    state.breaker.record_success()
+                elif status is not None and status >= 500:
+                    state.breaker.record_failure()
+                else:
+                    state.breaker.record_success()
+                if status not in policy.retry_statuses:
+                    raise
+                error = e
+            except (requests.ConnectionError, requests.Timeout) as e:
+                state.breaker.record_failure()
+                if not policy.retry_connection_errors:
+                    raise
+                error = e
+            except requests.RequestException:
+                # A broken or undecodable response: the server did not handle it.
+                state.breaker.record_failure()
+                raise
+            except BaseException:
+                # Nothing learned about the server, e.g. KeyboardInterrupt.
+                state.breaker.release()
+                raise
+            else:
+                state.breaker.record_success()
+                if state.throttle_streak:
+                    with state.lock:
+                        state.throttle_streak = 0
+                return result
+
+            attempt += 1
+            if attempt >= policy.max_attempts:
+                raise error
+            delay = policy.backoff(attempt - 1, self._rng)
+            if retry_after is not None:
+                if retry_after > policy.max_delay:
+                    raise error
+                delay = 0.0
+            logger.warning(f"{method} {url_path} failed ({error}); retry {attempt} of "
+                           f"{policy.max_attempts - 1} in {delay:.2f}s")
+            if delay > 0:
+                self._sleep(delay)
+
+    def _throttle(self, state: _GroupState, retry_after: Optional[float]) -> float:
+        """Pause a group after a 429 and return the pause in seconds."""
+        with state.lock:
+            if retry_after is None:
+                retry_after = self.throttle_base_delay * 2 ** state.throttle_streak
+            state.throttle_streak += 1
+            state.throttled_until = max(state.throttled_until, self._clock() + retry_after)
+            return retry_after
+
+    def _wait_for_throttle(self, state: _GroupState, group: str, policy: RetryPolicy,
+                           instrumentation: Optional[Instrumentation]) -> None:
+        wait = state.throttled_until - self._clock()
+        if wait <= 0:
+            return
+        if wait > policy.max_delay:
+            raise ThrottledError(f"'{group}' requests are throttled for {wait:.1f}s",
+                                 group, wait)
+        self._sleep(wait)
+        if instrumentation is not None:
+            instrumentation.on_rate_limit_wait(group, wait)
+
+    def status(self) -> Dict[str, Tuple[str, float]]:
+        """Return each known group's breaker state and remaining throttle time."""
+        now = self._clock()
+        return {group: (state.breaker.state, max(0.0, state.throttled_until - now))
+                for group, state in sorted(self._groups.items())}
@@ -0,0 +1,238 @@
+"""Routing orders between equivalent quote currencies.
+
+BTC trades against both USD and USDC, and the two books often differ by a
+few ticks or in depth. `QuoteRouter` takes a base asset and a fiat amount,
+reads the top of every candidate book in one `get_best_bid_ask` request,
+and picks the product where the order costs least (buys) or pays most
+(sells) after fees. Books whose top level cannot absorb the whole order
+are ranked after those that can. Buys only consider quote currencies with
+enough available balance to pay for them.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.models import Order, OrderSide, OrderType
+
+#: Quote currencies treated as the same fiat amount.
+DEFAULT_QUOTE_CURRENCIES = ('USD', 'USDC')
+
+
+@dataclass
+class RouteQuote:
+    """
+    One candidate product for a routed order.
+
+    Attributes:
+        product_id (str): The product, e.g. 'BTC-USDC'.
+        price (Decimal): Best ask for buys, best bid for sells.
+        depth (Decimal): Base size available at that price.
+        fee_rate (Decimal): Fee rate the order would pay.
+        effective_price (Decimal): Price per unit of base after fees: paid
+            for buys, received for sells.
+        covers_order (bool): Whether the top level absorbs the whole order.
+    """
+
+    product_id: str
+    price: Decimal
+    depth: Decimal
+    fee_rate: Decimal
+    effective_price: Decimal
+    covers_order: bool
+
+
+@dataclass
+class RoutingDecision:
+    """
+    The candidates considered for an order, best first.
+
+    Attributes:
+        base_currency (str): The asset bought or sold, e.g. 'BTC'.
+        side (OrderSide): The side of the order.
+        fiat_amount (Decimal): The fiat amount of the order.
+        candidates (List[RouteQuote]): Every product quoted, best first.
+        skipped (Dict[str, str]): Products left out, with the reason.
+    """
+
+    base_currency: str
+    side: OrderSide
+    fiat_amount: Decimal
+    candidates: List[RouteQuote]
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def best(self) -> RouteQuote:
+        """The chosen product."""
+        return self.candidates[0]
+
+    @property
+    def product_id(self) -> str:
+        """The ID of the chosen product."""
+        return self.best.product_id
+
+    @property
+    def savings(self) -> Decimal:
+        """Fiat saved (buys) or gained (sells) against the worst candidate."""
+        worst = self.candidates[-1].effective_price
+        best = self.best.effective_price
+        if self.side == OrderSide.BUY:
+            return self.fiat_amount * (worst - best) / worst
+        return self.fiat_amount * (best - worst) / worst
+
+
+@dataclass
+class RoutedOrder:
+    """
+    An order placed on the product chosen by a `QuoteRouter`.
+
+    Attributes:
+        order (Order): The order.
+        decision (RoutingDecision): Why its product was chosen.
+    """
+
+    order: Order
+    decision: RoutingDecision
+
+
+class QuoteRouter:
+    """Places orders on whichever equivalent quote currency is cheapest."""
+
+    def __init__(self, client: Any,
+                 quote_currencies: Sequence[str] = DEFAULT_QUOTE_CURRENCIES,
+                 fee_rates: Optional[Callable[[str], Tuple[Decimal, Decimal]]] = None) -> None:
+        """
+        Args:
+            client (Any): The `EnhancedRESTClient` quoting and placing orders.
+            quote_currencies (Sequence[str]): Quote currencies to choose from.
+            fee_rates (Optional[Callable[[str], Tuple[Decimal, Decimal]]]):
+                Returns the (maker, taker) fee rates of a product; the
+                client's cached account rates if omitted.
+        """
+        self.client = client
+        self.quote_currencies = tuple(quote_currencies)
+        self.fee_rates = fee_rates or client.fee_service.get_fee_rates
+
+    def route(self, base_currency: str, fiat_amount: str, side: OrderSide,
+              order_type: OrderType = OrderType.MARKET) -> RoutingDecision:
+        """
+        Rank the products trading `base_currency` against the quote currencies.
+
+        Args:
+            base_currency (str): The asset to buy or sell, e.g. 'BTC'.
+            fiat_amount (str): The fiat amount to spend or receive.
+            side (OrderSide): The side of the order.
+            order_type (OrderType): Market orders pay the taker fee, limit
+                orders the maker fee.
+
+        Returns:
+            RoutingDecision: The candidates, best first.
+
+        Raises:
+            ValueError: If no candidate product can take the order.
+        """
+        amount = Decimal(fiat_amount)
+        product_ids = [f"{base_currency}-{quote}" for quote in self.quote_currencies]
+        skipped: Dict[str, str] = {}
+        if side == OrderSide.BUY:
+            balances = self.client.get_available_balances()
+            for quote, product_id in zip(self.quote_currencies, product_ids):
+                if balances.get(quote, Decimal('0')) < amount:
+                    skipped[product_id] = f"insufficient {quote} balance"
+            product_ids = [product_id for product_id in product_ids
+                           if product_id not in skipped]
+
+        books = {}
+        if product_ids:
+            response = self.client.get_best_bid_ask(product_ids=product_ids)
+            books = {pricebook['product_id']: pricebook for pricebook in response['pricebooks']}
+        candidates = []
+        for product_id in product_ids:
+            levels = self._levels(books, product_id, side)
+            if not levels:
+                skipped[product_id] = "no quote"
+                continue
+            candidates.append(self._quote(product_id, levels[0], amount, side, order_type))
+        if not candidates:
+            raise ValueError(f"No product can {side.value} {fiat_amount} of {base_currency}: "
+                             f"{skipped}")
+
+        if side == OrderSide.BUY:
+            candidates.sort(key=lambda quote: (not quote.covers_order, quote.effective_price))
+        else:
+            candidates.sort(key=lambda quote: (not quote.covers_order, -quote.effective_price))
+        decision = RoutingDecision(base_currency, side, amount, candidates, skipped)
+        logger.info(f"Routed {side.value} of {fiat_amount} {base_currency} to "
+                    f"{decision.product_id} at {decision.best.price}")
+        return decision
+
+    @staticmethod
+    def _levels(books: Dict[str, Any], product_id: str, side: OrderSide) -> List[Any]:
+        pricebook = books.get(product_id)
+        if pricebook is None:
+            return []
+        return pricebook['asks' if side == OrderSide.BUY else 'bids']
+
+    def _quote(self, product_id: str, level: Any, amount: Decimal, side: OrderSide,
+               order_type: OrderType) -> RouteQuote:
+        price, depth = Decimal(level['price']), Decimal(level['size'])
+        maker, taker = self.fee_rates(product_id)
+        fee_rate = maker if order_type == OrderType.LIMIT else taker
+        effective = price * (1 + fee_rate) if side == OrderSide.BUY else price * (1 - fee_rate)
+        return RouteQuote(product_id, price, depth, fee_rate, effective,
+                          covers_order=depth * price >= amount)
+
+    def buy(self, base_currency: str, fiat_amount: str,
+            order_type: OrderType = OrderType.MARKET,
+            price_multiplier: Optional[float] = None) -> RoutedOrder:
+        """
+        Buy `fiat_amount` worth of `base_currency` on the cheapest product.
+
+        Args:
+            base_currency (str): The asset to buy, e.g. 'BTC'.
+            fiat_amount (str): The fiat amount to spend.
+            order_type (OrderType): A market or a limit order.
+            price_multiplier (Optional[float]): For limit orders, the
+                multiplier of the chosen product's spot price; defaults to
+                the configured BUY_PRICE_MULTIPLIER.
+
+        Returns:
+            RoutedOrder: The order and the routing decision.
+        """
+        return self._place(base_currency, fiat_amount, OrderSide.BUY, order_type,
+                           price_multiplier)
+
+    def sell(self, base_currency: str, fiat_amount: str,
+             order_type: OrderType = OrderType.MARKET,
+             price_multiplier: Optional[float] = None) -> RoutedOrder:
+        """
+        Sell `fiat_amount` worth of `base_currency` on the best-paying product.
+
+        Args:
+            base_currency (str): The asset to sell, e.g. 'BTC'.
+            fiat_amount (str): The fiat amount to receive.
+            order_type (OrderType): A market or a limit order.
+            price_multiplier (Optional[float]): For limit orders, the
+                multiplier of the chosen product's spot price; defaults to
+                the configured SELL_PRICE_MULTIPLIER.
+
+        Returns:
+            RoutedOrder: The order and the routing decision.
+        """
+        return self._place(base_currency, fiat_amount, OrderSide.SELL, order_type,
+                           price_multiplier)
+
+    def _place(self, base_currency: str, fiat_amount: str, side: OrderSide,
+               order_type: OrderType, price_multiplier: Optional[float]) -> RoutedOrder:
+        decision = self.route(base_currency, fiat_amount, side, order_type)
+        product_id = decision.product_id
+        if order_type == OrderType.MARKET:
+            place = (self.client.fiat_market_buy if side == OrderSide.BUY
+                     else self.client.fiat_market_sell)
+            order = place(product_id, fiat_amount)
+        else:
+            place = (self.client.fiat_limit_buy if side == OrderSide.BUY
+                     else self.client.fiat_limit_sell)
+            order = place(product_id, fiat_amount, price_multiplier=price_multiplier)
+        return RoutedOrder(order, decision)
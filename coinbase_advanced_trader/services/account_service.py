@@ -1,12 +1,16 @@
+import threading
 from decimal import Decimal
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
-from coinbase.rest import RESTClient
-
+from coinbase_advanced_trader.instrumentation.hooks import instrumentation_of
+from coinbase_advanced_trader.instrumentation.tracing import traced
 from coinbase_advanced_trader.logger import logger
 
+if TYPE_CHECKING:
+    from coinbase.rest import RESTClient
+
 @dataclass
 class Account:
     uuid: str
@@ -30,30 +34,60 @@ class PaymentMethod:
     updated_at: Optional[str] = None
 
 class AccountService:
-    """Service for handling account-related operations."""
+    """
+    Service for handling account-related operations.
+
+    Safe to share between threads. The accounts cache is replaced as a
+    whole, never modified in place, so readers need no lock, and a single
+    thread refreshes it when it expires while the others wait for the
+    result.
+    """
 
-    def __init__(self, rest_client: RESTClient):
+    def __init__(self, rest_client: 'RESTClient'):
         self.rest_client = rest_client
-        self._accounts_cache = None
-        self._cache_timestamp = None
+        # (accounts, fetched at), published atomically.
+        self._accounts_snapshot: Optional[Tuple[Dict[str, Dict[str, Any]], datetime]] = None
         self._cache_duration = timedelta(hours=1)
+        self._refresh_lock = threading.Lock()
 
+    def _fresh_accounts(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return the cached accounts, or None if they are missing or expired."""
+        snapshot = self._accounts_snapshot
+        if snapshot is None or datetime.now() - snapshot[1] > self._cache_duration:
+            return None
+        return snapshot[0]
+
+    def invalidate(self) -> None:
+        """Drop the cached accounts, e.g. after a fill, so the next read fetches them."""
+        self._accounts_snapshot = None
+
+    @traced()
     def _get_accounts(self, limit: int = 250) -> Dict[str, Dict[str, Any]]:
-        if self._accounts_cache is None or \
-        (datetime.now() - self._cache_timestamp) > self._cache_duration:
-            logger.info("Fetching fresh account data from Coinbase")
-            response = self.rest_client.get_accounts(limit=limit)
-            self._accounts_cache = {
-                account['currency']: {
-                    'uuid': account['uuid'],
-                    'available_balance': Decimal(account['available_balance']['value'])
+        accounts = self._fresh_accounts()
+        instrumentation = instrumentation_of(self.rest_client)
+        if instrumentation is not None:
+            instrumentation.on_cache_lookup('accounts', accounts is not None)
+        if accounts is not None:
+            return accounts
+
+        with self._refresh_lock:
+            # Another thread may have refreshed the cache while we waited.
+            accounts = self._fresh_accounts()
+            if accounts is None:
+                logger.info("Fetching fresh account data from Coinbase")
+                response = self.rest_client.get_accounts(limit=limit)
+                accounts = {
+                    account['currency']: {
+                        'uuid': account['uuid'],
+                        'available_balance': Decimal(account['available_balance']['value'])
+                    }
+                    for account in response['accounts']
                 }
-                for account in response['accounts']
-            }
-            logger.debug(f"Processed accounts cache: {self._accounts_cache}")
-            self._cache_timestamp = datetime.now()
-        return self._accounts_cache
+                logger.debug(f"Processed accounts cache: {accounts}")
+                self._accounts_snapshot = (accounts, datetime.now())
+        return accounts
 
+    @traced('currency')
     def get_crypto_balance(self, currency: str) -> Decimal:
         """
         Get just the balance for a currency. More efficient than get_account_by_currency
@@ -74,6 +108,7 @@ class AccountService:
             logger.error(f"Error retrieving balance for {currency}: {str(e)}")
             raise
 
+    @traced('currency')
     def get_account_by_currency(self, currency: str) -> Optional[Account]:
         """
         Get full account details for a currency. Uses cached data for basic info
@@ -94,7 +129,8 @@ class AccountService:
             # Get detailed account info using the UUID we found
             account_uuid = accounts[currency]['uuid']
             detailed_response = self.rest_client.get_account(account_uuid)
-            detailed_account = detailed_response.account
+            detailed_account = detailed_response['account'] \
+                if isinstance(detailed_response, dict) else detailed_response.account
             
             return Account(
                 uuid=account_uuid,
@@ -154,6 +190,17 @@ class AccountService:
             logger.error(f"Error showing deposit methods: {str(e)}")
             raise
 
+    @traced()
+    def get_available_balances(self) -> Dict[str, Decimal]:
+        """
+        Get the available balance of every account, from the accounts cache.
+
+        Returns:
+            Dict mapping currency codes to their available balances
+        """
+        return {currency: account['available_balance']
+                for currency, account in self._get_accounts().items()}
+
     def list_held_crypto_balances(self) -> Dict[str, Decimal]:
         """
         List all accounts with non-zero balances and their details.
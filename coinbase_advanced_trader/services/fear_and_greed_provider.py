@@ -0,0 +1,138 @@
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Optional, Union
+
+from coinbase_advanced_trader.logger import logger
+
+# The index is published once a day; used when the API omits time_until_update.
+PUBLICATION_INTERVAL = 24 * 60 * 60
+# How long to wait before asking the upstream again when it is down or the
+# next publication is overdue.
+RETRY_INTERVAL = 5 * 60
+
+
+@dataclass(frozen=True)
+class FearAndGreedReading:
+    """
+    A single Fear and Greed Index publication.
+
+    Attributes:
+        value (int): The index value (0-100).
+        classification (str): The label, e.g. 'Extreme Fear'.
+        timestamp (int): Unix timestamp of the publication.
+        expires_at (float): Unix time at which the next publication is expected.
+    """
+
+    value: int
+    classification: str
+    timestamp: int
+    expires_at: float
+
+    @property
+    def is_expired(self) -> bool:
+        """Returns True once the next publication is due."""
+        return time.time() >= self.expires_at
+
+
+class FearAndGreedProvider:
+    """
+    Fetches the Fear and Greed Index and caches it until the next publication.
+
+    Value and classification are read from a single API response. When the
+    upstream is unavailable the last reading is served instead, either from
+    memory or from an optional fallback file written after every fetch.
+    """
+
+    def __init__(self, client=None,
+                 fallback_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the FearAndGreedProvider.
+
+        Args:
+            client: A FearAndGreedIndex client. Created on first use if omitted.
+            fallback_path (Optional[Union[str, Path]]): File used to persist
+                the last reading for use when the upstream is down.
+        """
+        self._client = client
+        self.fallback_path = Path(fallback_path) if fallback_path else None
+        self._reading: Optional[FearAndGreedReading] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """The Fear and Greed Index client, created on first use."""
+        if self._client is None:
+            from fear_and_greed import FearAndGreedIndex
+
+            self._client = FearAndGreedIndex()
+        return self._client
+
+    def get_reading(self) -> FearAndGreedReading:
+        """
+        Get the current reading, fetching it only when the cached one expired.
+
+        Returns:
+            FearAndGreedReading: The current index reading.
+
+        Raises:
+            Exception: If the fetch fails and no fallback reading exists.
+        """
+        with self._lock:
+            if self._reading is not None and not self._reading.is_expired:
+                return self._reading
+            try:
+                self._reading = self._fetch()
+                self._persist(self._reading)
+            except Exception as e:
+                fallback = self._reading or self._load_fallback()
+                if fallback is None:
+                    logger.error(f"Error fetching Fear and Greed Index: {e}")
+                    raise
+                logger.warning(f"Error fetching Fear and Greed Index: {e}. "
+                               f"Using last reading from {fallback.timestamp}")
+                self._reading = replace(
+                    fallback, expires_at=time.time() + RETRY_INTERVAL
+                )
+            return self._reading
+
+    def invalidate(self) -> None:
+        """Drop the cached reading so the next call fetches a fresh one."""
+        with self._lock:
+            self._reading = None
+
+    def _fetch(self) -> FearAndGreedReading:
+        data = self.client.get_current_data()
+        now = time.time()
+        timestamp = int(data['timestamp'])
+        if data.get('time_until_update'):
+            expires_at = now + int(data['time_until_update'])
+        elif timestamp + PUBLICATION_INTERVAL > now:
+            expires_at = timestamp + PUBLICATION_INTERVAL
+        else:
+            expires_at = now + RETRY_INTERVAL
+        return FearAndGreedReading(
+            value=int(data['value']),
+            classification=data['value_classification'],
+            timestamp=timestamp,
+            expires_at=expires_at
+        )
+
+    def _persist(self, reading: FearAndGreedReading) -> None:
+        if self.fallback_path is None:
+            return
+        try:
+            self.fallback_path.write_text(json.dumps(asdict(reading)))
+        except OSError as e:
+            logger.warning(f"Could not persist Fear and Greed reading: {e}")
+
+    def _load_fallback(self) -> Optional[FearAndGreedReading]:
+        if self.fallback_path is None or not self.fallback_path.exists():
+            return None
+        try:
+            return FearAndGreedReading(**json.loads(self.fallback_path.read_text()))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not load Fear and Greed fallback: {e}")
+            return None
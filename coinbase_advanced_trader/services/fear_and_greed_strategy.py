@@ -1,61 +1,158 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Union
 
-from fear_and_greed import FearAndGreedIndex
-
-from coinbase_advanced_trader.config import config_manager
+from coinbase_advanced_trader.instrumentation.hooks import instrumentation_of
+from coinbase_advanced_trader.instrumentation.tracing import traced
 from coinbase_advanced_trader.logger import logger
 from coinbase_advanced_trader.models import Order
+from coinbase_advanced_trader.trading_config import CompiledFGISchedule, FGIRule
+from .fear_and_greed_provider import FearAndGreedProvider
 from .trading_strategy_service import BaseTradingStrategy
 
 
+def _rest_client(strategy: 'FearAndGreedStrategy'):
+    """Return the REST client behind the strategy's order service, if any."""
+    return getattr(strategy.order_service, 'rest_client', None)
+
+
 class FearAndGreedStrategy(BaseTradingStrategy):
     """
     A trading strategy based on the Fear and Greed Index (FGI).
     """
 
-    def __init__(self, order_service, price_service, config):
+    def __init__(self, order_service, price_service, config,
+                 fgi_provider: Optional[FearAndGreedProvider] = None):
         """
         Initialize the FearAndGreedStrategy.
 
         :param order_service: Service for handling orders.
         :param price_service: Service for handling prices.
         :param config: Configuration object.
+        :param fgi_provider: Cached source of the index. A private one is
+                             created if omitted.
         """
         super().__init__(order_service, price_service)
         self.config = config
-        self._fgi_client = FearAndGreedIndex()
+        self.fgi_provider = fgi_provider or FearAndGreedProvider()
 
-    def execute_trade(self, product_id: str, fiat_amount: str) -> Optional[Order]:
+    @traced('product_id', 'fiat_amount', client=_rest_client)
+    def execute_trade(self, product_id: str, fiat_amount: str,
+                      schedule: Optional[List[Dict[str, Any]]] = None
+                      ) -> Optional[Order]:
         """
         Execute a trade based on the Fear and Greed Index (FGI).
 
         :param product_id: The product identifier for the trade.
         :param fiat_amount: The amount of fiat currency to trade.
+        :param schedule: Optional schedule overriding the configured one.
         :return: An Order object if a trade is executed, None otherwise.
+        :raises ValueError: If the override schedule is invalid.
+        """
+        schedule = self._resolve_schedule(schedule)
+        fgi = self._get_fgi(product_id)
+
+        rule = self._match_rule(schedule, fgi)
+        if rule is None:
+            return None
+        adjusted_amount = Decimal(fiat_amount) * rule.factor
+        self._log_trade(fgi, rule.action, adjusted_amount)
+        return self._execute_trade(product_id, str(adjusted_amount), rule.action)
+
+    @traced(client=_rest_client)
+    def execute_trades(self, fiat_amounts: Dict[str, str],
+                       schedule: Optional[List[Dict[str, Any]]] = None,
+                       max_workers: Optional[int] = None
+                       ) -> Dict[str, Union[Order, None, Exception]]:
+        """
+        Execute FGI trades for several products at once.
+
+        The index is evaluated once, prices and increments for every product
+        are fetched in one request, and the orders are placed concurrently.
+
+        :param fiat_amounts: Mapping of product identifier to fiat amount.
+        :param schedule: Optional schedule overriding the configured one.
+        :param max_workers: Maximum number of orders placed in parallel.
+        :return: Mapping of product identifier to the placed Order, None if
+                 no condition was met, or the exception raised for it.
+        :raises ValueError: If the override schedule is invalid.
+        """
+        schedule = self._resolve_schedule(schedule)
+        if not fiat_amounts:
+            return {}
+        fgi = self._get_fgi(', '.join(fiat_amounts))
+
+        rule = self._match_rule(schedule, fgi)
+        if rule is None:
+            return dict.fromkeys(fiat_amounts)
+
+        results: Dict[str, Union[Order, None, Exception]] = {}
+        trades = {}
+        for product_id, fiat_amount in fiat_amounts.items():
+            adjusted_amount = Decimal(fiat_amount) * rule.factor
+            self._log_trade(fgi, rule.action, adjusted_amount)
+            trades[product_id] = (rule.action, adjusted_amount)
+
+        try:
+            self.price_service.prefetch_products(list(trades))
+        except Exception as e:
+            logger.warning(f"Bulk price fetch failed, falling back to "
+                           f"per-product lookups: {e}")
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(trades)) as executor:
+            futures = {
+                product_id: executor.submit(copy_context().run, self._execute_trade,
+                                            product_id, str(amount), action)
+                for product_id, (action, amount) in trades.items()
+            }
+            for product_id, future in futures.items():
+                try:
+                    results[product_id] = future.result()
+                except Exception as e:
+                    logger.error(f"FGI trade failed for {product_id}: {e}")
+                    results[product_id] = e
+        return results
+
+    def _resolve_schedule(self, schedule: Optional[List[Dict[str, Any]]]
+                          ) -> CompiledFGISchedule:
+        """Compile the override schedule, or return the configured one."""
+        if schedule is None:
+            return self.config.get_compiled_schedule()
+        return CompiledFGISchedule(schedule)
+
+    @traced(client=_rest_client)
+    def _get_fgi(self, product_ids: str) -> int:
+        """Get the current FGI value and log it for the given products."""
+        reading = self.fgi_provider.get_reading()
+        logger.info(f"FGI retrieved: {reading.value} ({reading.classification}) "
+                    f"for trading {product_ids}")
+        instrumentation = instrumentation_of(_rest_client(self))
+        if instrumentation is not None:
+            instrumentation.on_signal('fear_and_greed_index', reading.value)
+        return reading.value
+
+    @staticmethod
+    def _match_rule(schedule: CompiledFGISchedule, fgi: int) -> Optional[FGIRule]:
         """
-        fgi = self._fgi_client.get_current_value()
-        fgi_classification = self._fgi_client.get_current_classification()
-        
-        logger.info(f"FGI retrieved: {fgi} ({fgi_classification}) "
-                    f"for trading {product_id}")
-
-        fiat_amount = Decimal(fiat_amount)
-        schedule = self.config.get_fgi_schedule()
-
-        for condition in schedule:
-            if self._should_execute_trade(condition, fgi):
-                adjusted_amount = fiat_amount * Decimal(condition['factor'])
-                logger.info(f"FGI condition met: FGI {fgi} "
-                            f"{condition['action']} condition. "
-                            f"Executing {condition['action']} with "
-                            f"adjusted amount {adjusted_amount:.2f}")
-                return self._execute_trade(product_id, str(adjusted_amount),
-                                           condition['action'])
-
-        logger.warning(f"No trading condition met for FGI: {fgi}")
-        return None
+        Find the schedule rule met by the FGI.
+
+        :param schedule: The compiled trading schedule.
+        :param fgi: The current Fear and Greed Index value.
+        :return: The matching rule, or None if no condition is met.
+        """
+        rule = schedule.evaluate(fgi)
+        if rule is None:
+            logger.warning(f"No trading condition met for FGI: {fgi}")
+        return rule
+
+    @staticmethod
+    def _log_trade(fgi: int, action: str, adjusted_amount: Decimal) -> None:
+        """Log the condition met and the amount about to be traded."""
+        logger.info(f"FGI condition met: FGI {fgi} "
+                    f"{action} condition. "
+                    f"Executing {action} with "
+                    f"adjusted amount {adjusted_amount:.2f}")
 
     def _execute_trade(self, product_id: str, fiat_amount: str,
                        action: str) -> Optional[Order]:
@@ -75,16 +172,3 @@ class FearAndGreedStrategy(BaseTradingStrategy):
         else:
             logger.error(f"Invalid action: {action}")
             return None
-
-    @staticmethod
-    def _should_execute_trade(condition: dict, fgi: int) -> bool:
-        """
-        Determine if a trade should be executed based on the condition and FGI.
-
-        :param condition: The trading condition.
-        :param fgi: The current Fear and Greed Index value.
-        :return: True if the trade should be executed, False otherwise.
-        """
-        return ((condition['action'] == 'buy' and fgi <= condition['threshold'])
-                or (condition['action'] == 'sell' and
-                    fgi >= condition['threshold']))
\ No newline at end of file
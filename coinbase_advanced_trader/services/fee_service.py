@@ -0,0 +1,145 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from coinbase_advanced_trader.instrumentation.hooks import instrumentation_of
+from coinbase_advanced_trader.instrumentation.tracing import traced
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.models import OrderType
+
+if TYPE_CHECKING:
+    from coinbase.rest import RESTClient
+
+
+@dataclass(frozen=True)
+class FeeTier:
+    """
+    The maker and taker fee rates of an account's volume tier.
+
+    Attributes:
+        pricing_tier (str): Name of the tier, e.g. 'Advanced 1'.
+        maker_fee_rate (Decimal): Fee rate of fills that rest on the book.
+        taker_fee_rate (Decimal): Fee rate of fills that take liquidity.
+    """
+
+    pricing_tier: str
+    maker_fee_rate: Decimal
+    taker_fee_rate: Decimal
+
+    def rate(self, order_type: OrderType) -> Decimal:
+        """Return the maker rate for limit orders and the taker rate otherwise."""
+        return self.maker_fee_rate if order_type == OrderType.LIMIT else self.taker_fee_rate
+
+
+#: Coinbase Advanced's lowest volume tier, used until the account's tier is known.
+DEFAULT_FEE_TIER = FeeTier('Default', Decimal('0.006'), Decimal('0.012'))
+
+
+class FeeService:
+    """
+    Service for the account's fee rates.
+
+    Rates come from the transaction summary endpoint and change at most
+    once a day, when Coinbase recomputes the 30-day volume, so they are
+    cached for a day and no order fetches them. The cache is published
+    atomically like `AccountService`'s, so the service is safe to share
+    between threads.
+    """
+
+    def __init__(self, rest_client: 'RESTClient',
+                 cache_duration: timedelta = timedelta(days=1),
+                 retry_after: timedelta = timedelta(minutes=5)):
+        """
+        Initialize the FeeService.
+
+        Args:
+            rest_client (RESTClient): The REST client for API calls.
+            cache_duration (timedelta): How long fetched rates are used.
+            retry_after (timedelta): How long the default rates are used
+                after a failed fetch before fetching again.
+        """
+        self.rest_client = rest_client
+        self._cache_duration = cache_duration
+        self._retry_after = retry_after
+        # (tier, expires at), published atomically.
+        self._tier_snapshot: Optional[Tuple[FeeTier, datetime]] = None
+        self._refresh_lock = threading.Lock()
+
+    def _fresh_tier(self) -> Optional[FeeTier]:
+        """Return the cached tier, or None if it is missing or expired."""
+        snapshot = self._tier_snapshot
+        if snapshot is None or datetime.now() >= snapshot[1]:
+            return None
+        return snapshot[0]
+
+    def invalidate(self) -> None:
+        """Drop the cached rates so the next read fetches them."""
+        self._tier_snapshot = None
+
+    @traced()
+    def get_fee_tier(self) -> FeeTier:
+        """
+        Get the account's fee tier, fetching it at most once a day.
+
+        Returns:
+            FeeTier: The account's rates, or `DEFAULT_FEE_TIER` if they
+            could not be fetched.
+        """
+        tier = self._fresh_tier()
+        instrumentation = instrumentation_of(self.rest_client)
+        if instrumentation is not None:
+            instrumentation.on_cache_lookup('fee_tier', tier is not None)
+        if tier is not None:
+            return tier
+
+        with self._refresh_lock:
+            # Another thread may have refreshed the cache while we waited.
+            tier = self._fresh_tier()
+            if tier is None:
+                logger.info("Fetching fee tier from Coinbase")
+                try:
+                    fee_tier = self.rest_client.get_transaction_summary()['fee_tier']
+                    tier = FeeTier(fee_tier['pricing_tier'],
+                                   Decimal(fee_tier['maker_fee_rate']),
+                                   Decimal(fee_tier['taker_fee_rate']))
+                    expires_at = datetime.now() + self._cache_duration
+                except Exception as e:
+                    logger.warning(f"Could not fetch fee tier, using default rates: {e}")
+                    tier = DEFAULT_FEE_TIER
+                    expires_at = datetime.now() + self._retry_after
+                logger.debug(f"Fee tier: {tier}")
+                self._tier_snapshot = (tier, expires_at)
+        return tier
+
+    def get_fee_rates(self, product_id: Optional[str] = None) -> Tuple[Decimal, Decimal]:
+        """
+        Get the maker and taker fee rates.
+
+        Args:
+            product_id (Optional[str]): The product traded. Rates are
+                account-wide; the argument lets this method be passed where
+                a per-product rate function is expected.
+
+        Returns:
+            Tuple[Decimal, Decimal]: The (maker, taker) fee rates.
+        """
+        tier = self.get_fee_tier()
+        return tier.maker_fee_rate, tier.taker_fee_rate
+
+    def net_of_fees(self, fiat_amount: Decimal,
+                    order_type: OrderType = OrderType.LIMIT) -> Decimal:
+        """
+        Return the notional an order can have so it costs at most
+        `fiat_amount` once the fee is added.
+
+        Args:
+            fiat_amount (Decimal): The fiat budget, fees included.
+            order_type (OrderType): Limit orders pay the maker rate,
+                market orders the taker rate.
+
+        Returns:
+            Decimal: The budget without the fee.
+        """
+        return fiat_amount / (1 + self.get_fee_tier().rate(order_type))
@@ -1,38 +1,105 @@
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from decimal import Decimal
-from typing import Dict, Any, Optional
-
-from coinbase.rest import RESTClient
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, Union
 
+from coinbase_advanced_trader import trading_config
+from coinbase_advanced_trader.instrumentation.hooks import OrderEvent, instrumentation_of
+from coinbase_advanced_trader.instrumentation.tracing import traced
 from coinbase_advanced_trader.models import Order, OrderSide, OrderType
-from coinbase_advanced_trader.trading_config import (
-    BUY_PRICE_MULTIPLIER,
-    SELL_PRICE_MULTIPLIER
-)
 from coinbase_advanced_trader.logger import logger
-from coinbase_advanced_trader.utils import calculate_base_size
+from coinbase_advanced_trader.sizing import VECTORIZED, SizingKernel, size_basket
+from .fee_service import DEFAULT_FEE_TIER, FeeService
 from .price_service import PriceService
 
+if TYPE_CHECKING:
+    from coinbase.rest import RESTClient
+
 
 class OrderService:
     """Service for handling order-related operations."""
 
-    def __init__(self, rest_client: RESTClient, price_service: PriceService):
+    # Lowest tier maker rate; the account's own rates come from `fee_service`.
+    MAKER_FEE_RATE = DEFAULT_FEE_TIER.maker_fee_rate
+
+    def __init__(self, rest_client: 'RESTClient', price_service: PriceService,
+                 fee_service: Optional[FeeService] = None):
         """
         Initialize the OrderService.
 
         Args:
             rest_client (RESTClient): The REST client for API calls.
             price_service (PriceService): The service for price-related operations.
+            fee_service (Optional[FeeService]): The account's fee rates. When
+                given, limit buys are sized so the maker fee fits in their
+                fiat amount.
         """
         self.rest_client = rest_client
         self.price_service = price_service
-        self.MAKER_FEE_RATE = Decimal('0.006')
+        self.fee_service = fee_service
+        # Called with every order placed or repriced, e.g. a `UserStream.track`.
+        self.order_listeners: List[Callable[[Order], Any]] = []
+        # Called with the ID of every order cancelled.
+        self.cancel_listeners: List[Callable[[str], Any]] = []
 
     def _generate_client_order_id(self) -> str:
         """Generate a unique client order ID."""
         return str(uuid.uuid4())
 
+    def _sizing_kernel(self, product_id: str) -> SizingKernel:
+        """Return the product's sizing kernel, raising if its details are unavailable."""
+        kernel = self.price_service.get_sizing_kernel(product_id)
+        if kernel is None:
+            raise ValueError(f"Could not get product details for {product_id}")
+        return kernel
+
+    def _limit_budget(self, fiat_amount: str, side: OrderSide) -> Decimal:
+        """Return the notional of a limit order worth `fiat_amount`, fees included for buys."""
+        amount = Decimal(fiat_amount)
+        if side == OrderSide.BUY and self.fee_service is not None:
+            return self.fee_service.net_of_fees(amount, OrderType.LIMIT)
+        return amount
+
+    def _placed(self, order: Order) -> Order:
+        """Hand a newly placed or repriced order to the order listeners and return it."""
+        for listener in self.order_listeners:
+            listener(order)
+        return order
+
+    def _submit_order(self, order_func: Callable[..., Any], product_id: str,
+                      side: OrderSide, order_type: OrderType, *args: Any) -> Any:
+        """
+        Submit an order and report its outcome and latency to the client's
+        instrumentation, if any.
+
+        Args:
+            order_func (Callable[..., Any]): The REST client method placing the order.
+            product_id (str): The ID of the product.
+            side (OrderSide): The side of the order.
+            order_type (OrderType): The type of the order.
+            *args (Any): Arguments for `order_func`.
+
+        Returns:
+            Any: The order response from Coinbase.
+        """
+        instrumentation = instrumentation_of(self.rest_client)
+        if instrumentation is None:
+            return order_func(*args)
+        outcome = 'error'
+        start = time.perf_counter()
+        try:
+            response = order_func(*args)
+            outcome = 'success' if response['success'] else 'failure'
+            return response
+        finally:
+            instrumentation.on_order(OrderEvent(
+                product_id, side.name.lower(), order_type.name.lower(), outcome,
+                time.perf_counter() - start
+            ))
+
+    @traced('product_id', 'fiat_amount')
     def fiat_market_buy(self, product_id: str, fiat_amount: str) -> Order:
         """
         Place a market buy order for a specified fiat amount.
@@ -48,7 +115,8 @@ class OrderService:
             Exception: If the order placement fails.
         """
         try:
-            order_response = self.rest_client.market_order_buy(
+            order_response = self._submit_order(
+                self.rest_client.market_order_buy, product_id, OrderSide.BUY, OrderType.MARKET,
                 self._generate_client_order_id(), product_id, fiat_amount
             )
             if not order_response['success']:
@@ -69,7 +137,7 @@ class OrderService:
                 size=Decimal(fiat_amount)
             )
             self._log_order_result(order_response, product_id, fiat_amount, side=OrderSide.BUY)
-            return order
+            return self._placed(order)
         except Exception as e:
             error_message = str(e)
             if "Invalid product_id" in error_message:
@@ -79,6 +147,7 @@ class OrderService:
                 logger.error(error_log)
             raise
 
+    @traced('product_id', 'fiat_amount')
     def fiat_market_sell(self, product_id: str, fiat_amount: str) -> Order:
         """
         Place a market sell order for a specified fiat amount.
@@ -94,12 +163,11 @@ class OrderService:
             Exception: If the order placement fails.
         """
         spot_price = self.price_service.get_spot_price(product_id)
-        product_details = self.price_service.get_product_details(product_id)
-        base_increment = Decimal(product_details['base_increment'])
-        base_size = calculate_base_size(Decimal(fiat_amount), spot_price, base_increment)
+        base_size = self._sizing_kernel(product_id).base_size(Decimal(fiat_amount), spot_price)
         
         try:
-            order_response = self.rest_client.market_order_sell(
+            order_response = self._submit_order(
+                self.rest_client.market_order_sell, product_id, OrderSide.SELL, OrderType.MARKET,
                 self._generate_client_order_id(), product_id, str(base_size)
             )
             if not order_response['success']:
@@ -120,7 +188,7 @@ class OrderService:
                 size=base_size
             )
             self._log_order_result(order_response, product_id, str(base_size), side=OrderSide.SELL)
-            return order
+            return self._placed(order)
         except Exception as e:
             error_message = str(e)
             if "Invalid product_id" in error_message:
@@ -130,22 +198,28 @@ class OrderService:
                 logger.error(error_log)
             raise
 
-    def fiat_limit_buy(self, product_id: str, fiat_amount: str, limit_price: Optional[str] = None, price_multiplier: float = BUY_PRICE_MULTIPLIER) -> Order:
+    @traced('product_id', 'fiat_amount', 'limit_price')
+    def fiat_limit_buy(self, product_id: str, fiat_amount: str, limit_price: Optional[str] = None, price_multiplier: Optional[float] = None) -> Order:
         """
         Place a limit buy order for a specified fiat amount.
 
         Args:
             product_id (str): The ID of the product to buy.
-            fiat_amount (str): The amount of fiat currency to spend.
+            fiat_amount (str): The amount of fiat currency to spend, including the maker
+                fee when the service has a fee_service.
             limit_price (Optional[str]): The specific limit price for the order (overrides price_multiplier if provided).
-            price_multiplier (float): The multiplier for the current price (used if limit_price is not provided).
+            price_multiplier (Optional[float]): The multiplier for the current price (used if limit_price is not provided).
+                Defaults to the configured BUY_PRICE_MULTIPLIER.
 
         Returns:
             Order: The order object containing details about the executed order.
         """
+        if price_multiplier is None:
+            price_multiplier = trading_config.BUY_PRICE_MULTIPLIER
         return self._place_limit_order(product_id, fiat_amount, limit_price, price_multiplier, OrderSide.BUY)
 
-    def fiat_limit_sell(self, product_id: str, fiat_amount: str, limit_price: Optional[str] = None, price_multiplier: float = SELL_PRICE_MULTIPLIER) -> Order:
+    @traced('product_id', 'fiat_amount', 'limit_price')
+    def fiat_limit_sell(self, product_id: str, fiat_amount: str, limit_price: Optional[str] = None, price_multiplier: Optional[float] = None) -> Order:
         """
         Place a limit sell order for a specified fiat amount.
 
@@ -153,11 +227,14 @@ class OrderService:
             product_id (str): The ID of the product to sell.
             fiat_amount (str): The amount of fiat currency to receive.
             limit_price (Optional[str]): The specific limit price for the order (overrides price_multiplier if provided).
-            price_multiplier (float): The multiplier for the current price (used if limit_price is not provided).
+            price_multiplier (Optional[float]): The multiplier for the current price (used if limit_price is not provided).
+                Defaults to the configured SELL_PRICE_MULTIPLIER.
 
         Returns:
             Order: The order object containing details about the executed order.
         """
+        if price_multiplier is None:
+            price_multiplier = trading_config.SELL_PRICE_MULTIPLIER
         return self._place_limit_order(product_id, fiat_amount, limit_price, price_multiplier, OrderSide.SELL)
     
     def _place_limit_order(self, product_id: str, fiat_amount: str, limit_price: Optional[str], price_multiplier: float, side: OrderSide) -> Order:
@@ -180,26 +257,37 @@ class OrderService:
         if current_price is None:
             raise ValueError(f"Could not get current price for {product_id}")
         
-        product_details = self.price_service.get_product_details(product_id)
-        if product_details is None:
-            raise ValueError(f"Could not get product details for {product_id}")
+        kernel = self._sizing_kernel(product_id)
 
-        base_increment = Decimal(product_details['base_increment'])
-        quote_increment = Decimal(product_details['quote_increment'])
+        # Round the price toward the passive side and the size down, so the
+        # order never costs more than fiat_amount
+        reference_price = (Decimal(limit_price) if limit_price
+                           else current_price * Decimal(str(price_multiplier)))
+        adjusted_price, base_size = kernel.limit_order(self._limit_budget(fiat_amount, side),
+                                                       reference_price, side)
+        return self._submit_limit_order(product_id, fiat_amount, side, adjusted_price, base_size)
 
-        # Calculate adjusted price
-        adjusted_price = (Decimal(limit_price) if limit_price 
-                        else current_price * Decimal(str(price_multiplier))).quantize(quote_increment)
+    def _submit_limit_order(self, product_id: str, fiat_amount: str, side: OrderSide,
+                            adjusted_price: Decimal, base_size: Decimal) -> Order:
+        """
+        Submit a priced and sized GTC limit order.
 
-        # Calculate base size
-        base_size = calculate_base_size(Decimal(fiat_amount), adjusted_price, base_increment)
+        Args:
+            product_id (str): The ID of the product.
+            fiat_amount (str): The amount of fiat currency the order was sized for.
+            side (OrderSide): The side of the order (buy or sell).
+            adjusted_price (Decimal): The limit price.
+            base_size (Decimal): The order size in base currency.
 
-        # Place the order
+        Returns:
+            Order: The order object containing details about the executed order.
+        """
         order_func = (self.rest_client.limit_order_gtc_buy 
                     if side == OrderSide.BUY 
                     else self.rest_client.limit_order_gtc_sell)
         
-        order_response = order_func(
+        order_response = self._submit_order(
+            order_func, product_id, side, OrderType.LIMIT,
             self._generate_client_order_id(),
             product_id,
             str(base_size),
@@ -218,8 +306,167 @@ class OrderService:
         # Pass fiat_amount for buy orders, base_size for sell orders
         amount = fiat_amount if side == OrderSide.BUY else str(base_size)
         self._log_order_result(order_response, product_id, amount, adjusted_price, side)
-        return order
+        return self._placed(order)
+
+    @traced('fiat_amounts')
+    def place_limit_orders(self, fiat_amounts: Dict[str, str], side: OrderSide,
+                           price_multiplier: Optional[float] = None,
+                           max_workers: Optional[int] = None
+                           ) -> Dict[str, Union[Order, None, Exception]]:
+        """
+        Place limit orders on several products at once.
+
+        Prices and increments of every product are fetched in one request and
+        the orders are sized together (with NumPy when it is installed).
+        Orders below their product's minimum size are skipped; the others are
+        placed concurrently.
+
+        Args:
+            fiat_amounts (Dict[str, str]): Mapping of product ID to fiat amount.
+            side (OrderSide): The side of every order.
+            price_multiplier (Optional[float]): The multiplier for the current prices.
+                Defaults to the configured BUY_ or SELL_PRICE_MULTIPLIER.
+            max_workers (Optional[int]): Maximum number of orders placed in parallel.
+
+        Returns:
+            Dict[str, Union[Order, None, Exception]]: The placed Order per product,
+            None if its order was below the minimum size, or the exception raised
+            for it.
+        """
+        if price_multiplier is None:
+            price_multiplier = (trading_config.BUY_PRICE_MULTIPLIER if side == OrderSide.BUY
+                                else trading_config.SELL_PRICE_MULTIPLIER)
+        multiplier = Decimal(str(price_multiplier))
+        try:
+            self.price_service.prefetch_products(list(fiat_amounts))
+        except Exception as e:
+            logger.warning(f"Bulk price fetch failed, falling back to "
+                           f"per-product lookups: {e}")
+
+        results: Dict[str, Union[Order, None, Exception]] = {}
+        kernels: List[SizingKernel] = []
+        reference_prices: List[Decimal] = []
+        for product_id in fiat_amounts:
+            try:
+                current_price = self.price_service.get_spot_price(product_id)
+                if current_price is None:
+                    raise ValueError(f"Could not get current price for {product_id}")
+                kernels.append(self._sizing_kernel(product_id))
+                reference_prices.append(current_price * multiplier)
+            except Exception as e:
+                logger.error(f"Could not size the {side.name.lower()} order for {product_id}: {e}")
+                results[product_id] = e
+
+        amounts = [self._limit_budget(fiat_amounts[kernel.product_id], side)
+                   for kernel in kernels]
+        sized = {product_id: (price, size) for product_id, _, price, size
+                 in self._size_limit_orders(kernels, amounts, reference_prices, side)}
+        for kernel in kernels:
+            if kernel.product_id not in sized:
+                logger.warning(f"Skipping {side.name.lower()} order for {kernel.product_id}: "
+                               f"{fiat_amounts[kernel.product_id]} is below the minimum size "
+                               f"of {kernel.base_min_size}")
+                results[kernel.product_id] = None
+        if not sized:
+            return {product_id: results[product_id] for product_id in fiat_amounts}
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(sized)) as executor:
+            futures = {
+                product_id: executor.submit(copy_context().run, self._submit_limit_order,
+                                            product_id, fiat_amounts[product_id], side, price, size)
+                for product_id, (price, size) in sized.items()
+            }
+            for product_id, future in futures.items():
+                try:
+                    results[product_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Limit {side.name.lower()} order failed for {product_id}: {e}")
+                    results[product_id] = e
+        return {product_id: results[product_id] for product_id in fiat_amounts}
+
+    @traced('order_ids')
+    def cancel_orders(self, order_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel orders by ID.
+
+        Args:
+            order_ids (List[str]): The IDs of the orders to cancel.
+
+        Returns:
+            Dict[str, bool]: Whether each order was cancelled.
+        """
+        response = self.rest_client.cancel_orders(order_ids=order_ids)
+        cancelled = {order_id: False for order_id in order_ids}
+        for result in response['results']:
+            cancelled[result['order_id']] = result['success']
+            if not result['success']:
+                logger.warning(f"Could not cancel order {result['order_id']}: "
+                               f"{result['failure_reason']}")
+        for order_id, success in cancelled.items():
+            if success:
+                for listener in self.cancel_listeners:
+                    listener(order_id)
+        return cancelled
+
+    @traced('price')
+    def edit_limit_price(self, order: Order, price: Decimal) -> bool:
+        """
+        Move a resting limit order to a new price, keeping its size.
+
+        Args:
+            order (Order): The order; its price is updated on success.
+            price (Decimal): The new limit price, a multiple of the quote increment.
+
+        Returns:
+            bool: Whether Coinbase accepted the edit.
+        """
+        response = self.rest_client.edit_order(order.id, size=str(order.size), price=str(price))
+        if not response['success']:
+            reasons = [error['edit_failure_reason'] for error in response['errors'] or ()]
+            logger.warning(f"Could not edit order {order.id}: {', '.join(reasons) or 'Unknown'}")
+            return False
+        order.price = price
+        self._placed(order)
+        return True
+
+    @traced('price')
+    def replace_limit_order(self, order: Order, price: Decimal) -> Optional[Order]:
+        """
+        Cancel a limit order and place its unfilled size again at `price`.
+
+        Fills that happen between the cancel and the new order are not
+        known here; a user stream reports them on the cancelled order.
+
+        Args:
+            order (Order): The order to replace; marked cancelled on success.
+            price (Decimal): The limit price of the new order.
+
+        Returns:
+            Optional[Order]: The new order, or None if the cancel failed
+            (usually because the order had already filled or closed).
+        """
+        if not self.cancel_orders([order.id])[order.id]:
+            return None
+        order.status = 'cancelled'
+        remaining = order.size - order.filled_size
+        return self._submit_limit_order(order.product_id, str(remaining * price), order.side,
+                                        price, remaining)
+
+    @staticmethod
+    def _size_limit_orders(kernels: List[SizingKernel], fiat_amounts: List[Decimal],
+                           prices: List[Decimal], side: OrderSide
+                           ) -> List[Tuple[str, OrderSide, Decimal, Decimal]]:
+        """Size limit orders, dropping those below their minimum size."""
+        if VECTORIZED:
+            return size_basket(kernels, fiat_amounts, prices, side).orders()
+        orders = []
+        for kernel, fiat_amount, price in zip(kernels, fiat_amounts, prices):
+            limit_price, size = kernel.limit_order(Decimal(fiat_amount), price, side)
+            if kernel.meets_min_size(size):
+                orders.append((kernel.product_id, side, limit_price, size))
+        return orders
     
+    @traced('product_id')
     def _log_order_result(self, order: Dict[str, Any], product_id: str, amount: Any, price: Any = None, side: OrderSide = None) -> None:
         """
         Log the result of an order.
@@ -234,13 +481,10 @@ class OrderService:
         base_currency, quote_currency = product_id.split('-')
         side_str = side.name.lower() if side else "unknown"
 
-        # Get product details for proper rounding
-        product_details = self.price_service.get_product_details(product_id)
-        if not product_details:
-            raise ValueError(f"Could not get product details for {product_id}")
-        
-        base_increment = Decimal(product_details['base_increment'])
-        quote_increment = Decimal(product_details['quote_increment'])
+        # Get product increments for proper rounding
+        kernel = self._sizing_kernel(product_id)
+        base_increment = kernel.base_increment
+        quote_increment = kernel.quote_increment
 
         if order['success']:
             spot_price = price if price else self.price_service.get_spot_price(product_id)
@@ -1,23 +1,121 @@
+import time
 from decimal import Decimal
-from typing import Dict, Any, Optional
-
-from coinbase.rest import RESTClient
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
+from coinbase_advanced_trader.instrumentation.hooks import instrumentation_of
+from coinbase_advanced_trader.instrumentation.tracing import traced
 from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.sizing import SizingKernel
+
+if TYPE_CHECKING:
+    from coinbase.rest import RESTClient
+    from coinbase_advanced_trader.shared_cache import ProductSnapshot, SharedMarketDataCache
 
 
 class PriceService:
-    """Service for handling price-related operations."""
+    """
+    Service for handling price-related operations.
+
+    Safe to share between threads: cache entries are built completely and
+    then stored with a single assignment, and never modified afterwards.
+    """
 
-    def __init__(self, rest_client: RESTClient):
+    def __init__(
+        self,
+        rest_client: 'RESTClient',
+        shared_cache: Optional['SharedMarketDataCache'] = None,
+        max_price_age: float = 10.0
+    ):
         """
         Initialize the PriceService.
 
         Args:
             rest_client (RESTClient): The REST client for API calls.
+            shared_cache (Optional[SharedMarketDataCache]): Cross-process cache
+                consulted before calling the API.
+            max_price_age (float): Maximum age in seconds of a cached or
+                prefetched price before falling back to the API.
         """
         self.rest_client = rest_client
+        self.shared_cache = shared_cache
+        self.max_price_age = max_price_age
+        # Increments rarely change, so they are kept for the service lifetime.
+        self._product_details: Dict[str, Dict[str, Decimal]] = {}
+        self._kernels: Dict[str, SizingKernel] = {}
+        self._prefetched_prices: Dict[str, Tuple[float, Decimal]] = {}
+
+    def _get_shared_snapshot(self, product_id: str) -> Optional['ProductSnapshot']:
+        """Return the shared cache snapshot for a product, if one is available."""
+        if self.shared_cache is None:
+            return None
+        try:
+            return self.shared_cache.get(product_id)
+        except Exception as e:
+            logger.warning(f"Error reading shared cache for {product_id}: {e}")
+            return None
+
+    def _remember_product_details(self, product_id: str, product: Dict[str, Any]) -> None:
+        """Keep the increments of a product response for later lookups."""
+        if product.get('base_increment') and product.get('quote_increment'):
+            self._product_details[product_id] = self._details_from_product(product)
+
+    @staticmethod
+    def _details_from_product(product: Dict[str, Any]) -> Dict[str, Decimal]:
+        """Extract increments, and the minimum order size if given, from a product."""
+        details = {
+            'base_increment': Decimal(product['base_increment']),
+            'quote_increment': Decimal(product['quote_increment'])
+        }
+        if product.get('base_min_size'):
+            details['base_min_size'] = Decimal(product['base_min_size'])
+        return details
+
+    def _report_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Report a cache lookup to the client's instrumentation, if any."""
+        instrumentation = instrumentation_of(self.rest_client)
+        if instrumentation is not None:
+            instrumentation.on_cache_lookup(cache, hit)
+
+    @traced('product_ids')
+    def prefetch_products(self, product_ids: List[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Fetch prices and increments for several products in a single request.
+
+        Subsequent `get_spot_price` and `get_product_details` calls for these
+        products are served locally while the prices are fresh.
+
+        Args:
+            product_ids (List[str]): The IDs of the products.
+
+        Returns:
+            Dict[str, Optional[Decimal]]: Spot price per product, None for
+            products missing from the response.
+        """
+        prices: Dict[str, Optional[Decimal]] = dict.fromkeys(product_ids)
+        if not product_ids:
+            return prices
+
+        response = self.rest_client.get_products(product_ids=list(product_ids))
+        fetched_at = time.monotonic()
+        for product in response['products'] or []:
+            product_dict = product if isinstance(product, dict) else product.__dict__
+            product_id = product_dict.get('product_id')
+            if product_id not in prices or not product_dict.get('price'):
+                continue
+            self._remember_product_details(product_id, product_dict)
+            price = Decimal(product_dict['price'])
+            details = self._product_details.get(product_id)
+            if details is not None:
+                price = price.quantize(details['quote_increment'])
+            self._prefetched_prices[product_id] = (fetched_at, price)
+            prices[product_id] = price
+
+        missing = [product_id for product_id, price in prices.items() if price is None]
+        if missing:
+            logger.warning(f"No price returned for {', '.join(missing)}")
+        return prices
 
+    @traced('product_id')
     def get_spot_price(self, product_id: str) -> Optional[Decimal]:
         """
         Get the spot price for a given product.
@@ -28,16 +126,28 @@ class PriceService:
         Returns:
             The current spot price as a Decimal, or None if price cannot be retrieved.
         """
+        snapshot = self._get_shared_snapshot(product_id)
+        if snapshot is not None and snapshot.age() <= self.max_price_age:
+            self._report_cache_lookup('spot_price', True)
+            return snapshot.price.quantize(snapshot.quote_increment)
+
+        prefetched = self._prefetched_prices.get(product_id)
+        if prefetched is not None and time.monotonic() - prefetched[0] <= self.max_price_age:
+            self._report_cache_lookup('spot_price', True)
+            return prefetched[1]
+        self._report_cache_lookup('spot_price', False)
+
         try:
             response = self.rest_client.get_product(product_id)
-            
+
             # Convert response to dictionary if it's a GetProductResponse object
             response_dict = response if isinstance(response, dict) else response.__dict__
-            
+
             if 'price' not in response_dict or 'quote_increment' not in response_dict:
                 logger.error(f"Required fields missing in response for {product_id}")
                 return None
 
+            self._remember_product_details(product_id, response_dict)
             price = Decimal(response_dict['price'])
             quote_increment = Decimal(response_dict['quote_increment'])
             return price.quantize(quote_increment)
@@ -46,6 +156,7 @@ class PriceService:
             logger.error(f"Error fetching spot price for {product_id}: {e}")
             return None
 
+    @traced('product_id')
     def get_product_details(self, product_id: str) -> Optional[Dict[str, Decimal]]:
         """
         Get the details of a product.
@@ -54,14 +165,56 @@ class PriceService:
             product_id (str): The ID of the product.
 
         Returns:
-            Optional[Dict[str, Decimal]]: A dictionary containing base and quote increments, or None if failed.
+            Optional[Dict[str, Decimal]]: A dictionary containing base and quote increments,
+            and the minimum base size when known, or None if failed.
         """
-        try:
-            response = self.rest_client.get_product(product_id)
+        # Snapshots published without a minimum size would leave sizing
+        # kernels unable to skip undersized orders; use the full details.
+        snapshot = self._get_shared_snapshot(product_id)
+        if snapshot is not None and snapshot.base_min_size is not None:
+            self._report_cache_lookup('product_details', True)
             return {
-                'base_increment': Decimal(response['base_increment']),
-                'quote_increment': Decimal(response['quote_increment'])
+                'base_increment': snapshot.base_increment,
+                'quote_increment': snapshot.quote_increment,
+                'base_min_size': snapshot.base_min_size
             }
+
+        details = self._product_details.get(product_id)
+        if details is not None:
+            self._report_cache_lookup('product_details', True)
+            return dict(details)
+        self._report_cache_lookup('product_details', False)
+
+        try:
+            response = self.rest_client.get_product(product_id)
+            response_dict = response if isinstance(response, dict) else response.__dict__
+            details = self._details_from_product(response_dict)
+            self._product_details[product_id] = details
+            return dict(details)
         except Exception as e:
             logger.error(f"Error fetching product details for {product_id}: {e}")
             return None
+
+    def get_sizing_kernel(self, product_id: str) -> Optional[SizingKernel]:
+        """
+        Get the sizing kernel of a product, built once from its increments.
+
+        Args:
+            product_id (str): The ID of the product.
+
+        Returns:
+            Optional[SizingKernel]: The product's kernel, or None if its
+            details could not be fetched.
+        """
+        kernel = self._kernels.get(product_id)
+        if kernel is not None:
+            self._report_cache_lookup('sizing_kernel', True)
+            return kernel
+        self._report_cache_lookup('sizing_kernel', False)
+
+        details = self.get_product_details(product_id)
+        if details is None:
+            return None
+        kernel = SizingKernel.from_details(product_id, details)
+        self._kernels[product_id] = kernel
+        return kernel
@@ -0,0 +1,284 @@
+"""Cross-process market data cache backed by shared memory.
+
+One feeder process publishes product snapshots (spot price, increments and
+minimum order size) into a fixed-size table of slots in a named shared memory block. Any number
+of reader processes attach to the same block and read snapshots without
+touching the Coinbase API. Each slot is guarded by a seqlock: the writer
+bumps the slot sequence to an odd value before writing and back to an even
+value afterwards, and readers retry whenever they observe an odd or changed
+sequence, so a reader never returns a half-written snapshot.
+"""
+
+import struct
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from decimal import Decimal
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, List, Optional
+
+from coinbase_advanced_trader.logger import logger
+
+DEFAULT_CACHE_NAME = 'coinbase_advanced_trader_market_data'
+DEFAULT_SLOT_COUNT = 256
+
+_MAGIC = b'CBATMKT2'
+_HEADER = struct.Struct('<8sI')
+_SEQ = struct.Struct('<Q')
+_PAYLOAD = struct.Struct('<32s24s24s24s24sd')
+_SLOT_SIZE = _SEQ.size + _PAYLOAD.size
+_EMPTY_KEY = b'\x00' * 32
+_MAX_READ_ATTEMPTS = 1000
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without registering it for cleanup.
+
+    The creating process owns the block and unlinks it; a reader attached
+    with `SharedMemory(name=...)` would otherwise have it unlinked when the
+    reader exits on Python < 3.13.
+
+    Args:
+        name: The name of the block.
+
+    Returns:
+        shared_memory.SharedMemory: The attached block; close it when done.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Older interpreters register attached blocks with the resource tracker,
+    # which unlinks them when the attaching process exits.
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+@dataclass(frozen=True)
+class ProductSnapshot:
+    """
+    A point-in-time view of a product published to the shared cache.
+
+    Attributes:
+        product_id (str): The product identifier (e.g. 'BTC-USDC').
+        price (Decimal): The last traded price.
+        base_increment (Decimal): Minimum increment for the base currency.
+        quote_increment (Decimal): Minimum increment for the quote currency.
+        updated_at (float): Unix timestamp of the publication.
+        base_min_size (Optional[Decimal]): Smallest accepted order size, or
+            None if the feeder did not publish it.
+    """
+
+    product_id: str
+    price: Decimal
+    base_increment: Decimal
+    quote_increment: Decimal
+    updated_at: float
+    base_min_size: Optional[Decimal] = None
+
+    def age(self) -> float:
+        """Return the number of seconds since the snapshot was published."""
+        return time.time() - self.updated_at
+
+
+class SharedMarketDataCache:
+    """
+    Fixed-size product snapshot table living in named shared memory.
+
+    Only one process should publish into a given cache; readers may be
+    arbitrarily many. Slots are located by a stable CRC32 hash of the
+    product id with linear probing, so every process resolves a product to
+    the same slot.
+    """
+
+    def __init__(self, name: str = DEFAULT_CACHE_NAME,
+                 slots: int = DEFAULT_SLOT_COUNT, create: bool = False) -> None:
+        """
+        Create or attach to a shared market data cache.
+
+        Args:
+            name (str): Name of the shared memory block.
+            slots (int): Number of product slots (only used when creating).
+            create (bool): Create the block (feeder) instead of attaching
+                to an existing one (reader).
+
+        Raises:
+            FileNotFoundError: If attaching and the block does not exist.
+            ValueError: If the block is not a market data cache.
+        """
+        self.name = name
+        self._owner = create
+        self._write_lock = threading.Lock()
+        if create:
+            size = _HEADER.size + slots * _SLOT_SIZE
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            _HEADER.pack_into(self._shm.buf, 0, _MAGIC, slots)
+            self.slots = slots
+        else:
+            self._shm = attach_shared_memory(name)
+            magic, self.slots = _HEADER.unpack_from(self._shm.buf, 0)
+            if magic != _MAGIC:
+                self._shm.close()
+                raise ValueError(f"Shared memory block {name} is not a market data cache")
+        self._buf = self._shm.buf
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER.size + index * _SLOT_SIZE
+
+    def _probe(self, key: bytes) -> Iterable[int]:
+        start = zlib.crc32(key) % self.slots
+        for step in range(self.slots):
+            yield (start + step) % self.slots
+
+    def _read_slot(self, offset: int) -> Optional[tuple]:
+        """Read a slot payload under the seqlock, or None if it never settles."""
+        buf = self._buf
+        for _ in range(_MAX_READ_ATTEMPTS):
+            seq_before = _SEQ.unpack_from(buf, offset)[0]
+            if seq_before & 1:
+                continue
+            payload = _PAYLOAD.unpack_from(buf, offset + _SEQ.size)
+            if _SEQ.unpack_from(buf, offset)[0] == seq_before:
+                return payload
+        return None
+
+    def publish(self, product_id: str, price: Decimal, base_increment: Decimal,
+                quote_increment: Decimal, base_min_size: Optional[Decimal] = None) -> None:
+        """
+        Publish a product snapshot. Intended to be called by the feeder only.
+
+        Args:
+            product_id (str): The product identifier.
+            price (Decimal): The current price.
+            base_increment (Decimal): Minimum increment for the base currency.
+            quote_increment (Decimal): Minimum increment for the quote currency.
+            base_min_size (Optional[Decimal]): Smallest accepted order size,
+                if known.
+
+        Raises:
+            ValueError: If the cache is full or a field does not fit its slot.
+        """
+        key = product_id.encode('ascii')
+        payload = (key, str(price).encode('ascii'), str(base_increment).encode('ascii'),
+                   str(quote_increment).encode('ascii'),
+                   b'' if base_min_size is None else str(base_min_size).encode('ascii'))
+        if any(len(field) > 24 for field in payload[1:]) or len(key) > 32:
+            raise ValueError(f"Snapshot for {product_id} does not fit in a cache slot")
+
+        padded_key = key.ljust(32, b'\x00')
+        with self._write_lock:
+            for index in self._probe(padded_key):
+                offset = self._slot_offset(index)
+                slot_key = _PAYLOAD.unpack_from(self._buf, offset + _SEQ.size)[0]
+                if slot_key in (padded_key, _EMPTY_KEY):
+                    break
+            else:
+                raise ValueError(f"Shared market data cache {self.name} is full")
+
+            seq = _SEQ.unpack_from(self._buf, offset)[0]
+            _SEQ.pack_into(self._buf, offset, seq + 1)
+            _PAYLOAD.pack_into(self._buf, offset + _SEQ.size, *payload, time.time())
+            _SEQ.pack_into(self._buf, offset, seq + 2)
+
+    def get(self, product_id: str) -> Optional[ProductSnapshot]:
+        """
+        Read the latest snapshot for a product.
+
+        Args:
+            product_id (str): The product identifier.
+
+        Returns:
+            Optional[ProductSnapshot]: The snapshot, or None if the product
+            has never been published.
+        """
+        padded_key = product_id.encode('ascii').ljust(32, b'\x00')
+        for index in self._probe(padded_key):
+            payload = self._read_slot(self._slot_offset(index))
+            if payload is None or payload[0] == _EMPTY_KEY:
+                return None
+            if payload[0] == padded_key:
+                key, price, base_increment, quote_increment, base_min_size, updated_at = payload
+                base_min_size = base_min_size.rstrip(b'\x00')
+                return ProductSnapshot(
+                    product_id=product_id,
+                    price=Decimal(price.rstrip(b'\x00').decode('ascii')),
+                    base_increment=Decimal(base_increment.rstrip(b'\x00').decode('ascii')),
+                    quote_increment=Decimal(quote_increment.rstrip(b'\x00').decode('ascii')),
+                    updated_at=updated_at,
+                    base_min_size=Decimal(base_min_size.decode('ascii')) if base_min_size else None
+                )
+        return None
+
+    def close(self) -> None:
+        """Detach from the shared memory block, unlinking it if this is the feeder."""
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> 'SharedMarketDataCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SharedMarketDataFeeder:
+    """Polls Coinbase for a set of products and publishes them to a shared cache."""
+
+    def __init__(self, rest_client, cache: SharedMarketDataCache,
+                 product_ids: List[str]) -> None:
+        """
+        Initialize the feeder.
+
+        Args:
+            rest_client: The REST client used to fetch products.
+            cache (SharedMarketDataCache): The cache to publish into.
+            product_ids (List[str]): The products to keep fresh.
+        """
+        self.rest_client = rest_client
+        self.cache = cache
+        self.product_ids = list(product_ids)
+
+    def refresh(self) -> int:
+        """
+        Fetch every tracked product in one request and publish the results.
+
+        Returns:
+            int: The number of products published.
+        """
+        response = self.rest_client.get_products(product_ids=self.product_ids)
+        published = 0
+        for product in response['products'] or []:
+            try:
+                self.cache.publish(
+                    product['product_id'],
+                    Decimal(product['price']),
+                    Decimal(product['base_increment']),
+                    Decimal(product['quote_increment']),
+                    Decimal(product['base_min_size']) if product.get('base_min_size') else None
+                )
+                published += 1
+            except Exception as e:
+                logger.error(f"Error publishing {product['product_id']} to shared cache: {e}")
+        return published
+
+    def run(self, interval: float, stop_event: threading.Event) -> None:
+        """
+        Refresh the cache every `interval` seconds until `stop_event` is set.
+
+        Args:
+            interval (float): Seconds between refreshes.
+            stop_event (threading.Event): Event used to stop the loop.
+        """
+        while not stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing shared market data cache: {e}")
+            stop_event.wait(interval)
@@ -0,0 +1,174 @@
+"""Coalescing of concurrent identical reads.
+
+When several threads or tasks ask for the same key at the same time,
+`SingleFlight` lets the first one do the work and hands its result, or its
+exception, to the others. Nothing is cached: a call arriving after the work
+finished starts a new one.
+"""
+
+import copy
+import threading
+from collections import Counter
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar('T')
+
+
+class _Call:
+    """One in-flight call and the callers waiting for it."""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class _AsyncCall:
+    """One in-flight awaitable and the number of tasks that joined it."""
+
+    __slots__ = ('future', 'waiters')
+
+    def __init__(self, future: 'asyncio.Future[Any]') -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers of the same key.
+
+    Results are handed out through `copy_result` (a deep copy by default)
+    whenever a call was shared, because callers such as the SDK's response
+    types consume the dictionaries they are given. Unshared results are
+    returned as is.
+
+    `stats()` reports, per name, how many calls were made, how many of them
+    ran and how many joined a call already in flight.
+    """
+
+    def __init__(self, copy_result: Callable[[Any], Any] = copy.deepcopy) -> None:
+        """
+        Initialize the group.
+
+        Args:
+            copy_result: Makes the private copy of a shared result each
+                caller receives.
+        """
+        self.copy_result = copy_result
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[int, Hashable], _AsyncCall] = {}
+        self._calls_made: Counter = Counter()
+        self._shared: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T], name: str = '') -> Tuple[T, bool]:
+        """
+        Run `fn` unless a call for `key` is already in flight, then share it.
+
+        Args:
+            key: Identifies identical calls, e.g. the request path and query.
+            fn: Does the work.
+            name: Groups the statistics, e.g. 'GET products/{id}'.
+
+        Returns:
+            Tuple[T, bool]: The result and whether this caller joined
+            another caller's call.
+
+        Raises:
+            BaseException: Whatever `fn` raised, in every caller sharing it.
+        """
+        with self._lock:
+            self._calls_made[name] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared[name] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self.copy_result(call.result), True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.done.set()
+        return (self.copy_result(call.result) if shared else call.result), False
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]],
+                       name: str = '') -> Tuple[T, bool]:
+        """
+        Await `fn()` unless a call for `key` is already in flight on this
+        event loop, then share it.
+
+        Cancelling one caller does not cancel the shared call.
+
+        Args:
+            key: Identifies identical calls.
+            fn: Returns the awaitable doing the work.
+            name: Groups the statistics.
+
+        Returns:
+            Tuple[T, bool]: The result and whether this caller joined
+            another caller's call.
+        """
+        # Imported here: asyncio adds noticeably to the client's import time.
+        import asyncio
+
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            self._calls_made[name] += 1
+            call = self._tasks.get(loop_key)
+            joined = call is not None
+            if joined:
+                call.waiters += 1
+                self._shared[name] += 1
+            else:
+                call = self._tasks[loop_key] = _AsyncCall(asyncio.ensure_future(fn()))
+                call.future.add_done_callback(lambda _: self._forget_task(loop_key, call))
+
+        result = await asyncio.shield(call.future)
+        return (self.copy_result(result) if joined or call.waiters else result), joined
+
+    def _forget_task(self, loop_key: Tuple[int, Hashable], call: '_AsyncCall') -> None:
+        with self._lock:
+            if self._tasks.get(loop_key) is call:
+                del self._tasks[loop_key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return the statistics per name.
+
+        Returns:
+            Dict[str, Dict[str, int]]: 'calls' made, 'executed' calls and
+            'shared' calls that joined one in flight.
+        """
+        with self._lock:
+            return {name: {'calls': calls, 'executed': calls - self._shared[name],
+                           'shared': self._shared[name]}
+                    for name, calls in sorted(self._calls_made.items())}
+
+    def reset_stats(self) -> None:
+        """Zero the statistics."""
+        with self._lock:
+            self._calls_made.clear()
+            self._shared.clear()
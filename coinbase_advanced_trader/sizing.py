@@ -0,0 +1,350 @@
+"""Per-product order sizing.
+
+A `SizingKernel` is built once per product from its increments and turns
+fiat amounts and reference prices into order prices and base sizes:
+
+* sizes are rounded down, so that size * price never exceeds the fiat
+  amount;
+* limit prices are rounded toward the passive side of the book, down for
+  buys and up for sells, so that rounding never makes an order more
+  aggressive than requested.
+
+Kernels are cheap to call: increments are parsed once, and the division
+uses a shared truncating context instead of a per-call local context.
+Batches reuse the results of the previous order when prices and amounts
+repeat.
+
+`size_basket` sizes orders across many products at once in integer ticks
+with NumPy (`pip install coinbase-advancedtrade-python[basket]`), dropping
+orders below their product's minimum size.
+"""
+
+import importlib.util
+from dataclasses import dataclass, field
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, Context, Decimal
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+from coinbase_advanced_trader.models import OrderSide
+
+#: Whether `size_basket` is available, i.e. NumPy is installed. NumPy itself
+#: is only imported by the first basket, keeping it out of the client's
+#: import time.
+VECTORIZED = importlib.util.find_spec('numpy') is not None
+
+Number = Union[Decimal, str, int]
+
+# Truncating division: the quotient can never round up onto the next increment.
+_TRUNCATE = Context(rounding=ROUND_DOWN)
+# Directed division for exact floors and ceilings of quotients.
+_FLOOR = Context(rounding=ROUND_FLOOR)
+_CEILING = Context(rounding=ROUND_CEILING)
+_BUY = OrderSide.BUY
+
+
+def _is_decimal_step(increment: Decimal) -> bool:
+    """Return whether the increment is 10**-n with n >= 0."""
+    sign, digits, exponent = increment.normalize().as_tuple()
+    return not sign and digits == (1,) and exponent <= 0
+
+
+class SizingKernel:
+    """
+    Prices and sizes orders for one product.
+
+    Attributes:
+        product_id (str): The product sized, e.g. 'BTC-USDC'.
+        base_increment (Decimal): Size step of the product.
+        quote_increment (Decimal): Price step of the product.
+        base_min_size (Decimal): Smallest size the exchange accepts.
+    """
+
+    __slots__ = ('product_id', 'base_increment', 'quote_increment', 'base_min_size',
+                 '_decimal_base', '_decimal_quote', '_tick_value', '_tick_places', '_quote_places', '_min_units')
+
+    def __init__(self, product_id: str, base_increment: Number, quote_increment: Number,
+                 base_min_size: Number = 0) -> None:
+        """
+        Initialize the kernel.
+
+        Args:
+            product_id: The product sized.
+            base_increment: Size step, e.g. '0.00000001'.
+            quote_increment: Price step, e.g. '0.01'.
+            base_min_size: Smallest accepted size, if known.
+        """
+        self.product_id = product_id
+        self.base_increment = Decimal(base_increment)
+        self.quote_increment = Decimal(quote_increment)
+        self.base_min_size = Decimal(base_min_size)
+        # Powers of ten round with quantize; other steps need a division.
+        self._decimal_base = _is_decimal_step(self.base_increment)
+        self._decimal_quote = _is_decimal_step(self.quote_increment)
+        # Quote value of one base increment at a price of one quote increment.
+        self._tick_value = self.quote_increment * self.base_increment
+        self._tick_places = (-self._tick_value.normalize().as_tuple().exponent
+                             if self._decimal_base and self._decimal_quote else None)
+        self._quote_places = (-self.quote_increment.normalize().as_tuple().exponent
+                              if self._decimal_quote else None)
+        self._min_units = max(1, int(_CEILING.divide(self.base_min_size, self.base_increment)
+                                     .to_integral_value(ROUND_CEILING)))
+
+    @classmethod
+    def from_details(cls, product_id: str, details: Dict[str, Number]) -> 'SizingKernel':
+        """Build a kernel from a product details dict with increments and, optionally, a minimum size."""
+        return cls(product_id, details['base_increment'], details['quote_increment'],
+                   details.get('base_min_size', 0))
+
+    def meets_min_size(self, size: Decimal) -> bool:
+        """Return whether the exchange accepts an order of this size."""
+        return size > 0 and size >= self.base_min_size
+
+    def quantize_size(self, size: Decimal) -> Decimal:
+        """Round a base size down to the base increment."""
+        if self._decimal_base:
+            return size.quantize(self.base_increment, rounding=ROUND_DOWN)
+        steps = _TRUNCATE.divide(size, self.base_increment).to_integral_value(ROUND_DOWN)
+        return steps * self.base_increment
+
+    def quantize_price(self, price: Decimal, side: OrderSide) -> Decimal:
+        """Round a limit price to the quote increment, toward the passive side."""
+        rounding = ROUND_FLOOR if side is _BUY else ROUND_CEILING
+        if self._decimal_quote:
+            return price.quantize(self.quote_increment, rounding=rounding)
+        return (price / self.quote_increment).to_integral_value(rounding) * self.quote_increment
+
+    def base_size(self, fiat_amount: Decimal, price: Decimal) -> Decimal:
+        """
+        Return the largest size on the base increment worth at most `fiat_amount`.
+
+        Args:
+            fiat_amount: Quote currency to spend or receive.
+            price: Price per unit of base currency.
+
+        Returns:
+            Decimal: The base size, rounded down.
+        """
+        if price <= 0:
+            raise ValueError(f"Price must be positive, got {price} for {self.product_id}")
+        size = _TRUNCATE.divide(fiat_amount, price)
+        if self._decimal_base:
+            return size.quantize(self.base_increment, rounding=ROUND_DOWN)
+        return self.quantize_size(size)
+
+    def limit_order(self, fiat_amount: Decimal, price: Decimal,
+                    side: OrderSide) -> Tuple[Decimal, Decimal]:
+        """
+        Price and size a limit order.
+
+        Args:
+            fiat_amount: Quote currency to spend (buys) or receive (sells).
+            price: Limit price before rounding, e.g. spot * multiplier.
+            side: The order side.
+
+        Returns:
+            Tuple[Decimal, Decimal]: The rounded limit price and base size.
+        """
+        if self._decimal_quote:
+            price = price.quantize(self.quote_increment,
+                                   rounding=ROUND_FLOOR if side is _BUY else ROUND_CEILING)
+        else:
+            price = self.quantize_price(price, side)
+        return price, self.base_size(fiat_amount, price)
+
+    def limit_orders(self, fiat_amounts: Iterable[Number], prices: Iterable[Number],
+                     side: OrderSide) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Price and size many limit orders at once.
+
+        Args:
+            fiat_amounts: Quote amount per order.
+            prices: Limit price before rounding per order.
+            side: The side of every order.
+
+        Returns:
+            List[Tuple[Decimal, Decimal]]: Rounded price and base size per
+            order, in input order.
+        """
+        fiat_amounts = [Decimal(amount) for amount in fiat_amounts]
+        prices = [Decimal(price) for price in prices]
+        if len(fiat_amounts) != len(prices):
+            raise ValueError(f"Got {len(fiat_amounts)} fiat amounts but {len(prices)} prices")
+
+        # Consecutive orders often share a price, and often an amount too
+        # (e.g. the same buy on many accounts), so their results are reused.
+        # Comparing with the previous order is cheaper than hashing Decimals.
+        quantize_price, base_size = self.quantize_price, self.base_size
+        last_price = last_amount = last_order = None
+        orders = []
+        for amount, price in zip(fiat_amounts, prices):
+            if price != last_price:
+                last_price, limit_price = price, quantize_price(price, side)
+                last_amount = None
+            if amount != last_amount:
+                last_amount, last_order = amount, (limit_price, base_size(amount, limit_price))
+            orders.append(last_order)
+        return orders
+
+    def _fiat_units(self, fiat_amount: Decimal) -> int:
+        """floor(fiat_amount / tick value): the fiat amount in size-times-price units."""
+        if self._tick_places is not None:
+            # int() truncates, which is the floor for the non-negative amounts sized.
+            return int(fiat_amount.scaleb(self._tick_places))
+        return int(_FLOOR.divide(fiat_amount, self._tick_value).to_integral_value(ROUND_FLOOR))
+
+    def _price_ticks(self, price: Decimal, side: OrderSide) -> int:
+        """The limit price in quote increments, rounded toward the passive side."""
+        if self._quote_places is not None:
+            ticks = price.scaleb(self._quote_places)
+            return int(ticks) if side is _BUY else int(ticks.to_integral_value(ROUND_CEILING))
+        if side is _BUY:
+            return int(_FLOOR.divide(price, self.quote_increment).to_integral_value(ROUND_FLOOR))
+        return int(_CEILING.divide(price, self.quote_increment).to_integral_value(ROUND_CEILING))
+
+    def __repr__(self) -> str:
+        return (f"SizingKernel({self.product_id!r}, base_increment={self.base_increment}, "
+                f"quote_increment={self.quote_increment}, base_min_size={self.base_min_size})")
+
+
+def _int_array(values: List[int]) -> Any:
+    """Return an int64 array, or an object array of Python ints if int64 overflows."""
+    import numpy as np
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        return np.array(values, dtype=object)
+
+
+@dataclass(frozen=True)
+class BasketSizing:
+    """
+    Limit prices and sizes of a basket of orders.
+
+    Prices and sizes are held as integer multiples of each product's
+    increments; the Decimal views are built on first access. Orders below
+    their product's minimum size are rejected: their size is zero and
+    their whole fiat amount stays as residual cash.
+
+    Attributes:
+        kernels (Tuple[SizingKernel, ...]): The kernel of each order.
+        sides (Tuple[OrderSide, ...]): The side of each order.
+        fiat_amounts (Tuple[Decimal, ...]): The fiat amount of each order.
+        price_ticks (np.ndarray): Limit prices in quote increments.
+        size_units (np.ndarray): Sizes in base increments, 0 if rejected.
+        accepted (np.ndarray): Whether each order meets its minimum size.
+    """
+
+    kernels: Tuple[SizingKernel, ...]
+    sides: Tuple[OrderSide, ...]
+    fiat_amounts: Tuple[Decimal, ...]
+    price_ticks: Any = field(repr=False)
+    size_units: Any = field(repr=False)
+    accepted: Any = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.kernels)
+
+    @property
+    def product_ids(self) -> List[str]:
+        """The product of each order."""
+        return [kernel.product_id for kernel in self.kernels]
+
+    @cached_property
+    def prices(self) -> List[Decimal]:
+        """The rounded limit price of each order."""
+        return [Decimal(ticks) * kernel.quote_increment
+                for ticks, kernel in zip(self.price_ticks.tolist(), self.kernels)]
+
+    @cached_property
+    def sizes(self) -> List[Decimal]:
+        """The base size of each order, zero for rejected orders."""
+        return [Decimal(units) * kernel.base_increment
+                for units, kernel in zip(self.size_units.tolist(), self.kernels)]
+
+    @cached_property
+    def residuals(self) -> List[Decimal]:
+        """The fiat amount each order leaves unspent."""
+        spent = (self.size_units * self.price_ticks).tolist()
+        return [amount - units * kernel._tick_value
+                for amount, units, kernel in zip(self.fiat_amounts, spent, self.kernels)]
+
+    @property
+    def residual_cash(self) -> Decimal:
+        """The fiat amount the whole basket leaves unspent."""
+        spent_units: Dict[Decimal, int] = {}
+        for units, kernel in zip((self.size_units * self.price_ticks).tolist(), self.kernels):
+            spent_units[kernel._tick_value] = spent_units.get(kernel._tick_value, 0) + units
+        spent = sum((units * tick_value for tick_value, units in spent_units.items()), Decimal(0))
+        return sum(self.fiat_amounts, Decimal(0)) - spent
+
+    def orders(self) -> List[Tuple[str, OrderSide, Decimal, Decimal]]:
+        """Return (product_id, side, price, size) of every accepted order."""
+        orders = []
+        last_kernel = last_ticks = price = None
+        for kernel, side, ticks, units, accepted in zip(
+                self.kernels, self.sides, self.price_ticks.tolist(),
+                self.size_units.tolist(), self.accepted.tolist()):
+            if not accepted:
+                continue
+            if kernel is not last_kernel or ticks != last_ticks:
+                last_kernel, last_ticks = kernel, ticks
+                price = Decimal(ticks) * kernel.quote_increment
+            orders.append((kernel.product_id, side, price, Decimal(units) * kernel.base_increment))
+        return orders
+
+
+def size_basket(kernels: Sequence[SizingKernel], fiat_amounts: Sequence[Number],
+                prices: Sequence[Number],
+                sides: Union[OrderSide, Sequence[OrderSide]]) -> BasketSizing:
+    """
+    Price and size limit orders on many products at once.
+
+    Amounts and prices are converted exactly to integer ticks, and sizes
+    are computed as floor(fiat units / price ticks) with NumPy, so no float
+    rounding is involved. The results match `SizingKernel.limit_order`.
+
+    Args:
+        kernels: The kernel of each order's product.
+        fiat_amounts: The fiat amount of each order.
+        prices: The limit price before rounding of each order.
+        sides: One side for every order, or the side of each order.
+
+    Returns:
+        BasketSizing: Prices, sizes and residual cash of the orders.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the inputs differ in length, a fiat amount is negative
+            or a price rounds to zero.
+    """
+    if not VECTORIZED:
+        raise ImportError("size_basket requires NumPy: "
+                          "pip install coinbase-advancedtrade-python[basket]")
+    kernels = tuple(kernels)
+    sides = (sides,) * len(kernels) if isinstance(sides, OrderSide) else tuple(sides)
+    fiat_amounts = tuple(Decimal(amount) for amount in fiat_amounts)
+    prices = [Decimal(price) for price in prices]
+    if not len(kernels) == len(sides) == len(fiat_amounts) == len(prices):
+        raise ValueError(f"Got {len(kernels)} kernels, {len(sides)} sides, "
+                         f"{len(fiat_amounts)} fiat amounts and {len(prices)} prices")
+
+    fiat_units = [kernel._fiat_units(amount) for kernel, amount in zip(kernels, fiat_amounts)]
+    price_ticks = []
+    last_kernel = last_price = last_side = None
+    for kernel, price, side in zip(kernels, prices, sides):
+        # Orders on one product usually share a price.
+        if kernel is not last_kernel or price != last_price or side is not last_side:
+            last_kernel, last_price, last_side = kernel, price, side
+            ticks = kernel._price_ticks(price, side)
+            if ticks <= 0:
+                raise ValueError(f"Price must be positive, got {price} for {kernel.product_id}")
+        price_ticks.append(ticks)
+
+    fiat_units = _int_array(fiat_units)
+    if (fiat_units < 0).any():
+        raise ValueError("Fiat amounts must not be negative")
+    price_ticks = _int_array(price_ticks)
+    size_units = fiat_units // price_ticks
+    accepted = size_units >= _int_array([kernel._min_units for kernel in kernels])
+    size_units[~accepted] = 0
+    return BasketSizing(kernels, sides, fiat_amounts, price_ticks, size_units, accepted)
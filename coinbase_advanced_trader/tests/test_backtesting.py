@@ -0,0 +1,355 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
+if np is not None:
+    from coinbase_advanced_trader.backtesting import (
+        AlphaSquaredReplay,
+        Candles,
+        FearAndGreedBacktester,
+        ScheduleSweep,
+        SimulatedCoinbaseClient,
+        align_fear_and_greed,
+        evaluate_schedule,
+        format_results,
+        load_candles,
+        load_fear_and_greed,
+        schedule_grid
+    )
+    from coinbase_advanced_trader.models import OrderSide
+    from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+    from coinbase_advanced_trader.trading_config import CompiledFGISchedule
+
+DAY = 24 * 60 * 60
+START = 1704067200  # 2024-01-01
+
+SCHEDULE = [
+    {'threshold': 20, 'factor': 1.2, 'action': 'buy'},
+    {'threshold': 80, 'factor': 0.8, 'action': 'sell'},
+]
+
+
+def _candles(close, low=None, high=None):
+    close = np.asarray(close, dtype=np.float64)
+    return Candles(
+        timestamp=START + DAY * np.arange(len(close), dtype=np.int64),
+        open=close,
+        high=close if high is None else np.asarray(high, dtype=np.float64),
+        low=close if low is None else np.asarray(low, dtype=np.float64),
+        close=close,
+        volume=np.zeros(len(close))
+    )
+
+
+@unittest.skipUnless(np is not None, "numpy is required for backtesting")
+class TestBacktestData(unittest.TestCase):
+    """Test cases for the backtest data loaders."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_load_candles_sorts_by_timestamp(self):
+        """Test that candles are loaded from CSV and sorted by time."""
+        path = self._write('candles.csv', (
+            "date,open,high,low,close,volume\n"
+            "2024-01-02,2,3,1,2.5,10\n"
+            "2024-01-01,1,2,0.5,1.5,20\n"
+        ))
+
+        candles = load_candles(path)
+
+        self.assertEqual(list(candles.timestamp), [START, START + DAY])
+        self.assertEqual(list(candles.close), [1.5, 2.5])
+        self.assertEqual(list(candles.volume), [20, 10])
+
+    def test_load_candles_missing_column(self):
+        """Test that a missing price column raises ValueError."""
+        path = self._write('candles.csv', "timestamp,open,high,low\n1,1,1,1\n")
+
+        with self.assertRaises(ValueError):
+            load_candles(path)
+
+    def test_align_fear_and_greed_forward_fills(self):
+        """Test that each candle gets the latest FGI published by its day."""
+        path = self._write('fgi.csv', (
+            f"timestamp,value\n{START + DAY},30\n{START + 3 * DAY},60\n"
+        ))
+        candles = _candles([1, 1, 1, 1, 1])
+
+        aligned = align_fear_and_greed(candles, load_fear_and_greed(path))
+
+        self.assertTrue(np.isnan(aligned[0]))
+        self.assertEqual(list(aligned[1:]), [30, 30, 60, 60])
+
+
+@unittest.skipUnless(np is not None, "numpy is required for backtesting")
+class TestFearAndGreedBacktester(unittest.TestCase):
+    """Test cases for the FearAndGreedBacktester class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.backtester = FearAndGreedBacktester(
+            SCHEDULE, fiat_amount=100, base_increment='0.001',
+            quote_increment='0.01', fee_rate='0.01',
+            buy_price_multiplier='0.99', sell_price_multiplier='1.01'
+        )
+
+    def test_evaluate_schedule_matches_compiled_schedule(self):
+        """Test that vectorized evaluation agrees with CompiledFGISchedule."""
+        compiled = CompiledFGISchedule(SCHEDULE + [
+            {'threshold': 10, 'factor': 1.5, 'action': 'buy'},
+            {'threshold': 90, 'factor': 0.5, 'action': 'sell'},
+        ])
+        values = np.arange(0, 101, dtype=np.float64)
+
+        side, factor = evaluate_schedule(compiled, values)
+
+        for value, s, f in zip(values, side, factor):
+            rule = compiled.evaluate(int(value))
+            if rule is None:
+                self.assertEqual(s, 0)
+            else:
+                self.assertEqual(s, 1 if rule.action == 'buy' else -1)
+                self.assertAlmostEqual(f, float(rule.factor))
+
+    def test_buy_fills_when_next_low_reaches_limit(self):
+        """Test that a buy fills at the limit price with fees and increments."""
+        candles = _candles([100, 100, 100], low=[100, 98, 100])
+        fgi = np.array([10, 50, 50], dtype=np.float64)
+
+        result = self.backtester.run(candles, fgi)
+
+        self.assertEqual(len(result.trades), 1)
+        trade = result.trades[0]
+        self.assertEqual(trade.side, OrderSide.BUY)
+        self.assertEqual(trade.timestamp, START + DAY)
+        self.assertAlmostEqual(trade.price, 99.0)
+        # 120 / 1.01 / 99 = 1.2001... rounded down to the 0.001 increment,
+        # so the order and its fee fit in 120.
+        self.assertAlmostEqual(trade.size, 1.2)
+        self.assertAlmostEqual(trade.fee, 1.2 * 99 * 0.01)
+        self.assertAlmostEqual(result.holdings[-1], 1.2)
+        self.assertAlmostEqual(result.cash[-1], -1.2 * 99 * 1.01)
+
+    def test_unfilled_order_expires(self):
+        """Test that an order whose limit is never reached does not trade."""
+        candles = _candles([100, 100, 100], low=[100, 99.5, 99.5])
+        fgi = np.array([10, 50, 50], dtype=np.float64)
+
+        result = self.backtester.run(candles, fgi)
+
+        self.assertEqual(result.trades, [])
+        self.assertTrue(np.all(result.equity == 0))
+
+    def test_order_ttl_extends_fill_window(self):
+        """Test that a longer order_ttl lets later candles fill the order."""
+        candles = _candles([100, 100, 100], low=[100, 100, 98])
+        fgi = np.array([10, 50, 50], dtype=np.float64)
+        backtester = FearAndGreedBacktester(
+            SCHEDULE, fiat_amount=100, buy_price_multiplier='0.99', order_ttl=2
+        )
+
+        result = backtester.run(candles, fgi)
+
+        self.assertEqual([trade.timestamp for trade in result.trades], [START + 2 * DAY])
+
+    def test_sells_are_clipped_to_holdings(self):
+        """Test that sells never take holdings below zero."""
+        candles = _candles([100, 100, 100, 100, 100], low=[90] * 5, high=[110] * 5)
+        fgi = np.array([90, 10, 90, 90, 50], dtype=np.float64)
+
+        result = self.backtester.run(candles, fgi)
+
+        sides = [trade.side for trade in result.trades]
+        # The first sell has nothing to sell; the third is clipped to the rest.
+        self.assertEqual(sides, [OrderSide.BUY, OrderSide.SELL, OrderSide.SELL])
+        self.assertAlmostEqual(sum(t.size for t in result.trades[1:]), result.trades[0].size)
+        self.assertGreaterEqual(result.holdings.min(), 0)
+        self.assertAlmostEqual(result.holdings[-1], 0)
+
+    def test_drawdown_and_summary(self):
+        """Test that drawdown tracks declines from the equity peak."""
+        candles = _candles([100, 100, 120, 60], low=[100, 98, 120, 60])
+        fgi = np.array([10, 50, 50, 50], dtype=np.float64)
+
+        result = self.backtester.run(candles, fgi)
+
+        self.assertTrue(np.all(result.drawdown <= 0))
+        self.assertAlmostEqual(result.max_drawdown, 1.2 * (60 - 120))
+        summary = result.summary()
+        self.assertEqual(summary['trades'], 1)
+        self.assertAlmostEqual(summary['total_fees'], result.total_fees)
+
+    def test_mismatched_lengths_raise(self):
+        """Test that FGI values must align with the candles."""
+        with self.assertRaises(ValueError):
+            self.backtester.run(_candles([1, 2, 3]), np.array([10.0]))
+
+    def test_fee_rates_from_fee_service(self):
+        """Test that the backtester pays the maker rate live orders are sized with."""
+        exchange = SimulatedExchange(maker_fee_rate='0.0025', taker_fee_rate='0.004')
+        fee_rates = PaperTradingClient(exchange).fee_service.get_fee_rates
+
+        backtester = FearAndGreedBacktester(SCHEDULE, fiat_amount=100, fee_rates=fee_rates,
+                                            product_id='BTC-USDC')
+        sweep = ScheduleSweep(_candles([1]), np.array([10.0]), fiat_amount=100,
+                              fee_rates=fee_rates)
+
+        self.assertEqual(backtester.fee_rate, 0.0025)
+        self.assertEqual(FearAndGreedBacktester(SCHEDULE, fiat_amount=100).fee_rate, 0.006)
+        self.assertEqual(sweep.backtest_settings, {'fiat_amount': 100,
+                                                   'fee_rate': Decimal('0.0025')})
+
+
+@unittest.skipUnless(np is not None, "numpy is required for backtesting")
+class TestScheduleSweep(unittest.TestCase):
+    """Test cases for the ScheduleSweep class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        rng = np.random.default_rng(7)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, 120)))
+        self.candles = _candles(close, low=close * 0.98, high=close * 1.02)
+        self.fgi = np.round(rng.uniform(0, 100, 120))
+        self.settings = {'fiat_amount': 10, 'buy_price_multiplier': '0.99',
+                         'sell_price_multiplier': '1.01'}
+
+    def test_schedule_grid_size(self):
+        """Test that the grid covers every rule combination."""
+        schedules = list(schedule_grid([10, 20], [1.0, 1.5], [80], [0.5],
+                                       max_buy_rules=2, max_sell_rules=1))
+
+        # Buy sides: 2 single rules x 2 factors + 1 pair x 4 factor pairs.
+        self.assertEqual(len(schedules), 8)
+        self.assertTrue(all(rule['action'] == 'sell' for rule in
+                            (schedule[-1] for schedule in schedules)))
+
+    def test_parallel_results_match_direct_backtests(self):
+        """Test that pooled results match running each schedule directly."""
+        schedules = list(schedule_grid([10, 25], [1.0, 2.0], [70, 85], [0.5]))
+        sweep = ScheduleSweep(self.candles, self.fgi, max_workers=2, **self.settings)
+
+        results = sweep.run(schedules)
+
+        self.assertEqual(len(results), len(schedules))
+        self.assertEqual([result.rank for result in results],
+                         list(range(1, len(schedules) + 1)))
+        profits = [result.stats['net_profit'] for result in results]
+        self.assertEqual(profits, sorted(profits, reverse=True))
+        for result in results:
+            expected = FearAndGreedBacktester(result.schedule, **self.settings).run(
+                self.candles, self.fgi).summary()
+            self.assertAlmostEqual(result.stats['net_profit'], expected['net_profit'])
+            self.assertEqual(result.stats['trades'], expected['trades'])
+
+    def test_invalid_schedules_are_skipped(self):
+        """Test that schedules failing validation are not backtested."""
+        schedules = [
+            [{'threshold': 20, 'factor': 1.0, 'action': 'buy'},
+             {'threshold': 80, 'factor': 1.0, 'action': 'sell'}],
+            [{'threshold': 90, 'factor': 1.0, 'action': 'buy'},
+             {'threshold': 10, 'factor': 1.0, 'action': 'sell'}],
+        ]
+        sweep = ScheduleSweep(self.candles, self.fgi, max_workers=1, **self.settings)
+
+        with self.assertLogs('coinbase_advanced_trader', level='INFO') as logs:
+            results = sweep.run(schedules, rank_by='max_drawdown')
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results.rejected, 1)
+        self.assertEqual(results[0].schedule, schedules[0])
+        self.assertFalse([line for line in logs.output if line.startswith('WARNING')])
+        table = format_results(results)
+        self.assertIn('B20x1.0 S80x1.0', table)
+
+
+def _risk_strategy(risk):
+    """Buy $100 below risk 30, sell 50% of holdings above risk 70."""
+    if risk < 30:
+        return 'buy', 100
+    if risk > 70:
+        return 'sell', 50
+    return 'none', 0
+
+
+@unittest.skipUnless(np is not None, "numpy is required for backtesting")
+class TestAlphaSquaredReplay(unittest.TestCase):
+    """Test cases for the AlphaSquaredReplay class."""
+
+    def test_buy_uses_order_service_sizing(self):
+        """Test that buys are priced at 0.995x close and sized by OrderService."""
+        candles = _candles([1000, 1000, 1000], low=[1000, 990, 1000])
+        replay = AlphaSquaredReplay(candles, np.array([10, 50, 50]), _risk_strategy,
+                                    fee_rate='0.01', base_increment='0.0001')
+
+        result = replay.run()
+
+        self.assertEqual(len(result.trades), 1)
+        trade = result.trades[0]
+        self.assertEqual(trade.side, OrderSide.BUY)
+        self.assertEqual(trade.timestamp, START + DAY)
+        self.assertAlmostEqual(trade.price, 995.0)
+        # 100 / 1.01 / 995 = 0.099507... rounded down to the 0.0001 increment.
+        self.assertAlmostEqual(trade.size, 0.0995)
+        self.assertAlmostEqual(result.holdings[-1], 0.0995)
+        self.assertAlmostEqual(result.cash[-1], -0.0995 * 995 * 1.01)
+        self.assertEqual(list(result.holdings[:1]), [0])
+
+    def test_sell_percentage_of_available_balance(self):
+        """Test that sells take a share of the balance at 1.005x close."""
+        candles = _candles([1000] * 4, high=[1000, 1010, 1010, 1010])
+        replay = AlphaSquaredReplay(candles, np.array([80, 80, 50, 50]), _risk_strategy,
+                                    initial_base_balance='2', fee_rate='0')
+
+        result = replay.run()
+
+        self.assertEqual([trade.side for trade in result.trades],
+                         [OrderSide.SELL, OrderSide.SELL])
+        # Day 0 sells 1 of 2; day 1 sells half of the remaining 1.
+        self.assertEqual([trade.size for trade in result.trades], [1.0, 0.5])
+        self.assertAlmostEqual(result.trades[0].price, 1005.0)
+        self.assertAlmostEqual(result.holdings[-1], 0.5)
+        self.assertAlmostEqual(result.cash[-1], 1.5 * 1005)
+
+    def test_unfilled_gtc_orders_hold_balance(self):
+        """Test that resting sells are excluded from the available balance."""
+        candles = _candles([1000] * 3)
+        replay = AlphaSquaredReplay(candles, np.array([80, 80, 80]), _risk_strategy,
+                                    initial_base_balance='1')
+
+        result = replay.run()
+
+        self.assertEqual(result.trades, [])
+        self.assertEqual(list(result.holdings), [1, 1, 1])
+
+    def test_fee_rates_from_fee_service(self):
+        """Test that the replay pays the maker rate live orders are sized with."""
+        exchange = SimulatedExchange(maker_fee_rate='0.0025', taker_fee_rate='0.004')
+        client = SimulatedCoinbaseClient(_candles([1000]), 'BTC-USDC',
+                                         fee_rates=PaperTradingClient(exchange).fee_service
+                                         .get_fee_rates)
+
+        self.assertEqual(client.fee_rate, Decimal('0.0025'))
+
+    def test_mismatched_lengths_raise(self):
+        """Test that the risk series must align with the candles."""
+        with self.assertRaises(ValueError):
+            AlphaSquaredReplay(_candles([1, 2]), np.array([10.0]), _risk_strategy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader import ClientPool
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.resilience import Resilience
+from coinbase_advanced_trader.single_flight import SingleFlight
+
+ACCOUNTS = 5
+
+
+class TestClientPool(unittest.TestCase):
+    """Test cases for the ClientPool class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchanges = {}
+        for index in range(ACCOUNTS):
+            exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': str(index)})
+            exchange.add_product('BTC-USDC', '50000')
+            self.exchanges[f'key-{index}'] = exchange
+        credentials = {f'account-{index}': (f'key-{index}', 'secret')
+                       for index in range(ACCOUNTS)}
+        self.pool = ClientPool(credentials, client_factory=self.paper_client,
+                               requests_per_second=100)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.pool.close()
+
+    def paper_client(self, api_key, api_secret, **kwargs):
+        return PaperTradingClient(self.exchanges[api_key], **kwargs)
+
+    def calls(self, endpoint):
+        return sum(self.pool[name].session.calls[endpoint] for name in self.pool)
+
+    def test_market_data_is_shared(self):
+        """Test that every client uses the first client's price service."""
+        price_services = {id(self.pool[name].price_service) for name in self.pool}
+        fgi_providers = {id(self.pool[name]._fear_and_greed_strategy.fgi_provider)
+                         for name in self.pool}
+
+        self.assertEqual(price_services, {id(self.pool.market_data)})
+        self.assertEqual(fgi_providers, {id(self.pool.fgi_provider)})
+        self.assertIs(self.pool.market_data.rest_client, self.pool['account-0'])
+
+    def test_fan_out_order_needs_one_market_data_request(self):
+        """Test that a DCA order on every account makes one price request in total."""
+        results = self.pool.fan_out('fiat_limit_buy', 'BTC-USDC', '10', prefetch=['BTC-USDC'])
+
+        self.assertEqual(list(results), self.pool.names)
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(self.calls('GET products'), 1)
+        self.assertEqual(self.calls('GET products/{id}'), 0)
+        for name in self.pool:
+            self.assertEqual(self.pool[name].session.calls['POST orders'], 1)
+
+    def test_accounts_and_rate_limiters_are_per_key(self):
+        """Test that balances and rate limiters are not shared."""
+        results = self.pool.fan_out('get_crypto_balance', 'BTC')
+
+        self.assertEqual([result.value for result in results.values()],
+                         [Decimal(index) for index in range(ACCOUNTS)])
+        limiters = [self.pool[name].rate_limiter for name in self.pool]
+        self.assertEqual([limiter.name for limiter in limiters], self.pool.names)
+        self.assertEqual(len({id(limiter) for limiter in limiters}), ACCOUNTS)
+        for attribute in ('resilience', 'single_flight'):
+            instances = {id(getattr(self.pool[name], attribute)) for name in self.pool}
+            self.assertEqual(len(instances), ACCOUNTS)
+
+    def test_failures_are_captured(self):
+        """Test that a failing call does not hide the other accounts' results."""
+        self.exchanges['key-1'].add_product('ETH-USDC', '3000')
+
+        results = self.pool.map(lambda name, client: client.get_product('ETH-USDC').product_id,
+                                names=['account-0', 'account-1'])
+
+        self.assertFalse(results['account-0'].ok)
+        self.assertEqual(results['account-1'].value, 'ETH-USDC')
+
+    def test_shared_per_client_objects_are_rejected(self):
+        """Test that one Resilience or SingleFlight cannot be given to every client."""
+        credentials = {'alice': ('key-0', 'secret'), 'bob': ('key-1', 'secret')}
+        for kwargs in ({'resilience': Resilience()}, {'coalesce_reads': SingleFlight()}):
+            with self.subTest(**{name: type(value).__name__ for name, value in kwargs.items()}):
+                with self.assertRaises(ValueError):
+                    ClientPool(credentials, client_factory=self.paper_client, **kwargs)
+
+    def test_empty_pool_is_rejected(self):
+        """Test that a pool needs at least one account."""
+        with self.assertRaises(ValueError):
+            ClientPool({})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, mock_open
 from coinbase_advanced_trader.config import ConfigManager
 from coinbase_advanced_trader.constants import DEFAULT_CONFIG
@@ -42,6 +45,31 @@ class TestConfigManager(unittest.TestCase):
 
         self.assertEqual(test_config, self.default_config)
 
+    def test_concurrent_first_use(self):
+        """Test that threads racing on first use share one instance and one load."""
+        loads = []
+
+        def slow_load(manager):
+            loads.append(1)
+            time.sleep(0.01)
+            return dict(self.default_config)
+
+        barrier = threading.Barrier(8)
+
+        def first_use():
+            barrier.wait()
+            manager = ConfigManager()
+            return manager, manager.config
+
+        with patch.object(ConfigManager, '_load_config', slow_load):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = [future.result() for future in
+                           [executor.submit(first_use) for _ in range(8)]]
+
+        self.assertEqual(len({id(manager) for manager, _ in results}), 1)
+        self.assertEqual(len({id(config) for _, config in results}), 1)
+        self.assertEqual(len(loads), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
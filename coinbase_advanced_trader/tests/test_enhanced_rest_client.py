@@ -103,6 +103,20 @@ class TestEnhancedRESTClient(unittest.TestCase):
         self.assertAlmostEqual(Decimal(call_args[0][1]), Decimal(fiat_amount), places=8)
         self.assertEqual(result, mock_result)
 
+    def test_trade_based_on_fgi_many(self):
+        """Test the trade_based_on_fgi_many method."""
+        fiat_amounts = {"BTC-USDC": "10", "ETH-USDC": "20"}
+        schedule = [{'threshold': 30, 'factor': 1.0, 'action': 'buy'}]
+        mock_result = {"BTC-USDC": None, "ETH-USDC": None}
+        self.client._fear_and_greed_strategy.execute_trades.return_value = mock_result
+
+        result = self.client.trade_based_on_fgi_many(fiat_amounts, schedule=schedule)
+
+        self.client._fear_and_greed_strategy.execute_trades.assert_called_once_with(
+            fiat_amounts, schedule=schedule
+        )
+        self.assertEqual(result, mock_result)
+
     def test_update_fgi_schedule(self):
         """Test the update_fgi_schedule method."""
         new_schedule = [
@@ -0,0 +1,67 @@
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader.fast_decode import JSON_BACKEND, loads
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+
+
+class TestFastDecode(unittest.TestCase):
+    """Test cases for the fast decoding mode of EnhancedRESTClient."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': '1'},
+                                          clock=lambda: 1700000000.0)
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.exchange.add_product('ETH-USDC', '3000')
+        self.client = PaperTradingClient(self.exchange)
+        self.fast_client = PaperTradingClient(self.exchange, fast_decode=True)
+
+    def assertSameResponse(self, call):
+        """Assert that both modes return the same data for a call."""
+        sdk_response = call(self.client)
+        fast_response = call(self.fast_client)
+        self.assertIsInstance(fast_response, dict)
+        self.assertEqual(fast_response, sdk_response.to_dict())
+        return fast_response
+
+    def test_reads_match_sdk_responses(self):
+        """Test that every dict-mode read returns what the SDK objects hold."""
+        order = self.client.fiat_market_buy('BTC-USDC', '10')
+        self.client.fiat_limit_buy('ETH-USDC', '10', '0.9')
+
+        self.assertSameResponse(lambda client: client.get_product('BTC-USDC'))
+        self.assertSameResponse(lambda client: client.get_products(product_ids=['BTC-USDC']))
+        self.assertSameResponse(lambda client: client.get_best_bid_ask(['BTC-USDC']))
+        accounts = self.assertSameResponse(lambda client: client.get_accounts(limit=10))
+        uuid = accounts['accounts'][0]['uuid']
+        self.assertSameResponse(lambda client: client.get_account(uuid))
+        orders = self.assertSameResponse(lambda client: client.list_orders(order_status=['OPEN']))
+        self.assertEqual(len(orders['orders']), 1)
+        self.assertSameResponse(lambda client: client.get_order(order.id))
+        self.assertSameResponse(lambda client: client.get_fills(order_ids=[order.id]))
+
+    def test_services_work_in_fast_mode(self):
+        """Test the order, price and account services against dict responses."""
+        self.assertIsNotNone(self.fast_client.fiat_limit_buy('BTC-USDC', '10'))
+        self.assertEqual(self.fast_client.get_crypto_balance('BTC'), Decimal('1'))
+        account = self.fast_client.get_account_by_currency('USDC')
+        self.assertEqual(account.currency, 'USDC')
+        self.assertEqual(self.fast_client.price_service.get_spot_price('BTC-USDC'),
+                         Decimal('50000.00'))
+
+    def test_errors_are_raised(self):
+        """Test that HTTP errors are raised as in the SDK path."""
+        with self.assertRaises(Exception) as context:
+            self.fast_client.get_product('DOGE-USDC')
+        self.assertEqual(context.exception.response.status_code, 404)
+
+    def test_loads(self):
+        """Test the JSON decoder."""
+        self.assertIn(JSON_BACKEND, ('orjson', 'json'))
+        self.assertEqual(loads(b'{"price": "1.5", "size": [1, 2]}'),
+                         {'price': '1.5', 'size': [1, 2]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from coinbase_advanced_trader.services.fear_and_greed_provider import (
+    RETRY_INTERVAL,
+    FearAndGreedProvider
+)
+
+
+class TestFearAndGreedProvider(unittest.TestCase):
+    """Test cases for the FearAndGreedProvider class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.client_mock = Mock()
+        self.client_mock.get_current_data.return_value = {
+            'value': '25',
+            'value_classification': 'Extreme Fear',
+            'timestamp': str(int(time.time())),
+            'time_until_update': '3600'
+        }
+        self.provider = FearAndGreedProvider(self.client_mock)
+
+    def test_single_fetch_for_value_and_classification(self):
+        """Test that value and classification come from one request."""
+        reading = self.provider.get_reading()
+
+        self.assertEqual(reading.value, 25)
+        self.assertEqual(reading.classification, 'Extreme Fear')
+        self.client_mock.get_current_data.assert_called_once()
+        self.client_mock.get_current_value.assert_not_called()
+        self.client_mock.get_current_classification.assert_not_called()
+
+    def test_reading_cached_until_next_publication(self):
+        """Test that repeated calls reuse the reading until it expires."""
+        for _ in range(30):
+            self.provider.get_reading()
+
+        self.client_mock.get_current_data.assert_called_once()
+
+    def test_expired_reading_refetched(self):
+        """Test that a reading past its publication time is fetched again."""
+        self.provider.get_reading()
+        self.provider.get_reading()
+        self.client_mock.get_current_data.assert_called_once()
+
+        with patch('coinbase_advanced_trader.services.fear_and_greed_provider.time.time',
+                   return_value=time.time() + 3601):
+            self.provider.get_reading()
+
+        self.assertEqual(self.client_mock.get_current_data.call_count, 2)
+
+    def test_overdue_publication_waits_retry_interval(self):
+        """Test that an overdue publication is not refetched on every call."""
+        self.client_mock.get_current_data.return_value['time_until_update'] = None
+        self.client_mock.get_current_data.return_value['timestamp'] = '0'
+
+        reading = self.provider.get_reading()
+        self.provider.get_reading()
+
+        self.client_mock.get_current_data.assert_called_once()
+        self.assertAlmostEqual(reading.expires_at, time.time() + RETRY_INTERVAL, delta=5)
+
+    def test_persisted_fallback_when_upstream_down(self):
+        """Test that the persisted reading is served when the API fails."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'fgi.json')
+            FearAndGreedProvider(self.client_mock, fallback_path=path).get_reading()
+
+            failing_client = Mock()
+            failing_client.get_current_data.side_effect = ConnectionError("down")
+            reading = FearAndGreedProvider(failing_client, fallback_path=path).get_reading()
+
+        self.assertEqual(reading.value, 25)
+        self.assertEqual(reading.classification, 'Extreme Fear')
+
+    def test_no_fallback_raises(self):
+        """Test that the error propagates when no reading is available."""
+        self.client_mock.get_current_data.side_effect = ConnectionError("down")
+
+        with self.assertRaises(ConnectionError):
+            self.provider.get_reading()
+
+
+if __name__ == '__main__':
+    unittest.main()
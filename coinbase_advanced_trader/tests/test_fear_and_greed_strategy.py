@@ -2,11 +2,15 @@ import unittest
 from unittest.mock import Mock, patch
 from decimal import Decimal
 
+from coinbase_advanced_trader.services.fear_and_greed_provider import (
+    FearAndGreedProvider,
+    FearAndGreedReading
+)
 from coinbase_advanced_trader.services.fear_and_greed_strategy import FearAndGreedStrategy
 from coinbase_advanced_trader.models import Order, OrderSide, OrderType
 from coinbase_advanced_trader.services.order_service import OrderService
 from coinbase_advanced_trader.services.price_service import PriceService
-from coinbase_advanced_trader.trading_config import FearAndGreedConfig
+from coinbase_advanced_trader.trading_config import CompiledFGISchedule, FearAndGreedConfig
 
 
 class TestFearAndGreedStrategy(unittest.TestCase):
@@ -17,23 +21,33 @@ class TestFearAndGreedStrategy(unittest.TestCase):
         self.order_service_mock = Mock(spec=OrderService)
         self.price_service_mock = Mock(spec=PriceService)
         self.config_mock = Mock(spec=FearAndGreedConfig)
+        self.fgi_provider_mock = Mock(spec=FearAndGreedProvider)
         self.strategy = FearAndGreedStrategy(
             self.order_service_mock,
             self.price_service_mock,
-            self.config_mock
+            self.config_mock,
+            fgi_provider=self.fgi_provider_mock
+        )
+
+    def _set_schedule(self, schedule):
+        """Make the mocked config return the given schedule, compiled."""
+        self.config_mock.get_compiled_schedule.return_value = CompiledFGISchedule(schedule)
+
+    def _set_fgi(self, value, classification):
+        """Make the mocked provider return the given reading."""
+        self.fgi_provider_mock.get_reading.return_value = FearAndGreedReading(
+            value=value, classification=classification,
+            timestamp=1700000000, expires_at=float('inf')
         )
-        # Mock the FearAndGreedIndex client
-        self.strategy._fgi_client = Mock()
 
     def test_execute_trade_buy(self):
         """Test execute_trade method for a buy scenario."""
-        self.strategy._fgi_client.get_current_value.return_value = 25
-        self.strategy._fgi_client.get_current_classification.return_value = "Extreme Fear"
+        self._set_fgi(25, "Extreme Fear")
 
-        self.config_mock.get_fgi_schedule.return_value = [
+        self._set_schedule([
             {'threshold': 30, 'factor': 1.2, 'action': 'buy'},
             {'threshold': 70, 'factor': 0.8, 'action': 'sell'}
-        ]
+        ])
 
         mock_order = Order(
             id='fb67bb54-73ba-41ec-a038-9883664325b7',
@@ -55,13 +69,12 @@ class TestFearAndGreedStrategy(unittest.TestCase):
 
     def test_execute_trade_sell(self):
         """Test execute_trade method for a sell scenario."""
-        self.strategy._fgi_client.get_current_value.return_value = 75
-        self.strategy._fgi_client.get_current_classification.return_value = "Extreme Greed"
+        self._set_fgi(75, "Extreme Greed")
 
-        self.config_mock.get_fgi_schedule.return_value = [
+        self._set_schedule([
             {'threshold': 30, 'factor': 1.2, 'action': 'buy'},
             {'threshold': 70, 'factor': 0.8, 'action': 'sell'}
-        ]
+        ])
 
         mock_order = Order(
             id='fb67bb54-73ba-41ec-a038-9883664325b7',
@@ -83,13 +96,12 @@ class TestFearAndGreedStrategy(unittest.TestCase):
 
     def test_execute_trade_no_condition_met(self):
         """Test execute_trade method when no condition is met."""
-        self.strategy._fgi_client.get_current_value.return_value = 50
-        self.strategy._fgi_client.get_current_classification.return_value = "Neutral"
+        self._set_fgi(50, "Neutral")
 
-        self.config_mock.get_fgi_schedule.return_value = [
+        self._set_schedule([
             {'threshold': 30, 'factor': 1.2, 'action': 'buy'},
             {'threshold': 70, 'factor': 0.8, 'action': 'sell'}
-        ]
+        ])
 
         result = self.strategy.execute_trade('BTC-USDC', '10')
 
@@ -97,6 +109,94 @@ class TestFearAndGreedStrategy(unittest.TestCase):
         self.order_service_mock.fiat_limit_buy.assert_not_called()
         self.order_service_mock.fiat_limit_sell.assert_not_called()
 
+    def test_execute_trade_schedule_override(self):
+        """Test that an override schedule is used instead of the configured one."""
+        self._set_fgi(25, "Extreme Fear")
+        schedule = [{'threshold': 40, 'factor': 2.0, 'action': 'buy'}]
+
+        self.strategy.execute_trade('BTC-USDC', '10', schedule=schedule)
+
+        self.config_mock.get_compiled_schedule.assert_not_called()
+        call_args = self.order_service_mock.fiat_limit_buy.call_args
+        self.assertAlmostEqual(Decimal(call_args[0][1]), Decimal('20.00'), places=8)
+
+    def test_execute_trade_invalid_schedule_override(self):
+        """Test that an invalid override schedule raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.strategy.execute_trade('BTC-USDC', '10', schedule=[])
+
+        self.order_service_mock.fiat_limit_buy.assert_not_called()
+
+    def test_execute_trades_many_products(self):
+        """Test that a basket is traded with one FGI and one price fetch."""
+        self._set_fgi(25, "Extreme Fear")
+        self._set_schedule([
+            {'threshold': 30, 'factor': 1.2, 'action': 'buy'},
+            {'threshold': 70, 'factor': 0.8, 'action': 'sell'}
+        ])
+        self.order_service_mock.fiat_limit_buy.side_effect = (
+            lambda product_id, amount: f"order-{product_id}"
+        )
+
+        results = self.strategy.execute_trades({'BTC-USDC': '10', 'ETH-USDC': '20'})
+
+        self.assertEqual(results, {'BTC-USDC': 'order-BTC-USDC',
+                                   'ETH-USDC': 'order-ETH-USDC'})
+        self.fgi_provider_mock.get_reading.assert_called_once()
+        self.price_service_mock.prefetch_products.assert_called_once_with(
+            ['BTC-USDC', 'ETH-USDC']
+        )
+        amounts = {call[0][0]: Decimal(call[0][1])
+                   for call in self.order_service_mock.fiat_limit_buy.call_args_list}
+        self.assertAlmostEqual(amounts['BTC-USDC'], Decimal('12.00'), places=8)
+        self.assertAlmostEqual(amounts['ETH-USDC'], Decimal('24.00'), places=8)
+
+    def test_execute_trades_reports_failures_per_product(self):
+        """Test that one failed order does not prevent the others."""
+        self._set_fgi(75, "Extreme Greed")
+        self._set_schedule([
+            {'threshold': 70, 'factor': 1.0, 'action': 'sell'}
+        ])
+        error = Exception("Insufficient balance")
+
+        def sell(product_id, amount):
+            if product_id == 'ETH-USDC':
+                raise error
+            return f"order-{product_id}"
+        self.order_service_mock.fiat_limit_sell.side_effect = sell
+
+        results = self.strategy.execute_trades({'BTC-USDC': '10', 'ETH-USDC': '10'})
+
+        self.assertEqual(results['BTC-USDC'], 'order-BTC-USDC')
+        self.assertIs(results['ETH-USDC'], error)
+
+    def test_execute_trades_no_condition_met(self):
+        """Test that products without a met condition map to None."""
+        self._set_fgi(50, "Neutral")
+        self._set_schedule([
+            {'threshold': 30, 'factor': 1.2, 'action': 'buy'}
+        ])
+
+        results = self.strategy.execute_trades({'BTC-USDC': '10'})
+
+        self.assertEqual(results, {'BTC-USDC': None})
+        self.price_service_mock.prefetch_products.assert_not_called()
+
+
+    def test_execute_trades_empty_basket(self):
+        """Test that an empty basket returns no results without fetching the index."""
+        self._set_fgi(25, "Extreme Fear")
+        self._set_schedule([
+            {'threshold': 30, 'factor': 1.2, 'action': 'buy'}
+        ])
+
+        results = self.strategy.execute_trades({})
+
+        self.assertEqual(results, {})
+        self.fgi_provider_mock.get_reading.assert_not_called()
+        self.price_service_mock.prefetch_products.assert_not_called()
+        self.order_service_mock.fiat_limit_buy.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
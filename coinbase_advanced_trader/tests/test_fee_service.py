@@ -0,0 +1,122 @@
+"""Unit tests for the FeeService class."""
+
+import unittest
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+from coinbase.rest import RESTClient
+from coinbase_advanced_trader.models import OrderSide, OrderType
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.services.fee_service import DEFAULT_FEE_TIER, FeeService, FeeTier
+
+
+class TestFeeService(unittest.TestCase):
+    """Test cases for the FeeService class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.rest_client_mock = Mock(spec=RESTClient)
+        self.rest_client_mock.get_transaction_summary.return_value = {
+            'total_volume': 120000.0,
+            'fee_tier': {
+                'pricing_tier': 'Advanced 2',
+                'usd_from': '50000',
+                'usd_to': '100000',
+                'maker_fee_rate': '0.0025',
+                'taker_fee_rate': '0.004'
+            }
+        }
+        self.fee_service = FeeService(self.rest_client_mock)
+
+    def test_fee_tier_is_cached(self):
+        """Test that the tier is fetched once and then served from the cache."""
+        tier = self.fee_service.get_fee_tier()
+
+        self.assertEqual(tier, FeeTier('Advanced 2', Decimal('0.0025'), Decimal('0.004')))
+        self.assertEqual(self.fee_service.get_fee_rates('BTC-USDC'),
+                         (Decimal('0.0025'), Decimal('0.004')))
+        self.rest_client_mock.get_transaction_summary.assert_called_once()
+
+        self.fee_service.invalidate()
+        self.fee_service.get_fee_tier()
+        self.assertEqual(self.rest_client_mock.get_transaction_summary.call_count, 2)
+
+    def test_fee_tier_expires(self):
+        """Test that an expired tier is fetched again."""
+        fee_service = FeeService(self.rest_client_mock, cache_duration=timedelta(0))
+
+        fee_service.get_fee_tier()
+        fee_service.get_fee_tier()
+
+        self.assertEqual(self.rest_client_mock.get_transaction_summary.call_count, 2)
+
+    def test_failed_fetch_uses_default_rates(self):
+        """Test that the default tier is used, and cached briefly, when the fetch fails."""
+        self.rest_client_mock.get_transaction_summary.side_effect = Exception("API Error")
+
+        self.assertEqual(self.fee_service.get_fee_tier(), DEFAULT_FEE_TIER)
+        self.assertEqual(self.fee_service.get_fee_tier(), DEFAULT_FEE_TIER)
+        self.rest_client_mock.get_transaction_summary.assert_called_once()
+
+        fee_service = FeeService(self.rest_client_mock, retry_after=timedelta(0))
+        fee_service.get_fee_tier()
+        fee_service.get_fee_tier()
+        self.assertEqual(self.rest_client_mock.get_transaction_summary.call_count, 3)
+
+    def test_net_of_fees(self):
+        """Test that the fee is taken out of the budget at the order type's rate."""
+        self.assertEqual(self.fee_service.net_of_fees(Decimal('100.25')), Decimal('100'))
+        self.assertEqual(self.fee_service.net_of_fees(Decimal('100.4'), OrderType.MARKET),
+                         Decimal('100'))
+
+
+class TestFeeAwareSizing(unittest.TestCase):
+    """Test cases for limit order sizing with the account's fee rates."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'ETH': '10'},
+                                          maker_fee_rate='0.0025', taker_fee_rate='0.004')
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.exchange.add_product('ETH-USDC', '2500')
+        self.client = PaperTradingClient(self.exchange)
+        self.fetches = 0
+        get_transaction_summary = self.client.get_transaction_summary
+
+        def counting_get_transaction_summary(**kwargs):
+            self.fetches += 1
+            return get_transaction_summary(**kwargs)
+        self.client.get_transaction_summary = counting_get_transaction_summary
+
+    def test_limit_buy_budget_includes_maker_fee(self):
+        """Test that a limit buy and its maker fee fit in the fiat amount."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+
+        self.assertEqual(order.price, Decimal('49500.00'))
+        # 100 / 1.0025 / 49500 = 0.00201516... rounded down.
+        self.assertEqual(order.size, Decimal('0.00201516'))
+        self.assertLessEqual(order.size * order.price * Decimal('1.0025'), Decimal('100'))
+
+    def test_limit_sell_size_is_unchanged(self):
+        """Test that sells are sized on the fiat amount alone."""
+        order = self.client.fiat_limit_sell('ETH-USDC', '100', price_multiplier='1.01')
+
+        # 100 / 2525 = 0.03960396... rounded down.
+        self.assertEqual(order.size, Decimal('0.03960396'))
+
+    def test_rates_are_fetched_once_for_many_orders(self):
+        """Test that no order fetches the fee rates once they are cached."""
+        self.client.fiat_limit_buy('BTC-USDC', '100')
+        self.client.fiat_limit_buy('BTC-USDC', '100')
+        orders = self.client._order_service.place_limit_orders(
+            {'BTC-USDC': '100', 'ETH-USDC': '100'}, OrderSide.BUY, price_multiplier='0.99')
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(orders['ETH-USDC'].size,
+                         (Decimal('100') / Decimal('1.0025') / orders['ETH-USDC'].price)
+                         .quantize(Decimal('0.00000001'), rounding='ROUND_DOWN'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import importlib.util
+import unittest
+from pathlib import Path
+
+BENCHMARK_PATH = Path(__file__).resolve().parents[2] / 'benchmarks' / 'bench_import_time.py'
+
+# Cumulative `python -X importtime` budget for `import coinbase_advanced_trader`.
+PACKAGE_IMPORT_BUDGET_US = 50000
+
+# Budget for `import coinbase_advanced_trader.enhanced_rest_client` beyond the
+# Coinbase SDK (`coinbase.rest`, with `requests`), which the client cannot
+# defer and which takes most of the time. Measured at about 40 ms.
+CLIENT_IMPORT_BUDGET_US = 60000
+
+# Modules that must only be imported when the feature needing them is used.
+LAZY_MODULES = ('fear_and_greed', 'alphasquared', 'yaml', 'numpy', 'http.server', 'asyncio')
+
+
+def load_benchmark():
+    """Import the import time benchmark from the benchmarks folder."""
+    spec = importlib.util.spec_from_file_location('bench_import_time', BENCHMARK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(BENCHMARK_PATH.exists(), "benchmarks are not part of this checkout")
+class TestImportTime(unittest.TestCase):
+    """Test cases guarding the package import time."""
+
+    @classmethod
+    def setUpClass(cls):
+        bench = load_benchmark()
+        cls.package_timings, _ = bench.profile_import('coinbase_advanced_trader')
+        cls.client_timings, _ = bench.profile_import(
+            'coinbase_advanced_trader.enhanced_rest_client')
+
+    def test_package_import_within_budget(self):
+        """Test that importing the package stays within the time budget."""
+        self.assertLess(self.package_timings['coinbase_advanced_trader'],
+                        PACKAGE_IMPORT_BUDGET_US)
+
+    def test_package_import_is_lazy(self):
+        """Test that importing the package does not load the SDK or strategies."""
+        for module in LAZY_MODULES + ('coinbase.rest',):
+            self.assertNotIn(module, self.package_timings)
+
+    def test_client_import_within_budget(self):
+        """Test that importing the client stays within the time budget."""
+        own = (self.client_timings['coinbase_advanced_trader.enhanced_rest_client']
+               - self.client_timings['coinbase.rest'])
+
+        self.assertLess(own, CLIENT_IMPORT_BUDGET_US)
+
+    def test_client_import_defers_strategy_dependencies(self):
+        """Test that importing the client does not load strategy dependencies."""
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, self.client_timings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import json
+import unittest
+
+from coinbase_advanced_trader.instrumentation import (
+    InMemoryInstrumentation,
+    Instrumentation,
+    InstrumentedSession,
+    LatencyHistogram,
+    current_operation,
+    endpoint_name,
+    track_operation
+)
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+
+
+class RecordingInstrumentation(Instrumentation):
+    """Instrumentation keeping every event it receives."""
+
+    def __init__(self):
+        self.requests = []
+        self.operations = []
+
+    def on_request(self, event):
+        self.requests.append(event)
+
+    def on_operation(self, event):
+        self.operations.append(event)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for the request instrumentation hooks."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': '1'})
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.recorder = RecordingInstrumentation()
+        self.client = PaperTradingClient(self.exchange, instrumentation=self.recorder)
+
+    def test_requests_attributed_to_operation(self):
+        """Test that requests are attributed to the client method making them."""
+        self.client.fiat_limit_buy('BTC-USDC', '10')
+
+        # The first order also fetches the fee tier, cached for a day.
+        self.assertEqual([(event.operation, event.endpoint) for event in self.recorder.requests],
+                         [('fiat_limit_buy', 'GET products/{id}'),
+                          ('fiat_limit_buy', 'GET transaction_summary'),
+                          ('fiat_limit_buy', 'POST orders')])
+        self.assertTrue(all(event.status == 200 for event in self.recorder.requests))
+        self.assertTrue(all(event.response_bytes > 0 for event in self.recorder.requests))
+        self.assertGreater(self.recorder.requests[2].request_bytes, 0)
+
+        operation, = self.recorder.operations
+        self.assertEqual(operation.name, 'fiat_limit_buy')
+        self.assertEqual(operation.requests, 3)
+        self.assertIsNone(operation.error)
+
+    def test_direct_sdk_calls_have_no_operation(self):
+        """Test that SDK methods called directly are recorded without an operation."""
+        self.client.get_product('BTC-USDC')
+
+        event, = self.recorder.requests
+        self.assertIsNone(event.operation)
+        self.assertEqual(self.recorder.operations, [])
+
+    def test_error_statuses_are_recorded(self):
+        """Test that failed requests are reported with their status."""
+        with self.assertRaises(Exception):
+            self.client.get_product('DOGE-USDC')
+
+        event, = self.recorder.requests
+        self.assertEqual(event.status, 404)
+        self.assertTrue(event.failed)
+
+    def test_outer_operation_keeps_attribution(self):
+        """Test that a user-defined operation scope groups nested client calls."""
+        with track_operation(self.client.instrumentation, 'rebalance'):
+            self.assertEqual(current_operation(), 'rebalance')
+            self.client.fiat_market_buy('BTC-USDC', '10')
+            self.client.fiat_market_sell('BTC-USDC', '10')
+
+        self.assertEqual({event.operation for event in self.recorder.requests}, {'rebalance'})
+        operation, = self.recorder.operations
+        self.assertEqual(operation.name, 'rebalance')
+        self.assertEqual(operation.requests, len(self.recorder.requests))
+        self.assertIsNone(current_operation())
+
+    def test_concurrent_basket_requests_are_attributed(self):
+        """Test that orders placed on worker threads keep the operation."""
+        self.client._fear_and_greed_strategy.fgi_provider.get_reading = (
+            lambda: type('Reading', (), {'value': 10, 'classification': 'Extreme Fear'})()
+        )
+        self.exchange.add_product('ETH-USDC', '3000')
+
+        self.client.trade_based_on_fgi_many({'BTC-USDC': '10', 'ETH-USDC': '10'})
+
+        self.assertEqual({event.operation for event in self.recorder.requests},
+                         {'trade_based_on_fgi_many'})
+        self.assertEqual(self.recorder.operations[0].requests, len(self.recorder.requests))
+
+    def test_instrumentation_can_be_removed(self):
+        """Test that clearing the instrumentation restores the plain session."""
+        self.assertIsInstance(self.client.session, InstrumentedSession)
+
+        self.client.instrumentation = None
+        self.client.fiat_market_buy('BTC-USDC', '10')
+
+        self.assertNotIsInstance(self.client.session, InstrumentedSession)
+        self.assertEqual(self.recorder.requests, [])
+
+    def test_session_attributes_are_forwarded(self):
+        """Test that the wrapper exposes the wrapped session's attributes."""
+        self.client.get_product('BTC-USDC')
+
+        self.assertEqual(self.client.session.request_count, 1)
+
+
+class TestInMemoryInstrumentation(unittest.TestCase):
+    """Test cases for the in-memory aggregator."""
+
+    def test_snapshot_aggregates_by_operation_and_endpoint(self):
+        """Test the aggregated counts, bytes and latencies."""
+        exchange = SimulatedExchange(balances={'USDC': '1000'})
+        exchange.add_product('BTC-USDC', '50000')
+        instrumentation = InMemoryInstrumentation()
+        client = PaperTradingClient(exchange, instrumentation=instrumentation)
+        client.fee_service.get_fee_tier()
+
+        for _ in range(3):
+            client.fiat_limit_buy('BTC-USDC', '10')
+        snapshot = instrumentation.snapshot()
+
+        operation, = snapshot['operations']
+        self.assertEqual((operation['name'], operation['count']), ('fiat_limit_buy', 3))
+        self.assertEqual(operation['requests_per_call'], 2)
+        by_endpoint = {entry['endpoint']: entry for entry in snapshot['requests']}
+        self.assertEqual(by_endpoint['POST orders']['count'], 3)
+        self.assertEqual(by_endpoint['POST orders']['statuses'], {'200': 3})
+        self.assertEqual(by_endpoint['POST orders']['latency']['count'], 3)
+        self.assertEqual(json.loads(instrumentation.dump()), snapshot)
+        self.assertIn('fiat_limit_buy', instrumentation.format_table())
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {'requests': [], 'operations': []})
+
+    def test_histogram_quantiles(self):
+        """Test that quantiles are interpolated within buckets."""
+        histogram = LatencyHistogram(buckets=(0.1, 0.2))
+        for value in (0.05, 0.15, 0.15, 0.3):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative(), [(0.1, 1), (0.2, 3), (float('inf'), 4)])
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.15)
+        self.assertEqual(histogram.quantile(1.0), 0.3)
+
+    def test_endpoint_name(self):
+        """Test that identifiers are replaced in endpoint names."""
+        base = 'https://api.coinbase.com/api/v3/brokerage'
+        self.assertEqual(endpoint_name('GET', f'{base}/products/BTC-USDC'), 'GET products/{id}')
+        self.assertEqual(endpoint_name('GET', f'{base}/orders/historical/batch'),
+                         'GET orders/historical/batch')
+        self.assertEqual(endpoint_name('GET', f'{base}/orders/historical/abc'),
+                         'GET orders/historical/{id}')
+        self.assertEqual(endpoint_name('POST', 'https://api.coinbase.com/v2/accounts/x/deposits'),
+                         'POST v2/accounts/{id}/deposits')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import Order, OrderSide, OrderType
+from coinbase_advanced_trader.open_orders import OpenOrderBook
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.tests.test_user_stream import (
+    ReplayTransport,
+    order_event,
+    user_message
+)
+
+
+def limit_order(order_id, price, side=OrderSide.BUY, product_id='ETH-USDC', status='open'):
+    return Order(id=order_id, product_id=product_id, side=side, type=OrderType.LIMIT,
+                 size=Decimal('1'), price=Decimal(price), status=status)
+
+
+class TestOpenOrderBook(unittest.TestCase):
+    """Test cases for the OpenOrderBook class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.book = OpenOrderBook()
+        for order_id, price, side in [('b1', '2900', OrderSide.BUY),
+                                      ('b2', '2950', OrderSide.BUY),
+                                      ('b3', '2950', OrderSide.BUY),
+                                      ('b4', '2990', OrderSide.BUY),
+                                      ('s1', '3010', OrderSide.SELL),
+                                      ('s2', '3100', OrderSide.SELL)]:
+            self.book.update(limit_order(order_id, price, side))
+
+    def ids(self, orders):
+        return [order.id for order in orders]
+
+    def test_orders_are_sorted_by_price(self):
+        """Test that orders come back by side and price level."""
+        self.assertEqual(len(self.book), 6)
+        self.assertEqual(self.ids(self.book.orders('ETH-USDC')),
+                         ['b1', 'b2', 'b3', 'b4', 's1', 's2'])
+        self.assertEqual(self.book.best('ETH-USDC', OrderSide.BUY), Decimal('2990'))
+        self.assertEqual(self.book.best('ETH-USDC', OrderSide.SELL), Decimal('3010'))
+        self.assertEqual(self.ids(self.book.between('ETH-USDC', OrderSide.BUY,
+                                                    Decimal('2950'), Decimal('2990'))),
+                         ['b2', 'b3', 'b4'])
+        self.assertEqual(self.book.orders('BTC-USDC'), [])
+
+    def test_away_from_mid(self):
+        """Test finding the orders more than a fraction away from mid."""
+        far = self.book.away_from('ETH-USDC', Decimal('3000'), Decimal('0.02'))
+
+        self.assertEqual(self.ids(far), ['b1', 's2'])
+        self.assertEqual(self.ids(self.book.away_from('ETH-USDC', Decimal('3000'),
+                                                      Decimal('0.01'), OrderSide.BUY)),
+                         ['b1', 'b2', 'b3'])
+
+    def test_updates_move_and_remove_orders(self):
+        """Test that repriced orders move and finished orders leave the index."""
+        self.book.update(limit_order('b1', '2995'))
+        self.book.update(limit_order('b2', '2950', status='filled'))
+        self.book.discard('s2')
+        self.book.discard('unknown')
+        self.book.update(Order(id='m', product_id='ETH-USDC', side=OrderSide.BUY,
+                               type=OrderType.MARKET, size=Decimal('10')))
+
+        self.assertEqual(self.ids(self.book.orders('ETH-USDC')), ['b3', 'b4', 'b1', 's1'])
+        self.assertNotIn('b2', self.book)
+        self.assertEqual(self.book.get('b1').price, Decimal('2995'))
+        self.assertIsNone(self.book.get('s2'))
+        self.assertEqual(self.book.best('ETH-USDC', OrderSide.SELL), Decimal('3010'))
+
+    def test_product_filter(self):
+        """Test that a book for some products ignores the others."""
+        book = OpenOrderBook(['BTC-USDC'])
+        book.update(limit_order('e', '3000'))
+        book.update(limit_order('b', '50000', product_id='BTC-USDC'))
+
+        self.assertEqual(self.ids(book), ['b'])
+
+    def test_resting_size(self):
+        """Test summing the unfilled size of one side."""
+        self.book.get('b4').filled_size = Decimal('0.25')
+
+        self.assertEqual(self.book.resting_size('ETH-USDC', OrderSide.BUY), Decimal('3.75'))
+
+
+class TestClientOpenOrderBook(unittest.TestCase):
+    """Test cases for the open order book kept by a client."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '10000', 'ETH': '1'})
+        self.exchange.add_product('ETH-USDC', '3000', spread='0.001', level_size='10',
+                                  base_increment='0.0001')
+        self.client = PaperTradingClient(self.exchange)
+
+    def test_seeded_and_kept_current(self):
+        """Test that the book is loaded from the API and follows placements and cancels."""
+        resting = [self.client.fiat_limit_buy('ETH-USDC', '100', price_multiplier=multiplier)
+                   for multiplier in ('0.97', '0.99')]
+        self.client.list_orders = self._paginated(self.client.list_orders)
+
+        book = self.client.open_order_book(['ETH-USDC'])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.ids(book.orders('ETH-USDC')), [order.id for order in resting])
+
+        placed = self.client.fiat_limit_sell('ETH-USDC', '100', price_multiplier='1.03')
+        self.assertEqual(self.ids(book.away_from('ETH-USDC', Decimal('3000'), Decimal('0.02'))),
+                         [resting[0].id, placed.id])
+
+        self.assertEqual(self.client.cancel_open_orders([resting[0].id, 'unknown']),
+                         {resting[0].id: True, 'unknown': False})
+        self.assertEqual(self.ids(book.orders('ETH-USDC')), [resting[1].id, placed.id])
+
+    def test_follows_user_stream(self):
+        """Test that fills reported by the user stream remove orders from the book."""
+        transport = ReplayTransport()
+        stream = self.client.user_stream(['ETH-USDC'], transport=transport).start()
+        book = self.client.open_order_book(['ETH-USDC'], stream=stream)
+        order = self.client.fiat_limit_buy('ETH-USDC', '100', price_multiplier='0.99')
+        self.assertIn(order.id, book)
+
+        transport.push(user_message(0, order_event(
+            order.id, status='FILLED', filled=str(order.size), leaves='0',
+            avg_price=str(order.price), product_id='ETH-USDC'
+        )))
+        stream.stop()
+
+        self.assertEqual(len(book), 0)
+
+    def test_reloaded_books_are_detached(self):
+        """Test that closed books stop following the client, so reloads do not pile up."""
+        order_service = self.client._order_service
+        listeners = (len(order_service.order_listeners), len(order_service.cancel_listeners))
+        stream = self.client.user_stream(['ETH-USDC'], transport=ReplayTransport()).start()
+
+        closed = []
+        for _ in range(3):
+            with self.client.open_order_book(['ETH-USDC'], stream=stream) as book:
+                closed.append(book)
+        order = self.client.fiat_limit_buy('ETH-USDC', '100', price_multiplier='0.99')
+        stream.stop()
+
+        self.assertEqual((len(order_service.order_listeners),
+                          len(order_service.cancel_listeners)), listeners)
+        self.assertEqual(stream.order_listeners, [])
+        self.assertTrue(all(order.id not in book for book in closed))
+
+    def ids(self, orders):
+        return [order.id for order in orders]
+
+    def _paginated(self, list_orders):
+        """Serve list_orders one order per page and count the calls."""
+        self.calls = 0
+
+        def paginated(**kwargs):
+            self.calls += 1
+            return list_orders(limit=1, **kwargs)
+        return paginated
+
+
+if __name__ == '__main__':
+    unittest.main()
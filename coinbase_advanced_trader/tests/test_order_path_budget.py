@@ -0,0 +1,48 @@
+import importlib.util
+import json
+import unittest
+from pathlib import Path
+
+BENCHMARK_PATH = Path(__file__).resolve().parents[2] / 'benchmarks' / 'bench_order_path.py'
+
+
+def load_benchmark():
+    """Import the order path benchmark from the benchmarks folder."""
+    spec = importlib.util.spec_from_file_location('bench_order_path', BENCHMARK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(BENCHMARK_PATH.exists(), "benchmarks are not part of this checkout")
+class TestOrderPathBudget(unittest.TestCase):
+    """Test cases guarding the REST calls made per order against the baseline."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.bench = load_benchmark()
+        cls.baseline = json.loads(cls.bench.BASELINE_PATH.read_text())
+
+    def test_requests_per_order_within_baseline(self):
+        """Test that no order entry point makes more REST calls than its baseline."""
+        with self.bench.formatted_logging():
+            for name, operation in self.bench.OPERATIONS.items():
+                with self.subTest(operation=name):
+                    stats = self.bench.measure_operation(operation, iterations=5)
+                    expected = self.baseline['operations'][name]
+
+                    self.assertLessEqual(stats['requests_per_order'],
+                                         expected['requests_per_order'], stats['endpoints'])
+
+    def test_cache_hit_rates_within_baseline(self):
+        """Test that the caches hit at least as often as in the baseline."""
+        with self.bench.formatted_logging():
+            rates = self.bench.measure_cache_hit_rates()
+
+        for cache, expected in self.baseline['cache_hit_rate'].items():
+            with self.subTest(cache=cache):
+                self.assertGreaterEqual(rates[cache], expected - 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
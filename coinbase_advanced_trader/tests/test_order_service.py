@@ -5,6 +5,7 @@ from decimal import Decimal
 from coinbase_advanced_trader.models import Order, OrderSide, OrderType
 from coinbase_advanced_trader.services.order_service import OrderService
 from coinbase_advanced_trader.services.price_service import PriceService
+from coinbase_advanced_trader.sizing import SizingKernel
 
 
 class TestOrderService(unittest.TestCase):
@@ -22,6 +23,11 @@ class TestOrderService(unittest.TestCase):
             'quote_increment': '0.01'        # 2 decimal places for USDC
         }
         self.price_service_mock.get_product_details.return_value = self.mock_product_details
+        self.price_service_mock.get_sizing_kernel.side_effect = lambda product_id: (
+            SizingKernel.from_details(
+                product_id, self.price_service_mock.get_product_details(product_id)
+            )
+        )
 
     def test_fiat_market_buy(self):
         """Test the fiat_market_buy method."""
@@ -247,6 +253,58 @@ class TestOrderService(unittest.TestCase):
                 mock_logger.info.assert_called_with(test_case['expected_message'])
                 mock_logger.info.reset_mock()
 
+    def _mock_basket(self):
+        """Mock prices and details of a basket with one unknown product."""
+        spot_prices = {'BTC-USDC': Decimal('50000'), 'ETH-USDC': Decimal('3000')}
+        details = {
+            'BTC-USDC': {'base_increment': '0.00000001', 'quote_increment': '0.01',
+                         'base_min_size': '0.00001'},
+            'ETH-USDC': {'base_increment': '0.0001', 'quote_increment': '0.01',
+                         'base_min_size': '0.01'},
+        }
+        self.price_service_mock.get_spot_price.side_effect = spot_prices.get
+        self.price_service_mock.get_product_details.side_effect = details.get
+        self.rest_client_mock.limit_order_gtc_buy.side_effect = (
+            lambda client_order_id, product_id, base_size, limit_price: {
+                'success': True,
+                'success_response': {'order_id': f'{product_id}-order'}
+            }
+        )
+
+    def _assert_basket_results(self, results):
+        self.price_service_mock.prefetch_products.assert_called_once_with(
+            ['BTC-USDC', 'ETH-USDC', 'XYZ-USDC']
+        )
+        self.assertEqual(list(results), ['BTC-USDC', 'ETH-USDC', 'XYZ-USDC'])
+        self.assertEqual(results['BTC-USDC'].size, Decimal('0.00020010'))
+        self.assertEqual(results['BTC-USDC'].price, Decimal('49975.00'))
+        self.assertIsNone(results['ETH-USDC'])
+        self.assertIsInstance(results['XYZ-USDC'], ValueError)
+        self.rest_client_mock.limit_order_gtc_buy.assert_called_once()
+
+    def test_place_limit_orders(self):
+        """Test placing a basket of limit buys, skipping orders below the minimum size."""
+        self._mock_basket()
+
+        results = self.order_service.place_limit_orders(
+            {'BTC-USDC': '10', 'ETH-USDC': '20', 'XYZ-USDC': '5'}, OrderSide.BUY,
+            price_multiplier=0.9995
+        )
+
+        self._assert_basket_results(results)
+
+    @patch('coinbase_advanced_trader.services.order_service.VECTORIZED', False)
+    def test_place_limit_orders_without_numpy(self):
+        """Test that baskets are sized one order at a time without NumPy."""
+        self._mock_basket()
+
+        results = self.order_service.place_limit_orders(
+            {'BTC-USDC': '10', 'ETH-USDC': '20', 'XYZ-USDC': '5'}, OrderSide.BUY,
+            price_multiplier=0.9995
+        )
+
+        self._assert_basket_results(results)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
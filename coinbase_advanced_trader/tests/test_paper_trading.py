@@ -0,0 +1,162 @@
+import time
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import OrderType
+from coinbase_advanced_trader.paper_trading import (
+    LatencyModel,
+    PaperTradingClient,
+    SimulatedExchange
+)
+
+
+class TestPaperTradingClient(unittest.TestCase):
+    """Test cases for the PaperTradingClient and SimulatedExchange."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000'},
+                                          maker_fee_rate='0.004', taker_fee_rate='0.006')
+        self.exchange.add_product('BTC-USDC', '50000', spread='0.001', level_size='0.01')
+        self.client = PaperTradingClient(self.exchange)
+
+    def test_get_product(self):
+        """Test that products are served in the Coinbase format."""
+        product = self.client.get_product('BTC-USDC')
+
+        self.assertEqual(product['price'], '50000.00')
+        self.assertEqual(product['base_increment'], '0.00000001')
+        self.assertEqual(product['quote_increment'], '0.01')
+
+    def test_fiat_market_buy_takes_the_book(self):
+        """Test that a market buy fills at the ask and charges the taker fee."""
+        order = self.client.fiat_market_buy('BTC-USDC', '100.60')
+
+        self.assertEqual(order.type, OrderType.MARKET)
+        available, hold = self.exchange.balance('BTC')
+        # 100 USDC of notional at the 50025 ask; 0.60 USDC of fee.
+        self.assertEqual(available, Decimal('0.00199900'))
+        usdc, _ = self.exchange.balance('USDC')
+        self.assertAlmostEqual(float(usdc), 1000 - 0.001999 * 50025 * 1.006, places=6)
+
+    def test_limit_buy_rests_then_fills_as_maker(self):
+        """Test that a passive limit buy holds funds and fills when the market trades down."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+
+        self.assertEqual(order.price, Decimal('49500.00'))
+        self.assertEqual(self.exchange.balance('BTC'), (Decimal('0'), Decimal('0')))
+        self.assertGreater(self.exchange.balance('USDC')[1], 0)
+        open_orders = self.client.list_orders(order_status=['OPEN'])['orders']
+        self.assertEqual([o['order_id'] for o in open_orders], [order.id])
+
+        self.exchange.set_price('BTC-USDC', '49000')
+
+        self.assertEqual(self.exchange.balance('BTC')[0], order.size)
+        usdc, hold = self.exchange.balance('USDC')
+        self.assertEqual(hold, 0)
+        self.assertEqual(usdc, Decimal('1000') - order.size * order.price * Decimal('1.004'))
+        fills = self.client.get_fills(order_ids=[order.id])['fills']
+        self.assertEqual(fills[0]['liquidity_indicator'], 'MAKER')
+        self.assertEqual(self.client.get_order(order.id)['order']['status'], 'FILLED')
+
+    def test_cancel_releases_hold(self):
+        """Test that cancelling an open order frees its funds."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+
+        response = self.client.cancel_orders([order.id])
+
+        self.assertTrue(response['results'][0]['success'])
+        self.assertEqual(self.exchange.balance('USDC'), (Decimal('1000'), Decimal('0')))
+        self.assertFalse(self.client.cancel_orders([order.id])['results'][0]['success'])
+
+    def test_edit_order_reprices(self):
+        """Test that an edited order rests at its new price."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+
+        response = self.client.edit_order(order.id, size=str(order.size), price='49900.00')
+
+        self.assertTrue(response['success'])
+        self.exchange.set_price('BTC-USDC', '49850')
+        self.assertEqual(self.client.get_order(order.id)['order']['status'], 'FILLED')
+        fill = self.client.get_fills(order_ids=[order.id])['fills'][0]
+        self.assertEqual(fill['price'], '49900.00')
+
+    def test_post_only_crossing_order_rejected(self):
+        """Test that a post-only order that would take liquidity is rejected."""
+        response = self.client.limit_order_gtc_buy(
+            'cid-1', 'BTC-USDC', '0.001', '51000.00', post_only=True)
+
+        self.assertFalse(response['success'])
+        self.assertEqual(response['error_response']['error'], 'INVALID_LIMIT_PRICE_POST_ONLY')
+
+    def test_crossing_sell_fills_against_one_level_book(self):
+        """Test that a crossing sell takes a single bid level."""
+        exchange = SimulatedExchange(balances={'BTC': '1'})
+        exchange.add_product('BTC-USDC', '100')
+        exchange.set_book('BTC-USDC', bids=[(100, 1)], asks=[(101, 1)])
+        client = PaperTradingClient(exchange)
+
+        response = client.limit_order_gtc_sell('cid-1', 'BTC-USDC', '0.5', '99.00')
+
+        self.assertTrue(response['success'])
+        order = client.get_order(response['success_response']['order_id'])['order']
+        self.assertEqual(order['status'], 'FILLED')
+        self.assertEqual(order['average_filled_price'], '100')
+        self.assertEqual(exchange.balance('BTC'), (Decimal('0.5'), Decimal('0')))
+
+    def test_insufficient_funds(self):
+        """Test that orders beyond the available balance fail."""
+        with self.assertRaises(Exception):
+            self.client.fiat_market_buy('BTC-USDC', '5000')
+
+    def test_repeated_client_order_id_is_idempotent(self):
+        """Test that retrying with the same client_order_id does not double-place."""
+        first = self.client.limit_order_gtc_buy('cid-2', 'BTC-USDC', '0.001', '49000.00')
+        second = self.client.limit_order_gtc_buy('cid-2', 'BTC-USDC', '0.001', '49000.00')
+
+        self.assertEqual(first['success_response']['order_id'],
+                         second['success_response']['order_id'])
+        self.assertEqual(len(self.client.list_orders()['orders']), 1)
+
+    def test_apply_candle_fills_inside_range(self):
+        """Test that replayed candles fill resting sells their high reaches."""
+        self.exchange.deposit('BTC', '0.01')
+        self.client.limit_order_gtc_sell('cid-3', 'BTC-USDC', '0.01', '52000.00')
+
+        self.exchange.apply_candle('BTC-USDC', low='49000', high='52500', close='51000')
+
+        self.assertEqual(self.exchange.balance('BTC'), (Decimal('0'), Decimal('0')))
+        self.assertEqual(self.exchange.products['BTC-USDC'].price, Decimal('51000'))
+
+    def test_account_services_read_simulated_balances(self):
+        """Test that the account service works against the simulator."""
+        self.assertEqual(self.client.get_crypto_balance('USDC'), Decimal('1000'))
+        self.assertEqual(self.client.get_available_balances()['USDC'], Decimal('1000'))
+
+    def test_latency_injection(self):
+        """Test that a fixed latency delays every request."""
+        client = PaperTradingClient(self.exchange, latency=0.02)
+
+        start = time.perf_counter()
+        client.get_product('BTC-USDC')
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.02)
+        self.assertEqual(client.session.request_count, 1)
+
+    def test_latency_model_is_reproducible(self):
+        """Test that seeded latency models produce the same delays."""
+        first = LatencyModel(read=0.05, write=0.1, seed=3)
+        second = LatencyModel(read=0.05, write=0.1, seed=3)
+
+        self.assertEqual([first.sample('GET') for _ in range(5)],
+                         [second.sample('GET') for _ in range(5)])
+
+    def test_unknown_endpoint_is_404(self):
+        """Test that unsupported endpoints surface as HTTP errors."""
+        with self.assertRaises(Exception) as context:
+            self.client.get('/api/v3/brokerage/portfolios')
+        self.assertIn('404', str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,64 @@ class TestPriceService(unittest.TestCase):
         }
         self.assertEqual(result, expected_result)
 
+    def test_get_product_details_reuses_spot_price_response(self):
+        """Test that increments from a spot price lookup are reused."""
+        self.rest_client_mock.get_product.return_value = {
+            'price': '61536',
+            'base_increment': '0.00000001',
+            'quote_increment': '0.01'
+        }
+
+        self.price_service.get_spot_price("BTC-USDC")
+        result = self.price_service.get_product_details("BTC-USDC")
+
+        self.rest_client_mock.get_product.assert_called_once_with("BTC-USDC")
+        self.assertEqual(result['base_increment'], Decimal('0.00000001'))
+
+    def test_prefetch_products(self):
+        """Test that prefetched products are served without further requests."""
+        self.rest_client_mock.get_products.return_value = {
+            'products': [
+                {'product_id': 'BTC-USDC', 'price': '61536.123',
+                 'base_increment': '0.00000001', 'quote_increment': '0.01'},
+                {'product_id': 'ETH-USDC', 'price': '3000',
+                 'base_increment': '0.0001', 'quote_increment': '0.01'}
+            ]
+        }
+
+        prices = self.price_service.prefetch_products(['BTC-USDC', 'ETH-USDC', 'SOL-USDC'])
+
+        self.rest_client_mock.get_products.assert_called_once_with(
+            product_ids=['BTC-USDC', 'ETH-USDC', 'SOL-USDC']
+        )
+        self.assertEqual(prices, {'BTC-USDC': Decimal('61536.12'),
+                                  'ETH-USDC': Decimal('3000.00'),
+                                  'SOL-USDC': None})
+        self.assertEqual(self.price_service.get_spot_price('ETH-USDC'), Decimal('3000.00'))
+        self.assertEqual(self.price_service.get_product_details('ETH-USDC')['base_increment'],
+                         Decimal('0.0001'))
+        self.rest_client_mock.get_product.assert_not_called()
+
+    def test_get_sizing_kernel_is_built_once(self):
+        """Test that a product's sizing kernel is cached."""
+        self.rest_client_mock.get_product.return_value = {
+            'base_increment': '0.00000001',
+            'quote_increment': '0.01'
+        }
+
+        kernel = self.price_service.get_sizing_kernel("BTC-USDC")
+
+        self.assertIs(self.price_service.get_sizing_kernel("BTC-USDC"), kernel)
+        self.assertEqual(kernel.base_increment, Decimal('0.00000001'))
+        self.assertEqual(kernel.quote_increment, Decimal('0.01'))
+        self.rest_client_mock.get_product.assert_called_once_with("BTC-USDC")
+
+    def test_get_sizing_kernel_unknown_product(self):
+        """Test that no kernel is returned when product details are unavailable."""
+        self.rest_client_mock.get_product.side_effect = Exception("Product not found")
+
+        self.assertIsNone(self.price_service.get_sizing_kernel("BTC-USDDC"))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+import unittest
+import urllib.error
+import urllib.request
+
+from coinbase_advanced_trader.instrumentation import MetricsServer, PrometheusInstrumentation
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.services.fear_and_greed_provider import FearAndGreedReading
+
+
+class TestPrometheusInstrumentation(unittest.TestCase):
+    """Test cases for the Prometheus metrics exporter."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': '1'})
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.metrics = PrometheusInstrumentation(namespace='test')
+        self.client = PaperTradingClient(self.exchange, instrumentation=self.metrics)
+
+    def metric_lines(self):
+        return self.metrics.render().splitlines()
+
+    def test_order_counts_and_latency(self):
+        """Test that orders are counted by product, side, type and outcome."""
+        self.client.fiat_limit_buy('BTC-USDC', '10')
+        self.client.fiat_limit_buy('BTC-USDC', '10')
+        self.client.fiat_market_sell('BTC-USDC', '10')
+
+        lines = self.metric_lines()
+        self.assertIn('test_orders_total{product_id="BTC-USDC",side="buy",type="limit",'
+                      'outcome="success"} 2.0', lines)
+        self.assertIn('test_orders_total{product_id="BTC-USDC",side="sell",type="market",'
+                      'outcome="success"} 1.0', lines)
+        self.assertIn('test_order_latency_seconds_count{side="buy",type="limit"} 2', lines)
+        self.assertIn('test_order_latency_seconds_bucket{side="buy",type="limit",le="+Inf"} 2',
+                      lines)
+
+    def test_rest_and_cache_metrics(self):
+        """Test the per-endpoint request metrics and cache hit ratios."""
+        self.client.get_crypto_balance('BTC')
+        self.client.get_crypto_balance('BTC')
+        with self.assertRaises(Exception):
+            self.client.get_product('DOGE-USDC')
+
+        lines = self.metric_lines()
+        self.assertIn('test_rest_requests_total{endpoint="GET accounts",status="200"} 1.0', lines)
+        self.assertIn('test_rest_requests_total{endpoint="GET products/{id}",status="404"} 1.0',
+                      lines)
+        self.assertIn('test_cache_hit_ratio{cache="accounts"} 0.5', lines)
+        self.assertIn('test_operation_requests_total{operation="get_crypto_balance"} 3.0', lines)
+
+    def test_signal_and_rate_limiter_metrics(self):
+        """Test the signal gauge and rate limiter wait histogram."""
+        provider = self.client._fear_and_greed_strategy.fgi_provider
+        provider.get_reading = lambda: FearAndGreedReading(20, 'Extreme Fear', 0, 3600)
+        self.client.trade_based_on_fgi('BTC-USDC', '10')
+        self.metrics.on_signal('alphasquared_risk', 42.5, 'BTC')
+        self.metrics.on_rate_limit_wait('private', 0.25)
+
+        lines = self.metric_lines()
+        self.assertIn('test_signal{name="fear_and_greed_index",asset=""} 20.0', lines)
+        self.assertIn('test_signal{name="alphasquared_risk",asset="BTC"} 42.5', lines)
+        self.assertIn('test_rate_limiter_wait_seconds_sum{limiter="private"} 0.25', lines)
+
+    def test_label_values_are_escaped(self):
+        """Test that quotes and backslashes in label values are escaped."""
+        self.metrics.on_signal('custom', 1, 'a"b\\c')
+
+        self.assertIn('test_signal{name="custom",asset="a\\"b\\\\c"} 1.0', self.metric_lines())
+
+    def test_metrics_server(self):
+        """Test that the server serves /metrics and nothing else."""
+        self.client.fiat_market_buy('BTC-USDC', '10')
+
+        with MetricsServer(self.metrics, port=0) as server:
+            with urllib.request.urlopen(server.url) as response:
+                body = response.read().decode('utf-8')
+                content_type = response.headers['Content-Type']
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                urllib.request.urlopen(server.url.replace('/metrics', '/other'))
+
+        self.assertIn('# TYPE test_orders_total counter', body)
+        self.assertTrue(content_type.startswith('text/plain; version=0.0.4'))
+        self.assertEqual(context.exception.code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import Order, OrderSide, OrderType
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.repricing import RepricingPolicy
+from coinbase_advanced_trader.resilience import RateLimiter
+
+
+class TestRepricer(unittest.TestCase):
+    """Test cases for the Repricer class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '10000', 'BTC': '1'},
+                                          maker_fee_rate='0.004', taker_fee_rate='0.006')
+        # Best bid 49975.00, best ask 50025.00.
+        self.exchange.add_product('BTC-USDC', '50000', spread='0.001', level_size='1')
+        self.client = PaperTradingClient(self.exchange)
+
+    def limit_order(self, price, side=OrderSide.BUY):
+        return Order(id='o', product_id='BTC-USDC', side=side, type=OrderType.LIMIT,
+                     size=Decimal('0.001'), price=Decimal(price))
+
+    def test_target_price(self):
+        """Test tick offsets, the chase limit and the minimum move."""
+        repricer = self.client.repricer(RepricingPolicy(tick_offset=2, max_chase=Decimal('0.01')))
+        bid, ask = Decimal('49975.00'), Decimal('50025.00')
+
+        buy = self.limit_order('49500.00')
+        self.assertEqual(repricer.target_price(buy, buy.price, bid, ask), Decimal('49974.98'))
+        # 1% above the 49000 anchor.
+        anchored = self.limit_order('49000.00')
+        self.assertEqual(repricer.target_price(anchored, anchored.price, bid, ask),
+                         Decimal('49490.00'))
+        sell = self.limit_order('50500.00', OrderSide.SELL)
+        self.assertEqual(repricer.target_price(sell, sell.price, bid, ask), Decimal('50025.02'))
+        # Already at the target, or ahead of the market: stay.
+        self.assertIsNone(repricer.target_price(self.limit_order('49974.98'), buy.price,
+                                                bid, ask))
+        self.assertIsNone(repricer.target_price(self.limit_order('49980.00'), buy.price,
+                                                bid, ask))
+
+    def test_fee_capped_chase(self):
+        """Test that fee capped orders stop where crossing would have cost less."""
+        repricer = self.client.repricer(RepricingPolicy(fee_capped_chase=True))
+        bid, ask = Decimal('49975.00'), Decimal('50025.00')
+
+        # 49000 * 1.006 / 1.004 = 49097.60..., below the 1% chase limit.
+        buy = self.limit_order('49000.00')
+        self.assertEqual(repricer.target_price(buy, buy.price, bid, ask), Decimal('49097.60'))
+        # 51000 * 0.994 / 0.996 = 50897.59...
+        sell = self.limit_order('51000.00', OrderSide.SELL)
+        self.assertEqual(repricer.target_price(sell, sell.price, bid, ask), Decimal('50897.60'))
+
+    def test_target_never_crosses_the_spread(self):
+        """Test that a negative offset stops one tick short of the other side."""
+        repricer = self.client.repricer(RepricingPolicy(tick_offset=-10))
+
+        target = repricer.target_price(self.limit_order('49900.00'), Decimal('49900.00'),
+                                       Decimal('50000.00'), Decimal('50000.05'))
+
+        self.assertEqual(target, Decimal('50000.04'))
+
+    def test_reprice_edits_order_and_fills_as_maker(self):
+        """Test that a stale buy is edited up behind the best bid, then fills as a maker."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        book = self.client.open_order_book(['BTC-USDC'])
+        repricer = self.client.repricer(RepricingPolicy(tick_offset=1))
+        repricer.chase(order)
+
+        requotes = repricer.reprice()
+
+        self.assertEqual([(r.order, r.old_price, r.new_price) for r in requotes],
+                         [(order, Decimal('49500.00'), Decimal('49974.99'))])
+        self.assertEqual(order.price, Decimal('49974.99'))
+        self.assertEqual(self.client.get_order(order.id)['order']['order_configuration']
+                         ['limit_limit_gtc']['limit_price'], '49974.99')
+        self.assertEqual(book.best('BTC-USDC', OrderSide.BUY), Decimal('49974.99'))
+        self.assertEqual(repricer.reprice(), [])
+        self.assertEqual(repricer.edits, 1)
+
+        self.exchange.set_price('BTC-USDC', '49900')
+        fills = self.client.get_fills(order_ids=[order.id])['fills']
+        self.assertEqual(fills[0]['liquidity_indicator'], 'MAKER')
+
+    def test_cancel_and_replace_when_edit_fails(self):
+        """Test that an order that cannot be edited is cancelled and placed again."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        self.client.edit_order = lambda order_id, size, price: {
+            'success': False,
+            'errors': [{'edit_failure_reason': 'UNKNOWN_EDIT_ORDER_FAILURE_REASON'}]
+        }
+        repricer = self.client.repricer()
+        repricer.chase(order)
+
+        [requote] = repricer.reprice()
+
+        self.assertIs(requote.replaced, order)
+        self.assertEqual(order.status, 'cancelled')
+        self.assertEqual(self.client.get_order(order.id)['order']['status'], 'CANCELLED')
+        self.assertEqual(requote.order.size, order.size)
+        self.assertEqual(requote.order.price, Decimal('49975.00'))
+        self.assertEqual(repricer.orders, [requote.order])
+        self.assertEqual((repricer.edits, repricer.replacements), (0, 1))
+
+    def test_requote_budget_defers_requotes(self):
+        """Test that requotes beyond the budget wait for a later pass."""
+        orders = [self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier=multiplier)
+                  for multiplier in ('0.97', '0.98', '0.99')]
+        clock = [0.0]
+        repricer = self.client.repricer(RepricingPolicy(max_chase=Decimal('0.05')))
+        repricer.rate_limiter = RateLimiter(rate=1, burst=2, clock=lambda: clock[0])
+        for order in orders:
+            repricer.chase(order)
+
+        self.assertEqual(len(repricer.reprice()), 2)
+        self.assertEqual(repricer.deferred, 1)
+        clock[0] += 1
+        self.assertEqual(len(repricer.reprice()), 1)
+        self.assertEqual({order.price for order in orders}, {Decimal('49975.00')})
+
+    def test_uneditable_order_replaced_with_two_tokens(self):
+        """Test that an order known not to be editable spends no token on an edit."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        self.client.edit_order = lambda order_id, size, price: {'success': False, 'errors': []}
+        clock = [0.0]
+        repricer = self.client.repricer(RepricingPolicy(max_chase=Decimal('0.05')))
+        repricer.rate_limiter = RateLimiter(rate=1, burst=2, clock=lambda: clock[0])
+        repricer.chase(order)
+
+        # The failed edit takes one token, leaving too few for the replacement.
+        self.assertEqual(repricer.reprice(), [])
+        self.assertEqual(repricer.deferred, 1)
+        clock[0] += 2
+        [requote] = repricer.reprice()
+
+        self.assertIs(requote.replaced, order)
+        self.assertEqual(repricer.deferred, 1)
+
+    def test_finished_orders_leave_the_chase(self):
+        """Test that filled and closed orders are no longer repriced."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        closed = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.98')
+        repricer = self.client.repricer()
+        repricer.chase(order)
+        repricer.chase(closed)
+        order.status = 'filled'
+        self.client.cancel_orders([closed.id])
+
+        self.assertEqual(repricer.reprice(), [])
+        self.assertEqual(repricer.orders, [])
+        with self.assertRaises(ValueError):
+            repricer.chase(Order(id='m', product_id='BTC-USDC', side=OrderSide.BUY,
+                                 type=OrderType.MARKET, size=Decimal('10')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+import unittest
+
+import requests
+
+from coinbase_advanced_trader.instrumentation import InMemoryInstrumentation
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiter,
+    Resilience,
+    ThrottledError,
+    endpoint_group,
+    request_kind
+)
+
+
+class FakeClock:
+    """Clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestResilience(unittest.TestCase):
+    """Test cases for retries, throttling and circuit breaking."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': '1'})
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.clock = FakeClock()
+        self.resilience = Resilience(failure_threshold=3, recovery_time=30,
+                                     clock=self.clock, sleep=self.clock.sleep, seed=1)
+        self.client = PaperTradingClient(self.exchange, resilience=self.resilience)
+        self.session = self.client.session
+
+    def test_request_classification(self):
+        """Test endpoint groups and request kinds."""
+        self.assertEqual(endpoint_group('/api/v3/brokerage/products/BTC-USDC'), 'products')
+        self.assertEqual(endpoint_group('/v2/accounts/abc/deposits'), 'v2')
+        self.assertEqual(request_kind('GET', '/api/v3/brokerage/orders/historical/1'), 'read')
+        self.assertEqual(request_kind('POST', '/api/v3/brokerage/orders'), 'order_write')
+        self.assertEqual(request_kind('POST', '/api/v3/brokerage/orders/batch_cancel'),
+                         'order_write')
+        self.assertEqual(request_kind('POST', '/v2/accounts/abc/deposits'), 'write')
+
+    def test_order_write_retries_server_errors(self):
+        """Test that order placement is retried after 5xx and connection errors."""
+        self.session.inject_failure(503, endpoint='POST orders')
+        self.session.inject_failure(None, endpoint='POST orders')
+
+        order = self.client.fiat_limit_buy('BTC-USDC', '10')
+
+        self.assertIsNotNone(order)
+        self.assertEqual(self.session.calls['POST orders'], 3)
+        self.assertEqual(len(self.client.list_orders().orders), 1)
+        self.assertEqual(len(self.clock.sleeps), 2)
+
+    def test_reads_fail_fast(self):
+        """Test that reads give up after one retry."""
+        self.session.inject_failure(500, times=5, endpoint='GET products/{id}')
+
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_product('BTC-USDC')
+
+        self.assertEqual(self.session.calls['GET products/{id}'], 2)
+
+    def test_client_errors_are_not_retried(self):
+        """Test that 4xx responses other than 429 are raised at once."""
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_product('DOGE-USDC')
+
+        self.assertEqual(self.session.request_count, 1)
+        self.assertEqual(self.resilience.breaker('products').state, CircuitBreaker.CLOSED)
+
+    def test_retry_after_is_honoured(self):
+        """Test that a 429 pauses the group for the Retry-After time."""
+        instrumentation = InMemoryInstrumentation()
+        self.client.instrumentation = instrumentation
+        self.session.inject_failure(429, endpoint='GET products/{id}', retry_after=0.5)
+
+        self.client.get_product('BTC-USDC')
+
+        self.assertEqual(self.clock.sleeps, [0.5])
+        stats, = instrumentation.snapshot()['requests']
+        self.assertEqual((stats['count'], stats['retries']), (2, 1))
+
+    def test_long_throttle_fails_fast(self):
+        """Test that a Retry-After beyond the policy's limit is not waited out."""
+        self.session.inject_failure(429, endpoint='GET products/{id}', retry_after=60)
+
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_product('BTC-USDC')
+        with self.assertRaises(ThrottledError) as context:
+            self.client.get_product('BTC-USDC')
+
+        self.assertEqual(context.exception.group, 'products')
+        self.assertEqual(self.session.request_count, 1)
+        self.client.get_crypto_balance('BTC')
+
+    def test_deposits_are_not_retried_after_server_errors(self):
+        """Test that non-idempotent writes are not retried on ambiguous failures."""
+        send_calls = []
+
+        def send():
+            send_calls.append(1)
+            raise requests.ConnectionError('reset')
+
+        with self.assertRaises(requests.ConnectionError):
+            self.resilience.call('POST', '/v2/accounts/abc/deposits', send)
+
+        self.assertEqual(len(send_calls), 1)
+
+    def test_circuit_opens_and_probes(self):
+        """Test that repeated failures open the breaker until a probe succeeds."""
+        self.session.inject_failure(503, times=4, endpoint='GET products/{id}')
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_product('BTC-USDC')
+        with self.assertRaises(CircuitOpenError):
+            self.client.get_product('BTC-USDC')
+        self.assertEqual(self.resilience.breaker('products').state, CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpenError) as context:
+            self.client.get_product('BTC-USDC')
+        self.assertEqual(context.exception.group, 'products')
+        self.assertEqual(self.session.calls['GET products/{id}'], 3)
+        self.client.get_crypto_balance('BTC')
+
+        self.clock.now += 30
+        self.assertEqual(self.resilience.breaker('products').state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.client.get_product('BTC-USDC')
+        self.assertEqual(self.session.calls['GET products/{id}'], 4)
+
+        self.clock.now += 30
+        self.assertEqual(self.client.get_product('BTC-USDC').product_id, 'BTC-USDC')
+        self.assertEqual(self.resilience.status()['products'], (CircuitBreaker.CLOSED, 0.0))
+
+    def test_half_open_limits_probes(self):
+        """Test that only one request probes a half-open breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=1, clock=self.clock)
+        breaker.record_failure()
+        self.clock.now += 1
+
+        self.assertIsNone(breaker.acquire())
+        self.assertEqual(breaker.acquire(), 1)
+        breaker.record_success()
+        self.assertIsNone(breaker.acquire())
+
+    def test_probe_outcomes_without_a_response(self):
+        """Test that broken responses fail a probe and client-side errors only release it."""
+        breaker = self.resilience.breaker('products')
+        for _ in range(3):
+            breaker.record_failure()
+        self.clock.now += 30
+
+        def interrupted():
+            raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self.resilience.call('GET', '/api/v3/brokerage/products', interrupted)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertIsNone(breaker.acquire())
+        breaker.release()
+
+        def truncated():
+            raise requests.exceptions.ChunkedEncodingError('connection broken')
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            self.resilience.call('GET', '/api/v3/brokerage/products', truncated)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_rate_limiter_paces_requests(self):
+        """Test that requests beyond the burst are spaced to the rate."""
+        limiter = RateLimiter(rate=2, burst=2, clock=self.clock, sleep=self.clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 0.5])
+        self.clock.now += 5
+        self.assertEqual(limiter.acquire(), 0.0)
+
+    def test_rate_limiter_try_acquire_never_waits(self):
+        """Test that try_acquire takes tokens only when the bucket holds them."""
+        limiter = RateLimiter(rate=2, burst=3, clock=self.clock, sleep=self.clock.sleep)
+
+        self.assertEqual([limiter.try_acquire(2), limiter.try_acquire(2), limiter.try_acquire()],
+                         [True, False, True])
+        self.assertFalse(limiter.try_acquire())
+        self.clock.now += 1
+        self.assertTrue(limiter.try_acquire(2))
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_resilience_can_be_disabled(self):
+        """Test that resilience=False sends each request once."""
+        client = PaperTradingClient(self.exchange, resilience=False)
+        client.session.inject_failure(503)
+
+        with self.assertRaises(requests.HTTPError):
+            client.get_product('BTC-USDC')
+        self.assertIsNone(client.resilience)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import Order, OrderSide, OrderType
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.routing import RoutedOrder
+
+
+class TestQuoteRouter(unittest.TestCase):
+    """Test cases for the QuoteRouter class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USD': '10000', 'USDC': '10000', 'BTC': '1'},
+                                          maker_fee_rate='0.004', taker_fee_rate='0.006')
+        # BTC-USDC trades a little below BTC-USD.
+        self.exchange.add_product('BTC-USD', '50000', spread='0.001', level_size='1')
+        self.exchange.add_product('BTC-USDC', '49950', spread='0.001', level_size='1')
+        self.client = PaperTradingClient(self.exchange)
+        self.router = self.client.quote_router()
+
+    def test_buy_routes_to_cheapest_ask(self):
+        """Test that buys go to the book with the lowest ask after fees."""
+        decision = self.router.route('BTC', '100', OrderSide.BUY)
+
+        self.assertEqual(decision.product_id, 'BTC-USDC')
+        self.assertEqual([quote.product_id for quote in decision.candidates],
+                         ['BTC-USDC', 'BTC-USD'])
+        self.assertEqual(decision.best.fee_rate, Decimal('0.006'))
+        self.assertEqual(decision.best.effective_price, decision.best.price * Decimal('1.006'))
+        self.assertGreater(decision.savings, 0)
+
+    def test_sell_routes_to_highest_bid(self):
+        """Test that sells go to the book with the highest bid."""
+        decision = self.router.route('BTC', '100', OrderSide.SELL)
+
+        self.assertEqual(decision.product_id, 'BTC-USD')
+        self.assertEqual(decision.best.price, Decimal('49975.00'))
+
+    def test_fees_decide_between_books(self):
+        """Test that a cheaper book loses when its fees outweigh the price gap."""
+        router = self.client.quote_router(fee_rates=lambda product_id: (
+            (Decimal('0'), Decimal('0.01')) if product_id == 'BTC-USDC'
+            else (Decimal('0'), Decimal('0'))))
+
+        self.assertEqual(router.route('BTC', '100', OrderSide.BUY).product_id, 'BTC-USD')
+        self.assertEqual(router.route('BTC', '100', OrderSide.BUY, OrderType.LIMIT).product_id,
+                         'BTC-USDC')
+
+    def test_buy_skips_quote_currency_without_balance(self):
+        """Test that buys only use quote currencies that can pay for them."""
+        exchange = SimulatedExchange(balances={'USD': '10000', 'USDC': '50'})
+        exchange.add_product('BTC-USD', '50000')
+        exchange.add_product('BTC-USDC', '49950')
+        router = PaperTradingClient(exchange).quote_router()
+
+        decision = router.route('BTC', '100', OrderSide.BUY)
+
+        self.assertEqual(decision.product_id, 'BTC-USD')
+        self.assertEqual(decision.skipped, {'BTC-USDC': 'insufficient USDC balance'})
+        with self.assertRaises(ValueError):
+            router.route('BTC', '20000', OrderSide.BUY)
+
+    def test_thin_books_rank_last(self):
+        """Test that a book whose top level cannot take the order ranks last."""
+        self.exchange.add_product('BTC-USDC', '49950', spread='0.001', level_size='0.001')
+
+        self.assertEqual(self.router.route('BTC', '10', OrderSide.BUY).product_id, 'BTC-USDC')
+        decision = self.router.route('BTC', '1000', OrderSide.BUY)
+        self.assertEqual(decision.product_id, 'BTC-USD')
+        self.assertFalse(decision.candidates[-1].covers_order)
+
+    def test_missing_product_is_skipped(self):
+        """Test that quote currencies without a book are skipped."""
+        router = self.client.quote_router(quote_currencies=('USD', 'EUR'))
+
+        decision = router.route('BTC', '100', OrderSide.SELL)
+
+        self.assertEqual(decision.product_id, 'BTC-USD')
+        self.assertEqual(decision.skipped, {'BTC-EUR': 'no quote'})
+
+    def test_one_quote_request(self):
+        """Test that every book is quoted in a single best bid/ask request."""
+        calls = []
+        get_best_bid_ask = self.client.get_best_bid_ask
+        self.client.get_best_bid_ask = lambda **kwargs: calls.append(kwargs) or \
+            get_best_bid_ask(**kwargs)
+
+        self.router.route('BTC', '100', OrderSide.BUY)
+
+        self.assertEqual(calls, [{'product_ids': ['BTC-USD', 'BTC-USDC']}])
+
+    def test_buy_and_sell_place_orders_on_chosen_product(self):
+        """Test that routed orders come back with their routing decision."""
+        bought = self.router.buy('BTC', '100')
+        sold = self.router.sell('BTC', '100', OrderType.LIMIT, price_multiplier='1.01')
+
+        self.assertIsInstance(bought, RoutedOrder)
+        self.assertIsInstance(bought.order, Order)
+        self.assertEqual(bought.order.product_id, 'BTC-USDC')
+        self.assertEqual(bought.decision.product_id, 'BTC-USDC')
+        self.assertTrue(bought.order.is_market)
+        self.assertEqual(sold.order.product_id, 'BTC-USD')
+        self.assertTrue(sold.order.is_limit)
+        self.assertEqual(sold.decision.best.fee_rate, Decimal('0.004'))
+
+
+if __name__ == '__main__':
+    unittest.main()
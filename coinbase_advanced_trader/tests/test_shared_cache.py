@@ -0,0 +1,145 @@
+import os
+import unittest
+from decimal import Decimal
+from unittest.mock import Mock
+
+from coinbase.rest import RESTClient
+
+from coinbase_advanced_trader.models import OrderSide
+from coinbase_advanced_trader.services.order_service import OrderService
+from coinbase_advanced_trader.services.price_service import PriceService
+from coinbase_advanced_trader.shared_cache import (
+    SharedMarketDataCache,
+    SharedMarketDataFeeder
+)
+
+
+class TestSharedMarketDataCache(unittest.TestCase):
+    """Test cases for the SharedMarketDataCache class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.name = f"cbat_test_{os.getpid()}_{id(self)}"
+        self.cache = SharedMarketDataCache(self.name, slots=4, create=True)
+
+    def tearDown(self):
+        """Release the shared memory block after each test method."""
+        self.cache.close()
+
+    def test_publish_and_read_from_attached_reader(self):
+        """Test that a reader attached by name sees the feeder's snapshot."""
+        self.cache.publish('BTC-USDC', Decimal('61536.12'),
+                           Decimal('0.00000001'), Decimal('0.01'))
+
+        reader = SharedMarketDataCache(self.name)
+        try:
+            snapshot = reader.get('BTC-USDC')
+        finally:
+            reader.close()
+
+        self.assertEqual(snapshot.product_id, 'BTC-USDC')
+        self.assertEqual(snapshot.price, Decimal('61536.12'))
+        self.assertEqual(snapshot.base_increment, Decimal('0.00000001'))
+        self.assertEqual(snapshot.quote_increment, Decimal('0.01'))
+
+    def test_publish_overwrites_existing_slot(self):
+        """Test that republishing a product updates its slot in place."""
+        self.cache.publish('ETH-USDC', Decimal('3000'), Decimal('0.0001'), Decimal('0.01'))
+        self.cache.publish('ETH-USDC', Decimal('3100'), Decimal('0.0001'), Decimal('0.01'))
+
+        self.assertEqual(self.cache.get('ETH-USDC').price, Decimal('3100'))
+
+    def test_get_missing_product(self):
+        """Test that an unknown product returns None."""
+        self.assertIsNone(self.cache.get('DOGE-USDC'))
+
+    def test_cache_full(self):
+        """Test that publishing more products than slots raises ValueError."""
+        for i in range(4):
+            self.cache.publish(f"P{i}-USD", Decimal('1'), Decimal('1'), Decimal('1'))
+
+        with self.assertRaises(ValueError):
+            self.cache.publish('P4-USD', Decimal('1'), Decimal('1'), Decimal('1'))
+
+    def test_feeder_refresh(self):
+        """Test that the feeder publishes every product from one bulk request."""
+        rest_client_mock = Mock(spec=RESTClient)
+        rest_client_mock.get_products.return_value = {
+            'products': [
+                {'product_id': 'BTC-USDC', 'price': '50000',
+                 'base_increment': '0.00000001', 'quote_increment': '0.01'},
+                {'product_id': 'ETH-USDC', 'price': '3000',
+                 'base_increment': '0.0001', 'quote_increment': '0.01',
+                 'base_min_size': '0.001'}
+            ]
+        }
+        feeder = SharedMarketDataFeeder(rest_client_mock, self.cache, ['BTC-USDC', 'ETH-USDC'])
+
+        self.assertEqual(feeder.refresh(), 2)
+        rest_client_mock.get_products.assert_called_once_with(
+            product_ids=['BTC-USDC', 'ETH-USDC']
+        )
+        self.assertEqual(self.cache.get('ETH-USDC').price, Decimal('3000'))
+        self.assertEqual(self.cache.get('ETH-USDC').base_min_size, Decimal('0.001'))
+        self.assertIsNone(self.cache.get('BTC-USDC').base_min_size)
+
+    def test_price_service_reads_shared_cache(self):
+        """Test that PriceService serves fresh snapshots without calling the API."""
+        self.cache.publish('BTC-USDC', Decimal('50000.123'),
+                           Decimal('0.00000001'), Decimal('0.01'), Decimal('0.00001'))
+        rest_client_mock = Mock(spec=RESTClient)
+        price_service = PriceService(rest_client_mock, shared_cache=self.cache)
+
+        self.assertEqual(price_service.get_spot_price('BTC-USDC'), Decimal('50000.12'))
+        self.assertEqual(price_service.get_product_details('BTC-USDC'), {
+            'base_increment': Decimal('0.00000001'),
+            'quote_increment': Decimal('0.01'),
+            'base_min_size': Decimal('0.00001')
+        })
+        rest_client_mock.get_product.assert_not_called()
+
+    def test_snapshot_without_minimum_uses_product_details(self):
+        """Test that the minimum size is fetched when the snapshot does not carry it."""
+        self.cache.publish('BTC-USDC', Decimal('50000'), Decimal('0.00000001'), Decimal('0.01'))
+        rest_client_mock = Mock(spec=RESTClient)
+        rest_client_mock.get_product.return_value = {
+            'price': '50000', 'base_increment': '0.00000001', 'quote_increment': '0.01',
+            'base_min_size': '0.00001'
+        }
+        price_service = PriceService(rest_client_mock, shared_cache=self.cache)
+
+        self.assertEqual(price_service.get_sizing_kernel('BTC-USDC').base_min_size,
+                         Decimal('0.00001'))
+        rest_client_mock.get_product.assert_called_once_with('BTC-USDC')
+
+    def test_orders_below_minimum_are_skipped_with_shared_cache(self):
+        """Test that limit orders sized from the shared cache respect the minimum size."""
+        self.cache.publish('BTC-USDC', Decimal('50000'),
+                           Decimal('0.00000001'), Decimal('0.01'), Decimal('0.001'))
+        rest_client_mock = Mock(spec=RESTClient)
+        order_service = OrderService(rest_client_mock,
+                                     PriceService(rest_client_mock, shared_cache=self.cache))
+
+        results = order_service.place_limit_orders({'BTC-USDC': '10'}, OrderSide.BUY)
+
+        self.assertEqual(results, {'BTC-USDC': None})
+        rest_client_mock.limit_order_gtc_buy.assert_not_called()
+        rest_client_mock.get_product.assert_not_called()
+
+    def test_price_service_falls_back_on_stale_price(self):
+        """Test that PriceService calls the API when the snapshot is too old."""
+        self.cache.publish('BTC-USDC', Decimal('50000'),
+                           Decimal('0.00000001'), Decimal('0.01'))
+        rest_client_mock = Mock(spec=RESTClient)
+        rest_client_mock.get_product.return_value = {
+            'price': '51000', 'quote_increment': '0.01'
+        }
+        price_service = PriceService(rest_client_mock, shared_cache=self.cache,
+                                     max_price_age=-1)
+
+        self.assertEqual(price_service.get_spot_price('BTC-USDC'), Decimal('51000.00'))
+        rest_client_mock.get_product.assert_called_once_with('BTC-USDC')
+
+
+if __name__ == '__main__':
+    unittest.main()
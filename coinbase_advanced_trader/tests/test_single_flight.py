@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from coinbase_advanced_trader.instrumentation import PrometheusInstrumentation
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for the SingleFlight coalescing group."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.group = SingleFlight()
+        self.error = None
+        self.executions = 0
+
+    def slow_call(self, followers):
+        """Return a call that blocks until `followers` callers have joined it."""
+        def call():
+            self.executions += 1
+            deadline = time.monotonic() + 5
+            while self.group.stats()['read']['shared'] < followers:
+                if time.monotonic() > deadline:
+                    raise AssertionError('followers never joined')
+                time.sleep(0.001)
+            if self.error is not None:
+                raise self.error
+            return {'price': '50000'}
+        return call
+
+    def test_threads_share_one_call(self):
+        """Test that concurrent callers of one key share a single execution."""
+        call = self.slow_call(followers=4)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(self.group.do, 'key', call, 'read') for _ in range(5)]
+            results = [future.result() for future in futures]
+
+        self.assertEqual(self.executions, 1)
+        self.assertEqual(sorted(joined for _, joined in results), [False] + [True] * 4)
+        self.assertEqual([result for result, _ in results], [{'price': '50000'}] * 5)
+        self.assertEqual(len({id(result) for result, _ in results}), 5)
+        self.assertEqual(self.group.stats(), {'read': {'calls': 5, 'executed': 1, 'shared': 4}})
+
+    def test_errors_are_shared(self):
+        """Test that every caller sharing a failed call gets its exception."""
+        self.error = ValueError('boom')
+        call = self.slow_call(followers=2)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self.group.do, 'key', call, 'read') for _ in range(3)]
+            for future in futures:
+                with self.assertRaises(ValueError):
+                    future.result()
+        self.assertEqual(self.executions, 1)
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test that a finished call is not reused and unshared results are not copied."""
+        result = {'price': '1'}
+        first, joined = self.group.do('key', lambda: result, 'read')
+        second, _ = self.group.do('key', lambda: {'price': '2'}, 'read')
+
+        self.assertIs(first, result)
+        self.assertFalse(joined)
+        self.assertEqual(second, {'price': '2'})
+        self.group.reset_stats()
+        self.assertEqual(self.group.stats(), {})
+
+    def test_asyncio_tasks_share_one_call(self):
+        """Test coalescing of coroutines on one event loop."""
+        async def fetch():
+            self.executions += 1
+            await asyncio.sleep(0.01)
+            return {'price': '50000'}
+
+        async def main():
+            return await asyncio.gather(*(self.group.do_async('key', fetch, 'read')
+                                          for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        self.assertEqual(self.executions, 1)
+        self.assertEqual([joined for _, joined in results], [False] + [True] * 4)
+        self.assertEqual(len({id(result) for result, _ in results}), 5)
+        self.assertEqual(self.group.stats()['read']['shared'], 4)
+
+
+class TestClientCoalescing(unittest.TestCase):
+    """Test cases for coalesced reads in EnhancedRESTClient."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': '1'})
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.metrics = PrometheusInstrumentation(namespace='test')
+
+    def burst(self, client, call, threads=8):
+        barrier = threading.Barrier(threads)
+
+        def worker():
+            barrier.wait()
+            return call()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return [future.result() for future in
+                    [executor.submit(worker) for _ in range(threads)]]
+
+    def test_concurrent_product_reads_are_coalesced(self):
+        """Test that a burst of identical reads sends fewer requests."""
+        client = PaperTradingClient(self.exchange, latency=0.2, instrumentation=self.metrics)
+
+        products = self.burst(client, lambda: client.get_product('BTC-USDC'))
+
+        self.assertTrue(all(product.product_id == 'BTC-USDC' for product in products))
+        stats = client.single_flight.stats()['GET products/{id}']
+        self.assertEqual(stats['calls'], 8)
+        self.assertGreater(stats['shared'], 0)
+        self.assertEqual(client.session.calls['GET products/{id}'], stats['executed'])
+        self.assertIn(f'test_rest_requests_coalesced_total{{endpoint="GET products/{{id}}"}} '
+                      f'{float(stats["shared"])}', self.metrics.render().splitlines())
+
+    def test_order_requests_are_not_coalesced(self):
+        """Test that writes and order reads always reach the API."""
+        client = PaperTradingClient(self.exchange, latency=0.05)
+
+        self.burst(client, lambda: client.list_orders(), threads=4)
+
+        self.assertEqual(client.session.calls['GET orders/historical/batch'], 4)
+        self.assertEqual(client.single_flight.stats(), {})
+
+    def test_shared_group_keeps_accounts_apart(self):
+        """Test that clients sharing a SingleFlight never join each other's account reads."""
+        group = SingleFlight()
+        poor = SimulatedExchange(balances={'USDC': '5'})
+        clients = [PaperTradingClient(exchange, latency=0.2, coalesce_reads=group)
+                   for exchange in (self.exchange, poor)]
+        barrier = threading.Barrier(len(clients))
+
+        def balances(client):
+            barrier.wait()
+            return client.get_available_balances()['USDC']
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            usdc = list(executor.map(balances, clients))
+
+        self.assertEqual(usdc, [1000, 5])
+        self.assertEqual(group.stats()['GET accounts']['shared'], 0)
+
+    def test_coalescing_can_be_disabled(self):
+        """Test that coalesce_reads=False sends every read."""
+        client = PaperTradingClient(self.exchange, latency=0.05, coalesce_reads=False)
+
+        self.burst(client, lambda: client.get_product('BTC-USDC'), threads=4)
+
+        self.assertEqual(client.session.calls['GET products/{id}'], 4)
+        self.assertIsNone(client.single_flight)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+import random
+import unittest
+from decimal import Decimal
+
+from coinbase_advanced_trader.models import OrderSide
+from coinbase_advanced_trader.sizing import VECTORIZED, SizingKernel, size_basket
+
+
+class TestSizingKernel(unittest.TestCase):
+    """Test cases for the SizingKernel class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.kernel = SizingKernel('BTC-USDC', '0.00000001', '0.01')
+
+    def test_base_size_rounds_down(self):
+        """Test that sizes are rounded down, never over the fiat amount."""
+        kernel = SizingKernel('ETH-USDC', '0.01', '0.01')
+
+        size = kernel.base_size(Decimal('2'), Decimal('3'))
+
+        self.assertEqual(size, Decimal('0.66'))
+        self.assertEqual(str(size), '0.66')
+
+    def test_limit_price_rounds_toward_passive_side(self):
+        """Test that buy prices round down and sell prices round up."""
+        price = Decimal('61536.12') * Decimal('0.9995')
+
+        self.assertEqual(self.kernel.quantize_price(price, OrderSide.BUY), Decimal('61505.35'))
+        self.assertEqual(self.kernel.quantize_price(price, OrderSide.SELL), Decimal('61505.36'))
+
+    def test_limit_order(self):
+        """Test pricing and sizing of a single limit order."""
+        price, size = self.kernel.limit_order(Decimal('10'), Decimal('50000') * Decimal('0.9995'),
+                                              OrderSide.BUY)
+
+        self.assertEqual(str(price), '49975.00')
+        self.assertEqual(str(size), '0.00020010')
+
+    def test_non_decimal_increments(self):
+        """Test increments that are not powers of ten."""
+        kernel = SizingKernel('XYZ-USD', '0.5', '0.05')
+
+        self.assertEqual(kernel.quantize_price(Decimal('1.234'), OrderSide.BUY), Decimal('1.20'))
+        self.assertEqual(kernel.quantize_price(Decimal('1.234'), OrderSide.SELL), Decimal('1.25'))
+        self.assertEqual(kernel.base_size(Decimal('10'), Decimal('1.3')), Decimal('7.5'))
+
+    def test_orders_never_exceed_fiat_amount(self):
+        """Test that size * price stays within the fiat amount for random orders."""
+        rng = random.Random(7)
+        for side in OrderSide:
+            for _ in range(500):
+                fiat_amount = Decimal(rng.randint(100, 10**6)) / 100
+                reference = Decimal(rng.randint(10**4, 10**9)) / 10**4
+                price, size = self.kernel.limit_order(fiat_amount, reference, side)
+                self.assertLessEqual(price * size, fiat_amount)
+                self.assertGreater((size + self.kernel.base_increment) * price, fiat_amount)
+
+    def test_limit_orders_match_single_orders(self):
+        """Test that the batch path gives the same results as sizing one by one."""
+        rng = random.Random(11)
+        fiat_amounts = [str(Decimal(rng.randint(100, 10**6)) / 100) for _ in range(300)]
+        prices = [Decimal(rng.randint(10**4, 10**9)) / 10**4 for _ in range(300)]
+        # Repeat orders, so the batch reuses earlier results.
+        fiat_amounts = [amount for amount in fiat_amounts for _ in range(2)] + fiat_amounts[:5] * 3
+        prices = [price for price in prices for _ in range(2)] + [prices[0]] * 15
+
+        for side in OrderSide:
+            expected = [self.kernel.limit_order(Decimal(amount), price, side)
+                        for amount, price in zip(fiat_amounts, prices)]
+            self.assertEqual(self.kernel.limit_orders(fiat_amounts, prices, side), expected)
+
+    def test_limit_orders_rejects_mismatched_lengths(self):
+        """Test that each order needs both an amount and a price."""
+        with self.assertRaises(ValueError):
+            self.kernel.limit_orders(['10', '20'], ['50000'], OrderSide.BUY)
+
+    def test_rejects_non_positive_price(self):
+        """Test that a zero price raises instead of dividing by zero."""
+        with self.assertRaises(ValueError):
+            self.kernel.base_size(Decimal('10'), Decimal('0'))
+        with self.assertRaises(ValueError):
+            self.kernel.limit_orders(['10'], ['0.001'], OrderSide.BUY)
+
+    def test_from_details(self):
+        """Test building a kernel from product details."""
+        kernel = SizingKernel.from_details('BTC-USDC', {
+            'base_increment': Decimal('0.00000001'),
+            'quote_increment': Decimal('0.01')
+        })
+
+        self.assertEqual(kernel.base_increment, Decimal('0.00000001'))
+        self.assertEqual(kernel.product_id, 'BTC-USDC')
+        self.assertEqual(kernel.base_min_size, Decimal('0'))
+
+    def test_meets_min_size(self):
+        """Test the minimum size check."""
+        kernel = SizingKernel('BTC-USDC', '0.00000001', '0.01', base_min_size='0.00001')
+
+        self.assertTrue(kernel.meets_min_size(Decimal('0.00001')))
+        self.assertFalse(kernel.meets_min_size(Decimal('0.00000999')))
+        self.assertFalse(self.kernel.meets_min_size(Decimal('0')))
+
+
+@unittest.skipUnless(VECTORIZED, "numpy is required for basket sizing")
+class TestSizeBasket(unittest.TestCase):
+    """Test cases for size_basket."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.btc = SizingKernel('BTC-USDC', '0.00000001', '0.01', base_min_size='0.00001')
+        self.eth = SizingKernel('ETH-USDC', '0.0001', '0.01', base_min_size='0.001')
+        self.odd = SizingKernel('XYZ-USD', '0.5', '0.05', base_min_size='1')
+
+    def test_matches_kernel_limit_orders(self):
+        """Test that basket sizing matches sizing each order with its kernel."""
+        rng = random.Random(3)
+        kernels = [rng.choice([self.btc, self.eth, self.odd]) for _ in range(400)]
+        sides = [rng.choice(list(OrderSide)) for _ in kernels]
+        fiat_amounts = [Decimal(rng.randint(1, 10**6)) / 100 for _ in kernels]
+        prices = [Decimal(rng.randint(10**3, 10**9)) / 10**4 for _ in kernels]
+
+        basket = size_basket(kernels, fiat_amounts, prices, sides)
+
+        expected = [kernel.limit_order(amount, price, side)
+                    for kernel, amount, price, side in zip(kernels, fiat_amounts, prices, sides)]
+        self.assertEqual(basket.prices, [price for price, _ in expected])
+        accepted = [kernel.meets_min_size(size) for kernel, (_, size) in zip(kernels, expected)]
+        self.assertEqual(basket.accepted.tolist(), accepted)
+        self.assertEqual(basket.sizes, [size if ok else Decimal(0)
+                                        for (_, size), ok in zip(expected, accepted)])
+        self.assertEqual(
+            basket.orders(),
+            [(kernel.product_id, side, price, size)
+             for kernel, side, (price, size), ok in zip(kernels, sides, expected, accepted) if ok]
+        )
+        self.assertEqual([str(size) for *_, size in basket.orders()],
+                         [str(size) for (_, size), ok in zip(expected, accepted) if ok])
+
+    def test_rejects_orders_below_min_size(self):
+        """Test that small orders are dropped and their fiat stays as residual cash."""
+        basket = size_basket([self.btc, self.eth], ['10', '1'], ['60000', '3000'],
+                             OrderSide.BUY)
+
+        self.assertEqual(basket.accepted.tolist(), [True, False])
+        self.assertEqual(basket.orders(), [('BTC-USDC', OrderSide.BUY, Decimal('60000.00'),
+                                            Decimal('0.00016666'))])
+        self.assertEqual(basket.residuals, [Decimal('0.0004'), Decimal('1')])
+        self.assertEqual(basket.residual_cash, Decimal('1.0004'))
+
+    def test_residual_cash(self):
+        """Test that residual cash is what the accepted orders leave unspent."""
+        rng = random.Random(5)
+        kernels = [rng.choice([self.btc, self.eth, self.odd]) for _ in range(200)]
+        fiat_amounts = [Decimal(rng.randint(1, 10**6)) / 100 for _ in kernels]
+        prices = [Decimal(rng.randint(10**3, 10**9)) / 10**4 for _ in kernels]
+
+        basket = size_basket(kernels, fiat_amounts, prices, OrderSide.BUY)
+
+        spent = sum((price * size for *_, price, size in basket.orders()), Decimal(0))
+        self.assertEqual(basket.residual_cash, sum(fiat_amounts) - spent)
+        self.assertEqual(basket.residual_cash, sum(basket.residuals))
+        self.assertTrue(all(residual >= 0 for residual in basket.residuals))
+
+    def test_large_amounts_do_not_overflow(self):
+        """Test amounts too large for 64-bit ticks."""
+        basket = size_basket([self.btc], ['1000000000000'], ['0.01'], OrderSide.BUY)
+
+        self.assertEqual(basket.sizes, [Decimal('100000000000000')])
+        self.assertEqual(basket.residual_cash, Decimal(0))
+
+    def test_invalid_input(self):
+        """Test that malformed baskets raise ValueError."""
+        with self.assertRaises(ValueError):
+            size_basket([self.btc], ['10', '20'], ['60000'], OrderSide.BUY)
+        with self.assertRaises(ValueError):
+            size_basket([self.btc], ['-10'], ['60000'], OrderSide.BUY)
+        with self.assertRaises(ValueError):
+            size_basket([self.btc], ['10'], ['0.001'], OrderSide.BUY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from coinbase_advanced_trader.paper_trading import LatencyModel, PaperTradingClient, SimulatedExchange
+
+THREADS = 16
+OPERATIONS_PER_THREAD = 25
+
+
+class TestSharedClientStress(unittest.TestCase):
+    """Stress test of one client shared by many worker threads."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000000', 'BTC': '100',
+                                                    'ETH': '1000'})
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.exchange.add_product('ETH-USDC', '3000')
+        self.client = PaperTradingClient(
+            self.exchange, latency=LatencyModel(read=0.001, write=0.002, seed=7)
+        )
+
+    def worker(self, seed, barrier):
+        """Run a random mix of balance, price and order calls."""
+        rng = random.Random(seed)
+        barrier.wait()
+        orders = []
+        for _ in range(OPERATIONS_PER_THREAD):
+            product_id = rng.choice(['BTC-USDC', 'ETH-USDC'])
+            action = rng.randrange(6)
+            if action == 0:
+                self.assertGreater(self.client.get_crypto_balance('BTC'), 0)
+            elif action == 1:
+                balances = self.client.list_held_crypto_balances()
+                self.assertEqual(set(balances), {'USDC', 'BTC', 'ETH'})
+            elif action == 2:
+                price = self.client._price_service.get_spot_price(product_id)
+                self.assertIn(price, (Decimal('50000.00'), Decimal('3000.00')))
+            elif action == 3:
+                orders.append(self.client.fiat_market_buy(product_id, '10'))
+            elif action == 4:
+                orders.append(self.client.fiat_limit_buy(product_id, '10', '0.9'))
+            else:
+                orders.append(self.client.fiat_market_sell(product_id, '10'))
+        return orders
+
+    def test_shared_client_under_load(self):
+        """Test that concurrent callers see consistent caches and all orders land."""
+        barrier = threading.Barrier(THREADS)
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            futures = [executor.submit(self.worker, seed, barrier) for seed in range(THREADS)]
+            orders = [order for future in futures for order in future.result()]
+
+        self.assertTrue(orders)
+        self.assertTrue(all(order is not None for order in orders))
+        self.assertEqual(len({order.id for order in orders}), len(orders))
+        self.assertEqual(self.client.session.calls['POST orders'], len(orders))
+        # Every thread shares one accounts cache, refreshed once.
+        self.assertEqual(self.client.session.calls['GET accounts'], 1)
+        for currency in ('USDC', 'BTC', 'ETH'):
+            available, hold = self.exchange.balance(currency)
+            self.assertGreaterEqual(available, 0)
+            self.assertGreaterEqual(hold, 0)
+
+    def test_concurrent_cache_expiry_refreshes_once(self):
+        """Test that an expired accounts cache is refreshed by one thread only."""
+        self.client.get_crypto_balance('BTC')
+        self.client._account_service._accounts_snapshot = None
+        self.client.single_flight = None
+        self.client.session.reset_counts()
+        barrier = threading.Barrier(THREADS)
+
+        def read_balance():
+            barrier.wait()
+            return self.client._account_service._get_accounts()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = [future.result() for future in
+                       [executor.submit(read_balance) for _ in range(THREADS)]]
+
+        self.assertEqual(self.client.session.calls['GET accounts'], 1)
+        self.assertEqual(len({id(accounts) for accounts in results}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import importlib.util
+import unittest
+from unittest.mock import Mock
+
+from coinbase_advanced_trader.alphasquared_trader import AlphaSquaredTrader
+from coinbase_advanced_trader.instrumentation import (
+    CompositeInstrumentation,
+    InMemoryInstrumentation,
+    OpenTelemetryInstrumentation,
+    SpanCollector
+)
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.services.fear_and_greed_provider import FearAndGreedReading
+
+
+def module_available(name):
+    """Return whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+class TestSpanCollector(unittest.TestCase):
+    """Test cases for span tracing through the client."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000', 'BTC': '1'})
+        self.exchange.add_product('BTC-USDC', '50000')
+        self.collector = SpanCollector()
+        self.client = PaperTradingClient(self.exchange, instrumentation=self.collector)
+        self.client._fear_and_greed_strategy.fgi_provider.get_reading = (
+            lambda: FearAndGreedReading(20, 'Extreme Fear', 0, 3600)
+        )
+
+    def children(self, parent):
+        return [span for span in self.collector.spans() if span.parent_id == parent.span_id]
+
+    def test_fgi_trade_spans_nest(self):
+        """Test that strategy, order, price and HTTP spans form one tree."""
+        self.client.trade_based_on_fgi('BTC-USDC', '10')
+
+        traces = self.collector.traces()
+        self.assertEqual(len(traces), 1)
+        spans = next(iter(traces.values()))
+        root = spans[0]
+        self.assertEqual(root.name, 'trade_based_on_fgi')
+        strategy, = self.children(root)
+        self.assertEqual(strategy.name, 'FearAndGreedStrategy.execute_trade')
+        self.assertEqual(strategy.attributes, {'product_id': 'BTC-USDC', 'fiat_amount': '10'})
+        self.assertEqual([span.name for span in self.children(strategy)],
+                         ['FearAndGreedStrategy._get_fgi', 'OrderService.fiat_limit_buy'])
+        order = self.children(strategy)[1]
+        self.assertIn('HTTP POST orders', [span.name for span in self.children(order)])
+        spot_price = next(span for span in self.children(order)
+                          if span.name == 'PriceService.get_spot_price')
+        self.assertEqual([span.name for span in self.children(spot_price)],
+                         ['HTTP GET products/{id}'])
+        for span in spans:
+            parent = next((other for other in spans if other.span_id == span.parent_id), None)
+            if parent is not None:
+                self.assertGreaterEqual(span.start, parent.start)
+                self.assertLessEqual(span.end, parent.end)
+
+    def test_breakdown_self_time(self):
+        """Test that self time excludes direct children."""
+        self.client.fiat_market_sell('BTC-USDC', '10')
+
+        breakdown = {entry['name']: entry for entry in self.collector.breakdown()}
+        order_span = next(span for span in self.collector.spans()
+                          if span.name == 'OrderService.fiat_market_sell')
+        children = sum(span.duration for span in self.children(order_span))
+        order = breakdown['OrderService.fiat_market_sell']
+        self.assertAlmostEqual(order['self'], order['total'] - children)
+        self.assertIn('OrderService.fiat_market_sell', self.collector.format_breakdown())
+        self.assertTrue(self.collector.format_trace().startswith('fiat_market_sell'))
+
+    def test_errors_are_recorded(self):
+        """Test that failing work and failed requests are marked."""
+        with self.assertRaises(Exception):
+            self.client.get_product('DOGE-USDC')
+
+        http, = self.collector.spans()
+        self.assertEqual(http.error, 'HTTP 404')
+
+    def test_account_and_alphasquared_spans(self):
+        """Test the AccountService and AlphaSquaredTrader spans."""
+        alphasquared = Mock()
+        alphasquared.get_current_risk.return_value = 50
+        alphasquared.get_strategy_value_for_risk.return_value = ('none', 0)
+
+        AlphaSquaredTrader(self.client, alphasquared).execute_strategy('BTC-USDC', 'Custom')
+        self.client.get_crypto_balance('BTC')
+
+        names = [span.name for span in self.collector.spans()]
+        self.assertIn('AlphaSquaredTrader.execute_strategy', names)
+        self.assertIn('AccountService.get_crypto_balance', names)
+        self.assertIn('AccountService._get_accounts', names)
+
+    def test_composite_instrumentation(self):
+        """Test that spans and metrics can be collected together."""
+        metrics = InMemoryInstrumentation()
+        self.client.fee_service.get_fee_tier()
+        self.collector.reset()
+        self.client.instrumentation = CompositeInstrumentation(self.collector, metrics)
+
+        self.client.fiat_limit_buy('BTC-USDC', '10')
+
+        self.assertEqual(self.collector.spans()[0].name, 'fiat_limit_buy')
+        self.assertEqual(metrics.snapshot()['operations'][0]['requests'], 2)
+
+    def test_max_spans(self):
+        """Test that only the most recent spans are kept."""
+        collector = SpanCollector(max_spans=3)
+        for _ in range(5):
+            with collector.span('work', {}):
+                pass
+
+        self.assertEqual(len(collector.spans()), 3)
+        collector.reset()
+        self.assertEqual(collector.spans(), [])
+
+
+class TestOpenTelemetryInstrumentation(unittest.TestCase):
+    """Test cases for the OpenTelemetry adapter."""
+
+    @unittest.skipIf(module_available('opentelemetry'),
+                     "opentelemetry-api is installed")
+    def test_requires_opentelemetry(self):
+        """Test the error raised without opentelemetry-api."""
+        with self.assertRaises(ImportError) as context:
+            OpenTelemetryInstrumentation()
+        self.assertIn('[tracing]', str(context.exception))
+
+    @unittest.skipUnless(module_available('opentelemetry.sdk'),
+                         "opentelemetry-sdk is not installed")
+    def test_spans_are_exported(self):
+        """Test that client spans reach an OpenTelemetry exporter."""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        exchange = SimulatedExchange(balances={'USDC': '1000'})
+        exchange.add_product('BTC-USDC', '50000')
+        client = PaperTradingClient(exchange, instrumentation=OpenTelemetryInstrumentation(
+            provider.get_tracer('test')))
+
+        client.fiat_limit_buy('BTC-USDC', '10')
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        self.assertEqual(spans['HTTP POST orders'].parent.span_id,
+                         spans['OrderService.fiat_limit_buy'].context.span_id)
+        self.assertEqual(spans['OrderService.fiat_limit_buy'].attributes['product_id'], 'BTC-USDC')
+
+
+if __name__ == '__main__':
+    unittest.main()
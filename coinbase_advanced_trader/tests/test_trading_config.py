@@ -1,5 +1,8 @@
+import random
 import unittest
-from coinbase_advanced_trader.trading_config import FearAndGreedConfig
+from decimal import Decimal
+
+from coinbase_advanced_trader.trading_config import CompiledFGISchedule, FearAndGreedConfig
 
 
 class TestTradingConfig(unittest.TestCase):
@@ -29,6 +32,65 @@ class TestTradingConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.config.update_fgi_schedule(invalid_schedule)
 
+    def test_update_fgi_schedule_recompiles(self):
+        """Test that updating the schedule replaces the compiled schedule."""
+        self.config.update_fgi_schedule([{'threshold': 10, 'factor': 1.5, 'action': 'buy'}])
+
+        compiled = self.config.get_compiled_schedule()
+        self.assertEqual(compiled.evaluate(5).factor, Decimal('1.5'))
+        self.assertIsNone(compiled.evaluate(50))
+
+
+class TestCompiledFGISchedule(unittest.TestCase):
+    """Test cases for the CompiledFGISchedule class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.schedule = FearAndGreedConfig().get_fgi_schedule()
+        self.compiled = CompiledFGISchedule(self.schedule)
+
+    def test_evaluate_buy_uses_tightest_threshold(self):
+        """Test that a buy matches the lowest threshold at or above the FGI."""
+        self.assertEqual(self.compiled.evaluate(25).threshold, 30)
+        self.assertEqual(self.compiled.evaluate(30).threshold, 30)
+        self.assertEqual(self.compiled.evaluate(0).factor, Decimal('1.5'))
+
+    def test_evaluate_sell_uses_most_extreme_threshold(self):
+        """Test that a sell matches the highest threshold at or below the FGI."""
+        self.assertEqual(self.compiled.evaluate(70).threshold, 70)
+        self.assertEqual(self.compiled.evaluate(85).threshold, 80)
+        self.assertEqual(self.compiled.evaluate(95).factor, Decimal('2.0'))
+
+    def test_evaluate_no_match(self):
+        """Test that values between buy and sell thresholds match nothing."""
+        self.assertIsNone(self.compiled.evaluate(65))
+
+    def test_evaluate_independent_of_list_order(self):
+        """Test that shuffling the schedule does not change the result."""
+        shuffled = list(self.schedule)
+        random.Random(7).shuffle(shuffled)
+        compiled = CompiledFGISchedule(shuffled)
+
+        self.assertEqual(compiled.evaluate_many(range(101)),
+                         self.compiled.evaluate_many(range(101)))
+
+    def test_invalid_schedules_rejected(self):
+        """Test that invalid schedules fail to compile."""
+        invalid_schedules = [
+            [],
+            [{'threshold': 10, 'factor': 1.5}],
+            [{'threshold': 10, 'factor': 1.5, 'action': 'hold'}],
+            [{'threshold': 50, 'factor': 1.0, 'action': 'buy'},
+             {'threshold': 40, 'factor': 1.0, 'action': 'sell'}],
+            [{'threshold': 10, 'factor': 1.0, 'action': 'buy'},
+             {'threshold': 10, 'factor': 2.0, 'action': 'buy'}],
+        ]
+        for schedule in invalid_schedules:
+            with self.subTest(schedule=schedule):
+                with self.assertRaises(ValueError):
+                    CompiledFGISchedule(schedule)
+                self.assertFalse(FearAndGreedConfig().validate_schedule(schedule))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
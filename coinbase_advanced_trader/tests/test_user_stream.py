@@ -0,0 +1,282 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from decimal import Decimal
+
+import websockets
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from coinbase_advanced_trader.paper_trading import PaperTradingClient, SimulatedExchange
+from coinbase_advanced_trader.user_stream import (
+    UserChannelTransport,
+    UserStream,
+    WebSocketTransport
+)
+
+
+def order_event(order_id, status='OPEN', filled='0', leaves='0.002', avg_price='0',
+                fees='0', product_id='BTC-USDC', side='BUY', limit_price='49500.00'):
+    """An order from a user channel event, as Coinbase sends it."""
+    return {
+        'order_id': order_id, 'client_order_id': f'client-{order_id}',
+        'product_id': product_id, 'product_type': 'SPOT', 'order_side': side,
+        'order_type': 'Limit', 'status': status, 'time_in_force': 'GOOD_UNTIL_CANCELLED',
+        'cumulative_quantity': filled, 'leaves_quantity': leaves, 'avg_price': avg_price,
+        'total_fees': fees, 'limit_price': limit_price, 'stop_price': '',
+        'number_of_fills': '0' if filled == '0' else '1', 'cancel_reason': '',
+        'creation_time': '2024-05-01T12:00:00.000000Z',
+    }
+
+
+def user_message(sequence, *orders, event_type='update'):
+    """A raw user channel message carrying `orders`."""
+    return json.dumps({
+        'channel': 'user', 'client_id': '', 'timestamp': '2024-05-01T12:00:00.000000Z',
+        'sequence_num': sequence,
+        'events': [{'type': event_type, 'orders': list(orders)}],
+    })
+
+
+def heartbeat_message(sequence):
+    return json.dumps({
+        'channel': 'heartbeats', 'client_id': '', 'timestamp': '2024-05-01T12:00:00.000000Z',
+        'sequence_num': sequence,
+        'events': [{'current_time': '2024-05-01 12:00:00', 'heartbeat_counter': sequence}],
+    })
+
+
+class ReplayTransport(UserChannelTransport):
+    """A transport delivering messages pushed by the test on the calling thread."""
+
+    def __init__(self):
+        self.on_message = None
+        self.subscriptions = []
+        self.closed = False
+
+    def open(self, on_message):
+        self.on_message = on_message
+
+    def subscribe(self, product_ids):
+        self.subscriptions.append(product_ids)
+
+    def close(self):
+        self.closed = True
+
+    def push(self, *messages):
+        for message in messages:
+            self.on_message(message)
+
+
+class TestUserStream(unittest.TestCase):
+    """Test cases for the UserStream class."""
+
+    def setUp(self):
+        """Set up the test environment before each test method."""
+        self.exchange = SimulatedExchange(balances={'USDC': '1000'},
+                                          maker_fee_rate='0.004', taker_fee_rate='0.006')
+        self.exchange.add_product('BTC-USDC', '50000', spread='0.001', level_size='0.01')
+        self.client = PaperTradingClient(self.exchange)
+        self.transport = ReplayTransport()
+        self.fills = []
+        self.updates = []
+        self.stream = self.client.user_stream(
+            ['BTC-USDC'], on_order=self.updates.append, on_fill=self.fills.append,
+            transport=self.transport
+        ).start()
+
+    def tearDown(self):
+        self.stream.stop()
+
+    def test_events_update_placed_orders(self):
+        """Test that fills from events update the placed order and drop cached balances."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        self.client.get_crypto_balance('USDC')
+        self.assertEqual(self.transport.subscriptions, [['BTC-USDC']])
+
+        self.transport.push(
+            user_message(0, order_event(order.id, filled='0.001', leaves='0.00102',
+                                        avg_price='49500', fees='0.198')),
+            user_message(1, order_event(order.id, status='FILLED', filled='0.00202',
+                                        leaves='0', avg_price='49450', fees='0.396')),
+        )
+
+        self.assertIs(self.stream.orders[order.id], order)
+        self.assertEqual(order.status, 'filled')
+        self.assertEqual(order.filled_size, Decimal('0.00202'))
+        self.assertEqual(order.average_filled_price, Decimal('49450'))
+        self.assertEqual([fill.size for fill in self.fills],
+                         [Decimal('0.001'), Decimal('0.00102')])
+        # 0.00202 * 49450 - 0.001 * 49500 = 50.389 for the second fill.
+        self.assertEqual(self.fills[1].price, Decimal('50.389') / Decimal('0.00102'))
+        self.assertEqual(self.fills[1].fees, Decimal('0.198'))
+        self.assertEqual(len(self.updates), 2)
+        accounts_reads = self.client.session.calls['GET accounts']
+        self.client.get_crypto_balance('USDC')
+        self.assertEqual(self.client.session.calls['GET accounts'], accounts_reads + 1)
+
+    def test_stopped_stream_stops_tracking_placed_orders(self):
+        """Test that stop() detaches the stream from the client's placed orders."""
+        self.stream.stop()
+
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+
+        self.assertNotIn(order.id, self.stream.orders)
+
+    def test_events_before_tracking_are_kept(self):
+        """Test that an order tracked after its first event takes over its state."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        del self.stream.orders[order.id]
+        self.transport.push(user_message(0, order_event(order.id, filled='0.001',
+                                                        avg_price='49500')))
+
+        self.stream.track(order)
+
+        self.assertIs(self.stream.orders[order.id], order)
+        self.assertEqual(order.filled_size, Decimal('0.001'))
+        self.assertEqual(order.status, 'open')
+
+    def test_stale_and_duplicate_messages_are_ignored(self):
+        """Test that old sequence numbers, shrinking fills and reopened orders are ignored."""
+        self.transport.push(
+            user_message(0, order_event('a', filled='0.001', avg_price='49500')),
+            user_message(1, order_event('a', status='CANCELLED', filled='0.001',
+                                        avg_price='49500')),
+            user_message(1, order_event('a', status='OPEN', filled='0.002',
+                                        avg_price='49500')),
+            user_message(2, order_event('a', status='OPEN', filled='0.001',
+                                        avg_price='49500')),
+            user_message(3, order_event('a', status='OPEN', filled='0',
+                                        avg_price='0')),
+        )
+
+        order = self.stream.orders['a']
+        self.assertEqual(order.status, 'cancelled')
+        self.assertEqual(order.filled_size, Decimal('0.001'))
+        self.assertEqual(len(self.fills), 1)
+        self.assertEqual(self.stream.gaps, 0)
+        self.assertEqual(self.stream.resyncs, 0)
+
+    def test_sequence_gap_resyncs_over_rest(self):
+        """Test that a skipped message triggers a REST resync recovering the fill."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        self.transport.push(user_message(0, order_event(order.id)), heartbeat_message(1))
+
+        self.exchange.set_price('BTC-USDC', '49000')
+        # The message announcing the fill (2) is lost.
+        self.transport.push(heartbeat_message(3))
+        self.stream.stop()
+
+        self.assertEqual(self.stream.gaps, 1)
+        self.assertEqual(self.stream.resyncs, 1)
+        self.assertEqual(order.status, 'filled')
+        self.assertEqual(order.filled_size, order.size)
+        self.assertEqual(order.average_filled_price, order.price)
+        self.assertEqual([fill.size for fill in self.fills], [order.size])
+
+    def test_reconnection_resyncs_over_rest(self):
+        """Test that sequence numbers restarting from zero trigger a REST resync."""
+        order = self.client.fiat_limit_buy('BTC-USDC', '100', price_multiplier='0.99')
+        self.transport.push(heartbeat_message(0), heartbeat_message(1))
+
+        self.client.cancel_orders([order.id])
+        self.transport.push(heartbeat_message(0))
+        self.stream.stop()
+
+        self.assertEqual(self.stream.gaps, 0)
+        self.assertEqual(self.stream.resyncs, 1)
+        self.assertEqual(order.status, 'cancelled')
+        self.assertEqual(self.fills, [])
+
+
+class WebSocketStub:
+    """A local user channel server replaying recorded messages after a subscription."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.subscriptions = []
+        self.sent_at = {}
+        self.subscribed = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        self._started.wait(5)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._loop.call_soon_threadsafe(self._stop.set_result, None)
+        self._thread.join(5)
+
+    @property
+    def url(self):
+        return f'ws://127.0.0.1:{self.port}'
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._serve())
+
+    async def _serve(self):
+        self._stop = self._loop.create_future()
+        async with websockets.serve(self._handle, '127.0.0.1', 0) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._started.set()
+            await self._stop
+
+    async def _handle(self, websocket):
+        async for raw in websocket:
+            message = json.loads(raw)
+            self.subscriptions.append(message)
+            if message['channel'] == 'user':
+                self.subscribed.set()
+                for sequence, payload in enumerate(self.messages):
+                    self.sent_at[sequence] = time.perf_counter()
+                    await websocket.send(payload)
+
+
+class TestWebSocketTransport(unittest.TestCase):
+    """Test cases for the WebSocketTransport class against a local stub."""
+
+    def test_replayed_messages_reach_callbacks_quickly(self):
+        """Test that events from a real WebSocket connection reach callbacks in under a second."""
+        key = ec.generate_private_key(ec.SECP256R1())
+        secret = key.private_bytes(serialization.Encoding.PEM,
+                                   serialization.PrivateFormat.TraditionalOpenSSL,
+                                   serialization.NoEncryption()).decode()
+        messages = [
+            user_message(0, order_event('a'), event_type='snapshot'),
+            user_message(1, order_event('a', filled='0.001', leaves='0.001',
+                                        avg_price='49500', fees='0.198')),
+            user_message(2, order_event('a', status='FILLED', filled='0.002', leaves='0',
+                                        avg_price='49500', fees='0.396')),
+        ]
+        received = {}
+        done = threading.Event()
+
+        def on_order(order):
+            received[order.status] = time.perf_counter()
+            if order.status == 'filled':
+                done.set()
+
+        with WebSocketStub(messages) as stub:
+            transport = WebSocketTransport('organizations/test/apiKeys/test', secret,
+                                           base_url=stub.url, retry=False)
+            stream = UserStream(PaperTradingClient(), ['BTC-USDC'], transport=transport,
+                                on_order=on_order)
+            with stream:
+                self.assertTrue(done.wait(5))
+
+        self.assertEqual({(m['type'], m['channel']) for m in stub.subscriptions},
+                         {('subscribe', 'user'), ('subscribe', 'heartbeats')})
+        self.assertTrue(all(m['jwt'] for m in stub.subscriptions))
+        self.assertEqual(stream.orders['a'].filled_size, Decimal('0.002'))
+        self.assertEqual(stream.gaps, 0)
+        self.assertLess(received['filled'] - stub.sent_at[2], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,139 @@
 """Trading configuration module for Coinbase Advanced Trader."""
 
-from typing import List, Dict, Any
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
 from coinbase_advanced_trader.config import config_manager
 from coinbase_advanced_trader.logger import logger
 
-BUY_PRICE_MULTIPLIER = config_manager.get('BUY_PRICE_MULTIPLIER')
-SELL_PRICE_MULTIPLIER = config_manager.get('SELL_PRICE_MULTIPLIER')
-FEAR_AND_GREED_API_URL = config_manager.get('FEAR_AND_GREED_API_URL')
+_CONFIG_CONSTANTS = (
+    'BUY_PRICE_MULTIPLIER',
+    'SELL_PRICE_MULTIPLIER',
+    'FEAR_AND_GREED_API_URL'
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve configuration constants on access instead of at import time."""
+    if name in _CONFIG_CONSTANTS:
+        return config_manager.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(frozen=True)
+class FGIRule:
+    """
+    A single compiled FGI schedule rule.
+
+    Attributes:
+        threshold (float): The FGI threshold of the rule.
+        factor (Decimal): The multiplier applied to the fiat amount.
+        action (str): Either 'buy' or 'sell'.
+    """
+
+    threshold: float
+    factor: Decimal
+    action: str
+
+
+class CompiledFGISchedule:
+    """
+    An FGI schedule validated once and compiled into sorted threshold arrays.
+
+    A buy rule applies when the FGI is at or below its threshold and a sell
+    rule when the FGI is at or above it. When several rules apply, the most
+    extreme one wins: the lowest buy threshold or the highest sell threshold
+    reached by the FGI, independently of the order rules were listed in.
+    """
+
+    def __init__(self, schedule: List[Dict[str, Any]]) -> None:
+        """
+        Compile a schedule.
+
+        Args:
+            schedule: List of dicts with 'threshold', 'factor' and 'action'.
+
+        Raises:
+            ValueError: If the schedule is invalid.
+        """
+        if not schedule:
+            raise ValueError("Empty schedule provided.")
+
+        buy_rules: List[FGIRule] = []
+        sell_rules: List[FGIRule] = []
+        for condition in schedule:
+            if not all(key in condition for key in ('threshold', 'factor', 'action')):
+                raise ValueError(f"Invalid condition format: {condition}")
+            rule = FGIRule(condition['threshold'], Decimal(str(condition['factor'])),
+                           condition['action'])
+            if rule.action == 'buy':
+                buy_rules.append(rule)
+            elif rule.action == 'sell':
+                sell_rules.append(rule)
+            else:
+                raise ValueError(f"Invalid action: {rule.action}")
+
+        buy_rules.sort(key=lambda rule: rule.threshold)
+        sell_rules.sort(key=lambda rule: rule.threshold)
+        for rules in (buy_rules, sell_rules):
+            for previous, rule in zip(rules, rules[1:]):
+                if previous.threshold == rule.threshold:
+                    raise ValueError(f"Duplicate {rule.action} threshold: {rule.threshold}")
+        if buy_rules and sell_rules and buy_rules[-1].threshold >= sell_rules[0].threshold:
+            raise ValueError(f"Invalid buy threshold: {buy_rules[-1].threshold} "
+                             f"is not below sell threshold {sell_rules[0].threshold}")
+
+        self.schedule = list(schedule)
+        # For buys the tightest match is the first threshold >= fgi, so
+        # rules are kept ascending. For sells it is the last threshold
+        # <= fgi, found with bisect_right on the ascending array as well.
+        self._buy_rules = buy_rules
+        self._buy_thresholds = [rule.threshold for rule in buy_rules]
+        self._sell_rules = sell_rules
+        self._sell_thresholds = [rule.threshold for rule in sell_rules]
+
+    @property
+    def buy_rules(self) -> List[FGIRule]:
+        """Buy rules sorted by ascending threshold."""
+        return list(self._buy_rules)
+
+    @property
+    def sell_rules(self) -> List[FGIRule]:
+        """Sell rules sorted by ascending threshold."""
+        return list(self._sell_rules)
+
+    def evaluate(self, fgi: float) -> Optional[FGIRule]:
+        """
+        Find the rule that applies to an FGI value in O(log n).
+
+        Args:
+            fgi: The Fear and Greed Index value.
+
+        Returns:
+            The matching rule, or None if no rule applies.
+        """
+        index = bisect_left(self._buy_thresholds, fgi)
+        if index < len(self._buy_rules):
+            return self._buy_rules[index]
+        index = bisect_right(self._sell_thresholds, fgi)
+        if index:
+            return self._sell_rules[index - 1]
+        return None
+
+    def evaluate_many(self, values: Iterable[float]) -> List[Optional[FGIRule]]:
+        """
+        Evaluate the schedule for many FGI values at once.
+
+        Args:
+            values: The Fear and Greed Index values.
+
+        Returns:
+            The matching rule (or None) for each value, in order.
+        """
+        evaluate = self.evaluate
+        return [evaluate(value) for value in values]
 
 
 class FearAndGreedConfig:
@@ -25,6 +152,7 @@ class FearAndGreedConfig:
             {'threshold': 80, 'factor': 1.5, 'action': 'sell'},
             {'threshold': 90, 'factor': 2.0, 'action': 'sell'}
         ]
+        self._compiled_schedule = CompiledFGISchedule(self._fgi_schedule)
 
     def update_fgi_schedule(self, new_schedule: List[Dict[str, Any]]) -> None:
         """
@@ -36,12 +164,14 @@ class FearAndGreedConfig:
         Raises:
             ValueError: If the provided schedule is invalid.
         """
-        if self.validate_schedule(new_schedule):
-            self._fgi_schedule = new_schedule
-            logger.info("FGI schedule updated.")
-        else:
-            logger.error("Invalid FGI schedule. Update rejected.")
-            raise ValueError("Invalid FGI schedule")
+        try:
+            compiled_schedule = CompiledFGISchedule(new_schedule)
+        except ValueError as error:
+            logger.error(f"Invalid FGI schedule. Update rejected: {error}")
+            raise ValueError("Invalid FGI schedule") from error
+        self._fgi_schedule = new_schedule
+        self._compiled_schedule = compiled_schedule
+        logger.info("FGI schedule updated.")
 
     def get_fgi_schedule(self) -> List[Dict[str, Any]]:
         """
@@ -52,6 +182,15 @@ class FearAndGreedConfig:
         """
         return self._fgi_schedule
 
+    def get_compiled_schedule(self) -> CompiledFGISchedule:
+        """
+        Get the current FGI schedule compiled for fast lookups.
+
+        Returns:
+            The compiled FGI schedule.
+        """
+        return self._compiled_schedule
+
     def validate_schedule(self, schedule: List[Dict[str, Any]]) -> bool:
         """
         Validate the given FGI schedule without updating it.
@@ -62,31 +201,11 @@ class FearAndGreedConfig:
         Returns:
             True if the schedule is valid, False otherwise.
         """
-        if not schedule:
-            logger.warning("Empty schedule provided.")
+        try:
+            CompiledFGISchedule(schedule)
+        except ValueError as error:
+            logger.warning(str(error))
             return False
 
-        last_buy_threshold = float('-inf')
-        last_sell_threshold = float('inf')
-
-        for condition in sorted(schedule, key=lambda x: x['threshold']):
-            if not all(key in condition for key in ('threshold', 'factor', 'action')):
-                logger.warning(f"Invalid condition format: {condition}")
-                return False
-
-            if condition['action'] == 'buy':
-                if condition['threshold'] >= last_sell_threshold:
-                    logger.warning(f"Invalid buy threshold: {condition['threshold']}")
-                    return False
-                last_buy_threshold = condition['threshold']
-            elif condition['action'] == 'sell':
-                if condition['threshold'] <= last_buy_threshold:
-                    logger.warning(f"Invalid sell threshold: {condition['threshold']}")
-                    return False
-                last_sell_threshold = condition['threshold']
-            else:
-                logger.warning(f"Invalid action: {condition['action']}")
-                return False
-
-        logger.info("FGI schedule is valid.")
+        logger.debug("FGI schedule is valid.")
         return True
@@ -0,0 +1,473 @@
+"""Order and fill updates from the authenticated WebSocket user channel.
+
+`UserStream` subscribes to the user channel and keeps local `Order` objects
+current as events arrive, instead of polling the REST API. Every message
+carries a connection-wide sequence number; when one is skipped, or the
+connection was re-established and the numbering restarted, the stream
+reloads open and unfinished tracked orders over REST so no fill is lost.
+
+The transport is pluggable: `WebSocketTransport` wraps the SDK's
+`WSUserClient`, and tests can replace it with anything that delivers raw
+JSON messages to a callback.
+"""
+
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from coinbase.constants import WS_USER_BASE_URL
+
+from coinbase_advanced_trader.fast_decode import loads
+from coinbase_advanced_trader.logger import logger
+from coinbase_advanced_trader.models import Order, OrderSide, OrderType
+
+#: Lowercased order statuses after which an order never changes again.
+TERMINAL_STATUSES = frozenset({'filled', 'cancelled', 'expired', 'failed'})
+
+_ZERO = Decimal('0')
+
+
+class UserChannelTransport:
+    """
+    Interface of a user channel connection.
+
+    Implementations deliver each raw message (a JSON string) to the
+    `on_message` callback given to `open`, from any thread.
+    """
+
+    def open(self, on_message: Callable[[str], None]) -> None:
+        """Connect and start delivering messages to `on_message`."""
+        raise NotImplementedError
+
+    def subscribe(self, product_ids: List[str]) -> None:
+        """Subscribe to order events (and heartbeats) for `product_ids`, or all if empty."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Disconnect."""
+        raise NotImplementedError
+
+
+class WebSocketTransport(UserChannelTransport):
+    """The SDK's `WSUserClient`, which reconnects and resubscribes by itself."""
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = WS_USER_BASE_URL,
+                 **kwargs: Any) -> None:
+        """
+        Args:
+            api_key (str): The API key for authentication.
+            api_secret (str): The API secret for authentication.
+            base_url (str): The user channel endpoint.
+            **kwargs (Any): Additional keyword arguments for WSUserClient,
+                e.g. `retry` or `timeout`.
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = base_url
+        self.kwargs = kwargs
+        self._client = None
+
+    def open(self, on_message: Callable[[str], None]) -> None:
+        from coinbase.websocket import WSUserClient
+
+        self._client = WSUserClient(api_key=self.api_key, api_secret=self.api_secret,
+                                    base_url=self.base_url, on_message=on_message,
+                                    **self.kwargs)
+        self._client.open()
+
+    def subscribe(self, product_ids: List[str]) -> None:
+        self._client.user(product_ids=product_ids)
+        self._client.heartbeats()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+@dataclass
+class OrderFill:
+    """
+    A fill derived from the change in an order's cumulative fills.
+
+    Attributes:
+        order (Order): The order after the fill.
+        size (Decimal): Base size filled.
+        price (Decimal): Average price of this fill.
+        fees (Decimal): Fees charged for this fill.
+    """
+
+    order: Order
+    size: Decimal
+    price: Decimal
+    fees: Decimal
+
+
+@dataclass
+class _OrderState:
+    """One order's state as reported by the user channel or the REST API."""
+
+    order_id: str
+    client_order_id: Optional[str]
+    product_id: str
+    side: OrderSide
+    type: OrderType
+    status: str
+    size: Decimal
+    price: Optional[Decimal]
+    filled_size: Decimal
+    average_filled_price: Optional[Decimal]
+    total_fees: Decimal
+
+    def to_order(self) -> Order:
+        return Order(id=self.order_id, product_id=self.product_id, side=self.side,
+                     type=self.type, size=self.size, price=self.price,
+                     client_order_id=self.client_order_id, status=self.status,
+                     filled_size=self.filled_size,
+                     average_filled_price=self.average_filled_price,
+                     total_fees=self.total_fees)
+
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    return Decimal(value) if value not in (None, '') else None
+
+
+def _order_type(order_type: str, price: Optional[Decimal]) -> OrderType:
+    """Map an API order type to ours; stop and bracket orders count as limit orders."""
+    order_type = (order_type or '').upper()
+    if order_type == 'MARKET' or (order_type != 'LIMIT' and price is None):
+        return OrderType.MARKET
+    return OrderType.LIMIT
+
+
+def _from_event(event: Dict[str, Any]) -> _OrderState:
+    """Read an order from a user channel event."""
+    filled_size = _decimal(event.get('cumulative_quantity')) or _ZERO
+    leaves = _decimal(event.get('leaves_quantity')) or _ZERO
+    average = _decimal(event.get('avg_price'))
+    price = _decimal(event.get('limit_price'))
+    order_type = _order_type(event.get('order_type'), price)
+    if order_type is OrderType.LIMIT and price is None:
+        price = average or _ZERO
+    return _OrderState(
+        order_id=event['order_id'],
+        client_order_id=event.get('client_order_id') or None,
+        product_id=event.get('product_id', ''),
+        side=OrderSide.BUY if event.get('order_side') == 'BUY' else OrderSide.SELL,
+        type=order_type,
+        status=event.get('status', 'pending').lower(),
+        size=filled_size + leaves,
+        price=price,
+        filled_size=filled_size,
+        average_filled_price=average if filled_size else None,
+        total_fees=_decimal(event.get('total_fees')) or _ZERO,
+    )
+
+
+def _from_rest(order: Any) -> _OrderState:
+    """Read an order from a REST order object or dict."""
+    order = order if isinstance(order, dict) else order.to_dict()
+    configuration = next(iter((order.get('order_configuration') or {}).values()), None) or {}
+    price = _decimal(configuration.get('limit_price'))
+    filled_size = _decimal(order.get('filled_size')) or _ZERO
+    size = _decimal(configuration.get('base_size'))
+    if size is None:
+        size = _decimal(configuration.get('quote_size')) or filled_size
+    order_type = _order_type(order.get('order_type'), price)
+    if order_type is OrderType.LIMIT and price is None:
+        price = _decimal(order.get('average_filled_price')) or _ZERO
+    return _OrderState(
+        order_id=order['order_id'],
+        client_order_id=order.get('client_order_id') or None,
+        product_id=order.get('product_id', ''),
+        side=OrderSide.BUY if order.get('side') == 'BUY' else OrderSide.SELL,
+        type=order_type,
+        status=(order.get('status') or 'pending').lower(),
+        size=size,
+        price=price,
+        filled_size=filled_size,
+        average_filled_price=(_decimal(order.get('average_filled_price'))
+                              if filled_size else None),
+        total_fees=_decimal(order.get('total_fees')) or _ZERO,
+    )
+
+
+def order_from_api(order: Any) -> Order:
+    """
+    Build an `Order` from a REST order object or dict.
+
+    Args:
+        order (Any): An order from `get_order` or `list_orders`.
+
+    Returns:
+        Order: The order, with its status lowercased.
+    """
+    return _from_rest(order).to_order()
+
+
+def list_open_orders(rest_client: Any, product_ids: Iterable[str] = ()) -> List[Any]:
+    """
+    Fetch every open order, following the pagination cursor.
+
+    Args:
+        rest_client (Any): The client to read the orders with.
+        product_ids (Iterable[str]): Products to read, all if empty.
+
+    Returns:
+        List[Any]: The REST order objects or dicts.
+    """
+    product_ids = list(product_ids)
+    kwargs = {'product_ids': product_ids} if product_ids else {}
+    orders: List[Any] = []
+    cursor = None
+    while True:
+        response = rest_client.list_orders(order_status=['OPEN'], cursor=cursor, **kwargs)
+        orders.extend(response['orders'])
+        cursor = response['cursor'] if response['has_next'] else None
+        if not cursor:
+            return orders
+
+
+class UserStream:
+    """
+    Keeps `Order` objects current from the WebSocket user channel.
+
+    While the stream runs, orders placed through its `EnhancedRESTClient`
+    are tracked automatically; other orders are added as their first event
+    arrives. Callbacks run on the transport's
+    thread as soon as a message is processed, outside the stream's lock.
+
+    Start the stream before placing orders: events sent while it is not
+    connected are only recovered for tracked orders, by the next resync.
+    """
+
+    def __init__(self, rest_client: Any, product_ids: Iterable[str] = (),
+                 transport: Optional[UserChannelTransport] = None,
+                 on_order: Optional[Callable[[Order], Any]] = None,
+                 on_fill: Optional[Callable[[OrderFill], Any]] = None) -> None:
+        """
+        Args:
+            rest_client (Any): The client used for REST resyncs, usually an
+                `EnhancedRESTClient`, whose accounts cache is dropped
+                whenever an order fills.
+            product_ids (Iterable[str]): Products to follow, all if empty.
+            transport (Optional[UserChannelTransport]): The connection, by
+                default a `WebSocketTransport` with the client's credentials.
+            on_order (Optional[Callable[[Order], Any]]): Called with every
+                order whose state changed.
+            on_fill (Optional[Callable[[OrderFill], Any]]): Called with every
+                new fill.
+        """
+        self.rest_client = rest_client
+        self.product_ids = list(product_ids)
+        self.transport = transport or WebSocketTransport(rest_client.api_key,
+                                                         rest_client.api_secret)
+        self.on_order = on_order
+        self.on_fill = on_fill
+        # Also called with every changed order, e.g. an `OpenOrderBook.update`.
+        self.order_listeners: List[Callable[[Order], Any]] = []
+        self.orders: Dict[str, Order] = {}
+        self.messages = 0
+        self.gaps = 0
+        self.resyncs = 0
+        self.last_sequence: Optional[int] = None
+        self._lock = threading.Lock()
+        self._resync_lock = threading.Lock()
+        self._resync_requested = False
+        self._resync_thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'UserStream':
+        """Connect and subscribe."""
+        add_order_listener = getattr(self.rest_client, 'add_order_listener', None)
+        if add_order_listener is not None:
+            add_order_listener(self.track)
+        self.transport.open(self._on_message)
+        self.transport.subscribe(self.product_ids)
+        logger.info(f"User stream started for {self.product_ids or 'all products'}")
+        return self
+
+    def stop(self) -> None:
+        """Disconnect and wait for a running resync to finish."""
+        remove_order_listener = getattr(self.rest_client, 'remove_order_listener', None)
+        if remove_order_listener is not None:
+            remove_order_listener(self.track)
+        self.transport.close()
+        thread = self._resync_thread
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self) -> 'UserStream':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def track(self, order: Order) -> Order:
+        """
+        Keep `order` up to date. If events for it arrived before it was
+        tracked, their state is copied into it first.
+
+        Args:
+            order (Order): An order placed on this account.
+
+        Returns:
+            Order: The same order.
+        """
+        with self._lock:
+            known = self.orders.get(order.id)
+            if known is not None and known is not order:
+                order.status = known.status
+                order.filled_size = known.filled_size
+                order.average_filled_price = known.average_filled_price
+                order.total_fees = known.total_fees
+                if order.client_order_id is None:
+                    order.client_order_id = known.client_order_id
+            self.orders[order.id] = order
+        return order
+
+    def resync(self) -> None:
+        """
+        Reload open orders and every unfinished tracked order over REST.
+
+        Called automatically, on a background thread, when the stream
+        detects a sequence gap or a reconnection.
+        """
+        with self._resync_lock:
+            states = [_from_rest(order)
+                      for order in list_open_orders(self.rest_client, self.product_ids)]
+            seen = {state.order_id for state in states}
+            with self._lock:
+                pending = [order_id for order_id, order in self.orders.items()
+                           if order_id not in seen and order.status not in TERMINAL_STATUSES]
+            for order_id in pending:
+                states.append(_from_rest(self.rest_client.get_order(order_id)['order']))
+            self._apply(states)
+            self.resyncs += 1
+            self._invalidate_balances()
+            logger.info(f"User stream resynced {len(states)} orders over REST")
+
+    def _on_message(self, raw: str) -> None:
+        """Process one raw message from the transport."""
+        try:
+            message = loads(raw)
+        except ValueError:
+            logger.warning(f"Ignoring undecodable user channel message: {raw[:200]}")
+            return
+        if self._check_sequence(message.get('sequence_num')):
+            return
+        if message.get('channel') != 'user':
+            return
+        states = [_from_event(event)
+                  for batch in message.get('events', ())
+                  for event in batch.get('orders') or ()]
+        if states:
+            self._apply(states)
+
+    def _check_sequence(self, sequence: Optional[int]) -> bool:
+        """Note a message's sequence number; True if it was already processed."""
+        if sequence is None:
+            return False
+        with self._lock:
+            self.messages += 1
+            last, self.last_sequence = self.last_sequence, sequence
+            if last is None or sequence == last + 1:
+                return False
+            if sequence > last:
+                self.gaps += 1
+                logger.warning(f"User channel skipped messages {last + 1} to {sequence - 1}")
+            elif sequence == 0:
+                logger.warning("User channel reconnected")
+            else:
+                self.last_sequence = last
+                return True
+        self._request_resync()
+        return False
+
+    def _request_resync(self) -> None:
+        """Run a resync on a background thread, once more if one is already running."""
+        with self._lock:
+            self._resync_requested = True
+            if self._resync_thread is not None and self._resync_thread.is_alive():
+                return
+            self._resync_thread = threading.Thread(target=self._resync_worker,
+                                                   name='user-stream-resync', daemon=True)
+            self._resync_thread.start()
+
+    def _resync_worker(self) -> None:
+        while True:
+            with self._lock:
+                if not self._resync_requested:
+                    self._resync_thread = None
+                    return
+                self._resync_requested = False
+            try:
+                self.resync()
+            except Exception as e:
+                logger.error(f"User stream resync failed: {str(e)}")
+
+    def _apply(self, states: List[_OrderState]) -> None:
+        """Update local orders, then run the callbacks."""
+        changed: List[Order] = []
+        fills: List[OrderFill] = []
+        with self._lock:
+            for state in states:
+                order, fill = self._update(state)
+                if order is not None:
+                    changed.append(order)
+                if fill is not None:
+                    fills.append(fill)
+        if fills:
+            self._invalidate_balances()
+        for fill in fills:
+            self._notify(self.on_fill, fill)
+        for order in changed:
+            for listener in self.order_listeners:
+                self._notify(listener, order)
+            self._notify(self.on_order, order)
+
+    def _update(self, state: _OrderState) -> Tuple[Optional[Order], Optional[OrderFill]]:
+        """Apply one state; return the order if it changed, and the fill if any."""
+        order = self.orders.get(state.order_id)
+        if order is None:
+            order = self.orders[state.order_id] = state.to_order()
+            fill = None
+            if state.filled_size:
+                fill = OrderFill(order, state.filled_size, state.average_filled_price,
+                                 state.total_fees)
+            return order, fill
+        # Ignore stale states, e.g. a REST read overtaken by newer events.
+        if state.filled_size < order.filled_size or (
+                order.status in TERMINAL_STATUSES and state.status != order.status):
+            return None, None
+        fill = None
+        if state.filled_size > order.filled_size:
+            size = state.filled_size - order.filled_size
+            value = (state.filled_size * (state.average_filled_price or _ZERO)
+                     - order.filled_size * (order.average_filled_price or _ZERO))
+            fill = OrderFill(order, size, value / size, state.total_fees - order.total_fees)
+        before = (order.status, order.filled_size, order.total_fees)
+        order.status = state.status
+        order.filled_size = state.filled_size
+        order.average_filled_price = state.average_filled_price
+        order.total_fees = state.total_fees
+        if order.client_order_id is None:
+            order.client_order_id = state.client_order_id
+        if before == (order.status, order.filled_size, order.total_fees):
+            return None, None
+        return order, fill
+
+    def _invalidate_balances(self) -> None:
+        """Make the client's next balance read fetch fresh accounts."""
+        invalidate_balances = getattr(self.rest_client, 'invalidate_balances', None)
+        if invalidate_balances is not None:
+            invalidate_balances()
+
+    @staticmethod
+    def _notify(callback: Optional[Callable[[Any], Any]], value: Any) -> None:
+        if callback is None:
+            return
+        try:
+            callback(value)
+        except Exception as e:
+            logger.error(f"User stream callback failed: {str(e)}")
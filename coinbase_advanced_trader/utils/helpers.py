@@ -1,5 +1,5 @@
 import uuid
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal, ROUND_DOWN, localcontext
 
 
 def calculate_base_size(
@@ -10,6 +10,9 @@ def calculate_base_size(
     """
     Calculate the base size for an order.
 
+    The size is rounded down to the base increment, so that it is never
+    worth more than `fiat_amount` at `spot_price`.
+
     Args:
         fiat_amount (Decimal): The amount in fiat currency.
         spot_price (Decimal): The current spot price.
@@ -18,9 +21,9 @@ def calculate_base_size(
     Returns:
         Decimal: The calculated base size.
     """
-    return (fiat_amount / spot_price).quantize(
-        base_increment, rounding=ROUND_HALF_UP
-    )
+    with localcontext() as context:
+        context.rounding = ROUND_DOWN
+        return (fiat_amount / spot_price).quantize(base_increment)
 
 
 def generate_client_order_id() -> str:
@@ -18,6 +18,12 @@ setup(
     url='https://github.com/rhettre/coinbase-advancedtrade-python',
     packages=find_packages(),
     install_requires=requirements,
+    extras_require={
+        'backtest': ['numpy>=1.24'],
+        'basket': ['numpy>=1.24'],
+        'fast': ['orjson>=3.8'],
+        'tracing': ['opentelemetry-api>=1.20'],
+    },
     include_package_data=True,
     keywords=['gdax', 'gdax-api', 'cbpro', 'cbpro-api', 'orderbook', 'trade', 'bitcoin', 'ethereum', 'BTC', 'ETH',
               'client', 'api', 'wrapper', 'exchange', 'crypto', 'currency', 'trading', 'trading-api', 'coinbase',